@@ -1,5 +1,6 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
+import tkinter.font as tkfont
 import csv
 import datetime
 import os
@@ -7,13 +8,24 @@ import sys
 import threading 
 import time
 import json
-import re
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Callable, Tuple
 from dataclasses import dataclass, field
 
 # 분리된 모듈들 import
-from core.models import InspectionSession, RemnantCreationSession, DefectiveMergeSession, ProductExchangeSession
-from utils.file_handler import resource_path, find_file_in_subdirs, ensure_directory_exists, get_safe_filename
+from core.models import InspectionSession, RemnantCreationSession, DefectiveMergeSession, ProductExchangeSession, ScanRecord, SCAN_GOOD, SCAN_DEFECTIVE
+from core.item_master import ItemMaster, precompile_in_background
+from core.completion_rollup import CompletionRollupStore, parse_master_label_qr
+from core.cycle_stats import CycleTimeStats, CycleStatsStore
+from core.throughput import ThroughputTracker
+from core.trace_index import BarcodeTraceIndex, STAGE_NAMES
+from core.log_shards import LogFile, ShardedEventLog, read_events
+from core.replication import WriteAheadReplicator
+from core.folder_watch import FolderWatcher
+from core.defect_ledger import DefectLedger
+from core.completed_registry import CompletedLabelRegistry
+from core.remnant_inventory import RemnantInventory
+from core.session_journal import ScanJournal, JOURNAL_KEY, load_session, session_counters
+from utils.file_handler import resource_path, find_file_in_subdirs, ensure_directory_exists, get_safe_filename, resolve_save_folder
 from utils.logger import EventLogger
 from ui.base_ui import UIUtils, StyleManager
 from ui.components import ScannerInputComponent, ProgressDisplayComponent, DataDisplayComponent
@@ -28,17 +40,22 @@ import keyboard
 import random
 import base64
 import binascii
+import importlib.util
 
 
-# 라벨 이미지 생성을 위한 라이브러리 import
+# 라벨 이미지 생성을 위한 라이브러리 확인 (실제 사용은 core.label_renderer, utils.asset_cache)
 # 실행 전 "pip install qrcode pillow" 명령어 실행 필요
-try:
-    from PIL import Image, ImageDraw, ImageFont, ImageTk
-    import qrcode
-except ImportError:
+if importlib.util.find_spec('PIL') is None or importlib.util.find_spec('qrcode') is None:
     messagebox.showerror("라이브러리 오류", "'qrcode'와 'Pillow' 라이브러리가 필요합니다.\n\n터미널에서 'pip install qrcode pillow' 명령어를 실행해주세요.")
     sys.exit()
 
+from utils.asset_cache import ImageAssetCache
+from core.label_renderer import LabelRenderer, LABEL_TEMPLATES, BUNDLED_FONT
+from core.label_queue import LabelRenderQueue
+from core.label_cache import LabelImageCache, label_fields_from_record
+from core.label_batch import render_labels_to_pdf_isolated, prune_batches
+from core.label_printer import create_label_printer
+
 # #####################################################################
 # # 설정 관리 클래스
 # #####################################################################
@@ -78,17 +95,23 @@ class ConfigManager:
                 "repo_owner": "KMTechn",
                 "repo_name": "Inspection_worker"
             },
+            "paths": {
+                "save_folder": ""
+            },
             "inspection": {
                 "tray_size": 60,
                 "idle_threshold_sec": 420,
                 "item_code_length": 13,
                 "default_product_code": "",
-                "sound_enabled": True
+                "sound_enabled": True,
+                "large_tray_threshold": 500,
+                "scan_list_window": 200
             },
             "ui": {
                 "window_title": "KMTech 검사 시스템",
                 "window_geometry": "1400x800",
-                "theme": "default"
+                "theme": "default",
+                "throughput_refresh_ms": 5000
             },
             "logging": {
                 "enabled": True,
@@ -96,10 +119,30 @@ class ConfigManager:
                 "session_file": "session_data.json",
                 "max_log_size": 1048576
             },
+            "sync": {
+                "max_retry_sec": 60,
+                "outbox_retention_days": 7,
+                "shutdown_flush_sec": 3,
+                "watch_backend": "auto",
+                "watch_poll_sec": 2,
+                "watch_rescan_sec": 300
+            },
             "network": {
                 "update_check_timeout": 5,
                 "download_timeout": 120,
                 "auto_update_check": True
+            },
+            "label": {
+                "image_cache_mb": 200,
+                "batch_keep_days": 7,
+                "batch_keep_count": 20,
+                "printer": {
+                    "backend": "none",
+                    "spool_dir": "",
+                    "host": "",
+                    "port": 9100,
+                    "font": ""
+                }
             }
         }
         self.save_config(default_config)
@@ -209,7 +252,14 @@ def download_and_apply_update(url, app_instance):
         new_program_folder_path = temp_update_folder
         if len(extracted_content) == 1 and os.path.isdir(os.path.join(temp_update_folder, extracted_content[0])):
                 new_program_folder_path = os.path.join(temp_update_folder, extracted_content[0])
-                
+
+        # 새 Item.csv가 포함되어 있으면 재시작 전에 품목 마스터 캐시를 백그라운드에서 미리 컴파일
+        precompile_thread = None
+        new_item_csv = find_file_in_subdirs(new_program_folder_path, 'Item.csv')
+        if new_item_csv:
+            cache_dir = os.path.join(application_path, InspectionProgram.SETTINGS_DIR, InspectionProgram.CACHE_DIR)
+            precompile_thread = precompile_in_background(new_item_csv, cache_dir)
+
         # 보안: 경로 인젝션 방지를 위한 입력 검증
         import shlex
 
@@ -260,7 +310,10 @@ del "%~f0"
                 temp_path=safe_temp_folder,
                 restart_path=safe_restart_path
             ))
-        
+
+        if precompile_thread:
+            precompile_thread.join(timeout=10)
+
         subprocess.Popen(updater_script_path, creationflags=subprocess.CREATE_NEW_CONSOLE)
         sys.exit(0)
 
@@ -296,6 +349,15 @@ class InspectionProgram:
     DEFAULT_FONT = 'Malgun Gothic'
     SETTINGS_DIR = 'config'
     SETTINGS_FILE = 'inspection_settings.json'
+    CACHE_DIR = 'cache'
+    OUTBOX_DIR = 'sync_outbox'
+    LOGO_ASSET = 'assets/logo.png'
+    LOGO_BASE_WIDTH = 400
+    TRAY_IMAGE_BASE_WIDTH = 240
+    REMNANT_SUGGESTION_COUNT = 3
+    MIN_SCALE_FACTOR, MAX_SCALE_FACTOR = 0.7, 2.5
+    ZOOM_DEBOUNCE_MS = 150
+    UI_DISPATCH_POLL_MS = 50
     DEFECT_PEDAL_KEY_NAME = 'F12'
 
     COLOR_BG = "#F5F7FA"
@@ -323,12 +385,6 @@ class InspectionProgram:
         self.root.configure(bg=self.COLOR_BG)
         
         self.current_mode = "standard" 
-        
-        self.log_queue: queue.Queue = queue.Queue()
-        self.log_file_path: Optional[str] = None
-        self.rework_log_file_path: Optional[str] = None
-        self.log_thread = threading.Thread(target=self._event_log_writer, daemon=True)
-        self.log_thread.start()
 
         try:
             self.root.iconbitmap(resource_path(os.path.join('assets', 'logo.ico')))
@@ -346,9 +402,9 @@ class InspectionProgram:
 
         self.application_path = os.path.dirname(sys.executable) if getattr(sys, 'frozen', False) else os.path.dirname(os.path.abspath(__file__))
         self.config_folder = os.path.join(self.application_path, self.SETTINGS_DIR)
-        os.makedirs(self.config_folder, exist_ok=True)
-        self.settings = self.load_app_settings()
-        self._setup_paths()
+        self._init_services()
+        self._warm_completion_rollups()
+        self._warm_trace_index()
         
         initial_delay = self.settings.get('scan_delay', 0.0)
         self.scan_delay_sec = tk.DoubleVar(value=initial_delay)
@@ -356,6 +412,78 @@ class InspectionProgram:
         self.scale_factor = self.settings.get('scale_factor', 1.0)
         self.paned_window_sash_positions: Dict[str, int] = self.settings.get('paned_window_sash_positions', {})
         self.column_widths: Dict[str, int] = self.settings.get('column_widths_inspector', {})
+        self.scaled_fonts: Dict[tuple, tkfont.Font] = {}
+        self.scaled_ipady_widgets: List[tuple] = []
+        self.logo_label: Optional[ttk.Label] = None
+
+        self.asset_cache = ImageAssetCache()
+        self.label_queue = LabelRenderQueue(self.label_image_cache, self._dispatch_to_ui, printer=self._create_label_printer())
+        self.label_font_warning_shown = False
+        self._prefetch_image_assets()
+
+        self.throughput_labels: Dict[int, Dict[str, ttk.Label]] = {}
+        self.info_cards: Dict[str, Dict[str, ttk.Widget]] = {}
+        self.logo_photo_ref = None
+        self.tray_photo_ref = None
+
+        self.status_message_job: Optional[str] = None
+        self.tick_job: Optional[str] = None
+        self.throughput_due = 0.0
+        self.focus_return_job: Optional[str] = None
+        self.zoom_job: Optional[str] = None
+        self.ui_dispatch_job: Optional[str] = None
+
+        self.folder_watcher = FolderWatcher(
+            self.save_folder, self._on_save_folder_changes,
+            backend=config.get('sync.watch_backend', 'auto'),
+            poll_interval=float(config.get('sync.watch_poll_sec', 2)),
+            rescan_interval=float(config.get('sync.watch_rescan_sec', 300)),
+            ignore_dirs=[os.path.relpath(self.labels_folder, self.save_folder)])
+        self.folder_watcher.start()
+        self._warm_defect_ledger()
+        self._warm_completed_labels()
+        self._warm_remnant_inventory()
+
+        self._setup_core_ui_structure()
+        self._setup_styles()
+        
+        self.show_worker_input_screen()
+        
+        self.root.bind('<Control-MouseWheel>', self.on_ctrl_wheel)
+        self.root.bind_all(f"<KeyPress-{self.DEFECT_PEDAL_KEY_NAME}>", self.on_pedal_press_ui_feedback)
+        self.root.bind_all(f"<KeyRelease-{self.DEFECT_PEDAL_KEY_NAME}>", self.on_pedal_release_ui_feedback)
+
+        self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
+        self._drain_ui_calls()
+
+    def _init_services(self):
+        """화면과 무관한 작업 상태와 서비스(로그 기록 스레드, 동기화 복제, 메모리 색인)를 만듭니다.
+
+        self.root 와 self.config_folder 가 먼저 정해져 있어야 합니다.
+        화면 없이 실제 작업 흐름을 측정하는 벤치마크(benchmarks/headless_app.py)도 이 메서드를 사용합니다.
+        """
+        # 백그라운드 스레드는 Tk 를 직접 호출하지 않고 이 큐에 콜백을 넣습니다. (_drain_ui_calls 가 실행)
+        self.ui_calls: queue.Queue = queue.Queue()
+        self.log_queue: queue.Queue = queue.Queue()
+        self.log_file_path: Optional[str] = None
+        self.rework_log_file_path: Optional[str] = None
+        self.log_thread = threading.Thread(target=self._event_log_writer, daemon=True)
+        self.log_thread.start()
+
+        os.makedirs(self.config_folder, exist_ok=True)
+        self.settings = self.load_app_settings()
+        self._setup_paths()
+        # 동기화 폴더 쓰기는 로컬 outbox 에 먼저 기록하고 백그라운드에서 순서대로 복제합니다.
+        self.replicator = WriteAheadReplicator(
+            os.path.join(self.config_folder, self.OUTBOX_DIR), self.save_folder,
+            max_retry_sec=float(config.get('sync.max_retry_sec', 60)),
+            on_change=lambda pending, error: self._dispatch_to_ui(lambda: self._update_sync_indicator(pending, error)))
+        self.replicator.prune(float(config.get('sync.outbox_retention_days', 7)))
+        self.replicator.start()
+        self.completion_rollups = CompletionRollupStore(self.save_folder, os.path.join(self.config_folder, self.CACHE_DIR, 'rollups'),
+                                                        overlay=self.replicator.local_root)
+        self.cycle_stats_store = CycleStatsStore(os.path.join(self.config_folder, self.CACHE_DIR, 'cycle_stats.json'))
+        self.trace_index = BarcodeTraceIndex(self.save_folder, os.path.join(self.config_folder, self.CACHE_DIR, 'trace_index.sqlite3'))
 
         self.worker_name = ""
         self.current_session = InspectionSession()
@@ -371,52 +499,48 @@ class InspectionProgram:
         self.current_exchange_session = ProductExchangeSession()
 
         self.items_data = self.load_items()
+        self.label_renderer = LabelRenderer(font_fallbacks=(resource_path(BUNDLED_FONT),))
+        self.label_image_cache = LabelImageCache(
+            os.path.join(self.config_folder, self.CACHE_DIR, 'labels'), self.label_renderer,
+            max_bytes=int(config.get('label.image_cache_mb', 200)) * 1024 * 1024)
         
         self.work_summary: Dict[str, Dict[str, Any]] = {}
 
-        self.completed_tray_times: List[float] = []
+        self.cycle_stats = CycleTimeStats(self._week_start(datetime.date.today()).isoformat())
         self.total_tray_count = 0
+        self.throughput = ThroughputTracker()
         self.tray_last_end_time: Optional[datetime.datetime] = None
-        self.info_cards: Dict[str, Dict[str, ttk.Widget]] = {}
-        self.logo_photo_ref = None
         self.is_idle = False
-        self.last_activity_time: Optional[datetime.datetime] = None
-        self.completed_master_labels: set = set()
         
         self.reworkable_defects: Dict[str, Dict[str, Any]] = {}
         self.reworked_items_today: List[Dict[str, Any]] = []
 
-        self.status_message_job: Optional[str] = None
-        self.clock_job: Optional[str] = None
-        self.stopwatch_job: Optional[str] = None
-        self.idle_check_job: Optional[str] = None
-        self.focus_return_job: Optional[str] = None
+        self.stopwatch_session: Optional[InspectionSession] = None
+        self.stopwatch_base = 0.0
+        self.stopwatch_started_at: Optional[float] = None
+        self.last_activity_mono: Optional[float] = None
         
         self.is_excluding_item = False
         self.exclusion_context = {}
 
-        try:
-            self.computer_id = hex(uuid.getnode())
-        except Exception:
-            import socket
-            self.computer_id = socket.gethostname()
-        self.CURRENT_TRAY_STATE_FILE = f"_current_inspection_state_{self.computer_id}.json"
-
-        self._setup_core_ui_structure()
-        self._setup_styles()
-        
-        self.show_worker_input_screen()
-        
-        self.root.bind('<Control-MouseWheel>', self.on_ctrl_wheel)
-        self.root.bind_all(f"<KeyPress-{self.DEFECT_PEDAL_KEY_NAME}>", self.on_pedal_press_ui_feedback)
-        self.root.bind_all(f"<KeyRelease-{self.DEFECT_PEDAL_KEY_NAME}>", self.on_pedal_release_ui_feedback)
-        
-
         # [수정] 현품표 교체 관련 상태 변수 수정
         self.master_label_replace_state: Optional[str] = None
         self.replacement_context: Dict[str, Any] = {}
 
-        self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
+        self.computer_id = self._detect_computer_id()
+        self.CURRENT_TRAY_STATE_FILE = f"_current_inspection_state_{self.computer_id}.json"
+        self.scan_journal = ScanJournal(self.replicator, os.path.join(self.save_folder, self.CURRENT_TRAY_STATE_FILE))
+        self.event_log = ShardedEventLog(self.save_folder, self.computer_id, overlay=self.replicator.local_root)
+        # 다른 스테이션이 만든 불량표/로그/잔량/완료 현품표는 폴더 변경 감지로 메모리 색인에 반영합니다.
+        self.defect_ledger = DefectLedger(self.save_folder, self.defects_data_folder,
+                                          overlay=self.replicator.local_root, resolve=self.replicator.resolve)
+        self.remnant_inventory = RemnantInventory(self.remnants_folder, resolve=self.replicator.resolve)
+        self.completed_labels = CompletedLabelRegistry(self.save_folder, self.event_log.station,
+                                                       overlay=self.replicator.local_root,
+                                                       on_append=self.replicator.append_done,
+                                                       adopt=self.replicator.adopt_remote)
+        # 색인 이름 → 처음 읽기(_warm_<이름>) 스레드. Tk 스레드는 색인이 만들어질 때까지 기다리지 않습니다.
+        self._warm_threads: Dict[str, threading.Thread] = {}
 
     def on_pedal_press_ui_feedback(self, event=None):
         if self.current_mode != "standard": return
@@ -443,8 +567,17 @@ class InspectionProgram:
         if hasattr(self, 'scan_entry'):
             self.scan_entry.config(highlightcolor=highlight_color)
     
+    def _detect_computer_id(self) -> str:
+        """스테이션 로그 폴더 이름의 기준이 되는 PC 식별자"""
+        try:
+            return hex(uuid.getnode())
+        except Exception:
+            import socket
+            return socket.gethostname()
+
     def _setup_paths(self):
-        self.save_folder = "C:\\Sync"
+        # 환경 변수 INSPECTION_SAVE_FOLDER > paths.save_folder > OS 기본값(Windows: C:\\Sync)
+        self.save_folder = resolve_save_folder(config.get('paths.save_folder', ''))
 
         # 데이터 폴더
         self.remnants_folder = os.path.join(self.save_folder, "spare")
@@ -463,18 +596,19 @@ class InspectionProgram:
         os.makedirs(self.remnant_labels_folder, exist_ok=True)
         os.makedirs(self.defective_labels_folder, exist_ok=True)
 
-    def _get_daily_folder_path(self, base_path: str) -> str:
+    def _get_daily_folder_path(self, base_path: str, create: bool = True) -> str:
         """주어진 기본 경로 하위에 오늘 날짜(YYYY-MM-DD) 폴더를 만들고 경로를 반환합니다."""
         today_str = datetime.date.today().strftime('%Y-%m-%d')
         path = os.path.join(base_path, today_str)
-        os.makedirs(path, exist_ok=True)
+        if create:
+            os.makedirs(path, exist_ok=True)
         return path
 
     def _find_file_in_subdirs(self, root_folder: str, filename: str) -> Optional[str]:
         """하위 폴더를 재귀적으로 탐색하여 파일을 찾고 전체 경로를 반환합니다."""
         for dirpath, _, filenames in os.walk(root_folder):
             if filename in filenames:
-                return os.path.join(dirpath, filename)
+                return self.replicator.resolve(os.path.join(dirpath, filename))
         return None
 
     def load_app_settings(self) -> Dict[str, Any]:
@@ -499,31 +633,32 @@ class InspectionProgram:
 
     def load_items(self) -> List[Dict[str, str]]:
         item_path = resource_path(os.path.join('assets', 'Item.csv'))
-        encodings_to_try = ['utf-8-sig', 'cp949', 'euc-kr', 'utf-8']
-        for encoding in encodings_to_try:
-            try:
-                with open(item_path, 'r', encoding=encoding) as file:
-                    items = list(csv.DictReader(file))
-                    self._log_event('ITEM_DATA_LOADED', detail={'item_count': len(items), 'path': item_path})
-                    return items
-            except UnicodeDecodeError: continue
-            except FileNotFoundError:
-                messagebox.showerror("오류", f"필수 파일 없음: {item_path}")
-                self.root.destroy()
-                return []
-            except Exception as e:
-                messagebox.showerror("파일 읽기 오류", f"파일 읽기 오류: {e}")
-                self.root.destroy()
-                return []
-        messagebox.showerror("인코딩 감지 실패", f"'{os.path.basename(item_path)}' 파일의 인코딩을 알 수 없습니다.")
-        self.root.destroy()
-        return []
+        cache_dir = os.path.join(self.config_folder, self.CACHE_DIR)
+        try:
+            self.item_master = ItemMaster.load(item_path, cache_dir)
+        except FileNotFoundError:
+            messagebox.showerror("오류", f"필수 파일 없음: {item_path}")
+            self.root.destroy()
+            return []
+        except FileHandlingError:
+            messagebox.showerror("인코딩 감지 실패", f"'{os.path.basename(item_path)}' 파일의 인코딩을 알 수 없습니다.")
+            self.root.destroy()
+            return []
+        except Exception as e:
+            messagebox.showerror("파일 읽기 오류", f"파일 읽기 오류: {e}")
+            self.root.destroy()
+            return []
+        self._log_event('ITEM_DATA_LOADED', detail={'item_count': len(self.item_master), 'path': item_path, 'source': self.item_master.source})
+        return self.item_master.records
 
     def _setup_core_ui_structure(self):
         status_bar = tk.Frame(self.root, bg=self.COLOR_SIDEBAR_BG, bd=1, relief=tk.SUNKEN)
         status_bar.pack(side=tk.BOTTOM, fill=tk.X)
         self.status_label = tk.Label(status_bar, text="준비", anchor=tk.W, bg=self.COLOR_SIDEBAR_BG, fg=self.COLOR_TEXT)
         self.status_label.pack(side=tk.LEFT, padx=10, pady=4)
+        self.sync_status_label = tk.Label(status_bar, text="", anchor=tk.E, bg=self.COLOR_SIDEBAR_BG, fg=self.COLOR_TEXT_SUBTLE)
+        self.sync_status_label.pack(side=tk.RIGHT, padx=10, pady=4)
+        self._update_sync_indicator(self.replicator.pending(), self.replicator.last_error)
         self.paned_window = ttk.PanedWindow(self.root, orient=tk.HORIZONTAL)
         self.left_pane = ttk.Frame(self.paned_window, style='Sidebar.TFrame')
         self.center_pane = ttk.Frame(self.paned_window, style='TFrame')
@@ -536,15 +671,40 @@ class InspectionProgram:
     def _setup_styles(self):
         self.style = ttk.Style()
         self.style.theme_use('clam')
-        m = int(12 * self.scale_factor)
-        self.style.configure('Good.Treeview.Heading', background=self.COLOR_SUCCESS, foreground='white', font=(self.DEFAULT_FONT, m, 'bold'))
-        self.style.configure('Defect.Treeview.Heading', background=self.COLOR_DEFECT, foreground='white', font=(self.DEFAULT_FONT, m, 'bold'))
+        m = self._scaled_font(12, 'bold')
+        self.style.configure('Good.Treeview.Heading', background=self.COLOR_SUCCESS, foreground='white', font=m)
+        self.style.configure('Defect.Treeview.Heading', background=self.COLOR_DEFECT, foreground='white', font=m)
         self.apply_scaling()
 
+    def _scaled_font(self, base_size: float, weight: str = 'normal') -> tkfont.Font:
+        """배율에 연동되는 명명된 Tk 폰트를 반환합니다. 배율이 바뀌면 apply_scaling에서 크기만 갱신됩니다."""
+        key = (base_size, weight)
+        font = self.scaled_fonts.get(key)
+        if font is None:
+            font = tkfont.Font(root=self.root, family=self.DEFAULT_FONT, size=int(base_size * self.scale_factor), weight=weight)
+            self.scaled_fonts[key] = font
+        return font
+
+    def _register_scaled_ipady(self, widget: tk.Widget, base_ipady: int):
+        """배율 변경 시 다시 적용할 내부 세로 여백(ipady)을 등록합니다.
+
+        화면을 다시 만들 때마다 등록되므로, 그 전에 파괴된 이전 화면의 위젯은 여기서 목록에서 뺍니다.
+        """
+        self.scaled_ipady_widgets = [(w, ipady) for w, ipady in self.scaled_ipady_widgets if w.winfo_exists()]
+        self.scaled_ipady_widgets.append((widget, base_ipady))
+
     def apply_scaling(self):
+        for (base_size, _), font in self.scaled_fonts.items():
+            new_size = int(base_size * self.scale_factor)
+            if font.cget('size') != new_size:
+                font.configure(size=new_size)
+
         base = 10
-        s, m, l, xl, xxl = (int(factor * self.scale_factor) for factor in [base, base + 2, base + 8, base + 20, base + 60])
-        
+        s, m = self._scaled_font(base), self._scaled_font(base + 2)
+        s_bold, m_bold, l_bold = self._scaled_font(base, 'bold'), self._scaled_font(base + 2, 'bold'), self._scaled_font(base + 8, 'bold')
+        value_bold, title_bold = self._scaled_font((base + 8) * 1.2, 'bold'), self._scaled_font((base + 20) * 1.5, 'bold')
+        xxl_bold = self._scaled_font(base + 60, 'bold')
+
         bg_color = self.COLOR_BG
         if self.current_mode == "rework":
             bg_color = self.COLOR_REWORK_BG
@@ -556,37 +716,64 @@ class InspectionProgram:
         self.style.configure('Sidebar.TFrame', background=self.COLOR_SIDEBAR_BG)
         self.style.configure('Card.TFrame', background=self.COLOR_SIDEBAR_BG, relief='solid', borderwidth=1, bordercolor=self.COLOR_BORDER)
         self.style.configure('Idle.TFrame', background=self.COLOR_IDLE, relief='solid', borderwidth=1, bordercolor=self.COLOR_BORDER)
-        self.style.configure('TLabel', background=bg_color, foreground=fg_color, font=(self.DEFAULT_FONT, m))
-        self.style.configure('Sidebar.TLabel', background=self.COLOR_SIDEBAR_BG, foreground=self.COLOR_TEXT, font=(self.DEFAULT_FONT, m))
-        self.style.configure('Idle.TLabel', background=self.COLOR_IDLE, foreground=self.COLOR_TEXT, font=(self.DEFAULT_FONT, m))
-        self.style.configure('Subtle.TLabel', background=self.COLOR_SIDEBAR_BG, foreground=self.COLOR_TEXT_SUBTLE, font=(self.DEFAULT_FONT, s))
-        self.style.configure('Idle.Subtle.TLabel', background=self.COLOR_IDLE, foreground=self.COLOR_TEXT_SUBTLE, font=(self.DEFAULT_FONT, s))
-        self.style.configure('Value.TLabel', background=self.COLOR_SIDEBAR_BG, foreground=self.COLOR_TEXT, font=(self.DEFAULT_FONT, int(l * 1.2), 'bold'))
-        self.style.configure('Idle.Value.TLabel', background=self.COLOR_IDLE, foreground=self.COLOR_TEXT, font=(self.DEFAULT_FONT, int(l * 1.2), 'bold'))
-        self.style.configure('Title.TLabel', background=bg_color, foreground=fg_color, font=(self.DEFAULT_FONT, int(xl * 1.5), 'bold'))
-        self.style.configure('ItemInfo.TLabel', background=bg_color, foreground=fg_color, font=(self.DEFAULT_FONT, l, 'bold'))
-        self.style.configure('MainCounter.TLabel', background=bg_color, foreground=fg_color, font=(self.DEFAULT_FONT, xxl, 'bold'))
-        self.style.configure('TButton', font=(self.DEFAULT_FONT, m, 'bold'), padding=(int(15 * self.scale_factor), int(10 * self.scale_factor)), borderwidth=0)
+        self.style.configure('TLabel', background=bg_color, foreground=fg_color, font=m)
+        self.style.configure('Sidebar.TLabel', background=self.COLOR_SIDEBAR_BG, foreground=self.COLOR_TEXT, font=m)
+        self.style.configure('Idle.TLabel', background=self.COLOR_IDLE, foreground=self.COLOR_TEXT, font=m)
+        self.style.configure('Subtle.TLabel', background=self.COLOR_SIDEBAR_BG, foreground=self.COLOR_TEXT_SUBTLE, font=s)
+        self.style.configure('Idle.Subtle.TLabel', background=self.COLOR_IDLE, foreground=self.COLOR_TEXT_SUBTLE, font=s)
+        self.style.configure('Value.TLabel', background=self.COLOR_SIDEBAR_BG, foreground=self.COLOR_TEXT, font=value_bold)
+        self.style.configure('Idle.Value.TLabel', background=self.COLOR_IDLE, foreground=self.COLOR_TEXT, font=value_bold)
+        self.style.configure('Title.TLabel', background=bg_color, foreground=fg_color, font=title_bold)
+        self.style.configure('ItemInfo.TLabel', background=bg_color, foreground=fg_color, font=l_bold)
+        self.style.configure('MainCounter.TLabel', background=bg_color, foreground=fg_color, font=xxl_bold)
+        self.style.configure('TButton', font=m_bold, padding=(int(15 * self.scale_factor), int(10 * self.scale_factor)), borderwidth=0)
         self.style.map('TButton', background=[('!active', self.COLOR_PRIMARY), ('active', '#0B5ED7')], foreground=[('!active', 'white')])
-        self.style.configure('Secondary.TButton', font=(self.DEFAULT_FONT, s, 'bold'), borderwidth=0)
+        self.style.configure('Secondary.TButton', font=s_bold, borderwidth=0)
         self.style.map('Secondary.TButton', background=[('!active', self.COLOR_TEXT_SUBTLE), ('active', self.COLOR_TEXT)], foreground=[('!active', 'white')])
-        self.style.configure('TCheckbutton', background=self.COLOR_SIDEBAR_BG, foreground=self.COLOR_TEXT, font=(self.DEFAULT_FONT, m))
+        self.style.configure('TCheckbutton', background=self.COLOR_SIDEBAR_BG, foreground=self.COLOR_TEXT, font=m)
         self.style.map('TCheckbutton', indicatorcolor=[('selected', self.COLOR_PRIMARY), ('!selected', self.COLOR_BORDER)])
         self.style.configure('VelvetCard.TFrame', background=self.COLOR_VELVET, relief='solid', borderwidth=1, bordercolor=self.COLOR_BORDER)
-        self.style.configure('Velvet.Subtle.TLabel', background=self.COLOR_VELVET, foreground='white', font=(self.DEFAULT_FONT, s))
-        self.style.configure('Velvet.Value.TLabel', background=self.COLOR_VELVET, foreground='white', font=(self.DEFAULT_FONT, int(l * 1.2), 'bold'))
-        self.style.configure('Treeview.Heading', font=(self.DEFAULT_FONT, m, 'bold'))
-        self.style.configure('Treeview', rowheight=int(25 * self.scale_factor), font=(self.DEFAULT_FONT, m))
+        self.style.configure('Velvet.Subtle.TLabel', background=self.COLOR_VELVET, foreground='white', font=s)
+        self.style.configure('Velvet.Value.TLabel', background=self.COLOR_VELVET, foreground='white', font=value_bold)
+        self.style.configure('Treeview.Heading', font=m_bold)
+        self.style.configure('Treeview', rowheight=int(25 * self.scale_factor), font=m)
         self.style.configure('Main.Horizontal.TProgressbar', troughcolor=self.COLOR_BORDER, background=self.COLOR_PRIMARY, thickness=int(25 * self.scale_factor))
         if hasattr(self, 'status_label'):
-            self.status_label['font'] = (self.DEFAULT_FONT, s)
+            self.status_label['font'] = s
+            self.sync_status_label['font'] = s
+
+    def _prefetch_image_assets(self):
+        """로고와 품목별 트레이 이미지를 현재 배율과 인접 배율로 백그라운드에서 미리 디코딩합니다."""
+        scales = {max(self.MIN_SCALE_FACTOR, min(self.MAX_SCALE_FACTOR, self.scale_factor + step)) for step in (0.0, -0.1, 0.1)}
+        self.asset_cache.prefetch([self.LOGO_ASSET], self.LOGO_BASE_WIDTH, scales)
+        tray_images = [item['Tray Image'] for item in self.items_data if item.get('Tray Image')]
+        self.asset_cache.prefetch(tray_images, self.TRAY_IMAGE_BASE_WIDTH, scales)
 
     def on_ctrl_wheel(self, event):
-        self.scale_factor += 0.1 if event.delta > 0 else -0.1
-        self.scale_factor = max(0.7, min(2.5, self.scale_factor))
+        step = 0.1 if event.delta > 0 else -0.1
+        self.scale_factor = round(max(self.MIN_SCALE_FACTOR, min(self.MAX_SCALE_FACTOR, self.scale_factor + step)), 2)
+        # 휠을 연속으로 돌리는 동안에는 마지막 배율만 한 번 적용
+        if self.zoom_job: self.root.after_cancel(self.zoom_job)
+        self.zoom_job = self.root.after(self.ZOOM_DEBOUNCE_MS, self._apply_zoom)
+
+    def _apply_zoom(self):
+        """화면을 다시 만들지 않고 폰트, 행 높이, 여백, 이미지만 현재 배율로 갱신합니다."""
+        self.zoom_job = None
+        self._prefetch_image_assets()
         self.apply_scaling()
-        if self.worker_name: self.show_inspection_screen()
-        else: self.show_worker_input_screen()
+
+        for widget, base_ipady in self.scaled_ipady_widgets:
+            if not widget.winfo_exists(): continue
+            manager = widget.winfo_manager()
+            if manager == 'grid': widget.grid_configure(ipady=int(base_ipady * self.scale_factor))
+            elif manager == 'pack': widget.pack_configure(ipady=int(base_ipady * self.scale_factor))
+
+        if self.logo_label and self.logo_label.winfo_exists():
+            self.logo_photo_ref = self.asset_cache.get_photo(self.LOGO_ASSET, self.LOGO_BASE_WIDTH, self.scale_factor)
+            if self.logo_photo_ref: self.logo_label.config(image=self.logo_photo_ref)
+        if hasattr(self, 'current_item_label') and self.current_item_label.winfo_exists():
+            self._update_tray_image()
+        self.show_status_message(f"화면 배율: {int(round(self.scale_factor * 100))}%", self.COLOR_PRIMARY, 1500)
 
     def _clear_main_frames(self):
         if self.worker_input_frame.winfo_ismapped(): self.worker_input_frame.pack_forget()
@@ -603,23 +790,23 @@ class InspectionProgram:
         center_frame = ttk.Frame(self.worker_input_frame, style='TFrame')
         center_frame.grid(row=0, column=0)
         
-        try:
-            logo_path = resource_path(os.path.join('assets', 'logo.png'))
-            logo_img = Image.open(logo_path)
-            max_width = 400 * self.scale_factor
-            logo_img_resized = logo_img.resize((int(max_width), int(max_width * (logo_img.height / logo_img.width))), Image.Resampling.LANCZOS)
-            self.logo_photo_ref = ImageTk.PhotoImage(logo_img_resized)
-            ttk.Label(center_frame, image=self.logo_photo_ref, style='TLabel').pack(pady=(40, 20))
-        except Exception as e: print(f"로고 로드 실패: {e}")
+        self.logo_label = None
+        self.logo_photo_ref = self.asset_cache.get_photo(self.LOGO_ASSET, self.LOGO_BASE_WIDTH, self.scale_factor)
+        if self.logo_photo_ref:
+            self.logo_label = ttk.Label(center_frame, image=self.logo_photo_ref, style='TLabel')
+            self.logo_label.pack(pady=(40, 20))
 
         app_title = f"{config.get('ui.window_title', '품질 검사 시스템')} ({config.get('app.version', 'v2.0.8')})"
         ttk.Label(center_frame, text=app_title, style='Title.TLabel').pack(pady=(20, 60))
-        ttk.Label(center_frame, text="작업자 이름", style='TLabel', font=(self.DEFAULT_FONT, int(12 * self.scale_factor))).pack(pady=(10, 5))
-        self.worker_entry = tk.Entry(center_frame, width=25, font=(self.DEFAULT_FONT, int(18 * self.scale_factor), 'bold'), bd=2, relief=tk.SOLID, justify='center', highlightbackground=self.COLOR_BORDER, highlightcolor=self.COLOR_PRIMARY, highlightthickness=2)
+        ttk.Label(center_frame, text="작업자 이름", style='TLabel', font=self._scaled_font(12)).pack(pady=(10, 5))
+        self.worker_entry = tk.Entry(center_frame, width=25, font=self._scaled_font(18, 'bold'), bd=2, relief=tk.SOLID, justify='center', highlightbackground=self.COLOR_BORDER, highlightcolor=self.COLOR_PRIMARY, highlightthickness=2)
         self.worker_entry.pack(ipady=int(12 * self.scale_factor))
+        self._register_scaled_ipady(self.worker_entry, 12)
         self.worker_entry.bind('<Return>', self.start_work)
         self.worker_entry.focus()
-        ttk.Button(center_frame, text="작업 시작", command=self.start_work, style='TButton', width=20).pack(pady=60, ipady=int(10 * self.scale_factor))
+        start_button = ttk.Button(center_frame, text="작업 시작", command=self.start_work, style='TButton', width=20)
+        start_button.pack(pady=60, ipady=int(10 * self.scale_factor))
+        self._register_scaled_ipady(start_button, 10)
 
     def start_work(self, event=None):
         worker_name = self.worker_entry.get().strip()
@@ -627,6 +814,7 @@ class InspectionProgram:
             messagebox.showerror("오류", "작업자 이름을 입력해주세요.")
             return
         self.worker_name = worker_name
+        self.throughput.reset()
         self._load_session_state()
         self._log_event('WORK_START')
         self._load_current_session_state()
@@ -647,34 +835,30 @@ class InspectionProgram:
     
     def _load_session_state(self):
         today = datetime.date.today()
-        sanitized_name = re.sub(r'[\\/*?:"<>|]', "", self.worker_name)
 
-        self.log_file_path = os.path.join(self.save_folder, f"검사작업이벤트로그_{sanitized_name}_{today.strftime('%Y%m%d')}.csv")
-        if not os.path.exists(self.log_file_path):
+        self.log_file_path = self.event_log.path_for('inspection', self.worker_name, today)
+        if not os.path.exists(self.replicator.local_path(self.log_file_path)):
             self._log_event('LOG_FILE_CREATED', detail={'path': self.log_file_path})
 
-        self.rework_log_file_path = os.path.join(self.save_folder, f"리워크작업이벤트로그_{sanitized_name}_{today.strftime('%Y%m%d')}.csv")
-        if not os.path.exists(self.rework_log_file_path):
+        self.rework_log_file_path = self.event_log.path_for('rework', self.worker_name, today)
+        if not os.path.exists(self.replicator.local_path(self.rework_log_file_path)):
                 self._log_event('REWORK_LOG_FILE_CREATED', detail={'path': self.rework_log_file_path})
 
-        self.defect_merge_log_file_path = os.path.join(self.save_folder, f"불량처리로그_{sanitized_name}_{today.strftime('%Y%m%d')}.csv")
-        if not os.path.exists(self.defect_merge_log_file_path):
+        self.defect_merge_log_file_path = self.event_log.path_for('defect_merge', self.worker_name, today)
+        if not os.path.exists(self.replicator.local_path(self.defect_merge_log_file_path)):
                 self._log_event('DEFECT_MERGE_LOG_FILE_CREATED', detail={'path': self.defect_merge_log_file_path})
 
-        # 모든 로그를 동일한 위치에 저장 (테스트와 실제 구분 없음)
+        # 로그는 스테이션별 폴더(stations/<ID>/)에 기록하고, 읽을 때는 모든 스테이션 로그를 합쳐서 봅니다.
 
         self.total_tray_count = 0
-        self.completed_tray_times = []
         self.work_summary = {}
         self.tray_last_end_time = None
         self.reworked_items_today = []
         
-        if os.path.exists(self.rework_log_file_path):
+        today_rework_logs = self.event_log.log_files('rework', self.worker_name, since=today, until=today)
+        if today_rework_logs:
             try:
-                with open(self.rework_log_file_path, 'r', encoding='utf-8-sig') as f:
-                    reader = list(csv.DictReader(f))
-                
-                for row in reader:
+                for row in read_events(today_rework_logs):
                     if row.get('worker') != self.worker_name: continue
                     
                     if row.get('event') == 'REWORK_SUCCESS':
@@ -691,39 +875,37 @@ class InspectionProgram:
                             continue
                 self.reworked_items_today.sort(key=lambda x: x.get('rework_time', ''), reverse=True)
             except Exception as e:
-                print(f"금일 리워크 로그 파일 '{self.rework_log_file_path}' 처리 중 오류: {e}")
+                print(f"금일 리워크 로그 파일 처리 중 오류: {e}")
+
+        # 주간 작업 시간 통계는 저장된 상태가 최신이면 복원하고, 아니면 이번 주 로그로 다시 계산합니다.
+        start_of_week = self._week_start(today)
+        week_logs = self.event_log.log_files('inspection', self.worker_name, since=start_of_week - datetime.timedelta(days=1))
+        week_log_sizes = self._log_sizes(week_logs)
+        restored_stats = self.cycle_stats_store.load(self.worker_name, start_of_week.isoformat(), week_log_sizes)
+        if restored_stats is not None:
+            # 금일 현황에는 오늘(자정 넘김 대비 어제 포함) 로그만 필요합니다.
+            since = (today - datetime.timedelta(days=1)).strftime('%Y%m%d')
+            logs_to_read = [log for log in week_logs if log.date >= since]
+        else:
+            logs_to_read = week_logs
 
         all_completed_sessions = []
-        log_file_pattern = re.compile(r"검사작업이벤트로그_.*_(\d{8})\.csv")
         try:
-            all_log_files = [os.path.join(self.save_folder, f) for f in os.listdir(self.save_folder) if log_file_pattern.match(f)]
-            for log_path in sorted(all_log_files):
-                with open(log_path, 'r', encoding='utf-8-sig') as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        if row.get('worker') != self.worker_name:
-                            continue
-                        
-                        if row.get('event') == 'TRAY_COMPLETE':
-                            try:
-                                details = json.loads(row['details'])
-                                details['timestamp'] = datetime.datetime.fromisoformat(row['timestamp'])
-                                all_completed_sessions.append(details)
-                            except (json.JSONDecodeError, KeyError, TypeError): continue
+            for row in read_events(logs_to_read):
+                if row.get('worker') != self.worker_name:
+                    continue
+
+                if row.get('event') == 'TRAY_COMPLETE':
+                    try:
+                        details = json.loads(row['details'])
+                        details['timestamp'] = datetime.datetime.fromisoformat(row['timestamp'])
+                        all_completed_sessions.append(details)
+                    except (json.JSONDecodeError, KeyError, TypeError): continue
         except Exception as e:
             print(f"전체 검사 로그 파일 처리 중 오류: {e}")
 
-        self.completed_master_labels.clear()
         today_sessions_list = [s for s in all_completed_sessions if s['timestamp'].date() == today]
-        for session in today_sessions_list:
-            master_code = session.get('master_label_code')
-            if master_code: self.completed_master_labels.add(master_code)
-
-        if self.completed_master_labels:
-            self._log_event('COMPLETED_LABELS_LOADED', detail={'count': len(self.completed_master_labels)})
         
-        start_of_week = today - datetime.timedelta(days=today.weekday())
-        current_week_sessions_list = [s for s in all_completed_sessions if s['timestamp'].date() >= start_of_week]
 
         for session in today_sessions_list:
             item_code = session.get('item_code', 'UNKNOWN')
@@ -743,47 +925,97 @@ class InspectionProgram:
             if not session.get('is_partial', False):
                 self.total_tray_count += 1
         
-        clean_sessions = [s for s in current_week_sessions_list if (
-            s.get('scan_count') == s.get('tray_capacity') and not s.get('has_error_or_reset') and 
-            not s.get('is_partial_submission') and not s.get('is_restored_session'))
-        ]
-        if clean_sessions:
-            MINIMUM_REALISTIC_TIME_PER_PC = 2.0
-            valid_times = [float(s.get('work_time_sec', 0.0)) for s in clean_sessions if s.get('tray_capacity', 0) > 0 and (float(s.get('work_time_sec', 0.0)) / s.get('tray_capacity')) >= MINIMUM_REALISTIC_TIME_PER_PC]
-            if valid_times: self.completed_tray_times = valid_times
+        if restored_stats is not None:
+            self.cycle_stats = restored_stats
+        else:
+            self.cycle_stats = CycleTimeStats(start_of_week.isoformat())
+            for s in all_completed_sessions:
+                if s['timestamp'].date() >= start_of_week:
+                    self.cycle_stats.add_tray(s)
+            self.cycle_stats.log_sizes = week_log_sizes
+            self._save_cycle_stats()
         if any(self.work_summary):
             self.show_status_message(f"금일 작업 현황을 불러왔습니다.", self.COLOR_PRIMARY)
 
+    @staticmethod
+    def _week_start(day: datetime.date) -> datetime.date:
+        return day - datetime.timedelta(days=day.weekday())
+
+    def _log_sizes(self, logs: List[LogFile]) -> Dict[str, int]:
+        """로그 파일 목록의 {save_folder 기준 상대 경로: 크기}를 반환합니다. (읽을 수 없는 파일은 제외)"""
+        sizes = {}
+        for log in logs:
+            try:
+                sizes[self.event_log.relative_name(log.path)] = os.path.getsize(log.path)
+            except OSError as e:
+                print(f"로그 파일 조회 오류: {e}")
+        return sizes
+
+    def _save_cycle_stats(self):
+        if not self.worker_name: return
+        try:
+            self.cycle_stats_store.save(self.worker_name, self.cycle_stats)
+        except OSError as e:
+            print(f"작업 시간 통계 저장 실패: {e}")
+
     def _save_current_session_state(self):
         if not self.current_session.master_label_code: return
-        state_path = os.path.join(self.save_folder, self.CURRENT_TRAY_STATE_FILE)
+        self._sync_stopwatch()
         try:
-            serializable_state = self.current_session.__dict__.copy()
-            serializable_state['start_time'] = serializable_state['start_time'].isoformat() if serializable_state['start_time'] else None
+            serializable_state = self.current_session.to_state()
             serializable_state['worker_name'] = self.worker_name
-            with open(state_path, 'w', encoding='utf-8') as f: json.dump(serializable_state, f, indent=4)
+            # 대형 트레이는 이후 스캔을 저널에 추가 기록하므로 스냅샷은 이때만 씁니다.
+            self.scan_journal.write_snapshot(serializable_state, journal=self._is_large_tray())
+        except Exception as e: print(f"현재 세션 상태 저장 실패: {e}")
+
+    def _is_large_tray(self, session: Optional[InspectionSession] = None) -> bool:
+        """대형 트레이 모드 여부 (목표 수량이 inspection.large_tray_threshold 이상)"""
+        session = session or self.current_session
+        return session.quantity >= int(config.get('inspection.large_tray_threshold', 500))
+
+    def _persist_scan_change(self, record: Optional[ScanRecord] = None, undone: Optional[str] = None):
+        """스캔/판정 취소(둘 다 없으면 오류·휴식 등 누적값 변경)를 작업 상태에 반영합니다.
+
+        대형 트레이는 저널에 한 줄만 추가하며, 복구 시 작업 시간과 오류 기록을 잃지 않도록 누적값을 함께 씁니다.
+        """
+        if not self.current_session.master_label_code: return
+        if not (self.scan_journal.active and self._is_large_tray()):
+            self._save_current_session_state()
+            return
+        try:
+            self._sync_stopwatch()
+            counters = session_counters(self.current_session)
+            if record is not None:
+                self.scan_journal.append_scan(record, counters)
+            elif undone is not None:
+                self.scan_journal.append_undo(undone, counters)
+            else:
+                self.scan_journal.append_counters(counters)
         except Exception as e: print(f"현재 세션 상태 저장 실패: {e}")
 
     def _load_current_session_state(self):
-        state_path = os.path.join(self.save_folder, self.CURRENT_TRAY_STATE_FILE)
+        remote_state_path = os.path.join(self.save_folder, self.CURRENT_TRAY_STATE_FILE)
+        state_path = self.replicator.resolve(remote_state_path)
         if not os.path.exists(state_path): return
         try:
             with open(state_path, 'r', encoding='utf-8') as f: saved_state = json.load(f)
+            self.scan_journal.attach(saved_state.get(JOURNAL_KEY))
             saved_worker = saved_state.get('worker_name')
             if not saved_worker:
                 self._delete_current_session_state()
                 return
-            total_scans = len(saved_state.get('scanned_barcodes', []))
+            saved_session = load_session(saved_state, remote_state_path, self.replicator.resolve)
+            total_scans = saved_session.scan_count
             msg_base = f"· 품목: {saved_state.get('item_name', '알 수 없음')}\n· 검사 수: {total_scans}개"
             if saved_worker == self.worker_name:
                 if messagebox.askyesno("이전 작업 복구", f"이전에 마치지 못한 검사 작업을 이어서 시작하시겠습니까?\n\n{msg_base}"):
-                    self._restore_session_from_state(saved_state)
+                    self._restore_session_from_state(saved_session)
                     self._log_event('TRAY_RESTORE')
                 else: self._delete_current_session_state()
             else:
                 response = messagebox.askyesnocancel("작업 인수 확인", f"이전 작업자 '{saved_worker}'님이 마치지 않은 작업이 있습니다.\n\n이 작업을 이어서 진행하시겠습니까?\n\n{msg_base}")
                 if response is True:
-                    self._restore_session_from_state(saved_state)
+                    self._restore_session_from_state(saved_session)
                     self._log_event('TRAY_TAKEOVER', detail={'previous': saved_worker, 'new': self.worker_name})
                 elif response is False:
                     if messagebox.askyesno("작업 삭제", "이전 작업을 영구적으로 삭제하시겠습니까?"):
@@ -799,26 +1031,21 @@ class InspectionProgram:
             messagebox.showwarning("오류", f"이전 작업 상태 로드 실패: {e}")
             self._delete_current_session_state()
 
-    def _restore_session_from_state(self, state: Dict[str, Any]):
-        state.pop('worker_name', None)
-        state.pop('is_defective_only_session', None) 
-        
-        state['start_time'] = datetime.datetime.fromisoformat(state['start_time']) if state.get('start_time') else None
-        session_fields = InspectionSession.__dataclass_fields__
-        for field_name in session_fields:
-            if field_name not in state:
-                state[field_name] = session_fields[field_name].default_factory() if callable(session_fields[field_name].default_factory) else session_fields[field_name].default
-        
-        self.current_session = InspectionSession(**state)
+    def _restore_session_from_state(self, session: InspectionSession):
+        self.current_session = session
         self.current_session.is_restored_session = True
+        if self._is_large_tray():
+            # 복구한 스캔을 스냅샷에 합치고 새 저널로 이어 갑니다.
+            self._save_current_session_state()
         
         self.current_mode = "standard"
         self.show_status_message("이전 검사 작업을 복구했습니다.", self.COLOR_PRIMARY)
 
     def _delete_current_session_state(self):
+        self.scan_journal.delete()
         state_path = os.path.join(self.save_folder, self.CURRENT_TRAY_STATE_FILE)
-        if os.path.exists(state_path):
-            try: os.remove(state_path)
+        if os.path.exists(self.replicator.resolve(state_path)):
+            try: self.replicator.delete(state_path)
             except Exception as e: print(f"임시 세션 파일 삭제 실패: {e}")
 
     def _bind_focus_return_recursive(self, widget):
@@ -838,8 +1065,9 @@ class InspectionProgram:
         self._create_right_sidebar_content(self.right_pane)
         
         self.root.after(50, self._set_initial_sash_positions)
-        self._update_clock()
         self._start_idle_checker()
+        self.throughput_due = 0.0
+        self._start_ui_tick()
         self._update_all_summaries()
         
         self._apply_mode_ui()
@@ -881,6 +1109,7 @@ class InspectionProgram:
         buttons_frame = ttk.Frame(top_frame, style='Sidebar.TFrame')
         buttons_frame.grid(row=0, column=1, sticky='e')
         ttk.Button(buttons_frame, text="완료 현황 보기", command=self.show_completion_summary_window, style='Secondary.TButton').pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Button(buttons_frame, text="바코드 이력", command=self.show_barcode_trace_window, style='Secondary.TButton').pack(side=tk.LEFT, padx=(0, 5))
         ttk.Button(buttons_frame, text="작업자 변경", command=self.change_worker, style='Secondary.TButton').pack(side=tk.LEFT, padx=(0, 5))
 
         summary_container = ttk.Frame(parent_frame, style='Sidebar.TFrame')
@@ -889,7 +1118,7 @@ class InspectionProgram:
         summary_container.grid_rowconfigure(1, weight=1) 
         summary_container.grid_rowconfigure(3, weight=1) 
 
-        self.summary_title_label = ttk.Label(summary_container, text="금일 작업 현황", style='Subtle.TLabel', font=(self.DEFAULT_FONT, int(14 * self.scale_factor), 'bold'))
+        self.summary_title_label = ttk.Label(summary_container, text="금일 작업 현황", style='Subtle.TLabel', font=self._scaled_font(14, 'bold'))
         self.summary_title_label.grid(row=0, column=0, sticky='w', pady=(5, 5))
         good_tree_frame = ttk.Frame(summary_container, style='Sidebar.TFrame')
         good_tree_frame.grid(row=1, column=0, sticky='nsew', pady=(0, 10))
@@ -913,7 +1142,7 @@ class InspectionProgram:
 
         self.good_summary_tree.bind('<Configure>', lambda e, t=self.good_summary_tree: self._adjust_treeview_columns(t))
         
-        ttk.Label(summary_container, text="불량 현황", style='Subtle.TLabel', font=(self.DEFAULT_FONT, int(13 * self.scale_factor), 'bold')).grid(row=2, column=0, sticky='w', pady=(10, 5))
+        ttk.Label(summary_container, text="불량 현황", style='Subtle.TLabel', font=self._scaled_font(13, 'bold')).grid(row=2, column=0, sticky='w', pady=(10, 5))
         defect_tree_frame = ttk.Frame(summary_container, style='Sidebar.TFrame')
         defect_tree_frame.grid(row=3, column=0, sticky='nsew')
         defect_tree_frame.grid_columnconfigure(0, weight=1)
@@ -972,6 +1201,7 @@ class InspectionProgram:
         self.rework_mode_button.pack(side=tk.RIGHT, padx=(5,0))
 
         self.current_item_label = ttk.Label(parent_frame, text="", style='ItemInfo.TLabel', justify='center', anchor='center')
+        self.tray_photo_ref = None
         self.current_item_label.grid(row=1, column=0, sticky='ew', pady=(0, 20))
         
         view_container = ttk.Frame(parent_frame, style='TFrame')
@@ -1003,20 +1233,21 @@ class InspectionProgram:
         self.counter_frame = ttk.Frame(self.inspection_view_frame, style='TFrame')
         self.counter_frame.grid(row=1, column=0, pady=(0, 20))
         
-        self.good_count_label = ttk.Label(self.counter_frame, text="양품: 0", style='TLabel', foreground=self.COLOR_SUCCESS, font=(self.DEFAULT_FONT, int(14 * self.scale_factor), 'bold'))
+        self.good_count_label = ttk.Label(self.counter_frame, text="양품: 0", style='TLabel', foreground=self.COLOR_SUCCESS, font=self._scaled_font(14, 'bold'))
         tray_size = config.get('inspection.tray_size', 60)
         self.main_count_label = ttk.Label(self.counter_frame, text=f"0 / {tray_size}", style='MainCounter.TLabel', anchor='center')
-        self.defect_count_label = ttk.Label(self.counter_frame, text="불량: 0", style='TLabel', foreground=self.COLOR_DEFECT, font=(self.DEFAULT_FONT, int(14 * self.scale_factor), 'bold'))
+        self.defect_count_label = ttk.Label(self.counter_frame, text="불량: 0", style='TLabel', foreground=self.COLOR_DEFECT, font=self._scaled_font(14, 'bold'))
         
         self.good_count_label.pack(side=tk.LEFT, padx=20)
         self.main_count_label.pack(side=tk.LEFT, padx=20)
         self.defect_count_label.pack(side=tk.LEFT, padx=20)
 
-        self.scan_entry_inspection = tk.Entry(self.inspection_view_frame, justify='center', font=(self.DEFAULT_FONT, int(30 * self.scale_factor), 'bold'), bd=2, relief=tk.SOLID, highlightbackground=self.COLOR_BORDER, highlightcolor=self.COLOR_PRIMARY, highlightthickness=3)
+        self.scan_entry_inspection = tk.Entry(self.inspection_view_frame, justify='center', font=self._scaled_font(30, 'bold'), bd=2, relief=tk.SOLID, highlightbackground=self.COLOR_BORDER, highlightcolor=self.COLOR_PRIMARY, highlightthickness=3)
         self.scan_entry_inspection.grid(row=2, column=0, sticky='ew', ipady=int(15 * self.scale_factor), padx=30)
+        self._register_scaled_ipady(self.scan_entry_inspection, 15)
         self.scan_entry_inspection.bind('<Return>', self.process_scan)
         
-        self.defect_mode_indicator = ttk.Label(self.inspection_view_frame, text="", font=(self.DEFAULT_FONT, int(12 * self.scale_factor), 'bold'), anchor='center')
+        self.defect_mode_indicator = ttk.Label(self.inspection_view_frame, text="", font=self._scaled_font(12, 'bold'), anchor='center')
         self.defect_mode_indicator.grid(row=3, column=0, sticky='ew', pady=(5, 0), padx=30)
         
         self.list_paned_window = ttk.PanedWindow(self.inspection_view_frame, orient=tk.HORIZONTAL)
@@ -1074,7 +1305,7 @@ class InspectionProgram:
         rework_top_frame = ttk.Frame(self.rework_view_frame, style='TFrame')
         rework_top_frame.grid(row=0, column=0, sticky='ew', pady=(10, 5), padx=20)
         
-        self.rework_count_label = ttk.Label(rework_top_frame, text="금일 리워크 완료: 0개", style='TLabel', foreground=self.COLOR_REWORK, font=(self.DEFAULT_FONT, int(14 * self.scale_factor), 'bold'))
+        self.rework_count_label = ttk.Label(rework_top_frame, text="금일 리워크 완료: 0개", style='TLabel', foreground=self.COLOR_REWORK, font=self._scaled_font(14, 'bold'))
         self.rework_count_label.pack(side=tk.LEFT)
 
         rework_list_container = ttk.Frame(self.rework_view_frame, style='TFrame')
@@ -1082,7 +1313,7 @@ class InspectionProgram:
         rework_list_container.grid_columnconfigure(0, weight=1)
         rework_list_container.grid_rowconfigure(1, weight=1)
 
-        ttk.Label(rework_list_container, text="금일 리워크 완료 목록", font=(self.DEFAULT_FONT, int(12*self.scale_factor), 'bold'), foreground=self.COLOR_SUCCESS).grid(row=0, column=0)
+        ttk.Label(rework_list_container, text="금일 리워크 완료 목록", font=self._scaled_font(12, 'bold'), foreground=self.COLOR_SUCCESS).grid(row=0, column=0)
         
         reworked_frame = ttk.Frame(rework_list_container)
         reworked_frame.grid(row=1, column=0, sticky='nsew', padx=(5, 0))
@@ -1104,8 +1335,9 @@ class InspectionProgram:
         rework_bottom_frame.grid(row=2, column=0, sticky='ew', pady=(5, 10), padx=20)
         rework_bottom_frame.grid_columnconfigure(0, weight=1)
 
-        self.scan_entry_rework = tk.Entry(rework_bottom_frame, justify='center', font=(self.DEFAULT_FONT, int(30 * self.scale_factor), 'bold'), bd=2, relief=tk.SOLID, highlightbackground=self.COLOR_BORDER, highlightcolor=self.COLOR_REWORK, highlightthickness=3)
+        self.scan_entry_rework = tk.Entry(rework_bottom_frame, justify='center', font=self._scaled_font(30, 'bold'), bd=2, relief=tk.SOLID, highlightbackground=self.COLOR_BORDER, highlightcolor=self.COLOR_REWORK, highlightthickness=3)
         self.scan_entry_rework.grid(row=0, column=0, sticky='ew', ipady=int(15 * self.scale_factor))
+        self._register_scaled_ipady(self.scan_entry_rework, 15)
         self.scan_entry_rework.bind('<Return>', self.process_scan)
 
     def _create_remnant_view(self, container):
@@ -1116,9 +1348,9 @@ class InspectionProgram:
 
         remnant_info_frame = ttk.Frame(self.remnant_view_frame, style='TFrame')
         remnant_info_frame.grid(row=0, column=0, sticky='ew', pady=10, padx=20)
-        self.remnant_item_label = ttk.Label(remnant_info_frame, text="등록할 품목: (첫 제품 스캔 대기)", style='TLabel', foreground=self.COLOR_SPARE, font=(self.DEFAULT_FONT, int(14 * self.scale_factor), 'bold'))
+        self.remnant_item_label = ttk.Label(remnant_info_frame, text="등록할 품목: (첫 제품 스캔 대기)", style='TLabel', foreground=self.COLOR_SPARE, font=self._scaled_font(14, 'bold'))
         self.remnant_item_label.pack(side=tk.LEFT)
-        self.remnant_count_label = ttk.Label(remnant_info_frame, text="수량: 0", style='TLabel', font=(self.DEFAULT_FONT, int(14 * self.scale_factor), 'bold'))
+        self.remnant_count_label = ttk.Label(remnant_info_frame, text="수량: 0", style='TLabel', font=self._scaled_font(14, 'bold'))
         self.remnant_count_label.pack(side=tk.RIGHT)
 
         remnant_list_frame = ttk.Frame(self.remnant_view_frame)
@@ -1141,8 +1373,9 @@ class InspectionProgram:
         remnant_bottom_frame.grid(row=2, column=0, sticky='ew', pady=10, padx=20)
         remnant_bottom_frame.grid_columnconfigure(0, weight=1)
         
-        self.scan_entry_remnant = tk.Entry(remnant_bottom_frame, justify='center', font=(self.DEFAULT_FONT, int(30 * self.scale_factor), 'bold'), bd=2, relief=tk.SOLID, highlightbackground=self.COLOR_BORDER, highlightcolor=self.COLOR_SPARE, highlightthickness=3)
+        self.scan_entry_remnant = tk.Entry(remnant_bottom_frame, justify='center', font=self._scaled_font(30, 'bold'), bd=2, relief=tk.SOLID, highlightbackground=self.COLOR_BORDER, highlightcolor=self.COLOR_SPARE, highlightthickness=3)
         self.scan_entry_remnant.grid(row=0, column=0, sticky='ew', ipady=int(15 * self.scale_factor))
+        self._register_scaled_ipady(self.scan_entry_remnant, 15)
         self.scan_entry_remnant.bind('<Return>', self.process_scan)
 
         remnant_button_frame = ttk.Frame(self.remnant_view_frame, style='TFrame')
@@ -1167,7 +1400,7 @@ class InspectionProgram:
         left_frame.grid_columnconfigure(0, weight=1)
 
         # 미처리 불량품 목록
-        ttk.Label(left_frame, text="미처리 불량품 (더블클릭하여 합치기 시작)", style='TLabel', font=(self.DEFAULT_FONT, int(12 * self.scale_factor), 'bold')).grid(row=0, column=0, sticky='w')
+        ttk.Label(left_frame, text="미처리 불량품 (더블클릭하여 합치기 시작)", style='TLabel', font=self._scaled_font(12, 'bold')).grid(row=0, column=0, sticky='w')
         unprocessed_cols = ('item_name', 'item_code', 'count')
         self.unprocessed_defects_tree = ttk.Treeview(left_frame, columns=unprocessed_cols, show='headings')
         self.unprocessed_defects_tree.grid(row=1, column=0, sticky='nsew', pady=(5, 10))
@@ -1179,7 +1412,7 @@ class InspectionProgram:
         self.unprocessed_defects_tree.bind('<Double-1>', self.on_available_defect_double_click)
 
         # 처리완료 불량품 목록
-        ttk.Label(left_frame, text="생성된 불량표", style='TLabel', font=(self.DEFAULT_FONT, int(12 * self.scale_factor), 'bold')).grid(row=2, column=0, sticky='w', pady=(10, 0))
+        ttk.Label(left_frame, text="생성된 불량표", style='TLabel', font=self._scaled_font(12, 'bold')).grid(row=2, column=0, sticky='w', pady=(10, 0))
         processed_cols = ('defect_id', 'item_name', 'count', 'creation_date')
         self.processed_defects_tree = ttk.Treeview(left_frame, columns=processed_cols, show='headings')
         self.processed_defects_tree.grid(row=3, column=0, sticky='nsew', pady=(5, 0))
@@ -1214,8 +1447,9 @@ class InspectionProgram:
         self.defect_target_qty_spinbox.pack(side=tk.LEFT, padx=(5, 15))
 
 
-        self.scan_entry_defective = tk.Entry(merge_frame, justify='center', font=(self.DEFAULT_FONT, int(16 * self.scale_factor), 'bold'), bd=2, relief=tk.SOLID, highlightbackground=self.COLOR_BORDER, highlightcolor=self.COLOR_DEFECT, highlightthickness=3)
+        self.scan_entry_defective = tk.Entry(merge_frame, justify='center', font=self._scaled_font(16, 'bold'), bd=2, relief=tk.SOLID, highlightbackground=self.COLOR_BORDER, highlightcolor=self.COLOR_DEFECT, highlightthickness=3)
         self.scan_entry_defective.grid(row=3, column=0, sticky='ew', ipady=int(8 * self.scale_factor), pady=(5,0))
+        self._register_scaled_ipady(self.scan_entry_defective, 8)
         self.scan_entry_defective.bind('<Return>', self.process_scan)
 
         scanned_list_frame = ttk.LabelFrame(merge_frame, text="스캔된 바코드 목록", style='TFrame', padding=5)
@@ -1236,6 +1470,8 @@ class InspectionProgram:
         self.generate_defect_label_button = ttk.Button(bottom_button_frame, text="불량표 생성", command=self.generate_defective_label, state=tk.DISABLED)
         self.generate_defect_label_button.pack(side=tk.LEFT, padx=5)
 
+        ttk.Button(left_frame, text="라벨 일괄 재발행 (PDF)", command=self._show_label_reissue_dialog).grid(row=4, column=0, sticky='e', pady=(5, 0))
+
     def _create_exchange_view(self, container):
         """개별 제품 교환 모드의 UI를 생성합니다."""
         self.exchange_view_frame = ttk.Frame(container, style='TFrame')
@@ -1249,22 +1485,22 @@ class InspectionProgram:
         exchange_info_frame.grid_columnconfigure(1, weight=1)
 
         # 수량 선택
-        ttk.Label(exchange_info_frame, text="교환할 수량:", style='TLabel', font=(self.DEFAULT_FONT, int(12 * self.scale_factor), 'bold')).grid(row=0, column=0, sticky='w', padx=(0, 10))
+        ttk.Label(exchange_info_frame, text="교환할 수량:", style='TLabel', font=self._scaled_font(12, 'bold')).grid(row=0, column=0, sticky='w', padx=(0, 10))
 
         quantity_frame = ttk.Frame(exchange_info_frame)
         quantity_frame.grid(row=0, column=1, sticky='w')
 
         self.exchange_quantity_var = tk.IntVar(value=1)
         self.exchange_quantity_spin = ttk.Spinbox(quantity_frame, from_=1, to=10, textvariable=self.exchange_quantity_var, width=5,
-                                                 command=self._on_exchange_quantity_change, font=(self.DEFAULT_FONT, int(12 * self.scale_factor)))
+                                                 command=self._on_exchange_quantity_change, font=self._scaled_font(12))
         self.exchange_quantity_spin.pack(side=tk.LEFT, padx=(0, 10))
 
-        ttk.Label(quantity_frame, text="개", style='TLabel', font=(self.DEFAULT_FONT, int(12 * self.scale_factor))).pack(side=tk.LEFT)
+        ttk.Label(quantity_frame, text="개", style='TLabel', font=self._scaled_font(12)).pack(side=tk.LEFT)
 
         # 상태 라벨
         self.exchange_status_label = ttk.Label(self.exchange_view_frame, text="교환할 수량을 선택한 후 불량품을 스캔하세요.",
                                              style='TLabel', foreground=self.COLOR_PRIMARY,
-                                             font=(self.DEFAULT_FONT, int(14 * self.scale_factor), 'bold'))
+                                             font=self._scaled_font(14, 'bold'))
         self.exchange_status_label.grid(row=1, column=0, pady=10)
 
         # 중단: 교환 목록 프레임
@@ -1324,8 +1560,9 @@ class InspectionProgram:
         self.exchange_cancel_button.pack(side=tk.LEFT, padx=5)
 
         # 스캔 엔트리 추가
-        self.scan_entry_exchange = tk.Entry(self.exchange_view_frame, justify='center', font=(self.DEFAULT_FONT, int(16 * self.scale_factor), 'bold'), bd=2, relief=tk.SOLID, highlightbackground=self.COLOR_BORDER, highlightcolor=self.COLOR_PRIMARY, highlightthickness=3)
+        self.scan_entry_exchange = tk.Entry(self.exchange_view_frame, justify='center', font=self._scaled_font(16, 'bold'), bd=2, relief=tk.SOLID, highlightbackground=self.COLOR_BORDER, highlightcolor=self.COLOR_PRIMARY, highlightthickness=3)
         self.scan_entry_exchange.grid(row=4, column=0, sticky='ew', ipady=int(8 * self.scale_factor), pady=10, padx=20)
+        self._register_scaled_ipady(self.scan_entry_exchange, 8)
         self.scan_entry_exchange.bind('<Return>', self.process_scan)
 
     def on_available_defect_double_click(self, event=None):
@@ -1440,7 +1677,7 @@ class InspectionProgram:
             temp_session.scanned_defects = list(self.available_defects[defect_key]['barcodes'])
 
             # 품목 정보 조회
-            matched_item = next((item for item in self.items_data if item.get('Item Code') == item_code), None)
+            matched_item = self.item_master.get(item_code)
             if matched_item:
                 temp_session.item_name = matched_item.get('Item Name', item_code)
                 temp_session.item_spec = matched_item.get('Specifications', '')
@@ -1484,16 +1721,16 @@ class InspectionProgram:
         parent_frame.grid_columnconfigure(0, weight=1)
         parent_frame['padding'] = (10, 10)
         
-        self.date_label = ttk.Label(parent_frame, style='Sidebar.TLabel', font=(self.DEFAULT_FONT, int(18 * self.scale_factor), 'bold'))
+        self.date_label = ttk.Label(parent_frame, style='Sidebar.TLabel', font=self._scaled_font(18, 'bold'))
         self.date_label.grid(row=0, column=0, pady=(0, 5))
-        self.clock_label = ttk.Label(parent_frame, style='Sidebar.TLabel', font=(self.DEFAULT_FONT, int(24 * self.scale_factor), 'bold'))
+        self.clock_label = ttk.Label(parent_frame, style='Sidebar.TLabel', font=self._scaled_font(24, 'bold'))
         self.clock_label.grid(row=1, column=0, pady=(0, 20))
         
         delay_frame = ttk.Frame(parent_frame, style='Card.TFrame', padding=10)
         delay_frame.grid(row=2, column=0, sticky='ew', pady=10)
         delay_frame.grid_columnconfigure(1, weight=1)
         ttk.Label(delay_frame, text="⚙️ 스캔 딜레이 (초):", style='Subtle.TLabel', background=self.COLOR_SIDEBAR_BG).grid(row=0, column=0, sticky='w', padx=(0, 10))
-        delay_spinbox = ttk.Spinbox(delay_frame, from_=0.0, to=5.0, increment=0.5, textvariable=self.scan_delay_sec, width=6, font=(self.DEFAULT_FONT, int(12 * self.scale_factor)))
+        delay_spinbox = ttk.Spinbox(delay_frame, from_=0.0, to=5.0, increment=0.5, textvariable=self.scan_delay_sec, width=6, font=self._scaled_font(12))
         delay_spinbox.grid(row=0, column=1, sticky='e')
 
         self.info_cards = {
@@ -1511,9 +1748,19 @@ class InspectionProgram:
         best_time_card['label'].config(style='Velvet.Subtle.TLabel')
         best_time_card['value'].config(style='Velvet.Value.TLabel')
         
-        parent_frame.grid_rowconfigure(len(self.info_cards) + 4, weight=1)
+        self._create_throughput_panel(parent_frame).grid(row=len(self.info_cards) + 3, column=0, sticky='ew', pady=10)
+
+        self.remnant_suggestion_frame = ttk.Frame(parent_frame, style='Card.TFrame', padding=10)
+        self.remnant_suggestion_frame.grid(row=len(self.info_cards) + 4, column=0, sticky='ew', pady=10)
+        ttk.Label(self.remnant_suggestion_frame, text="📦 사용 가능한 잔량 (오래된 순)", style='Subtle.TLabel').pack(anchor='w')
+        self.remnant_suggestion_label = ttk.Label(self.remnant_suggestion_frame, text="-", style='Subtle.TLabel',
+                                                  font=self._scaled_font(10), foreground=self.COLOR_SPARE, justify='left')
+        self.remnant_suggestion_label.pack(anchor='w', pady=(5, 0))
+        self.remnant_suggestion_frame.grid_remove()
+
+        parent_frame.grid_rowconfigure(len(self.info_cards) + 5, weight=1)
         legend_frame = ttk.Frame(parent_frame, style='Sidebar.TFrame', padding=(0, 15))
-        legend_frame.grid(row=len(self.info_cards) + 5, column=0, sticky='sew')
+        legend_frame.grid(row=len(self.info_cards) + 6, column=0, sticky='sew')
         ttk.Label(legend_frame, text="범례:", style='Subtle.TLabel').pack(anchor='w')
         ttk.Label(legend_frame, text="🟩 양품", style='Sidebar.TLabel', foreground=self.COLOR_SUCCESS).pack(anchor='w')
         ttk.Label(legend_frame, text="🟥 불량", style='Sidebar.TLabel', foreground=self.COLOR_DEFECT).pack(anchor='w')
@@ -1530,6 +1777,46 @@ class InspectionProgram:
         except tk.TclError:
             print("Note: Custom treeview heading colors may not be supported on this OS.")
 
+    def _create_throughput_panel(self, parent: ttk.Frame) -> ttk.Frame:
+        panel = ttk.Frame(parent, style='Card.TFrame', padding=10)
+        ttk.Label(panel, text="📈 최근 처리량", style='Subtle.TLabel').grid(row=0, column=0, columnspan=5, pady=(0, 5))
+        columns = [('pieces_per_min', "EA/분"), ('trays_per_hour', "트레이/시"), ('defect_rate', "불량률"), ('idle_share', "대기")]
+        for col, (_, title) in enumerate(columns, 1):
+            ttk.Label(panel, text=title, style='Subtle.TLabel', font=self._scaled_font(9)).grid(row=1, column=col, padx=4)
+            panel.grid_columnconfigure(col, weight=1)
+
+        self.throughput_labels = {}
+        for row, window in enumerate(self.throughput.windows_min, 2):
+            window_text = f"{window // 60}시간" if window % 60 == 0 else f"{window}분"
+            ttk.Label(panel, text=window_text, style='Subtle.TLabel', font=self._scaled_font(9)).grid(row=row, column=0, sticky='w')
+            self.throughput_labels[window] = {}
+            for col, (key, _) in enumerate(columns, 1):
+                value = ttk.Label(panel, text="-", style='Subtle.TLabel', font=self._scaled_font(10, 'bold'))
+                value.grid(row=row, column=col, padx=4)
+                self.throughput_labels[window][key] = value
+        return panel
+
+    def _refresh_throughput_panel(self):
+        """처리량 패널을 갱신합니다. (통합 타이머가 ui.throughput_refresh_ms 간격으로 호출, 스캔 직후에는 다음 틱으로 미룸)"""
+        if not self.root.winfo_exists(): return
+        now_mono = time.monotonic()
+        if self.last_activity_mono is not None and now_mono - self.last_activity_mono < 0.5:
+            self.throughput_due = now_mono
+            return
+        self.throughput_due = now_mono + max(1000, int(config.get('ui.throughput_refresh_ms', 5000))) / 1000
+
+        for window, rates in self.throughput.snapshot().items():
+            labels = self.throughput_labels.get(window)
+            if not labels or not labels['pieces_per_min'].winfo_exists(): continue
+            texts = {
+                'pieces_per_min': f"{rates['pieces_per_min']:.1f}",
+                'trays_per_hour': f"{rates['trays_per_hour']:.1f}",
+                'defect_rate': "-" if rates['defect_rate'] is None else f"{rates['defect_rate']:.1%}",
+                'idle_share': f"{rates['idle_share']:.0%}",
+            }
+            for key, text in texts.items():
+                if labels[key]['text'] != text: labels[key]['text'] = text
+
     def _create_info_card(self, parent: ttk.Frame, label_text: str) -> Dict[str, ttk.Widget]:
         card = ttk.Frame(parent, style='Card.TFrame', padding=20)
         label = ttk.Label(card, text=label_text, style='Subtle.TLabel')
@@ -1598,76 +1885,34 @@ class InspectionProgram:
         self.show_status_message("전체 불량 데이터를 불러오는 중...", self.COLOR_PRIMARY)
         self.root.update_idletasks()
 
-        # 1. 모든 '처리된' 불량품 바코드 목록 생성 (defects_merged 폴더의 .json 파일 기준)
-        processed_barcodes = set()
-        if os.path.exists(self.defects_data_folder):
-            for root, _, files in os.walk(self.defects_data_folder):
-                for filename in files:
-                    if filename.endswith('.json'):
-                        try:
-                            with open(os.path.join(root, filename), 'r', encoding='utf-8') as f:
-                                data = json.load(f)
-                                processed_barcodes.update(data.get('barcodes', []))
-                        except (json.JSONDecodeError, IOError) as e:
-                            print(f"불량 데이터 파일 '{filename}' 처리 중 오류: {e}")
-
-        # 2. 리워크되어 더 이상 불량이 아닌 바코드 목록 생성
-        reworked_barcodes = set()
-        rework_log_pattern = re.compile(r"리워크작업이벤트로그_.*\.csv")
-        for filename in os.listdir(self.save_folder):
-            if rework_log_pattern.match(filename):
-                try:
-                    with open(os.path.join(self.save_folder, filename), 'r', encoding='utf-8-sig') as f:
-                        reader = csv.DictReader(f)
-                        for row in reader:
-                            if row.get('event') == 'REWORK_SUCCESS':
-                                details = json.loads(row.get('details', '{}'))
-                                if 'barcode' in details:
-                                    reworked_barcodes.add(details['barcode'])
-                except Exception as e:
-                    print(f"리워크 로그 파일 '{filename}' 처리 중 오류: {e}")
+        if self._refresh_defective_items():
+            self.show_status_message("불량 데이터 로드 완료.", self.COLOR_SUCCESS)
+
+    def _refresh_defective_items(self) -> bool:
+        """불량 원장 색인(메모리)으로 처리/미처리 불량품 목록을 다시 만듭니다.
+
+        색인을 처음 만드는 중이면 안내만 하고 False 를 반환합니다. (완료되면 _warm_defect_ledger 가 다시 호출)
+        """
+        if not self._index_ready('defect_ledger'):
+            self.show_status_message("불량 데이터를 불러오는 중...", self.COLOR_PRIMARY, duration=60000)
+            return False
+        # 이 스테이션의 로그는 동기화 폴더 반영 전이라도 바로 보이도록 직접 확인합니다.
+        self.defect_ledger.apply([path for path in (self.log_file_path, self.rework_log_file_path) if path])
 
-        # 3. 모든 검사 로그에서 'INSPECTION_DEFECTIVE' 이벤트를 찾아 처리/미처리로 분류
         all_defects = {}
-        inspection_log_pattern = re.compile(r"검사작업이벤트로그_.*\.csv")
-        for filename in os.listdir(self.save_folder):
-            if inspection_log_pattern.match(filename):
-                try:
-                    with open(os.path.join(self.save_folder, filename), 'r', encoding='utf-8-sig') as f:
-                        reader = csv.DictReader(f)
-                        for row in reader:
-                            if row.get('event') == 'INSPECTION_DEFECTIVE':
-                                details = json.loads(row.get('details', '{}'))
-                                barcode = details.get('barcode')
-
-                                # 유효하지 않거나 리워크된 바코드는 건너뜀
-                                if not barcode or barcode in reworked_barcodes:
-                                    continue
-
-                                item_code = details.get('item_code')
-                                if not item_code: continue
-
-                                if item_code not in all_defects:
-                                    matched_item = next((i for i in self.items_data if i['Item Code'] == item_code), None)
-                                    all_defects[item_code] = {
-                                        'item_code': item_code,
-                                        'name': matched_item.get('Item Name', '알수없음') if matched_item else '알수없음',
-                                        'spec': matched_item.get('Spec', '') if matched_item else '',
-                                        'unprocessed_barcodes': set(),
-                                        'processed_barcodes': set()
-                                    }
-
-                                # 처리/미처리 여부 판단
-                                if barcode in processed_barcodes:
-                                    all_defects[item_code]['processed_barcodes'].add(barcode)
-                                else:
-                                    all_defects[item_code]['unprocessed_barcodes'].add(barcode)
-                except Exception as e:
-                    print(f"검사 로그 파일 '{filename}' 처리 중 오류: {e}")
+        for item_code, barcodes in self.defect_ledger.summary().items():
+            matched_item = self.item_master.get(item_code)
+            all_defects[item_code] = {
+                'item_code': item_code,
+                'name': matched_item.get('Item Name', '알수없음') if matched_item else '알수없음',
+                'spec': matched_item.get('Spec', '') if matched_item else '',
+                'unprocessed_barcodes': barcodes['unprocessed_barcodes'],
+                'processed_barcodes': barcodes['processed_barcodes']
+            }
 
         self.available_defects = all_defects
         self._update_defective_mode_ui()
-        self.show_status_message("불량 데이터 로드 완료.", self.COLOR_SUCCESS)
+        return True
 
     def _load_and_display_defect_sheets(self):
         """오늘 생성된 불량표(.json)를 읽어 '생성된 불량표' 목록을 업데이트합니다."""
@@ -1677,17 +1922,7 @@ class InspectionProgram:
         today_str = datetime.date.today().strftime('%Y-%m-%d')
         daily_defects_path = os.path.join(self.defects_data_folder, today_str)
 
-        if not os.path.exists(daily_defects_path):
-            return
-
-        defect_sheets = []
-        for filename in os.listdir(daily_defects_path):
-            if filename.endswith('.json'):
-                try:
-                    with open(os.path.join(daily_defects_path, filename), 'r', encoding='utf-8') as f:
-                        defect_sheets.append(json.load(f))
-                except (IOError, json.JSONDecodeError):
-                    continue
+        defect_sheets = [record for _, record in self.defect_ledger.records.items(daily_defects_path)]
 
         # 최신순으로 정렬
         defect_sheets.sort(key=lambda x: x.get('creation_date', ''), reverse=True)
@@ -1767,15 +2002,10 @@ class InspectionProgram:
 
         # 세션에 품목 코드가 없는 경우: 첫 스캔으로 품목 자동 설정
         if not session.item_code:
-            detected_item_code = None
-            for item in self.items_data:
-                item_code = item.get('Item Code')
-                if item_code and item_code in barcode:
-                    detected_item_code = item_code
-                    break
+            detected_item_code = self.item_master.find_code_in_barcode(barcode)
 
             if detected_item_code:
-                matched_item = next((item for item in self.items_data if item['Item Code'] == detected_item_code), None)
+                matched_item = self.item_master.get(detected_item_code)
                 if matched_item:
                     session.item_code = detected_item_code
                     session.item_name = matched_item.get('Item Name', '')
@@ -1858,22 +2088,6 @@ class InspectionProgram:
         now = datetime.datetime.now()
         defect_box_id = f"DEFECT-{now.strftime('%Y%m%d-%H%M%S%f')}"
 
-        try:
-            image_path = self._generate_defective_label_image(
-                defect_box_id=defect_box_id,
-                item_code=session.item_code,
-                item_name=session.item_name,
-                item_spec=session.item_spec,
-                quantity=len(session.scanned_defects),
-                worker_name=self.worker_name,
-                creation_date=now.strftime('%Y-%m-%d %H:%M:%S')
-            )
-            if sys.platform == "win32":
-                os.startfile(image_path)
-        except Exception as e:
-            messagebox.showerror("라벨 생성 오류", f"불량표 라벨 이미지 생성 중 오류가 발생했습니다: {e}")
-            return
-
         defect_data = {
             "defect_box_id": defect_box_id,
             "creation_date": now.isoformat(),
@@ -1885,10 +2099,10 @@ class InspectionProgram:
             "barcodes": session.scanned_defects
         }
         try:
-            daily_data_path = self._get_daily_folder_path(self.defects_data_folder)
+            daily_data_path = self._get_daily_folder_path(self.defects_data_folder, create=False)
             filepath = os.path.join(daily_data_path, f"{defect_box_id}.json")
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(defect_data, f, ensure_ascii=False, indent=4)
+            self.replicator.write_json(filepath, defect_data, ensure_ascii=False, indent=4)
+            self.defect_ledger.apply([filepath])
         except Exception as e:
             if True:
                 messagebox.showerror("저장 오류", f"불량표 데이터 파일 저장 중 오류가 발생했습니다: {e}")
@@ -1896,7 +2110,8 @@ class InspectionProgram:
 
         self._log_event('DEFECT_MERGE_COMPLETE', detail=defect_data)
 
-        messagebox.showinfo("생성 완료", f"불량표 생성이 완료되었습니다.\n\n불량상자 ID: {defect_box_id}")
+        self._submit_label_render('defective', defect_data)
+        self.show_status_message(f"불량표 생성 완료 (불량상자 ID: {defect_box_id}). 라벨을 출력 중입니다...", self.COLOR_SUCCESS)
 
         # 세션 초기화
         self.current_defective_merge_session = DefectiveMergeSession()
@@ -1909,71 +2124,210 @@ class InspectionProgram:
         # 불량표 생성 완료를 반환값으로 알림 (테스트용)
         return defect_box_id
 
-    def _generate_defective_label_image(self, defect_box_id, item_code, item_name, item_spec, quantity, worker_name, creation_date):
-        """'불량표' 라벨 이미지를 생성합니다."""
-        config = {
-            'size': (800, 400), 'bg_color': "#FADBD8", 'text_color': "#C0392B", 'padding': 30,
-            'font_path': "C:/Windows/Fonts/malgunbd.ttf",
-            'font_sizes': {'title': 60, 'header': 32, 'body': 34, 'quantity': 70, 'unit': 32, 'footer': 16,},
-            'qr_code': {'size': 220, 'box_size': 10, 'border': 4,},
-            'layout': {
-                'title_top_margin': 25, 'header_line_margin': 15, 'content_top_margin': 30,
-                'table_line_height': 48, 'table_header_x': 50, 'table_value_x': 180,
-                'footer_bottom_margin': 40, 'footer_line_margin': 15,
-            }
-        }
-        W, H = config['size']
+    def _dispatch_to_ui(self, callback):
+        """백그라운드 스레드의 콜백을 Tk 메인 스레드에서 실행하도록 넘깁니다.
+
+        root.after 를 다른 스레드에서 부르면 Tk 가 이벤트를 처리하지 않는 동안(종료 대기 등) 호출 스레드가 멈추므로
+        큐에만 넣고, Tk 스레드가 _drain_ui_calls 로 주기적으로 꺼내 실행합니다.
+        """
+        self.ui_calls.put(callback)
+
+    def _drain_ui_calls(self):
+        """(Tk 스레드) 대기 중인 백그라운드 콜백을 실행합니다."""
+        self.ui_dispatch_job = None
+        while True:
+            try:
+                callback = self.ui_calls.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                callback()
+            except Exception as e:
+                print(f"UI 콜백 실행 오류: {e}")
+        if self.root.winfo_exists():
+            self.ui_dispatch_job = self.root.after(self.UI_DISPATCH_POLL_MS, self._drain_ui_calls)
+
+    def _discard_ui_calls(self):
+        """(종료 시) 대기 중인 백그라운드 콜백을 실행하지 않고 버립니다."""
+        while True:
+            try:
+                self.ui_calls.get_nowait()
+            except queue.Empty:
+                break
 
-        fonts = {}
+    def _create_label_printer(self):
+        """config.json의 label.printer 설정으로 라벨 프린터(ZPL) 출력을 준비합니다. 미설정 시 None."""
         try:
-            for name, size in config['font_sizes'].items():
-                fonts[name] = ImageFont.truetype(config['font_path'], size)
-        except IOError:
-            for name in config['font_sizes']: fonts[name] = ImageFont.load_default()
-
-        qr_data = json.dumps({'id': defect_box_id, 'code': item_code, 'qty': quantity})
-        qr = qrcode.QRCode(version=1, box_size=config['qr_code']['box_size'], border=config['qr_code']['border'])
-        qr.add_data(qr_data)
-        qr.make(fit=True)
-        qr_img = qr.make_image(fill_color=config['text_color'], back_color=config['bg_color']).resize((config['qr_code']['size'], config['qr_code']['size']))
-
-        img = Image.new('RGB', (W, H), config['bg_color'])
-        draw = ImageDraw.Draw(img)
-
-        title_text = "불 량 표"
-        title_bbox = draw.textbbox((0, 0), title_text, font=fonts['title'])
-        title_w, title_h = title_bbox[2] - title_bbox[0], title_bbox[3] - title_bbox[1]
-        draw.text(((W - title_w) / 2, config['layout']['title_top_margin']), title_text, font=fonts['title'], fill=config['text_color'])
-        line_y = config['layout']['title_top_margin'] + title_h + config['layout']['header_line_margin']
-        draw.line([(30, line_y), (W - 30, line_y)], fill=config['text_color'], width=3)
-
-        info_items = [
-            {'label': "품 목 명", 'value': f": {item_name}"},
-            {'label': "품목코드", 'value': f": {item_code}"},
-            {'label': "규    격", 'value': f": {item_spec}"},
-        ]
-        y_pos = line_y + config['layout']['content_top_margin']
-        for item in info_items:
-            draw.text((config['layout']['table_header_x'], y_pos), item['label'], font=fonts['header'], fill=config['text_color'])
-            draw.text((config['layout']['table_value_x'], y_pos), item['value'], font=fonts['body'], fill=config['text_color'])
-            y_pos += config['layout']['table_line_height']
+            return create_label_printer(
+                backend=config.get('label.printer.backend', 'none'),
+                spool_dir=config.get('label.printer.spool_dir', ''),
+                host=config.get('label.printer.host', ''),
+                port=config.get('label.printer.port', 9100),
+                printer_font=config.get('label.printer.font', ''),
+                timeout=config.get('label.printer.timeout', 5.0),
+            )
+        except ConfigurationError as e:
+            print(f"라벨 프린터 설정 오류: {e}")
+            return None
 
-        draw.text((config['layout']['table_header_x'], y_pos), "수    량", font=fonts['header'], fill=config['text_color'])
-        qty_text = str(quantity)
-        draw.text((config['layout']['table_value_x'], y_pos-10), f": {qty_text}", font=fonts['quantity'], fill=config['text_color'], stroke_width=1)
-        draw.text((config['layout']['table_value_x'] + draw.textlength(f": {qty_text}", font=fonts['quantity']) + 5, y_pos), "EA", font=fonts['unit'], fill=config['text_color'])
+    def _open_file(self, path: str):
+        """파일을 OS 기본 프로그램으로 엽니다."""
+        try:
+            if sys.platform == "win32":
+                os.startfile(path)
+            else:
+                subprocess.run(['xdg-open', path])
+        except Exception as e:
+            messagebox.showerror("파일 열기 오류", f"이미지를 열 수 없습니다: {e}")
+
+    def _warn_label_font_fallback(self, template_name: str):
+        if self.label_renderer.used_fallback_font and not self.label_font_warning_shown:
+            self.label_font_warning_shown = True
+            messagebox.showwarning("폰트 오류", f"{LABEL_TEMPLATES[template_name].font_path} 폰트를 찾을 수 없습니다. 기본 폰트로 생성합니다.")
+
+    def _submit_label_render(self, template_name: str, record: Dict[str, Any]):
+        """저장된 불량표/잔량표 레코드(JSON)의 라벨 출력을 백그라운드 큐에 넣습니다.
+
+        라벨 프린터가 설정되어 있으면 프린터로 바로 출력하고, 아니면 이미지를 생성해 엽니다.
+        """
+        fields = label_fields_from_record(template_name, record)
+        label_id = fields['label_id']
+        label_name = "불량표" if template_name == 'defective' else "잔량표"
+
+        def on_done(job):
+            if job.printed_to:
+                self.show_status_message(f"{label_name} 라벨 출력 완료: {label_id}", self.COLOR_SUCCESS)
+                return
+            if job.print_error is not None:
+                messagebox.showwarning("라벨 출력 실패", f"{label_name} 프린터 출력에 실패했습니다: {job.print_error}\n\n라벨 이미지를 열어 수동으로 출력해주세요.")
+            self._warn_label_font_fallback(template_name)
+            if sys.platform == "win32":
+                self._open_file(job.output_path)
+            self.show_status_message(f"{label_name} 라벨 이미지 생성 완료: {label_id}", self.COLOR_SUCCESS)
+
+        def on_error(error):
+            messagebox.showwarning("이미지 생성 실패", f"{label_name} 라벨 이미지 생성에 실패했습니다: {error}\n\n데이터는 저장되었습니다. (ID: {label_id})")
+
+        self.label_queue.submit(template_name, fields, on_done, on_error, print_label=True)
+
+    def _open_label_image(self, template_name: str, record: Dict[str, Any]):
+        """레코드의 라벨 이미지를 (캐시에 없으면 생성하여) 엽니다."""
+        def on_done(job):
+            self._warn_label_font_fallback(template_name)
+            self._open_file(job.output_path)
 
-        footer_y = H - config['layout']['footer_bottom_margin']
-        draw.line([(30, footer_y - config['layout']['footer_line_margin']), (W - 30, footer_y - config['layout']['footer_line_margin'])], fill=config['text_color'], width=1)
-        footer_text = f"ID: {defect_box_id} | 생성일: {creation_date} | 작업자: {worker_name}"
-        draw.text((config['padding'], footer_y), footer_text, font=fonts['footer'], fill=config['text_color'])
+        def on_error(error):
+            messagebox.showerror("이미지 생성 실패", f"라벨 이미지를 생성할 수 없습니다: {error}")
+
+        self.label_queue.submit(template_name, label_fields_from_record(template_name, record), on_done, on_error)
+
+    def _load_label_record(self, label_id: str) -> Optional[tuple]:
+        """라벨 ID(DEFECT-/SPARE-)로 (템플릿 이름, JSON 레코드)를 찾습니다. 없으면 None."""
+        if label_id.startswith('DEFECT-'):
+            template_name, filepath = 'defective', self._find_defective_label_data_file(label_id)
+        elif label_id.startswith('SPARE-'):
+            template_name, filepath = 'remnant', self.replicator.resolve(os.path.join(self.remnants_folder, f"{label_id}.json"))
+        else:
+            return None
+        if not filepath or not os.path.exists(filepath):
+            return None
+        try:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                return template_name, json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"라벨 데이터 로드 실패 ({label_id}): {e}")
+            return None
+
+    def _show_label_reissue_dialog(self):
+        """불량표/잔량표 ID 목록을 받아 라벨을 한 PDF로 일괄 재발행하는 창을 표시합니다."""
+        win = tk.Toplevel(self.root)
+        win.title("라벨 일괄 재발행")
+        win.geometry("520x520")
+        win.transient(self.root)
+
+        frame = ttk.Frame(win, padding=15)
+        frame.pack(fill=tk.BOTH, expand=True)
+        frame.grid_columnconfigure(0, weight=1)
+        frame.grid_rowconfigure(1, weight=1)
+
+        ttk.Label(frame, text="재발행할 불량표/잔량표 ID를 한 줄에 하나씩 입력하거나 스캔하세요.", style='TLabel', wraplength=480).grid(row=0, column=0, sticky='w')
+        ids_text = tk.Text(frame, height=15, font=self._scaled_font(10))
+        ids_text.grid(row=1, column=0, sticky='nsew', pady=(5, 10))
+        if hasattr(self, 'processed_defects_tree'):
+            selected = [self.processed_defects_tree.item(i, 'values')[0] for i in self.processed_defects_tree.selection()]
+            if selected:
+                ids_text.insert('1.0', "\n".join(selected))
+
+        progress_bar = ttk.Progressbar(frame, orient='horizontal', mode='determinate')
+        progress_bar.grid(row=2, column=0, sticky='ew')
+        progress_label = ttk.Label(frame, text="", style='Subtle.TLabel')
+        progress_label.grid(row=3, column=0, sticky='w', pady=(2, 10))
+
+        button_frame = ttk.Frame(frame)
+        button_frame.grid(row=4, column=0, sticky='ew')
+
+        def on_progress(done, total):
+            if progress_bar.winfo_exists():
+                progress_bar.config(maximum=total, value=done)
+                progress_label.config(text=f"{done} / {total}")
+
+        def start():
+            label_ids = list(dict.fromkeys(line.strip() for line in ids_text.get('1.0', tk.END).splitlines() if line.strip()))
+            if not label_ids:
+                messagebox.showwarning("입력 오류", "재발행할 라벨 ID를 입력하세요.", parent=win)
+                return
+            start_button.config(state=tk.DISABLED)
+            progress_label.config(text="라벨 데이터를 찾는 중...")
+            self.reissue_labels_batch(label_ids, on_progress=on_progress,
+                                      on_finished=lambda: start_button.winfo_exists() and start_button.config(state=tk.NORMAL))
+
+        start_button = ttk.Button(button_frame, text="PDF 생성", command=start)
+        start_button.pack(side=tk.LEFT)
+        ttk.Button(button_frame, text="닫기", command=win.destroy).pack(side=tk.RIGHT)
+
+    def reissue_labels_batch(self, label_ids: List[str], on_progress=None, on_finished=None):
+        """라벨 여러 장을 백그라운드에서 프로세스 풀로 렌더링하여 한 PDF로 저장한 뒤 엽니다."""
+        batch_dir = os.path.join(self.config_folder, self.CACHE_DIR, 'label_batches')
+        output_path = os.path.join(batch_dir, f"라벨재발행_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf")
+
+        def finish(pdf_path, found_ids, missing_ids, error=None):
+            if on_finished:
+                on_finished()
+            if error is not None:
+                messagebox.showerror("일괄 재발행 실패", f"라벨 PDF 생성 중 오류가 발생했습니다: {error}")
+                return
+            if missing_ids:
+                messagebox.showwarning("일부 라벨 없음", "다음 라벨의 데이터를 찾을 수 없어 제외했습니다:\n\n" + "\n".join(missing_ids[:20]))
+            if not pdf_path:
+                return
+            self._log_event('LABEL_BATCH_REISSUED', detail={'label_ids': found_ids, 'missing_ids': missing_ids, 'pdf_path': pdf_path})
+            self.show_status_message(f"라벨 {len(found_ids)}장 재발행 PDF 생성 완료", self.COLOR_SUCCESS)
+            self._open_file(pdf_path)
 
-        img.paste(qr_img, (W - config['qr_code']['size'] - config['padding'], line_y + config['layout']['content_top_margin']))
+        def worker():
+            found_ids, missing_ids, jobs = [], [], []
+            try:
+                prune_batches(batch_dir, float(config.get('label.batch_keep_days', 7)),
+                              int(config.get('label.batch_keep_count', 20)))
+                for label_id in label_ids:
+                    loaded = self._load_label_record(label_id)
+                    if loaded is None:
+                        missing_ids.append(label_id)
+                        continue
+                    template_name, record = loaded
+                    found_ids.append(label_id)
+                    jobs.append((template_name, label_fields_from_record(template_name, record)))
+                pdf_path = None
+                if jobs:
+                    progress = (lambda d, t: self._dispatch_to_ui(lambda: on_progress(d, t))) if on_progress else None
+                    # 작업 프로세스가 앱 모듈을 다시 읽지 않도록 별도 프로세스에서 렌더링합니다.
+                    pdf_path = render_labels_to_pdf_isolated(jobs, output_path, progress=progress,
+                                                             font_fallbacks=self.label_renderer.font_fallbacks)
+                self._dispatch_to_ui(lambda: finish(pdf_path, found_ids, missing_ids))
+            except Exception as e:
+                self._dispatch_to_ui(lambda err=e: finish(None, found_ids, missing_ids, error=err))
 
-        daily_labels_path = self._get_daily_folder_path(self.defective_labels_folder)
-        filepath = os.path.join(daily_labels_path, f"{defect_box_id}.png")
-        img.save(filepath)
-        return filepath
+        threading.Thread(target=worker, daemon=True).start()
 
     def _apply_mode_ui(self):
         self.apply_scaling()
@@ -2103,42 +2457,58 @@ class InspectionProgram:
             color = self.COLOR_TEXT_SUBTLE
         
         self.current_item_label['text'], self.current_item_label['foreground'] = text, color
+        self._update_tray_image()
+        self._update_remnant_suggestions()
+
+    def _update_remnant_suggestions(self):
+        """진행 중인 검사 품목의 잔량을 오래된 순으로 안내합니다. (잔량 재고 색인 사용)"""
+        if not (hasattr(self, 'remnant_suggestion_label') and self.remnant_suggestion_label.winfo_exists()): return
+        suggestions = []
+        if self.current_mode == "standard" and self.current_session.master_label_code and not self.master_label_replace_state \
+                and self._index_ready('remnant_inventory'):  # 색인을 만드는 중이면 완료 후 다시 호출됩니다.
+            suggestions = self.remnant_inventory.for_item(self.current_session.item_code,
+                                                          exclude=self.current_session.consumed_remnant_ids,
+                                                          limit=self.REMNANT_SUGGESTION_COUNT)
+        if not suggestions:
+            self.remnant_suggestion_frame.grid_remove()
+            return
+        now = datetime.datetime.now()
+        lines = []
+        for remnant in suggestions:
+            age = remnant.age(now)
+            age_text = "-" if age is None else (f"{age.days}일" if age.days else f"{age.seconds // 3600}시간")
+            lines.append(f"{remnant.remnant_id}  {remnant.quantity}개 · {age_text} 전 · {remnant.worker}")
+        text = "\n".join(lines)
+        if self.remnant_suggestion_label['text'] != text:
+            self.remnant_suggestion_label['text'] = text
+        self.remnant_suggestion_frame.grid()
+
+    def _update_tray_image(self):
+        """진행 중인 검사 품목의 트레이 이미지를 현재 품목 라벨 옆에 표시합니다."""
+        tray_photo = None
+        if self.current_mode == "standard" and self.current_session.master_label_code and not self.master_label_replace_state:
+            matched_item = self.item_master.get(self.current_session.item_code)
+            if matched_item and matched_item.get('Tray Image'):
+                tray_photo = self.asset_cache.get_photo(matched_item['Tray Image'], self.TRAY_IMAGE_BASE_WIDTH, self.scale_factor)
+        if tray_photo is not self.tray_photo_ref:
+            self.tray_photo_ref = tray_photo
+            self.current_item_label.config(image=tray_photo or '', compound='left')
 
     def _parse_new_format_qr(self, qr_data: str) -> Optional[Dict[str, str]]:
-        # JSON 형식 현품표 QR 코드 처리
-        if qr_data.strip().startswith('{') and qr_data.strip().endswith('}'):
-            try:
-                parsed = json.loads(qr_data)
-                if False:
-                    print(f"[DEBUG] JSON 파싱 성공: {parsed}")
-                if 'CLC' in parsed:
-                    return parsed
-                return None
-            except json.JSONDecodeError as e:
-                if False:
-                    print(f"[DEBUG] JSON 파싱 실패: {e}, QR 데이터: {qr_data}")
-                pass
-
-        # 기존 형식 (=, |로 구분) 처리
-        if '=' not in qr_data or '|' not in qr_data:
-            return None
-        try:
-            parsed = dict(pair.split('=', 1) for pair in qr_data.strip().split('|'))
-            if 'CLC' in parsed and 'WID' in parsed: return parsed
-            return None
-        except ValueError:
-            return None
+        return parse_master_label_qr(qr_data)
 
     def _complete_session_logic_only(self, session: InspectionSession):
         if session.master_label_code:
-            self.completed_master_labels.add(session.master_label_code)
+            # 다른 스테이션도 중복 제출을 확인할 수 있도록 공용 완료 등록부에 남깁니다.
+            self.completed_labels.record_complete(session.master_label_code, datetime.datetime.now().isoformat(),
+                                                  self.worker_name, self.log_file_path)
 
         log_detail = {
             'master_label_code': session.master_label_code, 'item_code': session.item_code,
             'item_name': session.item_name, 'item_spec': session.item_spec,
-            'scan_count': len(session.scanned_barcodes), 'tray_capacity': session.quantity,
-            'scanned_product_barcodes': [item['barcode'] for item in session.good_items],
-            'defective_product_barcodes': [item['barcode'] for item in session.defective_items],
+            'scan_count': session.scan_count, 'tray_capacity': session.quantity,
+            'scanned_product_barcodes': [item.barcode for item in session.good_items],
+            'defective_product_barcodes': [item.barcode for item in session.defective_items],
             'work_time_sec': session.stopwatch_seconds, 'error_count': session.mismatch_error_count,
             'total_idle_seconds': session.total_idle_seconds, 'has_error_or_reset': session.has_error_or_reset,
             'is_partial_submission': session.is_partial_submission, 'is_restored_session': session.is_restored_session,
@@ -2146,7 +2516,9 @@ class InspectionProgram:
             'end_time': datetime.datetime.now().isoformat(), 
             'is_remnant_session': session.is_remnant_session 
         }
-        self._log_event('TRAY_COMPLETE', detail=log_detail)
+        # 로그 기록 스레드가 통계를 저장하므로 기록 요청 전에 반영합니다. (재구성 때와 같은 정상 트레이 기준)
+        self.cycle_stats.add_tray(log_detail)
+        self._log_event('TRAY_COMPLETE', detail=log_detail, owned=True)
         item_code = session.item_code
         if item_code not in self.work_summary:
             self.work_summary[item_code] = {'name': session.item_name, 'spec': session.item_spec, 
@@ -2155,7 +2527,6 @@ class InspectionProgram:
         self.work_summary[item_code]['pallet_count'] += 1
         if not session.is_partial_submission:
             self.total_tray_count += 1
-            self.completed_tray_times.append(session.stopwatch_seconds)
     
     def process_scan(self, event=None):
         raw_barcode = self.scan_entry.get().strip()
@@ -2239,7 +2610,7 @@ class InspectionProgram:
 
         if parsed_data:
             is_master_label_format = True
-        elif len(barcode) == item_code_length and any(item['Item Code'] == barcode for item in self.items_data):
+        elif len(barcode) == item_code_length and barcode in self.item_master:
             is_master_label_format = True
 
         if self.current_session.master_label_code:
@@ -2260,12 +2631,14 @@ class InspectionProgram:
                 if self.current_session.item_code not in barcode:
                     self.current_session.mismatch_error_count += 1
                     self.current_session.has_error_or_reset = True
+                    self._persist_scan_change()
                     self.show_fullscreen_warning("품목 코드 불일치!", f"제품의 품목 코드가 일치하지 않습니다.\n[기준: {self.current_session.item_code}]", self.COLOR_DEFECT)
                     self._log_event('SCAN_FAIL_MISMATCH', detail={'expected': self.current_session.item_code, 'scanned': barcode})
                     return
-                if barcode in self.current_session.scanned_barcodes:
+                if self.current_session.has_scanned(barcode):
                     self.current_session.mismatch_error_count += 1
                     self.current_session.has_error_or_reset = True
+                    self._persist_scan_change()
                     self.show_fullscreen_warning("바코드 중복!", f"제품 바코드 '{barcode}'는 이미 검사되었습니다.", self.COLOR_DEFECT)
                     self._log_event('SCAN_FAIL_DUPLICATE', detail={'barcode': barcode})
                     return
@@ -2274,14 +2647,14 @@ class InspectionProgram:
                 self.record_inspection_result(barcode, status)
         else:
             if is_master_label_format:
-                if parsed_data and barcode in self.completed_master_labels:
+                if parsed_data and self._is_completed_master_label(barcode):
                     if messagebox.askyesno("작업 재개 확인", "이미 제출된 작업입니다.\n이어서 진행하시겠습니까?"):
                         self._resume_submitted_session(barcode)
                     return
 
                 item_info = parsed_data if parsed_data else {'CLC': barcode}
                 item_code_from_label = item_info.get('CLC')
-                matched_item = next((item for item in self.items_data if item['Item Code'] == item_code_from_label), None)
+                matched_item = self.item_master.get(item_code_from_label)
 
                 if not matched_item:
                     self.show_fullscreen_warning("품목 없음", f"현품표의 품목코드 '{item_code_from_label}' 정보를 찾을 수 없습니다.", self.COLOR_DEFECT)
@@ -2343,12 +2716,7 @@ class InspectionProgram:
             return
 
         try:
-            item_code_from_barcode = None
-            for item in self.items_data:
-                item_code = item.get('Item Code')
-                if item_code and item_code in barcode:
-                    item_code_from_barcode = item_code
-                    break
+            item_code_from_barcode = self.item_master.find_code_in_barcode(barcode)
             if not item_code_from_barcode:
                     raise ValueError("바코드에서 품목 코드를 찾을 수 없습니다.")
         except Exception as e:
@@ -2356,7 +2724,7 @@ class InspectionProgram:
             return
 
         if not self.current_remnant_session.item_code:
-            matched_item = next((item for item in self.items_data if item['Item Code'] == item_code_from_barcode), None)
+            matched_item = self.item_master.get(item_code_from_barcode)
             if not matched_item:
                 self.show_fullscreen_warning("품목 없음", f"품목코드 '{item_code_from_barcode}'에 해당하는 정보를 찾을 수 없습니다.", self.COLOR_DEFECT)
                 return
@@ -2377,25 +2745,26 @@ class InspectionProgram:
     def record_inspection_result(self, barcode: str, status: str):
         if status == 'Good':
             if self.success_sound: self.success_sound.play()
-            item_data = {'barcode': barcode, 'timestamp': datetime.datetime.now().isoformat(), 'status': 'Good'}
-            self.current_session.good_items.append(item_data)
+            record = ScanRecord(barcode, SCAN_GOOD)
             self._log_event('INSPECTION_GOOD', detail={'barcode': barcode})
         else:
             if self.success_sound: self.success_sound.play()
-            item_data = {'barcode': barcode, 'timestamp': datetime.datetime.now().isoformat(), 'status': 'Defective'}
-            self.current_session.defective_items.append(item_data)
+            record = ScanRecord(barcode, SCAN_DEFECTIVE)
             self.current_session.has_error_or_reset = True
             self._log_event('INSPECTION_DEFECTIVE', detail={'barcode': barcode})
 
-        self.current_session.scanned_barcodes.append(barcode)
+        self.current_session.add_scan(record)
         
         if self.root.winfo_exists():
-            self.root.after(0, self._redraw_scan_trees)
+            if self._is_large_tray():
+                self.root.after(0, lambda: self._append_scan_row(record))
+            else:
+                self.root.after(0, self._redraw_scan_trees)
             self.root.after(0, self._update_center_display)
             self.root.after(0, self._update_current_item_label)
             self.root.after(0, lambda: self.undo_button.config(state=tk.NORMAL))
         
-        self._save_current_session_state()
+        self._persist_scan_change(record=record)
         
         good_item_count = len(self.current_session.good_items)
         target_quantity = self.current_session.quantity
@@ -2429,10 +2798,29 @@ class InspectionProgram:
         if not hasattr(self, 'good_items_tree') or not self.good_items_tree.winfo_exists(): return
         for i in self.good_items_tree.get_children(): self.good_items_tree.delete(i)
         for i in self.defective_items_tree.get_children(): self.defective_items_tree.delete(i)
-        for idx, item in enumerate(self.current_session.good_items):
-            self.good_items_tree.insert('', 0, values=(idx + 1, item['barcode']))
-        for idx, item in enumerate(self.current_session.defective_items):
-            self.defective_items_tree.insert('', 0, values=(idx + 1, item['barcode']))
+        # 최근 scan_list_window 건만 표시합니다. (대형 트레이에서도 목록 크기 일정)
+        window = int(config.get('inspection.scan_list_window', 200))
+        for tree, items in ((self.good_items_tree, self.current_session.good_items),
+                            (self.defective_items_tree, self.current_session.defective_items)):
+            start = max(0, len(items) - window)
+            for idx in range(start, len(items)):
+                tree.insert('', 0, values=(idx + 1, items[idx].barcode))
+
+    def _append_scan_row(self, record: ScanRecord):
+        """스캔 1건을 목록 맨 위에 추가하고, 표시 범위를 넘는 가장 오래된 행을 지웁니다."""
+        if not hasattr(self, 'good_items_tree') or not self.good_items_tree.winfo_exists(): return
+        if record.status == SCAN_DEFECTIVE:
+            tree, items = self.defective_items_tree, self.current_session.defective_items
+        else:
+            tree, items = self.good_items_tree, self.current_session.good_items
+        if not items or items[-1] is not record:
+            self._redraw_scan_trees()  # 그 사이 취소/초기화된 경우
+            return
+        tree.insert('', 0, values=(len(items), record.barcode))
+        children = tree.get_children()
+        window = int(config.get('inspection.scan_list_window', 200))
+        if len(children) > window:
+            tree.delete(*children[window:])
 
     def complete_session(self):
         session_to_complete = self.current_session
@@ -2443,18 +2831,16 @@ class InspectionProgram:
                 try:
                     remnant_filepath_json = os.path.join(self.remnants_folder, f"{remnant_id}.json")
                     remnant_filepath_png = os.path.join(self.labels_folder, f"{remnant_id}.png")
-                    if os.path.exists(remnant_filepath_json):
-                        os.remove(remnant_filepath_json)
-                    if os.path.exists(remnant_filepath_png):
-                        os.remove(remnant_filepath_png)
+                    self.replicator.delete(remnant_filepath_json)
+                    self.replicator.delete(remnant_filepath_png)
+                    self.remnant_inventory.apply([remnant_filepath_json])
                 except Exception as e:
                     print(f"잔량 파일 삭제 중 오류 발생 (ID: {remnant_id}): {e}")
                     self._log_event('REMNANT_FILE_DELETION_ERROR', detail={'remnant_id': remnant_id, 'error': str(e)})
 
+        self._stop_stopwatch()
         self.current_session = InspectionSession()
         
-        self._stop_stopwatch()
-        self._stop_idle_checker()
         if self.root.winfo_exists():
             self.undo_button['state'] = tk.DISABLED
             
@@ -2478,36 +2864,24 @@ class InspectionProgram:
 
     def undo_last_inspection(self):
         self._update_last_activity_time()
-        if not self.current_session.scanned_barcodes: return
-        last_barcode = self.current_session.scanned_barcodes.pop()
-        last_item_status = None
-        for i, item in enumerate(self.current_session.good_items):
-            if item['barcode'] == last_barcode:
-                self.current_session.good_items.pop(i)
-                last_item_status = "Good"
-                break
-        if not last_item_status:
-            for i, item in enumerate(self.current_session.defective_items):
-                if item['barcode'] == last_barcode:
-                    self.current_session.defective_items.pop(i)
-                    last_item_status = "Defective"
-                    break
+        last_item = self.current_session.pop_last_scan()
+        if last_item is None: return
+        last_barcode, last_item_status = last_item.barcode, last_item.status
         self._redraw_scan_trees()
         self._update_center_display()
         self._log_event('INSPECTION_UNDO', detail={'barcode': last_barcode, 'status': last_item_status})
         self.show_status_message(f"'{last_barcode}' 판정이 취소되었습니다.", self.COLOR_DEFECT)
         self._update_current_item_label()
-        if not self.current_session.scanned_barcodes: self.undo_button['state'] = tk.DISABLED
-        self._save_current_session_state()
+        if not self.current_session.scan_count: self.undo_button['state'] = tk.DISABLED
+        self._persist_scan_change(undone=last_barcode)
         self._schedule_focus_return()
         
     def reset_current_work(self):
         self._update_last_activity_time()
         if self.current_session.master_label_code and messagebox.askyesno("확인", "현재 진행중인 검사를 초기화하시겠습니까?"):
             self._stop_stopwatch()
-            self._stop_idle_checker()
             self.is_idle = False
-            self._log_event('TRAY_RESET', detail={'scan_count': len(self.current_session.scanned_barcodes)})
+            self._log_event('TRAY_RESET', detail={'scan_count': self.current_session.scan_count})
             self.current_session = InspectionSession()
             self._redraw_scan_trees()
             self._delete_current_session_state()
@@ -2519,7 +2893,7 @@ class InspectionProgram:
 
     def submit_current_tray(self):
         self._update_last_activity_time()
-        if not self.current_session.master_label_code or not self.current_session.scanned_barcodes:
+        if not self.current_session.master_label_code or not self.current_session.scan_count:
             self.show_status_message("제출할 검사 내역이 없습니다.", self.COLOR_TEXT_SUBTLE)
             return
         
@@ -2552,14 +2926,19 @@ class InspectionProgram:
             good_barcodes = log_details.get('scanned_product_barcodes', [])
             defective_barcodes = log_details.get('defective_product_barcodes', [])
             
-            restored_session.good_items = [{'barcode': bc, 'timestamp': datetime.datetime.now().isoformat(), 'status': 'Good'} for bc in good_barcodes]
-            restored_session.defective_items = [{'barcode': bc, 'timestamp': datetime.datetime.now().isoformat(), 'status': 'Defective'} for bc in defective_barcodes]
-            restored_session.scanned_barcodes = good_barcodes + defective_barcodes
+            # 로그에는 개별 스캔 시각이 없으므로 이전 작업의 완료 시각을 공통으로 사용합니다.
+            try:
+                scanned_at = datetime.datetime.fromisoformat(log_details['end_time']).timestamp()
+            except (KeyError, TypeError, ValueError):
+                scanned_at = time.time()
+            for bc in good_barcodes:
+                restored_session.add_scan(ScanRecord(bc, SCAN_GOOD, scanned_at))
+            for bc in defective_barcodes:
+                restored_session.add_scan(ScanRecord(bc, SCAN_DEFECTIVE, scanned_at))
 
             self.current_session = restored_session
             
-            if master_label_code in self.completed_master_labels:
-                self.completed_master_labels.remove(master_label_code)
+            self.completed_labels.record_resume(master_label_code, datetime.datetime.now().isoformat(), self.worker_name)
             self._log_event('TRAY_RESUMED', detail={'master_label_code': master_label_code})
 
             self.show_status_message("이전 작업을 복원했습니다. 이어서 진행하세요.", self.COLOR_SUCCESS)
@@ -2567,7 +2946,7 @@ class InspectionProgram:
             self._redraw_scan_trees()
             self._update_center_display()
             self._start_stopwatch(resume=True)
-            self.undo_button.config(state=tk.NORMAL if self.current_session.scanned_barcodes else tk.DISABLED)
+            self.undo_button.config(state=tk.NORMAL if self.current_session.scan_count else tk.DISABLED)
             self._save_current_session_state()
 
         except Exception as e:
@@ -2575,14 +2954,26 @@ class InspectionProgram:
             self._log_event('TRAY_RESUME_FAILED', detail={'error': str(e)})
 
 
+    def _is_completed_master_label(self, master_label_code: str) -> bool:
+        """제출(완료)된 현품표인지 확인합니다. 등록부를 읽는 중이면 오늘 로그의 완료 기록으로 판단합니다."""
+        if self._index_ready('completed_labels'):
+            return self.completed_labels.is_completed(master_label_code)
+        return self._find_last_tray_complete_log(master_label_code) is not None
+
     def _find_last_tray_complete_log(self, master_label_code: str) -> Optional[Dict[str, Any]]:
-        """로그 파일에서 특정 master_label_code의 마지막 TRAY_COMPLETE 이벤트를 찾습니다."""
-        if not self.log_file_path or not os.path.exists(self.log_file_path):
+        """로그 파일에서 특정 master_label_code의 마지막 TRAY_COMPLETE 이벤트를 찾습니다.
+
+        완료 등록부에 기록된 로그 파일(다른 스테이션/날짜 포함)을 먼저 보고, 없으면(또는 등록부를 읽는 중이면) 오늘 로그를 봅니다.
+        """
+        log_path = self.completed_labels.completed_log(master_label_code) if self.completed_labels.built else None
+        log_path = log_path or self.log_file_path
+        log_path = self.replicator.resolve(log_path) if log_path else None
+        if not log_path or not os.path.exists(log_path):
             return None
         
         last_match = None
         try:
-            with open(self.log_file_path, 'r', encoding='utf-8-sig') as f:
+            with open(log_path, 'r', encoding='utf-8-sig') as f:
                 reader = csv.DictReader(f)
                 all_rows = list(reader)
                 for row in reversed(all_rows):
@@ -2597,7 +2988,7 @@ class InspectionProgram:
             return None
 
     def _add_remnant_to_current_session(self, remnant_id: str):
-        remnant_filepath = os.path.join(self.remnants_folder, f"{remnant_id}.json")
+        remnant_filepath = self.replicator.resolve(os.path.join(self.remnants_folder, f"{remnant_id}.json"))
         if not os.path.exists(remnant_filepath):
             self.show_fullscreen_warning("잔량표 없음", f"해당 잔량 ID({remnant_id})를 찾을 수 없습니다.", self.COLOR_DEFECT)
             return
@@ -2624,6 +3015,7 @@ class InspectionProgram:
                         self.record_inspection_result(barcode, 'Good')
                     
                     self.current_session.consumed_remnant_ids.append(remnant_id)
+                    self._update_remnant_suggestions()
                     self._log_event('REMNANT_CONSUMED', detail={'remnant_id': remnant_id})
                     self.show_status_message(f"잔량 {remnant_quantity}개가 추가되었습니다.", self.COLOR_SUCCESS)
             else:
@@ -2722,13 +3114,9 @@ class InspectionProgram:
             remnant_filepath_json = os.path.join(self.remnants_folder, f"{remnant_id}.json")
             remnant_filepath_png = os.path.join(self.labels_folder, f"{remnant_id}.png")
             
-            if os.path.exists(remnant_filepath_json):
-                os.remove(remnant_filepath_json)
-            try:
-                if os.path.exists(remnant_filepath_png):
-                    os.remove(remnant_filepath_png)
-            except FileNotFoundError:
-                pass
+            self.replicator.delete(remnant_filepath_json)
+            self.replicator.delete(remnant_filepath_png)
+            self.remnant_inventory.apply([remnant_filepath_json])
             
             self.is_excluding_item = False
             self.exclusion_context = {}
@@ -2752,30 +3140,15 @@ class InspectionProgram:
 
         try:
             filepath = os.path.join(self.remnants_folder, f"{new_remnant_id}.json")
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(new_remnant_data, f, ensure_ascii=False, indent=4)
+            self.replicator.write_json(filepath, new_remnant_data, ensure_ascii=False, indent=4)
+            self.remnant_inventory.apply([filepath])
             self._log_event('REMNANT_CREATED_FROM_OVERFLOW', detail=new_remnant_data)
         except Exception as e:
             messagebox.showerror("저장 실패", f"초과분 잔량 파일 저장 중 오류 발생: {e}")
             return
             
-        try:
-            image_path = self._generate_remnant_label_image(
-                remnant_id=new_remnant_id,
-                item_code=new_remnant_data['item_code'],
-                item_name=new_remnant_data['item_name'],
-                item_spec=new_remnant_data['item_spec'],
-                quantity=len(new_remnant_data['remnant_barcodes']),
-                worker_name=self.worker_name,
-                creation_date=now.strftime('%Y-%m-%d %H:%M:%S')
-            )
-            if sys.platform == "win32":
-                os.startfile(image_path)
-            
-            messagebox.showinfo("초과분 잔량 생성 완료", f"현품표 작업을 완료하고 남은 {len(barcodes)}개의 제품으로\n새로운 잔량표를 생성했습니다.\n\n신규 잔량 ID: {new_remnant_id}")
-
-        except Exception as e:
-            messagebox.showwarning("이미지 생성 실패", f"새 잔량 라벨 이미지 생성에 실패했습니다: {e}")
+        self._submit_label_render('remnant', new_remnant_data)
+        self.show_status_message(f"남은 {len(barcodes)}개로 새 잔량표를 생성했습니다. (신규 잔량 ID: {new_remnant_id})", self.COLOR_SPARE, 8000)
 
     def _add_defective_label_to_current_session(self, defect_qr_data: Dict[str, Any]):
         """불량표 QR 코드를 스캔했을 때 불량품 통합 세션에 추가하는 함수"""
@@ -2803,7 +3176,7 @@ class InspectionProgram:
 
         # 세션이 시작되지 않은 경우 자동 시작
         if not session.item_code:
-            matched_item = next((item for item in self.items_data if item['Item Code'] == item_code), None)
+            matched_item = self.item_master.get(item_code)
             if not matched_item:
                 self.show_fullscreen_warning("품목 없음", f"불량표의 품목코드 '{item_code}' 정보를 찾을 수 없습니다.", self.COLOR_DEFECT)
                 return
@@ -2870,18 +3243,21 @@ class InspectionProgram:
             formatted_date = f"{date_part[:4]}-{date_part[4:6]}-{date_part[6:8]}"  # YYYY-MM-DD
 
             daily_folder = os.path.join(self.defects_data_folder, formatted_date)
-            if not os.path.exists(daily_folder):
-                return None
-
-            filepath = os.path.join(daily_folder, f"{defect_box_id}.json")
+            filepath = self.replicator.resolve(os.path.join(daily_folder, f"{defect_box_id}.json"))
             if os.path.exists(filepath):
                 return filepath
+            if not os.path.exists(daily_folder):
+                return None
 
         except (IndexError, ValueError):
             pass
 
-        # 날짜별 폴더에서 찾지 못한 경우 전체 하위 폴더 탐색
-        return self._find_file_in_subdirs(self.defects_data_folder, f"{defect_box_id}.json")
+        # 날짜별 폴더에서 찾지 못한 경우 불량 원장 색인에서 찾습니다. (색인을 만드는 중이면 폴더를 직접 탐색)
+        if not self._index_ready('defect_ledger'):
+            return self._find_file_in_subdirs(self.defects_data_folder, f"{defect_box_id}.json")
+
+        filepath = self.defect_ledger.records.find(f"{defect_box_id}.json")
+        return self.replicator.resolve(filepath) if filepath else None
 
     def _handle_defective_overflow(self, defect_barcodes: List[str], overflow: int, session, defect_data: Dict[str, Any]):
         """불량표 스캔 시 초과 수량 처리"""
@@ -2956,7 +3332,7 @@ class InspectionProgram:
                     return
 
                 # 품목코드 유효성 검사
-                if not any(item['Item Code'] == overflow_item_code for item in self.items_data):
+                if overflow_item_code not in self.item_master:
                     messagebox.showwarning("품목코드 오류", f"품목코드 '{overflow_item_code}'를 찾을 수 없습니다.")
                     return
 
@@ -2982,7 +3358,7 @@ class InspectionProgram:
             result_label.config(text="품목코드를 입력해주세요.", foreground="red")
             return
 
-        matched_item = next((item for item in self.items_data if item['Item Code'] == item_code), None)
+        matched_item = self.item_master.get(item_code)
         if matched_item:
             result_label.config(text=f"✓ 유효: {matched_item.get('Item Name', '')}", foreground="green")
         else:
@@ -3020,7 +3396,7 @@ class InspectionProgram:
         new_defect_box_id = f"DEFECT-{now.strftime('%Y%m%d-%H%M%S%f')}"
 
         # 품목 정보 가져오기
-        matched_item = next((item for item in self.items_data if item['Item Code'] == item_code), None)
+        matched_item = self.item_master.get(item_code)
         if not matched_item:
             messagebox.showwarning("품목 오류", f"품목코드 '{item_code}' 정보를 찾을 수 없습니다.")
             return
@@ -3040,33 +3416,18 @@ class InspectionProgram:
 
         try:
             # JSON 데이터 파일 저장
-            daily_data_path = self._get_daily_folder_path(self.defects_data_folder)
+            daily_data_path = self._get_daily_folder_path(self.defects_data_folder, create=False)
             filepath = os.path.join(daily_data_path, f"{new_defect_box_id}.json")
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(new_defect_data, f, ensure_ascii=False, indent=4)
-
-            # 불량표 이미지 생성
-            image_path = self._generate_defective_label_image(
-                defect_box_id=new_defect_box_id,
-                item_code=item_code,
-                item_name=matched_item.get('Item Name', ''),
-                item_spec=matched_item.get('Spec', ''),
-                quantity=len(barcodes),
-                worker_name=self.worker_name,
-                creation_date=now.strftime('%Y-%m-%d %H:%M:%S')
-            )
+            self.replicator.write_json(filepath, new_defect_data, ensure_ascii=False, indent=4)
+            self.defect_ledger.apply([filepath])
 
             self._log_event('DEFECT_CREATED_FROM_OVERFLOW', detail=new_defect_data)
-
-            messagebox.showinfo("초과분 불량표 생성 완료",
-                              f"초과된 {len(barcodes)}개의 불량품으로\n새로운 불량표를 생성했습니다.\n\n"
-                              f"신규 불량표 ID: {new_defect_box_id}\n품목: {matched_item.get('Item Name', '')}")
-
-            if sys.platform == "win32":
-                os.startfile(image_path)
-
         except Exception as e:
             messagebox.showwarning("불량표 생성 실패", f"새 불량표 생성에 실패했습니다: {e}")
+            return
+
+        self._submit_label_render('defective', new_defect_data)
+        self.show_status_message(f"초과된 {len(barcodes)}개로 새 불량표를 생성했습니다. (신규 불량표 ID: {new_defect_box_id})", self.COLOR_DEFECT, 8000)
 
     def _update_remnant_list(self):
         for i in self.remnant_items_tree.get_children():
@@ -3097,31 +3458,17 @@ class InspectionProgram:
 
         try:
             filepath = os.path.join(self.remnants_folder, f"{remnant_id}.json")
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(remnant_data, f, ensure_ascii=False, indent=4)
+            self.replicator.write_json(filepath, remnant_data, ensure_ascii=False, indent=4)
+            self.remnant_inventory.apply([filepath])
             self._log_event('REMNANT_CREATED', detail=remnant_data)
         except Exception as e:
             messagebox.showerror("저장 실패", f"잔량 파일 저장 중 오류 발생: {e}")
             return None
         
-        try:
-            image_path = self._generate_remnant_label_image(
-                remnant_id=remnant_id,
-                item_code=remnant_data['item_code'],
-                item_name=remnant_data['item_name'],
-                item_spec=remnant_data['item_spec'],
-                quantity=len(remnant_data['remnant_barcodes']),
-                worker_name=self.worker_name,
-                creation_date=now.strftime('%Y-%m-%d %H:%M:%S')
-            )
-            if sys.platform == "win32":
-                os.startfile(image_path)
-        except Exception as e:
-            messagebox.showwarning("이미지 생성 실패", f"라벨 이미지 생성에 실패했습니다: {e}")
+        self._submit_label_render('remnant', remnant_data)
 
-        messagebox.showinfo("생성 완료", f"잔량표 생성이 완료되었습니다.\n\n잔량 ID: {remnant_id}\n\n라벨 이미지가 '{self.labels_folder}' 폴더에 저장되었습니다.")
-        
         self.toggle_remnant_mode()
+        self.show_status_message(f"잔량표 생성 완료 (잔량 ID: {remnant_id}). 라벨을 출력 중입니다...", self.COLOR_SUCCESS)
         return remnant_id
 
     def cancel_remnant_creation(self, force_clear=False):
@@ -3133,92 +3480,6 @@ class InspectionProgram:
         self._update_remnant_list()
         self.remnant_item_label.config(text="등록할 품목: (첫 제품 스캔 대기)")
     
-    def _generate_remnant_label_image(self, remnant_id, item_code, item_name, item_spec, quantity, worker_name, creation_date):
-        config = {
-            'size': (800, 400), 'bg_color': "white", 'text_color': "black", 'padding': 30,
-            'font_path': "C:/Windows/Fonts/malgun.ttf",
-            'font_sizes': {'title': 48, 'header': 32, 'body': 34, 'quantity': 70, 'unit': 32, 'footer': 16,},
-            'qr_code': {'size': 220, 'box_size': 10, 'border': 4,},
-            'layout': {
-                'title_top_margin': 25, 'header_line_margin': 15, 'content_top_margin': 30,
-                'table_line_height': 48, 'table_header_x': 50, 'table_value_x': 180,
-                'footer_bottom_margin': 40, 'footer_line_margin': 15,
-            }
-        }
-        W, H = config['size']
-
-        fonts = {}
-        try:
-            for name, size in config['font_sizes'].items():
-                fonts[name] = ImageFont.truetype(config['font_path'], size)
-        except IOError:
-            messagebox.showwarning("폰트 오류", f"{config['font_path']} 폰트를 찾을 수 없습니다. 기본 폰트로 생성합니다.")
-            for name in config['font_sizes']:
-                fonts[name] = ImageFont.load_default()
-
-        qr_data = json.dumps({'id': remnant_id, 'code': item_code, 'qty': quantity})
-        qr = qrcode.QRCode(version=1, error_correction=qrcode.constants.ERROR_CORRECT_L,
-                                             box_size=config['qr_code']['box_size'], border=config['qr_code']['border'])
-        qr.add_data(qr_data)
-        qr.make(fit=True)
-        qr_img = qr.make_image(fill_color=config['text_color'], back_color=config['bg_color']).resize((config['qr_code']['size'], config['qr_code']['size']))
-
-        img = Image.new('RGB', (W, H), config['bg_color'])
-        draw = ImageDraw.Draw(img)
-
-        def draw_header(draw_obj):
-            title_text = "잔 량 표"
-            title_bbox = draw_obj.textbbox((0, 0), title_text, font=fonts['title'])
-            title_w, title_h = title_bbox[2] - title_bbox[0], title_bbox[3] - title_bbox[1]
-            title_x, title_y = (W - title_w) / 2, config['layout']['title_top_margin']
-            draw_obj.text((title_x, title_y), title_text, font=fonts['title'], fill=config['text_color'])
-
-            line_y = title_y + title_h + config['layout']['header_line_margin']
-            draw_obj.line([(30, line_y), (W - 30, line_y)], fill=config['text_color'], width=3)
-            return line_y
-
-        def draw_info_table(draw_obj, start_y):
-            info_items = [
-                {'label': "품 목 명", 'value': f": {item_name}"},
-                {'label': "품목코드", 'value': f": {item_code}"},
-                {'label': "규      격", 'value': f": {item_spec}"},
-            ]
-            y_pos = start_y + config['layout']['content_top_margin']
-            x_header, x_value = config['layout']['table_header_x'], config['layout']['table_value_x']
-
-            for item in info_items:
-                draw_obj.text((x_header, y_pos), item['label'], font=fonts['header'], fill=config['text_color'])
-                draw_obj.text((x_value, y_pos), item['value'], font=fonts['body'], fill=config['text_color'])
-                y_pos += config['layout']['table_line_height']
-                
-            draw_obj.text((x_header, y_pos), "수      량", font=fonts['header'], fill=config['text_color'])
-            draw_obj.text((x_value, y_pos - 10), ": ", font=fonts['quantity'], fill=config['text_color'])
-            qty_text = str(quantity)
-            colon_w = draw_obj.textlength(": ", font=fonts['quantity'])
-            qty_w = draw_obj.textlength(qty_text, font=fonts['quantity'])
-            draw_obj.text((x_value + colon_w, y_pos - 10), qty_text, font=fonts['quantity'], fill=config['text_color'], stroke_width=1)
-            draw_obj.text((x_value + colon_w + qty_w + 5, y_pos), "EA", font=fonts['unit'], fill=config['text_color'])
-
-        def draw_footer(draw_obj):
-            footer_y = H - config['layout']['footer_bottom_margin']
-            line_y = footer_y - config['layout']['footer_line_margin']
-            draw_obj.line([(30, line_y), (W - 30, line_y)], fill=config['text_color'], width=1)
-            footer_text = f"잔량 ID: {remnant_id}   |   생성일: {creation_date}   |   작업자: {worker_name}"
-            draw_obj.text((config['padding'], footer_y), footer_text, font=fonts['footer'], fill=config['text_color'])
-
-        content_start_y = draw_header(draw)
-        draw_info_table(draw, content_start_y)
-        draw_footer(draw)
-        
-        qr_x = W - config['qr_code']['size'] - config['padding']
-        qr_y = content_start_y + config['layout']['content_top_margin']
-        img.paste(qr_img, (qr_x, qr_y))
-
-        daily_labels_path = self._get_daily_folder_path(self.remnant_labels_folder)
-        filepath = os.path.join(daily_labels_path, f"잔량표_{remnant_id}.png")
-        img.save(filepath)
-        return filepath
-        
     def _update_all_summaries(self):
         self._update_summary_title()
         self._update_summary_list()
@@ -3252,16 +3513,16 @@ class InspectionProgram:
     def _update_avg_time(self):
         card = self.info_cards.get('avg_time')
         if not card or not card['value'].winfo_exists(): return
-        if self.completed_tray_times:
-            avg = sum(self.completed_tray_times) / len(self.completed_tray_times)
+        if self.cycle_stats.overall.count:
+            avg = self.cycle_stats.overall.mean
             card['value']['text'] = f"{int(avg // 60):02d}:{int(avg % 60):02d}"
         else: card['value']['text'] = "-"
     
     def _update_best_time(self):
         card = self.info_cards.get('best_time')
         if not card or not card['value'].winfo_exists(): return
-        if self.completed_tray_times:
-            best_time = min(self.completed_tray_times)
+        if self.cycle_stats.overall.count:
+            best_time = self.cycle_stats.overall.min
             card['value']['text'] = f"{int(best_time // 60):02d}:{int(best_time % 60):02d}"
         else: card['value']['text'] = "-"
 
@@ -3286,74 +3547,99 @@ class InspectionProgram:
             tray_size = config.get('inspection.tray_size', 60)
             self.main_progress_bar['maximum'] = tray_size
 
-    def _update_clock(self):
+    def _start_ui_tick(self):
+        """시계/스톱워치/휴식 감지/처리량 패널을 하나의 주기 타이머로 갱신합니다."""
+        if self.tick_job: self.root.after_cancel(self.tick_job)
+        self.tick_job = None
+        self._tick()
+
+    def _tick(self):
+        """1초마다 실행되는 통합 타이머. 경과 시간은 호출 횟수가 아니라 time.monotonic() 으로 계산하므로
+        Tk 이벤트 루프가 바빠 호출이 늦어져도 작업 시간이 밀리지 않습니다."""
+        self.tick_job = None
         if not self.root.winfo_exists(): return
+        now_mono = time.monotonic()
+        self._update_clock()
+        self._update_stopwatch(now_mono)
+        self._check_for_idle(now_mono)
+        if now_mono >= self.throughput_due:
+            self._refresh_throughput_panel()
+        # 벽시계 초가 바뀌는 시점에 맞춰 다음 틱을 예약합니다.
+        self.tick_job = self.root.after(1000 - int(time.time() * 1000) % 1000 + 5, self._tick)
+
+    def _update_clock(self):
         now = datetime.datetime.now()
-        if hasattr(self, 'date_label') and self.date_label.winfo_exists():
-            self.date_label['text'] = now.strftime('%Y-%m-%d')
-        if hasattr(self, 'clock_label') and self.clock_label.winfo_exists():
-            self.clock_label['text'] = now.strftime('%H:%M:%S')
-        self.clock_job = self.root.after(1000, self._update_clock)
+        for label, text in ((getattr(self, 'date_label', None), now.strftime('%Y-%m-%d')),
+                            (getattr(self, 'clock_label', None), now.strftime('%H:%M:%S'))):
+            if label is not None and label.winfo_exists() and label['text'] != text:
+                label['text'] = text
         
     def _start_stopwatch(self, resume=False):
+        self._sync_stopwatch()  # 이미 실행 중이면(화면 재구성 등) 지금까지의 시간을 먼저 반영
         if not resume:
             self.current_session.stopwatch_seconds = 0
             self.current_session.start_time = datetime.datetime.now()
         self._update_last_activity_time()
-        if self.stopwatch_job: self.root.after_cancel(self.stopwatch_job)
+        self.stopwatch_session = self.current_session
+        self.stopwatch_base = self.current_session.stopwatch_seconds
+        self.stopwatch_started_at = time.monotonic()
         self._update_stopwatch()
 
     def _stop_stopwatch(self):
-        if self.stopwatch_job:
-            self.root.after_cancel(self.stopwatch_job)
-            self.stopwatch_job = None
+        self._sync_stopwatch()
+        self.stopwatch_started_at = None
+        self.stopwatch_session = None
+
+    def _sync_stopwatch(self, now_mono: Optional[float] = None):
+        """실행 중인 스톱워치의 경과 시간을 해당 세션의 작업 시간(stopwatch_seconds)에 반영합니다."""
+        if self.stopwatch_started_at is None or self.stopwatch_session is None: return
+        elapsed = (now_mono if now_mono is not None else time.monotonic()) - self.stopwatch_started_at
+        self.stopwatch_session.stopwatch_seconds = self.stopwatch_base + max(0.0, elapsed)
             
-    def _update_stopwatch(self):
-        if not self.root.winfo_exists() or self.is_idle: return
+    def _update_stopwatch(self, now_mono: Optional[float] = None):
+        if self.stopwatch_started_at is None or self.is_idle: return
+        self._sync_stopwatch(now_mono)
         mins, secs = divmod(int(self.current_session.stopwatch_seconds), 60)
+        text = f"{mins:02d}:{secs:02d}"
         if self.info_cards.get('stopwatch') and self.info_cards['stopwatch']['value'].winfo_exists():
-            self.info_cards['stopwatch']['value']['text'] = f"{mins:02d}:{secs:02d}"
-        self.current_session.stopwatch_seconds += 1
-        self.stopwatch_job = self.root.after(1000, self._update_stopwatch)
+            if self.info_cards['stopwatch']['value']['text'] != text:
+                self.info_cards['stopwatch']['value']['text'] = text
 
     def _start_idle_checker(self):
         self._update_last_activity_time()
-        if self.idle_check_job: self.root.after_cancel(self.idle_check_job)
-        self.idle_check_job = self.root.after(1000, self._check_for_idle)
-
-    def _stop_idle_checker(self):
-        if self.idle_check_job:
-            self.root.after_cancel(self.idle_check_job)
-            self.idle_check_job = None
 
     def _update_last_activity_time(self):
-        self.last_activity_time = datetime.datetime.now()
-        if self.is_idle: self._wakeup_from_idle()
+        previous = self.last_activity_mono
+        self.last_activity_mono = time.monotonic()
+        if self.is_idle: self._wakeup_from_idle(previous)
 
-    def _check_for_idle(self):
+    def _check_for_idle(self, now_mono: float):
         is_active_session = self.current_session.master_label_code or self.current_mode == 'rework'
-        if not self.root.winfo_exists() or self.is_idle or not is_active_session or not self.last_activity_time:
-            self.idle_check_job = self.root.after(1000, self._check_for_idle)
+        if self.is_idle or not is_active_session or self.last_activity_mono is None:
             return
         idle_threshold = config.get('inspection.idle_threshold_sec', 420)
-        if (datetime.datetime.now() - self.last_activity_time).total_seconds() > idle_threshold:
+        if now_mono - self.last_activity_mono > idle_threshold:
+            # 휴식 중에는 스톱워치를 멈춥니다. 휴식 시간은 마지막 활동부터 재므로(_wakeup_from_idle)
+            # 작업 시간도 마지막 활동 시점까지로 되돌려 감지 대기 시간이 두 번 집계되지 않게 합니다.
+            self._sync_stopwatch(self.last_activity_mono)
+            self.stopwatch_started_at = None
             self.is_idle = True
+            self._persist_scan_change()
             self._set_idle_style(is_idle=True)
             self._log_event('IDLE_START')
-        else: self.idle_check_job = self.root.after(1000, self._check_for_idle)
             
-    def _wakeup_from_idle(self):
+    def _wakeup_from_idle(self, last_activity_mono: Optional[float]):
         if not self.is_idle: return
         self.is_idle = False
-        if self.last_activity_time:
-            idle_duration = (datetime.datetime.now() - self.last_activity_time).total_seconds()
+        if last_activity_mono is not None:
+            idle_duration = self.last_activity_mono - last_activity_mono
             if self.current_session.master_label_code:
                 self.current_session.total_idle_seconds += idle_duration
             self._log_event('IDLE_END', detail={'duration_sec': f"{idle_duration:.2f}"})
         self._set_idle_style(is_idle=False)
         self._start_idle_checker()
         if self.current_session.master_label_code:
-            self._update_stopwatch()
+            self._start_stopwatch(resume=True)
         self.show_status_message("작업 재개.", self.COLOR_SUCCESS)
 
     def _set_idle_style(self, is_idle: bool):
@@ -3397,8 +3683,8 @@ class InspectionProgram:
             self._stop_warning_beep()
             popup.destroy()
             self._schedule_focus_return()
-        title_font = (self.DEFAULT_FONT, int(60 * self.scale_factor), 'bold')
-        msg_font = (self.DEFAULT_FONT, int(30 * self.scale_factor), 'bold')
+        title_font = self._scaled_font(60, 'bold')
+        msg_font = self._scaled_font(30, 'bold')
         tk.Label(popup, text=title, font=title_font, fg='white', bg=color).pack(pady=(100, 50), expand=True)
         tk.Label(popup, text=message, font=msg_font, fg='white', bg=color, wraplength=self.root.winfo_screenwidth() - 100, justify=tk.CENTER).pack(pady=20, expand=True)
         btn = tk.Button(popup, text="확인 (클릭)", font=msg_font, command=on_popup_close, bg='white', fg=color, relief='flat', padx=20, pady=10)
@@ -3406,7 +3692,7 @@ class InspectionProgram:
         btn.focus_set()
 
     def _cancel_all_jobs(self):
-        for job_attr in ['clock_job', 'status_message_job', 'stopwatch_job', 'idle_check_job', 'focus_return_job']:
+        for job_attr in ['tick_job', 'status_message_job', 'focus_return_job', 'zoom_job']:
             job_id = getattr(self, job_attr, None)
             if job_id:
                 self.root.after_cancel(job_id)
@@ -3427,8 +3713,19 @@ class InspectionProgram:
                 except tk.TclError: pass
             self.save_settings()
             self._cancel_all_jobs()
+            if self.ui_dispatch_job:
+                self.root.after_cancel(self.ui_dispatch_job)
+                self.ui_dispatch_job = None
+            self.label_queue.stop(timeout=5.0)
             self.log_queue.put((None, None))
             if self.log_thread.is_alive(): self.log_thread.join(timeout=1.0)
+            self._save_cycle_stats()
+            # 남은 복제 작업은 outbox 저널에 남아 다음 실행 때 이어서 반영됩니다.
+            self.folder_watcher.stop()
+            self.replicator.flush(timeout=float(config.get('sync.shutdown_flush_sec', 3)))
+            self.replicator.stop()
+            # 종료 중에 끝난 작업의 알림(메시지 창, 파일 열기 등)은 실행하지 않고 버립니다.
+            self._discard_ui_calls()
             pygame.quit()
             self.root.destroy()
             
@@ -3451,8 +3748,14 @@ class InspectionProgram:
                     self.log_queue.put((log_type, log_entry))
                     continue
 
-                file_exists = os.path.exists(target_path) and os.stat(target_path).st_size > 0
-                with open(target_path, 'a', newline='', encoding='utf-8-sig') as f:
+                # 로컬 outbox 에 기록하고 동기화 폴더 반영은 복제 스레드에 맡깁니다.
+                local_path = self.replicator.local_path(target_path)
+                file_exists = os.path.exists(local_path) and os.stat(local_path).st_size > 0
+                if not file_exists:
+                    os.makedirs(os.path.dirname(local_path), exist_ok=True)
+                    # outbox 가 지워진 뒤 같은 날 다시 기록하면 원격 로그를 가져와 이어 씁니다.
+                    file_exists = self.replicator.adopt_remote(target_path)
+                with open(local_path, 'a', newline='', encoding='utf-8-sig') as f:
                     headers = ['timestamp', 'worker', 'event', 'details']
                     writer = csv.DictWriter(f, fieldnames=headers)
                     if not file_exists:
@@ -3460,22 +3763,56 @@ class InspectionProgram:
 
                     log_entry_for_csv = log_entry.copy()
                     log_entry_for_csv['worker'] = log_entry_for_csv.pop('worker_name')
+                    if isinstance(log_entry_for_csv['details'], dict):
+                        log_entry_for_csv['details'] = json.dumps(log_entry_for_csv['details'], ensure_ascii=False)
                     writer.writerow(log_entry_for_csv)
+                    f.flush()
+                    log_size = os.fstat(f.fileno()).st_size
+                self.replicator.append_done(target_path, log_size)
+
+                if log_type == 'main':
+                    # 통계 상태가 반영한 로그 크기를 함께 저장해 재시작 시 유효성을 확인합니다.
+                    is_current_worker = log_entry.get('worker_name') == self.worker_name
+                    if is_current_worker:
+                        self.cycle_stats.log_sizes[self.event_log.relative_name(target_path)] = log_size
+                    if log_entry.get('event') == 'TRAY_COMPLETE' and is_current_worker:
+                        self._save_cycle_stats()
 
             except queue.Empty: continue
             except Exception as e: print(f"로그 파일 쓰기 오류: {e}")
 
-    def _log_event(self, event_type: str, detail: Optional[Dict] = None):
+    def _update_sync_indicator(self, pending: int, error: Optional[str]):
+        """상태 표시줄 오른쪽에 동기화 폴더 반영 대기 건수를 표시합니다."""
+        if not hasattr(self, 'sync_status_label') or not self.sync_status_label.winfo_exists():
+            return
+        if error and pending:
+            text, color = f"동기화 지연: {pending}건 대기 (재시도 중)", self.COLOR_DEFECT
+        elif pending:
+            text, color = f"동기화 중: {pending}건", self.COLOR_TEXT_SUBTLE
+        else:
+            text, color = "동기화 완료", self.COLOR_TEXT_SUBTLE
+        if self.sync_status_label['text'] != text:
+            self.sync_status_label['text'], self.sync_status_label['fg'] = text, color
+
+    def _log_event(self, event_type: str, detail: Optional[Dict] = None, owned: bool = False):
+        """이벤트를 로그 기록 대기열에 넣습니다.
+
+        owned=True 는 호출 측이 이 기록만을 위해 새로 만든 detail(다른 곳에서 고치지 않음)이라는 뜻으로,
+        JSON 변환을 로그 기록 스레드에 맡깁니다. (대형 트레이의 TRAY_COMPLETE 바코드 목록 등)
+        그 밖의 detail 은 화면 스레드가 계속 고치는 객체(설정의 열 너비 등)를 담을 수 있으므로 바로 변환합니다.
+        """
         if not self.worker_name and event_type not in ['UPDATE_CHECK_FOUND', 'UPDATE_STARTED', 'UPDATE_FAILED', 'ITEM_DATA_LOADED']:
             return
 
         worker = self.worker_name if self.worker_name else "System"
+        if self.worker_name:
+            self.throughput.record(event_type, detail)
 
         log_entry = {
             'timestamp': datetime.datetime.now().isoformat(),
             'worker_name': worker,
             'event': event_type,
-            'details': json.dumps(detail, ensure_ascii=False) if detail else ''
+            'details': (detail if owned else json.dumps(detail, ensure_ascii=False)) if detail else ''
         }
 
         if event_type.startswith('REWORK_'):
@@ -3554,12 +3891,11 @@ class InspectionProgram:
         old_label = self.replacement_context.get('old_label')
 
         # 1. C:\Sync 폴더의 모든 로그 파일 목록을 가져옵니다.
-        log_file_pattern = re.compile(r"검사작업이벤트로그_.*_(\d{8})\.csv")
-        try:
-            all_log_files = [os.path.join(self.save_folder, f) for f in os.listdir(self.save_folder) if log_file_pattern.match(f)]
-            # 최신 파일부터 검색하기 위해 역순으로 정렬합니다.
-            all_log_files.sort(reverse=True)
-        except FileNotFoundError:
+        #    (기존 최상위 로그와 모든 스테이션 폴더의 로그를 함께 검색합니다.)
+        if os.path.isdir(self.save_folder):
+            # 최신 파일부터 검색하기 위해 날짜 역순으로 정렬합니다.
+            all_log_files = list(reversed(self.event_log.log_files('inspection')))
+        else:
             if True:
                 messagebox.showerror("오류", f"로그 폴더 '{self.save_folder}'를 찾을 수 없습니다.")
             self.cancel_master_label_replacement()
@@ -3567,13 +3903,20 @@ class InspectionProgram:
 
         # 2. 각 로그 파일을 순회하며 old_label을 찾습니다.
         found_log_info = None
-        for log_path in all_log_files:
-            found_log_info = self._find_log_in_file(log_path, old_label)
+        for log in all_log_files:
+            found_log_info = self._find_log_in_file(log.path, old_label)
             if found_log_info:
+                found_log_info['found_station'] = log.station
                 break # 기록을 찾았으면 검색을 중단합니다.
 
         # 3. 검색 결과에 따라 다음 단계를 진행합니다.
-        if found_log_info:
+        if found_log_info and found_log_info['found_station'] not in ('', self.event_log.station):
+            # 다른 스테이션의 로그는 그 스테이션의 outbox 가 원본이라 여기서 고치면 다음 복제 때 되돌려집니다.
+            messagebox.showwarning("다른 스테이션 기록",
+                                   f"해당 현품표({old_label})는 다른 스테이션({found_log_info['found_station']})에서 "
+                                   "완료되었습니다.\n작업을 완료한 스테이션에서 교체해 주세요.")
+            self.cancel_master_label_replacement()
+        elif found_log_info:
             self.replacement_context.update(found_log_info) # 찾은 파일 경로, 내용 등을 컨텍스트에 추가
             self._compare_quantities_and_proceed() # 수량 비교 및 추가/제외 스캔 단계로 이동
         else:
@@ -3692,11 +4035,20 @@ class InspectionProgram:
 
         # --- (파일 저장 로직 수정) ---
         try:
-            # 컨텍스트에 저장된 '찾았던 파일의 경로'에 수정된 전체 내용을 다시 씁니다.
-            with open(ctx['found_log_path'], 'w', newline='', encoding='utf-8-sig') as f:
+            # 이 스테이션의 로그는 outbox 사본을 고친 뒤 동기화 폴더에 전체 파일을 다시 반영합니다.
+            # (분할 이전의 최상위 로그는 기록하는 스테이션이 없으므로 그 자리에서 고칩니다.)
+            remote_log_path = self.replicator.remote_path(ctx['found_log_path'])
+            own_log = ctx.get('found_station') == self.event_log.station
+            write_path = self.replicator.local_path(remote_log_path) if own_log else ctx['found_log_path']
+            os.makedirs(os.path.dirname(write_path), exist_ok=True)
+            with open(write_path, 'w', newline='', encoding='utf-8-sig') as f:
                 writer = csv.DictWriter(f, fieldnames=ctx['headers'])
                 writer.writeheader()
                 writer.writerows(ctx['all_rows'])
+            if own_log:
+                self.replicator.replace(remote_log_path)
+            self.completion_rollups.invalidate(remote_log_path)
+            self.trace_index.invalidate(remote_log_path)
 
             # 성공 처리
             log_details = {'old_master_label': ctx['old_label'], 'new_master_label': ctx['new_label']}
@@ -3764,21 +4116,41 @@ class InspectionProgram:
         scrollbar.grid(row=0, column=1, sticky='ns')
         tree['yscrollcommand'] = scrollbar.set
 
+        query_id = [0]  # 마지막 조회만 화면에 반영합니다.
+
+        def show_results(current, summary_data):
+            if current != query_id[0] or not tree.winfo_exists(): return
+            self._populate_summary_tree(tree, summary_data)
+            self.show_status_message("완료 현황을 새로고침했습니다.", self.COLOR_SUCCESS)
+
+        def show_error(current, error):
+            if current != query_id[0] or not summary_win.winfo_exists(): return
+            messagebox.showerror("오류", f"데이터를 불러오는 중 오류가 발생했습니다:\n{error}", parent=summary_win)
+
         def refresh_data():
             try:
                 start_date = datetime.datetime.strptime(start_date_var.get(), '%Y-%m-%d').date()
                 end_date = datetime.datetime.strptime(end_date_var.get(), '%Y-%m-%d').date()
-                if start_date > end_date:
-                    messagebox.showerror("기간 오류", "시작일은 종료일보다 이전이어야 합니다.", parent=summary_win)
-                    return
-
-                summary_data = self._get_completion_summary_data(start_date, end_date)
-                self._populate_summary_tree(tree, summary_data)
-                self.show_status_message("완료 현황을 새로고침했습니다.", self.COLOR_SUCCESS)
             except ValueError:
                 messagebox.showerror("날짜 형식 오류", "날짜를 'YYYY-MM-DD' 형식으로 입력해주세요.", parent=summary_win)
-            except Exception as e:
-                messagebox.showerror("오류", f"데이터를 불러오는 중 오류가 발생했습니다:\n{e}", parent=summary_win)
+                return
+            if start_date > end_date:
+                messagebox.showerror("기간 오류", "시작일은 종료일보다 이전이어야 합니다.", parent=summary_win)
+                return
+
+            query_id[0] += 1
+            current = query_id[0]
+            self.show_status_message("완료 현황을 조회하는 중...", self.COLOR_PRIMARY)
+
+            # 긴 기간은 로그 파일이 많으므로 백그라운드에서 집계하고 결과만 화면 스레드로 넘깁니다.
+            def worker():
+                try:
+                    summary_data = self._get_completion_summary_data(start_date, end_date)
+                except Exception as e:
+                    self._dispatch_to_ui(lambda err=e: show_error(current, err))
+                    return
+                self._dispatch_to_ui(lambda: show_results(current, summary_data))
+            threading.Thread(target=worker, daemon=True).start()
         
         ttk.Button(top_frame, text="조회", command=refresh_data, style='Secondary.TButton').pack(side=tk.LEFT)
         
@@ -3788,52 +4160,163 @@ class InspectionProgram:
         self.root.wait_window(summary_win)
 
     def _get_completion_summary_data(self, start_date: datetime.date, end_date: datetime.date) -> Dict:
-        """지정된 기간의 로그 파일을 읽어 날짜별, 차수별로 완료된 트레이를 집계합니다."""
-        summary = {}
-        log_file_pattern = re.compile(r"검사작업이벤트로그_.*_(\d{8})\.csv")
-        
-        try:
-            all_log_files = [os.path.join(self.save_folder, f) for f in os.listdir(self.save_folder) if log_file_pattern.match(f)]
-        except FileNotFoundError:
-            return {}
+        """지정된 기간의 일별 완료 집계를 합산하여 (출고일, 차수, 품목코드)별 완료 트레이 수를 반환합니다."""
+        return self.completion_rollups.summarize(start_date, end_date)
+
+    def _warm_completion_rollups(self, days: int = 31):
+        """최근 로그의 완료 집계를 백그라운드에서 미리 만들어 둡니다."""
+        today = datetime.date.today()
+        threading.Thread(target=self.completion_rollups.summarize,
+                         args=(today - datetime.timedelta(days=days), today), daemon=True).start()
 
-        for log_path in all_log_files:
+    def _index_ready(self, name: str) -> bool:
+        """메모리 색인(self.<name>)이 만들어졌으면 True.
+
+        아직이면 Tk 스레드를 막지 않도록 False 를 반환하고, 처음 읽기 스레드가 끝나 있으면(실패) 다시 시작합니다.
+        """
+        if getattr(self, name).built:
+            return True
+        thread = self._warm_threads.get(name)
+        if thread is None or not thread.is_alive():
+            getattr(self, f'_warm_{name}')()
+        return False
+
+    def _start_warm(self, name: str, worker: Callable[[], None]):
+        thread = threading.Thread(target=worker, daemon=True)
+        self._warm_threads[name] = thread
+        thread.start()
+
+    def _warm_defect_ledger(self):
+        """불량 원장 색인을 백그라운드에서 처음 만들어 둡니다. 끝나면 보고 있는 불량 목록을 갱신합니다."""
+        def worker():
             try:
-                match = log_file_pattern.search(os.path.basename(log_path))
-                if not match: continue
-                
-                file_date = datetime.datetime.strptime(match.group(1), '%Y%m%d').date()
-                if not (start_date <= file_date <= end_date):
-                    continue
+                self.defect_ledger.ensure_built()
+            except Exception as e:
+                print(f"불량 원장 색인 생성 실패: {e}")
+                return
+            self._dispatch_to_ui(self._on_defect_ledger_built)
+        self._start_warm('defect_ledger', worker)
 
-                with open(log_path, 'r', encoding='utf-8-sig') as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        if row.get('event') == 'TRAY_COMPLETE':
-                            details = json.loads(row['details'])
-                            
-                            master_code = details.get('master_label_code')
-                            if not master_code: continue
-
-                            qr_data = self._parse_new_format_qr(master_code)
-                            if not qr_data: continue
-
-                            obd = qr_data.get('OBD', 'N/A')
-                            phs = qr_data.get('PHS', 'N/A')
-                            item_code = details.get('item_code')
-                            item_name = details.get('item_name', '알 수 없음')
-                            
-                            if not item_code: continue
-
-                            if not details.get('is_partial_submission', False):
-                                key = (obd, phs, item_code)
-                                if key not in summary:
-                                    summary[key] = {'count': 0, 'item_name': item_name}
-                                summary[key]['count'] += 1
+    def _on_defect_ledger_built(self):
+        if self.current_mode == "defective":
+            self.load_all_defective_items()
+
+    def _warm_remnant_inventory(self):
+        """잔량 재고 색인을 백그라운드에서 처음 만들어 둡니다. 끝나면 잔량 안내를 갱신합니다."""
+        def worker():
+            try:
+                self.remnant_inventory.ensure_built()
             except Exception as e:
-                print(f"'{log_path}' 처리 중 오류: {e}")
-        
-        return summary
+                print(f"잔량 재고 색인 생성 실패: {e}")
+                return
+            self._dispatch_to_ui(self._update_remnant_suggestions)
+        self._start_warm('remnant_inventory', worker)
+
+    def _on_save_folder_changes(self, paths: set):
+        """감시 스레드에서 호출: 바뀐 파일을 메모리 색인에 반영하고, 보고 있는 화면을 갱신합니다."""
+        self.completed_labels.apply(paths)
+        if self.remnant_inventory.apply(paths):
+            self._dispatch_to_ui(self._update_remnant_suggestions)
+        if self.defect_ledger.apply(paths) and self.current_mode == "defective":
+            self._dispatch_to_ui(self._refresh_defective_items)
+
+    def _warm_completed_labels(self):
+        """완료 현품표 등록부를 백그라운드에서 읽어 둡니다. (이 스테이션 등록부가 없으면 기존 로그로 생성)"""
+        def worker():
+            try:
+                self.completed_labels.ensure_built()
+                count = len(self.completed_labels)
+                self._dispatch_to_ui(lambda: self._log_event('COMPLETED_LABELS_LOADED', detail={'count': count}))
+            except Exception as e:
+                print(f"완료 현품표 등록부 생성 실패: {e}")
+        self._start_warm('completed_labels', worker)
+
+    def _warm_trace_index(self):
+        """바코드 추적 색인을 백그라운드에서 최신 상태로 맞춥니다. (최초 실행 시 전체 로그 색인)"""
+        def worker():
+            try:
+                self.trace_index.refresh_all()
+            except Exception as e:
+                print(f"바코드 추적 색인 갱신 실패: {e}")
+        threading.Thread(target=worker, daemon=True).start()
+
+    def show_barcode_trace_window(self):
+        """제품 바코드의 검사/리워크/불량표/교환/잔량 이력을 조회하는 창을 표시합니다."""
+        trace_win = tk.Toplevel(self.root)
+        trace_win.title("바코드 이력 조회")
+        trace_win.geometry("1000x600")
+        trace_win.configure(bg=self.COLOR_BG)
+
+        top_frame = ttk.Frame(trace_win, style='Sidebar.TFrame', padding=10)
+        top_frame.pack(fill=tk.X)
+        ttk.Label(top_frame, text="바코드:", style='Sidebar.TLabel').pack(side=tk.LEFT)
+        barcode_var = tk.StringVar()
+        barcode_entry = tk.Entry(top_frame, textvariable=barcode_var, width=40, font=(self.DEFAULT_FONT, 11))
+        barcode_entry.pack(side=tk.LEFT, padx=(5, 10))
+
+        summary_label = ttk.Label(trace_win, text="바코드를 입력하거나 스캔한 뒤 Enter 를 누르세요.", style='TLabel', padding=(10, 5), wraplength=960)
+        summary_label.pack(fill=tk.X)
+
+        tree_frame = ttk.Frame(trace_win, style='TFrame', padding=10)
+        tree_frame.pack(fill=tk.BOTH, expand=True)
+        tree_frame.grid_rowconfigure(0, weight=1)
+        tree_frame.grid_columnconfigure(0, weight=1)
+
+        cols = ('timestamp', 'stage', 'role', 'ref', 'worker', 'source')
+        tree = ttk.Treeview(tree_frame, columns=cols, show='headings')
+        tree.grid(row=0, column=0, sticky='nsew')
+        for col, text, width in [('timestamp', '시간', 170), ('stage', '단계', 110), ('role', '구분', 110),
+                                 ('ref', '현품표/라벨/교환 상대', 260), ('worker', '작업자', 90), ('source', '로그 파일', 240)]:
+            tree.heading(col, text=text)
+            tree.column(col, width=width, anchor='w')
+        scrollbar = ttk.Scrollbar(tree_frame, orient='vertical', command=tree.yview)
+        scrollbar.grid(row=0, column=1, sticky='ns')
+        tree['yscrollcommand'] = scrollbar.set
+
+        role_names = {'good': "양품", 'defective': "불량", 'good_partial': "양품(부분 제출)", 'defective_partial': "불량(부분 제출)",
+                      'reworked': "리워크 완료", 'merged': "불량표 통합", 'scanned': "불량표 스캔", 'replaced': "교환됨(불량)",
+                      'replacement': "교환 투입(양품)", 'stored': "잔량 보관", 'consumed': "잔량 사용"}
+
+        def show_results(barcode, events):
+            if not tree.winfo_exists(): return
+            for i in tree.get_children(): tree.delete(i)
+            for e in events:
+                tree.insert('', 'end', values=(e['timestamp'].replace('T', ' ')[:19], STAGE_NAMES.get(e['stage'], e['stage']),
+                                               role_names.get(e['role'], e['role']), e['ref'], e['worker'], e['source']))
+            if not events:
+                summary_label.config(text=f"'{barcode}' 의 기록을 찾을 수 없습니다.")
+                return
+            summary = BarcodeTraceIndex.summarize(events)
+            parts = []
+            if summary['inspection']:
+                parts.append(f"검사: {'양품' if summary['inspection'] == 'good' else '불량'}")
+            if summary['master_labels']:
+                parts.append(f"트레이 {len(summary['master_labels'])}건")
+            if summary['reworked']: parts.append("리워크 완료")
+            if summary['defect_boxes']: parts.append(f"불량표: {', '.join(summary['defect_boxes'])}")
+            if summary['exchanged_with']: parts.append(f"교환 상대: {', '.join(summary['exchanged_with'])}")
+            if summary['remnants']:
+                consumed = set(summary['remnants_consumed'])
+                parts.append("잔량표: " + ", ".join(f"{r}{' (사용됨)' if r in consumed else ''}" for r in summary['remnants']))
+            summary_label.config(text=f"{barcode} — " + " / ".join(parts))
+
+        def search(event=None):
+            barcode = barcode_var.get().strip()
+            if not barcode: return
+            summary_label.config(text="조회 중...")
+
+            def worker():
+                try:
+                    events = self.trace_index.lookup(barcode)
+                except Exception as e:
+                    self._dispatch_to_ui(lambda err=e: summary_label.winfo_exists() and summary_label.config(text=f"조회 중 오류가 발생했습니다: {err}"))
+                    return
+                self._dispatch_to_ui(lambda: show_results(barcode, events))
+            threading.Thread(target=worker, daemon=True).start()
+
+        barcode_entry.bind('<Return>', search)
+        ttk.Button(top_frame, text="조회", command=search, style='Secondary.TButton').pack(side=tk.LEFT)
+        barcode_entry.focus_set()
 
     def _populate_summary_tree(self, tree: ttk.Treeview, data: Dict):
         """집계된 데이터를 Treeview에 채웁니다."""
@@ -3980,7 +4463,7 @@ class InspectionProgram:
 
         # 제목
         title_label = ttk.Label(main_frame, text=f"품목 코드 '{item_code}'의 불량표 목록",
-                               style='TLabel', font=(self.DEFAULT_FONT, int(14 * self.scale_factor), 'bold'))
+                               style='TLabel', font=self._scaled_font(14, 'bold'))
         title_label.pack(pady=(0, 10))
 
         # 불량표 목록 프레임
@@ -4057,22 +4540,18 @@ class InspectionProgram:
                 return
 
             selected_item = tree.selection()[0]
-            values = tree.item(selected_item, 'values')
-            defect_id = values[0]
-
-            # 이미지 파일 경로 생성
-            image_path = os.path.join(self.labels_folder, f"불량표_{defect_id}.png")
+            tags = tree.item(selected_item, 'tags')
+            if not tags or not tags[0]:
+                return
 
-            if os.path.exists(image_path):
-                try:
-                    if sys.platform == "win32":
-                        os.startfile(image_path)
-                    else:
-                        subprocess.run(['xdg-open', image_path])
-                except Exception as e:
-                    messagebox.showerror("파일 열기 오류", f"이미지를 열 수 없습니다: {e}")
-            else:
-                messagebox.showwarning("파일 없음", "해당 불량표 이미지 파일을 찾을 수 없습니다.")
+            # 이미지는 JSON 레코드로부터 필요할 때 생성됩니다.
+            try:
+                with open(tags[0], 'r', encoding='utf-8') as f:
+                    defect_record = json.load(f)
+            except Exception as e:
+                messagebox.showerror("파일 오류", f"불량표 파일을 열 수 없습니다: {e}")
+                return
+            self._open_label_image('defective', defect_record)
 
         # 버튼들
         ttk.Button(button_frame, text="불량표 상세보기", command=open_defect_label).pack(side=tk.LEFT, padx=(0, 5))
@@ -4090,35 +4569,27 @@ class InspectionProgram:
             return defect_data
 
         try:
-            # 오늘 날짜의 폴더에서 검색
-            today = datetime.datetime.now()
-            daily_folder = self._get_daily_folder_path(self.defects_data_folder)
-
-            if os.path.exists(daily_folder):
-                for filename in os.listdir(daily_folder):
-                    if filename.endswith('.json') and filename.startswith('DEFECT-'):
-                        file_path = os.path.join(daily_folder, filename)
+            # 오늘 날짜의 폴더에서 검색 (불량 원장 색인. 색인을 만드는 중이면 오늘 폴더만 직접 읽음)
+            daily_folder = self._get_daily_folder_path(self.defects_data_folder, create=False)
+            if self._index_ready('defect_ledger'):
+                records = self.defect_ledger.records.items(daily_folder)
+            else:
+                records = self._read_defect_sheets(daily_folder)
+
+            for file_path, data in records:
+                # 해당 품목의 불량표인지 확인
+                if os.path.basename(file_path).startswith('DEFECT-') and data.get('item_code') == item_code:
+                    # 생성일시 포맷팅
+                    creation_date = data.get('creation_date', '')
+                    if creation_date:
                         try:
-                            with open(file_path, 'r', encoding='utf-8') as f:
-                                data = json.load(f)
-
-                            # 해당 품목의 불량표인지 확인
-                            if data.get('item_code') == item_code:
-                                # 생성일시 포맷팅
-                                creation_date = data.get('creation_date', '')
-                                if creation_date:
-                                    try:
-                                        dt = datetime.datetime.fromisoformat(creation_date.replace('Z', '+00:00'))
-                                        data['creation_date'] = dt.strftime('%Y-%m-%d %H:%M:%S')
-                                    except:
-                                        pass
-
-                                data['file_path'] = file_path
-                                defect_data.append(data)
-
-                        except Exception as e:
-                            print(f"불량표 파일 로드 오류 ({filename}): {e}")
-                            continue
+                            dt = datetime.datetime.fromisoformat(creation_date.replace('Z', '+00:00'))
+                            data['creation_date'] = dt.strftime('%Y-%m-%d %H:%M:%S')
+                        except:
+                            pass
+
+                    data['file_path'] = self.replicator.resolve(file_path)
+                    defect_data.append(data)
 
             # 생성일시 기준 내림차순 정렬 (최신순)
             defect_data.sort(key=lambda x: x.get('creation_date', ''), reverse=True)
@@ -4128,6 +4599,24 @@ class InspectionProgram:
 
         return defect_data
 
+    def _read_defect_sheets(self, folder: str) -> List[Tuple[str, dict]]:
+        """폴더 바로 아래 불량표(.json)를 직접 읽어 (경로, 레코드) 목록으로 반환합니다."""
+        records = []
+        try:
+            filenames = sorted(os.listdir(folder))
+        except OSError:
+            return records
+        for filename in filenames:
+            if not filename.endswith('.json'):
+                continue
+            file_path = os.path.join(folder, filename)
+            try:
+                with open(self.replicator.resolve(file_path), 'r', encoding='utf-8') as f:
+                    records.append((file_path, json.load(f)))
+            except (OSError, ValueError):
+                continue
+        return records
+
     def _show_defect_label_details_window(self, defect_data: Dict, file_path: str):
         """불량표의 상세 정보를 새 창에 표시합니다."""
         detail_win = tk.Toplevel(self.root)
@@ -4153,11 +4642,11 @@ class InspectionProgram:
         ]
 
         for i, (label, value) in enumerate(info_map):
-            ttk.Label(main_frame, text=label, style='TLabel', font=(self.DEFAULT_FONT, int(10 * self.scale_factor), 'bold')).grid(row=i, column=0, sticky='w', pady=2, padx=(0, 10))
+            ttk.Label(main_frame, text=label, style='TLabel', font=self._scaled_font(10, 'bold')).grid(row=i, column=0, sticky='w', pady=2, padx=(0, 10))
             ttk.Label(main_frame, text=str(value), style='TLabel').grid(row=i, column=1, sticky='w', pady=2)
 
         # 불량품 바코드 목록
-        ttk.Label(main_frame, text="불량품 바코드 목록:", style='TLabel', font=(self.DEFAULT_FONT, int(10 * self.scale_factor), 'bold')).grid(row=len(info_map), column=0, sticky='nw', pady=(15, 5), padx=(0, 10))
+        ttk.Label(main_frame, text="불량품 바코드 목록:", style='TLabel', font=self._scaled_font(10, 'bold')).grid(row=len(info_map), column=0, sticky='nw', pady=(15, 5), padx=(0, 10))
 
         # 바코드 리스트박스
         listbox_frame = ttk.Frame(main_frame)
@@ -4165,7 +4654,7 @@ class InspectionProgram:
         listbox_frame.grid_columnconfigure(0, weight=1)
         listbox_frame.grid_rowconfigure(0, weight=1)
 
-        barcodes_listbox = tk.Listbox(listbox_frame, height=12, font=(self.DEFAULT_FONT, int(9 * self.scale_factor)))
+        barcodes_listbox = tk.Listbox(listbox_frame, height=12, font=self._scaled_font(9))
         barcodes_listbox.grid(row=0, column=0, sticky='nsew')
 
         # 바코드 데이터 추가
@@ -4184,19 +4673,7 @@ class InspectionProgram:
 
         def open_image():
             """불량표 이미지를 엽니다."""
-            defect_id = defect_data.get('defect_box_id', '')
-            image_path = os.path.join(self.labels_folder, f"불량표_{defect_id}.png")
-
-            if os.path.exists(image_path):
-                try:
-                    if sys.platform == "win32":
-                        os.startfile(image_path)
-                    else:
-                        subprocess.run(['xdg-open', image_path])
-                except Exception as e:
-                    messagebox.showerror("파일 열기 오류", f"이미지를 열 수 없습니다: {e}")
-            else:
-                messagebox.showwarning("파일 없음", "해당 불량표 이미지 파일을 찾을 수 없습니다.")
+            self._open_label_image('defective', defect_data)
 
         ttk.Button(button_frame, text="불량표 이미지 열기", command=open_image).pack(side=tk.LEFT)
         ttk.Button(button_frame, text="닫기", command=detail_win.destroy).pack(side=tk.RIGHT)
@@ -4359,7 +4836,7 @@ class InspectionProgram:
 
         # 첫 스캔인 경우 품목 정보 설정
         if not session.item_code:
-            matched_item = next((item for item in self.items_data if item.get('Item Code') == item_code), None)
+            matched_item = self.item_master.get(item_code)
             if not matched_item:
                 self.show_fullscreen_warning("품목 없음",
                                             f"품목 코드 '{item_code}' 정보를 찾을 수 없습니다.",
@@ -4454,6 +4931,9 @@ class InspectionProgram:
 
 
 if __name__ == "__main__":
+    # 라벨 일괄 렌더링 프로세스 풀이 PyInstaller 실행 파일에서도 동작하도록 합니다.
+    import multiprocessing
+    multiprocessing.freeze_support()
     app = InspectionProgram()
     threading.Thread(target=check_and_apply_updates, args=(app,), daemon=True).start()
     app.run()
@@ -0,0 +1,423 @@
+"""합성 생산 데이터(Sync 폴더) 생성기
+
+사용법 (저장소 루트에서):
+    python benchmarks/generate_sync_data.py --out /tmp/sync                      # 3개월, 작업자 4명, 스테이션 2대
+    python benchmarks/generate_sync_data.py --out /tmp/sync --months 6 --workers 8 --stations 4 \\
+        --trays-per-day 30 --defect-rate 0.02 --seed 7 --end 2025-06-30
+    python -m core.log_analytics --log-dir /tmp/sync --out /tmp/report
+
+앱이 Sync 폴더에 남기는 것과 같은 구조를 만듭니다.
+  - stations/<스테이션 ID>/검사작업이벤트로그_<작업자>_<YYYYMMDD>.csv (리워크/불량처리 로그 포함, _log_event 형식)
+  - stations/<스테이션 ID>/completed_master_labels.csv (완료 현품표 등록부)
+  - defects_merged/YYYY-MM-DD/DEFECT-*.json, spare/SPARE-*.json (소진되지 않은 잔량만)
+  - labels/remnant_labels, labels/defective_labels (라벨 이미지는 앱에서 열 때 생성되므로 폴더만)
+
+품목은 Item.csv 에서 읽습니다. Item.csv 에 'Mix Weight', 'Defect Rate', 'Tray Qty' 열이 있으면
+품목별로 적용하고, 없으면 CSV 순서 기준 Zipf 분포(--mix-skew)와 명령줄 기본값을 씁니다.
+같은 --seed 와 --end 이면 같은 데이터가 만들어집니다.
+"""
+
+import argparse
+import csv
+import datetime
+import json
+import os
+import random
+import sys
+import time
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.completed_registry import REGISTRY_FILE, REGISTRY_HEADERS, EVENT_COMPLETE  # noqa: E402
+from core.item_master import compile_item_master, compute_csv_hash  # noqa: E402
+from core.log_shards import LOG_HEADERS, LOG_PREFIXES, SHARD_ROOT, sanitize_worker_name  # noqa: E402
+
+DEFAULT_ITEMS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'assets', 'Item.csv')
+COL_WEIGHT, COL_DEFECT_RATE, COL_TRAY_QTY = 'Mix Weight', 'Defect Rate', 'Tray Qty'
+IDLE_THRESHOLD_SEC = 420  # inspection.idle_threshold_sec 기본값
+SHIFT_START = datetime.time(8, 30)
+LUNCH_START = datetime.time(12, 0)
+LUNCH_SEC = 3600
+
+
+@dataclass(frozen=True)
+class ItemProfile:
+    code: str
+    name: str
+    spec: str
+    weight: float
+    defect_rate: float
+    tray_qty: int
+
+
+@dataclass
+class GeneratorOptions:
+    start: datetime.date
+    end: datetime.date
+    workers: int = 4
+    stations: int = 2
+    trays_per_day: float = 20.0
+    cycle_sec: float = 3.0
+    idle_rate: float = 0.0005        # 스캔 사이에 대기(IDLE)가 생길 확률
+    mismatch_rate: float = 0.001     # 품목 불일치 스캔 확률
+    partial_rate: float = 0.01       # 부분 제출 트레이 비율
+    remnant_rate: float = 0.05       # 트레이 완료 후 잔량표를 만드는 비율
+    remnant_use_rate: float = 0.5    # 같은 품목 잔량이 있을 때 트레이 시작 시 소진하는 비율
+    rework_rate: float = 0.4         # 불량 중 다음 작업일에 리워크되는 비율 (나머지는 불량표로 병합)
+    defect_box_size: int = 20
+    include_sundays: bool = False
+
+
+def _number(value: Optional[str], default, cast=float):
+    try:
+        return cast(value) if value not in (None, '') else default
+    except ValueError:
+        return default
+
+
+def load_item_profiles(path: str, defect_rate: float, tray_qty: int, mix_skew: float,
+                       limit: Optional[int] = None) -> List[ItemProfile]:
+    with open(path, 'rb') as f:
+        data = f.read()
+    records = [r for r in compile_item_master(data, compute_csv_hash(data))['records'] if r.get('Item Code')]
+    profiles = []
+    for rank, record in enumerate(records[:limit] if limit else records, 1):
+        profiles.append(ItemProfile(
+            record['Item Code'], record.get('Item Name', ''), record.get('Spec', ''),
+            weight=_number(record.get(COL_WEIGHT), 1.0 / rank ** mix_skew),
+            defect_rate=_number(record.get(COL_DEFECT_RATE), defect_rate),
+            tray_qty=_number(record.get(COL_TRAY_QTY), tray_qty, int)))
+    if not profiles:
+        raise ValueError(f"품목이 없습니다: {path}")
+    return profiles
+
+
+def _ts(moment: datetime.datetime) -> str:
+    return moment.isoformat()
+
+
+class _DayLogs:
+    """작업자 하루치 로그(검사/리워크/불량처리) 행 버퍼"""
+
+    def __init__(self, save_folder: str, station: str, worker: str, day: datetime.date):
+        self.worker = worker
+        self.paths = {kind: os.path.join(save_folder, SHARD_ROOT, station,
+                                         f"{prefix}_{sanitize_worker_name(worker)}_{day.strftime('%Y%m%d')}.csv")
+                      for kind, prefix in LOG_PREFIXES.items()}
+        self.rows: Dict[str, List[List[str]]] = defaultdict(list)
+
+    def event(self, kind: str, moment: datetime.datetime, event: str, detail: Optional[Dict[str, Any]] = None):
+        rows = self.rows[kind]
+        if not rows:
+            created = {'inspection': 'LOG_FILE_CREATED', 'rework': 'REWORK_LOG_FILE_CREATED',
+                       'defect_merge': 'DEFECT_MERGE_LOG_FILE_CREATED'}[kind]
+            rows.append([_ts(moment), self.worker, created, json.dumps({'path': self.paths[kind]}, ensure_ascii=False)])
+        rows.append([_ts(moment), self.worker, event, json.dumps(detail, ensure_ascii=False) if detail else ''])
+
+    def write(self) -> int:
+        count = 0
+        for kind, rows in self.rows.items():
+            os.makedirs(os.path.dirname(self.paths[kind]), exist_ok=True)
+            with open(self.paths[kind], 'w', newline='', encoding='utf-8-sig') as f:
+                writer = csv.writer(f)
+                writer.writerow(LOG_HEADERS)
+                writer.writerows(rows)
+            count += len(rows)
+        return count
+
+
+class SyncDataGenerator:
+    def __init__(self, save_folder: str, items: List[ItemProfile], options: GeneratorOptions, seed: int = 0):
+        self.save_folder = save_folder
+        self.items = items
+        self.weights = [item.weight for item in items]
+        self.opt = options
+        self.rng = random.Random(seed)
+        self.stations = [f"{self.rng.getrandbits(48):012x}" for _ in range(options.stations)]
+        self.workers = [(f"작업자{i + 1:02d}", self.stations[i % len(self.stations)]) for i in range(options.workers)]
+        self.serial = 0
+        self.work_order = 0
+        self.ids = set()
+        self.remnants: Dict[str, deque] = defaultdict(deque)   # 품목코드 → 잔량 레코드 (오래된 순)
+        self.pending_defects: List[tuple] = []                  # (바코드, 품목, 발생일)
+        self.merge_pool: Dict[str, deque] = defaultdict(deque)  # 품목코드 → 병합 대기 불량 바코드
+        self.registry: Dict[str, List[List[str]]] = defaultdict(list)
+        self.stats = defaultdict(int)
+
+    # ------------------------------------------------------------------
+    def run(self):
+        for folder in ('spare', 'defects_merged', os.path.join('labels', 'remnant_labels'),
+                       os.path.join('labels', 'defective_labels')):
+            os.makedirs(os.path.join(self.save_folder, folder), exist_ok=True)
+        day = self.opt.start
+        while day <= self.opt.end:
+            if self.opt.include_sundays or day.weekday() != 6:
+                self._day(day)
+            day += datetime.timedelta(days=1)
+        self._write_remnants()
+        self._write_registries()
+        return dict(self.stats)
+
+    def _day(self, day: datetime.date):
+        logs, clocks = {}, {}
+        for worker, station in self.workers:
+            logs[worker] = _DayLogs(self.save_folder, station, worker, day)
+            clocks[worker] = self._inspection_shift(logs[worker], station, day)
+        # 전날까지 발생한 불량은 오늘 검사를 마친 작업자가 리워크하거나 불량표로 병합합니다.
+        due = [d for d in self.pending_defects if d[2] < day]
+        self.pending_defects = [d for d in self.pending_defects if d[2] >= day]
+        self._rework_and_merge(logs, clocks, due, day)
+        for worker, day_logs in logs.items():
+            day_logs.event('inspection', clocks[worker] + datetime.timedelta(seconds=self.rng.uniform(30, 300)), 'WORK_END')
+            self.stats['rows'] += day_logs.write()
+            self.stats['files'] += len(day_logs.rows)
+
+    def _unique_id(self, prefix: str, moment: datetime.datetime) -> str:
+        while True:
+            label_id = f"{prefix}-{moment.strftime('%Y%m%d-%H%M%S%f')}"
+            if label_id not in self.ids:
+                self.ids.add(label_id)
+                return label_id
+            moment += datetime.timedelta(microseconds=1)
+
+    def _barcode(self, item: ItemProfile, day: datetime.date) -> str:
+        self.serial += 1
+        return f"{item.code}{day.strftime('%y%m%d')}{self.serial:07d}"
+
+    # ------------------------------------------------------------------
+    def _inspection_shift(self, logs: _DayLogs, station: str, day: datetime.date):
+        rng = self.rng
+        now = datetime.datetime.combine(day, SHIFT_START) + datetime.timedelta(seconds=rng.uniform(0, 1200),
+                                                                               microseconds=rng.randrange(1000000))
+        logs.event('inspection', now, 'WORK_START')
+        lunch_done = False
+        trays = max(0, round(rng.gauss(self.opt.trays_per_day, self.opt.trays_per_day * 0.2)))
+        for _ in range(trays):
+            now += datetime.timedelta(seconds=rng.uniform(20, 90))
+            if not lunch_done and now.time() >= LUNCH_START:
+                now = self._idle(logs, now, LUNCH_SEC + rng.uniform(-300, 300))
+                lunch_done = True
+            now = self._tray(logs, station, day, now)
+        return now
+
+    def _idle(self, logs: _DayLogs, last_activity: datetime.datetime, gap: float) -> datetime.datetime:
+        logs.event('inspection', last_activity + datetime.timedelta(seconds=IDLE_THRESHOLD_SEC), 'IDLE_START')
+        now = last_activity + datetime.timedelta(seconds=gap)
+        logs.event('inspection', now, 'IDLE_END', {'duration_sec': f"{gap:.2f}"})
+        return now
+
+    def _tray(self, logs: _DayLogs, station: str, day: datetime.date, now: datetime.datetime) -> datetime.datetime:
+        rng, opt = self.rng, self.opt
+        item = rng.choices(self.items, self.weights)[0]
+        self.work_order += 1
+        label = {'WID': f"WO{day.strftime('%y%m%d')}{self.work_order:06d}", 'CLC': item.code, 'QT': str(item.tray_qty),
+                 'PHS': str(rng.randint(1, 3)), 'SPC': 'KMT', 'FPB': f"{day.strftime('%y%m%d')}{rng.choice('ABC')}",
+                 'OBD': day.isoformat(), 'PJT': item.spec}
+        master_label_code = '|'.join(f"{key}={value}" for key, value in label.items())
+        logs.event('inspection', now, 'MASTER_LABEL_SCANNED', label)
+        start = now
+
+        good, defective, idle_total, paused, errors = [], [], 0.0, 0.0, 0
+        remnants = self.remnants.get(item.code)
+        if remnants and len(remnants[0]['remnant_barcodes']) <= item.tray_qty and rng.random() < opt.remnant_use_rate:
+            remnant = remnants.popleft()
+            for barcode in remnant['remnant_barcodes']:
+                now += datetime.timedelta(seconds=rng.uniform(0.05, 0.2))
+                logs.event('inspection', now, 'INSPECTION_GOOD', {'barcode': barcode})
+                good.append(barcode)
+            logs.event('inspection', now, 'REMNANT_CONSUMED', {'remnant_id': remnant['remnant_id']})
+            self.stats['remnants_consumed'] += 1
+
+        target = item.tray_qty
+        if rng.random() < opt.partial_rate:
+            target = rng.randint(max(1, len(good)), item.tray_qty)
+        while len(good) < target:
+            gap = max(0.8, rng.gauss(opt.cycle_sec, opt.cycle_sec * 0.25))
+            if rng.random() < opt.idle_rate:
+                gap = rng.uniform(IDLE_THRESHOLD_SEC + 60, 1800)
+                now = self._idle(logs, now, gap)
+                idle_total += gap
+                paused += gap - IDLE_THRESHOLD_SEC
+            else:
+                now += datetime.timedelta(seconds=gap)
+            if rng.random() < opt.mismatch_rate:
+                other = rng.choice(self.items)
+                errors += 1
+                logs.event('inspection', now, 'SCAN_FAIL_MISMATCH',
+                           {'expected': item.code, 'scanned': self._barcode(other, day)})
+                continue
+            barcode = self._barcode(item, day)
+            if rng.random() < item.defect_rate:
+                logs.event('inspection', now, 'INSPECTION_DEFECTIVE', {'barcode': barcode})
+                defective.append(barcode)
+                self.pending_defects.append((barcode, item, day))
+            else:
+                logs.event('inspection', now, 'INSPECTION_GOOD', {'barcode': barcode})
+                good.append(barcode)
+
+        now += datetime.timedelta(seconds=rng.uniform(0.5, 2.0))
+        detail = {
+            'master_label_code': master_label_code, 'item_code': item.code,
+            'item_name': item.name, 'item_spec': item.spec,
+            'scan_count': len(good) + len(defective), 'tray_capacity': item.tray_qty,
+            'scanned_product_barcodes': good, 'defective_product_barcodes': defective,
+            'work_time_sec': (now - start).total_seconds() - paused, 'error_count': errors,
+            'total_idle_seconds': idle_total, 'has_error_or_reset': bool(defective or errors),
+            'is_partial_submission': target < item.tray_qty, 'is_restored_session': False,
+            'start_time': start.isoformat(), 'end_time': now.isoformat(), 'is_remnant_session': False
+        }
+        logs.event('inspection', now, 'TRAY_COMPLETE', detail)
+        self.registry[station].append([_ts(now), EVENT_COMPLETE, master_label_code, logs.worker,
+                                       os.path.relpath(logs.paths['inspection'], self.save_folder)])
+        self.stats['trays'] += 1
+        self.stats['scans'] += len(good) + len(defective)
+        self.stats['defects'] += len(defective)
+
+        if rng.random() < opt.remnant_rate:
+            now = self._create_remnant(logs, item, day, now)
+        return now
+
+    def _create_remnant(self, logs: _DayLogs, item: ItemProfile, day: datetime.date,
+                        now: datetime.datetime) -> datetime.datetime:
+        count = self.rng.randint(1, max(1, item.tray_qty // 4))
+        now += datetime.timedelta(seconds=count * self.rng.uniform(1.0, 2.0))
+        remnant = {
+            "remnant_id": self._unique_id('SPARE', now),
+            "creation_date": now.isoformat(),
+            "worker": logs.worker,
+            "item_code": item.code,
+            "item_name": item.name,
+            "item_spec": item.spec,
+            "remnant_barcodes": [self._barcode(item, day) for _ in range(count)]
+        }
+        logs.event('inspection', now, 'REMNANT_CREATED', remnant)
+        self.remnants[item.code].append(remnant)
+        self.stats['remnants_created'] += 1
+        return now
+
+    # ------------------------------------------------------------------
+    def _rework_and_merge(self, logs: Dict[str, _DayLogs], clocks: Dict[str, datetime.datetime],
+                          due: List[tuple], day: datetime.date):
+        rng = self.rng
+        names = [worker for worker, _ in self.workers]
+        for barcode, item, _ in due:
+            if rng.random() >= self.opt.rework_rate:
+                self.merge_pool[item.code].append((barcode, item))
+                continue
+            worker = rng.choice(names)
+            clocks[worker] += datetime.timedelta(seconds=rng.uniform(20, 90))
+            moment = clocks[worker]
+            logs[worker].event('rework', moment, 'REWORK_SUCCESS',
+                               {'barcode': barcode, 'rework_time': moment.strftime('%Y-%m-%d %H:%M:%S')})
+            self.stats['reworks'] += 1
+
+        for code in sorted(self.merge_pool):
+            pool = self.merge_pool[code]
+            while len(pool) >= self.opt.defect_box_size:
+                batch = [pool.popleft() for _ in range(self.opt.defect_box_size)]
+                item = batch[0][1]
+                worker = rng.choice(names)
+                day_logs = logs[worker]
+                # 검사 모드의 불량 판정은 품목코드가 없어 불량 처리 목록에 없으므로, 앱처럼 직접 스캔으로 기록됩니다.
+                for barcode, _ in batch:
+                    clocks[worker] += datetime.timedelta(seconds=rng.uniform(1.5, 4.0))
+                    day_logs.event('inspection', clocks[worker], 'INSPECTION_DEFECTIVE', {
+                        'barcode': barcode, 'item_code': item.code, 'item_name': item.name,
+                        'direct_scan': True, 'scan_time': clocks[worker].isoformat()})
+                clocks[worker] += datetime.timedelta(seconds=rng.uniform(2, 10))
+                moment = clocks[worker]
+                defect_box_id = self._unique_id('DEFECT', moment)
+                defect_data = {
+                    "defect_box_id": defect_box_id,
+                    "creation_date": moment.isoformat(),
+                    "worker": worker,
+                    "item_code": item.code,
+                    "item_name": item.name,
+                    "item_spec": item.spec,
+                    "quantity": len(batch),
+                    "barcodes": [barcode for barcode, _ in batch]
+                }
+                self._write_json(os.path.join('defects_merged', day.strftime('%Y-%m-%d'), f"{defect_box_id}.json"),
+                                 defect_data)
+                day_logs.event('defect_merge', moment, 'DEFECT_MERGE_COMPLETE', defect_data)
+                self.stats['defect_boxes'] += 1
+
+    # ------------------------------------------------------------------
+    def _write_json(self, relpath: str, data: Dict[str, Any]):
+        path = os.path.join(self.save_folder, relpath)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=4)
+
+    def _write_remnants(self):
+        for remnants in self.remnants.values():
+            for remnant in remnants:
+                self._write_json(os.path.join('spare', f"{remnant['remnant_id']}.json"), remnant)
+
+    def _write_registries(self):
+        for station, rows in self.registry.items():
+            path = os.path.join(self.save_folder, SHARD_ROOT, station, REGISTRY_FILE)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(REGISTRY_HEADERS)
+                writer.writerows(sorted(rows, key=lambda r: r[0]))
+
+
+def _parse_date(value: str) -> datetime.date:
+    try:
+        return datetime.date.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"날짜 형식은 YYYY-MM-DD 입니다: {value}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--out', required=True, help="생성할 Sync 폴더 (비어 있는 폴더 권장)")
+    parser.add_argument('--months', type=int, default=3, help="기간 (30일 단위, --start 가 없을 때)")
+    parser.add_argument('--start', type=_parse_date, help="시작일 (YYYY-MM-DD)")
+    parser.add_argument('--end', type=_parse_date, help="종료일 (기본: 어제)")
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--stations', type=int, default=2)
+    parser.add_argument('--trays-per-day', type=float, default=20.0, help="작업자 1명의 하루 평균 트레이 수")
+    parser.add_argument('--defect-rate', type=float, default=0.01, help="품목 기본 불량률 (Item.csv 'Defect Rate' 우선)")
+    parser.add_argument('--tray-qty', type=int, default=60, help="품목 기본 트레이 수량 (Item.csv 'Tray Qty' 우선)")
+    parser.add_argument('--mix-skew', type=float, default=1.0, help="품목 구성 Zipf 지수 (0: 균등, Item.csv 'Mix Weight' 우선)")
+    parser.add_argument('--items', default=DEFAULT_ITEMS, help="품목 CSV (기본: assets/Item.csv)")
+    parser.add_argument('--item-limit', type=int, help="CSV 앞쪽 N개 품목만 사용")
+    parser.add_argument('--cycle-sec', type=float, default=3.0, help="평균 스캔 간격(초)")
+    parser.add_argument('--rework-rate', type=float, default=0.4)
+    parser.add_argument('--remnant-rate', type=float, default=0.05)
+    parser.add_argument('--defect-box-size', type=int, default=20)
+    parser.add_argument('--include-sundays', action='store_true')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    end = args.end or datetime.date.today() - datetime.timedelta(days=1)
+    start = args.start or end - datetime.timedelta(days=30 * args.months - 1)
+    if start > end:
+        print("시작일이 종료일보다 늦습니다.", file=sys.stderr)
+        return 2
+    if os.path.isdir(args.out) and os.listdir(args.out):
+        print(f"주의: 비어 있지 않은 폴더입니다. 같은 이름의 파일은 덮어씁니다: {args.out}", file=sys.stderr)
+
+    items = load_item_profiles(args.items, args.defect_rate, args.tray_qty, args.mix_skew, args.item_limit)
+    options = GeneratorOptions(start, end, workers=args.workers, stations=args.stations,
+                               trays_per_day=args.trays_per_day, cycle_sec=args.cycle_sec,
+                               remnant_rate=args.remnant_rate, rework_rate=args.rework_rate,
+                               defect_box_size=args.defect_box_size, include_sundays=args.include_sundays)
+    t0 = time.perf_counter()
+    stats = SyncDataGenerator(os.path.abspath(args.out), items, options, args.seed).run()
+    print(f"{start} ~ {end}: 품목 {len(items)}개, 작업자 {args.workers}명, 스테이션 {args.stations}대 "
+          f"({time.perf_counter() - t0:.1f}초)")
+    for key in ('files', 'rows', 'trays', 'scans', 'defects', 'reworks', 'defect_boxes',
+                'remnants_created', 'remnants_consumed'):
+        print(f"  {key:>18}: {stats.get(key, 0):,}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
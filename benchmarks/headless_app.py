@@ -0,0 +1,119 @@
+"""벤치마크용 화면 없는(headless) InspectionProgram
+
+Tk 창을 만들지 않고 InspectionProgram._init_services() 로 로그 기록 스레드, 동기화 복제, 메모리 색인만
+만든 뒤 실제 앱 메서드(_load_session_state, record_inspection_result, complete_session 등)를 그대로 호출합니다.
+화면 갱신 메서드(UI_METHODS)는 아무 일도 하지 않고, 확인 대화상자는 모두 '예'로 답합니다.
+앱 모듈을 import 하므로 앱 실행에 필요한 라이브러리(pygame, keyboard, requests 등)가 설치되어 있어야 합니다.
+"""
+
+import os
+import sys
+import threading
+from typing import Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import Inspection_worker as app  # noqa: E402
+from core.models import InspectionSession  # noqa: E402
+from core.completion_rollup import parse_master_label_qr  # noqa: E402
+from utils.file_handler import SAVE_FOLDER_ENV  # noqa: E402
+
+# 위젯을 갱신하는 메서드. 측정 대상 흐름 중에 호출되지만 화면이 없으므로 건너뜁니다.
+UI_METHODS = (
+    'show_status_message', 'show_fullscreen_warning', '_update_current_item_label', '_update_all_summaries',
+    '_update_defective_mode_ui', '_update_center_display', '_redraw_scan_trees', '_apply_mode_ui',
+    '_update_stopwatch', '_set_idle_style', '_schedule_focus_return', '_update_sync_indicator',
+    '_dispatch_to_ui',
+)
+
+
+class _HeadlessRoot:
+    """tk.Tk 대신 쓰는 빈 루트. winfo_exists() 가 False 이므로 앱의 화면 갱신 분기를 타지 않습니다."""
+
+    def winfo_exists(self):
+        return False
+
+    def after(self, *args, **kwargs):
+        return None
+
+    def after_cancel(self, *args):
+        pass
+
+    def update_idletasks(self):
+        pass
+
+    def destroy(self):
+        pass
+
+
+class _AutoDialogs:
+    """tkinter.messagebox 대체: ask* 질문은 모두 '예', 알림은 무시합니다."""
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: True if name.startswith('ask') else None
+
+
+def _skip_ui(self, *args, **kwargs):
+    return None
+
+
+class HeadlessInspection(app.InspectionProgram):
+    """save_folder 를 Sync 폴더로, config_folder 를 설정/캐시/outbox 폴더로 쓰는 화면 없는 앱
+
+    station 을 주면 그 스테이션 ID 로 실행합니다. (합성 데이터의 스테이션 로그를 자기 로그로 다룰 때)
+    """
+
+    def __init__(self, save_folder: str, config_folder: str, worker_name: Optional[str] = None,
+                 station: Optional[str] = None):
+        self.station = station
+        os.environ[SAVE_FOLDER_ENV] = save_folder
+        app.messagebox = _AutoDialogs()
+        self.root = _HeadlessRoot()
+        self.current_mode = "standard"
+        self.success_sound = self.error_sound = None
+        self.application_path = config_folder
+        self.config_folder = config_folder
+        self.info_cards = {}
+        self._init_services()
+        if worker_name:
+            self.worker_name = worker_name
+
+    def _detect_computer_id(self) -> str:
+        return f"0x{self.station}" if self.station else super()._detect_computer_id()
+
+    def _index_ready(self, name: str) -> bool:
+        # Tk 스레드가 없으므로 앱처럼 백그라운드 생성을 기다리지 않고 바로 만듭니다. (cold 측정 대상)
+        getattr(self, name).ensure_built()
+        return True
+
+    def flush_logs(self):
+        """로그 기록 스레드가 대기열을 모두 쓸 때까지 기다립니다."""
+        self.log_queue.put(('main', None))
+        self.log_thread.join()
+        self.log_thread = threading.Thread(target=self._event_log_writer, daemon=True)
+        self.log_thread.start()
+
+    def start_tray(self, master_label_code: str):
+        """현품표 스캔 직후와 같은 상태로 새 트레이를 시작합니다. (_process_inspection_scan 의 현품표 분기)"""
+        parsed = parse_master_label_qr(master_label_code) or {}
+        item = self.item_master.get(parsed.get('CLC')) or {}
+        self.current_session = InspectionSession(
+            master_label_code=master_label_code, item_code=item.get('Item Code', ''),
+            item_name=item.get('Item Name', ''), item_spec=item.get('Spec', ''),
+            phs=parsed.get('PHS', ''), work_order_id=parsed.get('WID', ''), supplier_code=parsed.get('SPC', ''),
+            finished_product_batch=parsed.get('FPB', ''), outbound_date=parsed.get('OBD', ''),
+            item_group=parsed.get('PJT', ''),
+            quantity=int(parsed.get('QT') or app.config.get('inspection.tray_size', 60)))
+        self._log_event('MASTER_LABEL_SCANNED', detail=parsed)
+        self._start_stopwatch()
+        self._save_current_session_state()
+
+    def close(self, flush_sec: float = 10.0):
+        self.flush_logs()
+        self.log_queue.put(('main', None))
+        self.replicator.flush(flush_sec)
+        self.replicator.stop()
+
+
+for _name in UI_METHODS:
+    setattr(HeadlessInspection, _name, _skip_ui)
@@ -0,0 +1,395 @@
+"""운영 핵심 동작 벤치마크 모음 및 기준값(baseline) 비교
+
+사용법 (저장소 루트에서):
+    python benchmarks/hot_paths_benchmark.py                        # S/M/L 데이터로 측정 후 기준값과 비교
+    python benchmarks/hot_paths_benchmark.py --sizes S M --only login scan complete
+    python benchmarks/hot_paths_benchmark.py --update-baseline      # 현재 결과를 기준값으로 저장
+    python benchmarks/hot_paths_benchmark.py --json result.json
+
+크기별로 generate_sync_data.py 의 합성 Sync 폴더(오늘까지의 기간)를 만들고, headless_app.HeadlessInspection 으로
+작업자가 기다리는 실제 앱 메서드를 호출해 시간을 잽니다. 화면(Tk)이 필요 없으므로 원격/CI PC 에서도 실행됩니다.
+  login      로그인 시 금일/주간 이력 로드 (_load_session_state)
+  scan       제품 스캔 1건 처리 (중복 확인 + record_inspection_result)
+  complete   트레이 완료 (complete_session, +write 는 로그 기록 스레드 반영까지)
+  defects    불량 처리 모드 목록 로드 (load_all_defective_items)
+  summary    완료 현황 조회 (_get_completion_summary_data, 최근 1주/1개월/전체 기간)
+  swap       완료된 현품표 교체 (새 현품표 스캔부터 로그 수정·이력 재로드까지)
+  labels     불량표/잔량표 라벨 이미지 생성 (LabelImageCache.materialize)
+  log_writer 이벤트 로그 기록 스레드 처리량 (1,000건당)
+
+결과는 항목별 중앙값/p95(ms)이며, 기준값보다 중앙값이 --tolerance 비율과 --min-delta-ms 를 모두 넘게
+느려진 항목이 있으면 종료 코드 1 입니다. 기준값은 PC 성능에 따라 다르므로 출고 검증에 쓰는 PC 에서 만들어 두고
+같은 PC 에서 비교합니다.
+"""
+
+import argparse
+import csv
+import datetime
+import glob
+import itertools
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from generate_sync_data import GeneratorOptions, SyncDataGenerator, load_item_profiles, DEFAULT_ITEMS  # noqa: E402
+from headless_app import HeadlessInspection  # noqa: E402
+from core.completed_registry import REGISTRY_FILE, EVENT_COMPLETE  # noqa: E402
+from core.log_shards import SHARD_ROOT  # noqa: E402
+from core.label_cache import label_fields_from_record  # noqa: E402
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baselines', 'hot_paths.json')
+BENCH_WORKER = "작업자01"  # generate_sync_data 의 첫 번째 작업자
+
+# 데이터 크기 단계: Sync 폴더 규모(기간/작업자/스테이션/트레이 수)와 단계별 트레이 수량/라벨 수/로그 건수
+SIZES = {
+    'S': dict(months=1, workers=2, stations=1, trays_per_day=10, scan_tray=60, labels=5, log_events=2000),
+    'M': dict(months=3, workers=4, stations=2, trays_per_day=20, scan_tray=500, labels=20, log_events=10000),
+    'L': dict(months=6, workers=8, stations=4, trays_per_day=30, scan_tray=2000, labels=50, log_events=50000),
+}
+
+
+def _timed(func, *args):
+    t0 = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - t0
+
+
+class BenchContext:
+    def __init__(self, size_name: str, save_folder: str, work_dir: str, items, repeat: int):
+        self.size_name = size_name
+        self.size = SIZES[size_name]
+        self.save_folder = save_folder
+        self.work_dir = work_dir
+        self.items = items
+        self.repeat = repeat
+        self._counter = itertools.count(1)
+        self._apps = []
+
+    def new_app(self, load_history: bool = True, station: str = None) -> HeadlessInspection:
+        """설정/캐시/outbox 가 비어 있는 새 앱 (첫 실행과 같은 상태)"""
+        config_folder = os.path.join(self.work_dir, f"config_{next(self._counter)}")
+        program = HeadlessInspection(self.save_folder, config_folder, BENCH_WORKER, station)
+        if load_history:
+            program._load_session_state()
+            program.flush_logs()
+        self._apps.append(program)
+        return program
+
+    def close_apps(self):
+        for program in self._apps:
+            program.close()
+        self._apps.clear()
+
+    def master_label(self, quantity: int, item_code: str = None) -> str:
+        code = item_code or self.items[0].code
+        return (f"WID=BENCH{next(self._counter):08d}|CLC={code}|QT={quantity}|PHS=1|SPC=KMT|"
+                f"FPB=BENCH|OBD={datetime.date.today().isoformat()}|PJT=BENCH")
+
+    def barcode(self, item_code: str) -> str:
+        return f"{item_code}BN{next(self._counter):010d}"
+
+
+def _fill_tray(ctx: BenchContext, program: HeadlessInspection, count: int):
+    item_code = program.current_session.item_code
+    for _ in range(count):
+        program.record_inspection_result(ctx.barcode(item_code), 'Good')
+
+
+# ----------------------------------------------------------------------
+# 측정 항목: 각 함수는 {변형 이름: [초, ...]} 를 반환합니다.
+# ----------------------------------------------------------------------
+def bench_login(ctx):
+    cold, warm = [], []
+    for _ in range(ctx.repeat):
+        program = ctx.new_app(load_history=False)
+        cold.append(_timed(program._load_session_state))
+        program.flush_logs()
+        warm.append(_timed(program._load_session_state))
+    return {'cold': cold, 'warm': warm}
+
+
+def bench_scan(ctx):
+    program = ctx.new_app()
+    quantity = ctx.size['scan_tray']
+    program.start_tray(ctx.master_label(quantity))
+    item_code = program.current_session.item_code
+    timings = []
+    for _ in range(quantity - 1):  # 마지막 스캔은 트레이 완료로 이어지므로 제외
+        barcode = ctx.barcode(item_code)
+        t0 = time.perf_counter()
+        if not program.current_session.has_scanned(barcode):
+            program.record_inspection_result(barcode, 'Good')
+        timings.append(time.perf_counter() - t0)
+    return {'per_scan': timings}
+
+
+def bench_complete(ctx):
+    program = ctx.new_app()
+    quantity = ctx.size['scan_tray']
+    call, written = [], []
+    for _ in range(ctx.repeat):
+        program.start_tray(ctx.master_label(quantity))
+        _fill_tray(ctx, program, quantity - 1)
+        program.flush_logs()
+        t0 = time.perf_counter()
+        program.complete_session()
+        call.append(time.perf_counter() - t0)
+        program.flush_logs()
+        written.append(time.perf_counter() - t0)
+    return {'call': call, 'call+write': written}
+
+
+def bench_defects(ctx):
+    cold, warm = [], []
+    for _ in range(ctx.repeat):
+        program = ctx.new_app()
+        cold.append(_timed(program.load_all_defective_items))
+        warm.append(_timed(program.load_all_defective_items))
+    return {'cold': cold, 'warm': warm}
+
+
+def bench_summary(ctx):
+    today = datetime.date.today()
+    spans = {'week': 7, 'month': 31, 'all': 30 * ctx.size['months'] + 7}
+    results = {}
+    for name, days in spans.items():
+        cold, warm = [], []
+        for _ in range(ctx.repeat):
+            program = ctx.new_app(load_history=False)
+            start = today - datetime.timedelta(days=days)
+            cold.append(_timed(program._get_completion_summary_data, start, today))
+            warm.append(_timed(program._get_completion_summary_data, start, today))
+        results[f'{name}_cold'], results[f'{name}_warm'] = cold, warm
+    return results
+
+
+def _completed_labels_by_time(save_folder: str, station: str):
+    with open(os.path.join(save_folder, SHARD_ROOT, station, REGISTRY_FILE), 'r', encoding='utf-8', newline='') as f:
+        rows = [(row['timestamp'], row['master_label_code']) for row in csv.DictReader(f)
+                if row.get('event') == EVENT_COMPLETE]
+    return [code for _, code in sorted(rows)]
+
+
+def bench_swap(ctx):
+    # 교체는 작업을 완료한 스테이션에서만 하므로 합성 데이터의 첫 스테이션으로 실행합니다.
+    # (앞서 측정한 앱의 스테이션 폴더에는 등록부가 없을 수 있습니다)
+    station = min(name for name in os.listdir(os.path.join(ctx.save_folder, SHARD_ROOT))
+                  if os.path.exists(os.path.join(ctx.save_folder, SHARD_ROOT, name, REGISTRY_FILE)))
+    program = ctx.new_app(station=station)
+    labels = _completed_labels_by_time(ctx.save_folder, station)
+    count = min(ctx.repeat, len(labels) // 2)
+    results = {}
+    for variant, codes in (('recent', labels[-count:]), ('oldest', labels[:count])):
+        timings = []
+        for old_label in codes:
+            new_label = old_label.replace('WID=', f"WID=SW{next(ctx._counter):04d}", 1)
+            program.master_label_replace_state = 'awaiting_old_completed'
+            program._handle_historical_replacement_scan(old_label)
+            timings.append(_timed(program._handle_historical_replacement_scan, new_label))
+            program.flush_logs()
+        results[variant] = timings
+    return results
+
+
+def bench_labels(ctx):
+    program = ctx.new_app(load_history=False)
+    records = []
+    for template_name, pattern in (('defective', os.path.join('defects_merged', '*', '*.json')),
+                                   ('remnant', os.path.join('spare', '*.json'))):
+        for path in sorted(glob.glob(os.path.join(ctx.save_folder, pattern)))[:ctx.size['labels']]:
+            with open(path, 'r', encoding='utf-8') as f:
+                records.append((template_name, label_fields_from_record(template_name, json.load(f))))
+    rendered, cached = [], []
+    for template_name, fields in records:
+        rendered.append(_timed(program.label_image_cache.materialize, template_name, fields))
+    for template_name, fields in records:
+        cached.append(_timed(program.label_image_cache.materialize, template_name, fields))
+    return {'render': rendered, 'cached': cached}
+
+
+def bench_log_writer(ctx):
+    program = ctx.new_app()
+    count = ctx.size['log_events']
+    # 기록 스레드를 멈춘 상태로 이벤트를 쌓은 뒤, 새 기록 스레드가 모두 쓰는 데 걸린 시간을 잽니다.
+    program.log_queue.put(('main', None))
+    program.log_thread.join()
+    timings = []
+    for _ in range(ctx.repeat):
+        program.start_tray(ctx.master_label(60))
+        barcodes = []
+        for i in range(count):
+            barcode = ctx.barcode(program.current_session.item_code)
+            barcodes.append(barcode)
+            program._log_event('INSPECTION_GOOD', detail={'barcode': barcode})
+            if len(barcodes) == 60:
+                program._log_event('TRAY_COMPLETE', detail={'master_label_code': program.current_session.master_label_code,
+                                                             'item_code': program.current_session.item_code,
+                                                             'scanned_product_barcodes': barcodes}, owned=True)
+                barcodes = []
+        writer = threading.Thread(target=program._event_log_writer, daemon=True)
+        t0 = time.perf_counter()
+        writer.start()
+        program.log_queue.put(('main', None))
+        writer.join()
+        timings.append((time.perf_counter() - t0) * 1000 / (count + count // 60))  # 1,000건당 초
+    program.log_thread = threading.Thread(target=program._event_log_writer, daemon=True)
+    program.log_thread.start()
+    return {'per_1k_events': timings}
+
+
+BENCHMARKS = {
+    'login': bench_login,
+    'defects': bench_defects,
+    'summary': bench_summary,
+    'labels': bench_labels,
+    'scan': bench_scan,
+    'complete': bench_complete,
+    'swap': bench_swap,
+    'log_writer': bench_log_writer,
+}
+
+
+# ----------------------------------------------------------------------
+# 결과 / 기준값 비교
+# ----------------------------------------------------------------------
+def _stats(timings, size_name, params):
+    ms = sorted(t * 1000 for t in timings)
+    p95 = ms[min(len(ms) - 1, int(round(0.95 * (len(ms) - 1))))]
+    return {'size': size_name, 'params': params, 'n': len(ms), 'median_ms': statistics.median(ms),
+            'p95_ms': p95, 'min_ms': ms[0], 'mean_ms': statistics.mean(ms)}
+
+
+def _machine_info():
+    return {'python': sys.version.split()[0], 'platform': platform.platform(), 'machine': platform.machine(),
+            'processor': platform.processor(), 'cpu_count': os.cpu_count(), 'node': platform.node()}
+
+
+def compare(results, baseline, tolerance, min_delta_ms):
+    """항목별 (현재, 기준, 비율, 회귀 여부). 기준값에 없는 항목은 비교하지 않습니다."""
+    rows = []
+    base_results = (baseline or {}).get('results', {})
+    for key, current in results.items():
+        base = base_results.get(key)
+        if not base:
+            rows.append({'key': key, 'median_ms': current['median_ms'], 'baseline_ms': None, 'ratio': None,
+                         'regressed': False})
+            continue
+        delta = current['median_ms'] - base['median_ms']
+        ratio = current['median_ms'] / base['median_ms'] if base['median_ms'] > 0 else float('inf')
+        rows.append({'key': key, 'median_ms': current['median_ms'], 'baseline_ms': base['median_ms'],
+                     'ratio': ratio, 'regressed': ratio > 1 + tolerance and delta > min_delta_ms})
+    return rows
+
+
+def _print_results(results, comparison):
+    by_key = {row['key']: row for row in comparison}
+    print(f"\n{'항목':<34} {'median ms':>11} {'p95 ms':>10} {'n':>6} {'baseline':>10} {'ratio':>7}")
+    for key, stats in results.items():
+        row = by_key.get(key, {})
+        base = f"{row['baseline_ms']:.3f}" if row.get('baseline_ms') is not None else '-'
+        ratio = f"{row['ratio']:.2f}" if row.get('ratio') is not None else '-'
+        flag = '  << 회귀' if row.get('regressed') else ''
+        print(f"{key:<34} {stats['median_ms']:>11.3f} {stats['p95_ms']:>10.3f} {stats['n']:>6} {base:>10} {ratio:>7}{flag}")
+
+
+def _generate(size_name, folder, items, seed):
+    size = SIZES[size_name]
+    end = datetime.date.today()
+    options = GeneratorOptions(end - datetime.timedelta(days=30 * size['months'] - 1), end,
+                               workers=size['workers'], stations=size['stations'],
+                               trays_per_day=size['trays_per_day'], include_sundays=True)
+    t0 = time.perf_counter()
+    stats = SyncDataGenerator(folder, items, options, seed).run()
+    print(f"[{size_name}] 데이터 생성: 로그 {stats['files']:,}개, {stats['rows']:,}행 ({time.perf_counter() - t0:.1f}초)")
+    return stats
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', nargs='+', choices=list(SIZES), default=list(SIZES))
+    parser.add_argument('--only', nargs='+', choices=list(BENCHMARKS), help="일부 항목만 측정")
+    parser.add_argument('--repeat', type=int, default=3, help="항목별 반복 횟수 (스캔은 트레이 전체를 측정)")
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--items', default=DEFAULT_ITEMS, help="품목 CSV (기본: assets/Item.csv)")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help="기준값 JSON (기본: benchmarks/baselines/hot_paths.json)")
+    parser.add_argument('--update-baseline', action='store_true', help="현재 결과로 기준값 파일을 갱신")
+    parser.add_argument('--tolerance', type=float, default=0.3, help="회귀로 판단할 중앙값 증가 비율 (기본 0.3 = 30%%)")
+    parser.add_argument('--min-delta-ms', type=float, default=0.02, help="회귀로 판단할 최소 증가량(ms)")
+    parser.add_argument('--json', help="결과와 비교 내용을 JSON 파일로 저장")
+    parser.add_argument('--work-dir', help="데이터/설정 작업 폴더 (지정하면 실행 후 남겨 둠)")
+    args = parser.parse_args(argv)
+
+    items = load_item_profiles(args.items, 0.01, 60, 1.0)
+    work_root = args.work_dir or tempfile.mkdtemp(prefix='hot_paths_')
+    names = args.only or list(BENCHMARKS)
+    results = {}
+    try:
+        for size_name in args.sizes:
+            size_dir = os.path.join(work_root, size_name)
+            save_folder = os.path.join(size_dir, 'Sync')
+            shutil.rmtree(size_dir, ignore_errors=True)
+            _generate(size_name, save_folder, items, args.seed)
+            for name in names:
+                ctx = BenchContext(size_name, save_folder, os.path.join(size_dir, name), items, args.repeat)
+                t0 = time.perf_counter()
+                try:
+                    variants = BENCHMARKS[name](ctx)
+                finally:
+                    ctx.close_apps()
+                for variant, timings in variants.items():
+                    if not timings:
+                        continue
+                    key = f"{name}.{variant}@{size_name}"
+                    results[key] = _stats(timings, size_name, ctx.size)
+                print(f"[{size_name}] {name} ({time.perf_counter() - t0:.1f}초)")
+    finally:
+        if not args.work_dir:
+            shutil.rmtree(work_root, ignore_errors=True)
+
+    baseline = None
+    if os.path.exists(args.baseline):
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        base_machine = baseline.get('meta', {}).get('machine_info', {})
+        if base_machine.get('node') != platform.node() or base_machine.get('python') != sys.version.split()[0]:
+            print(f"\n주의: 기준값은 다른 PC/파이썬에서 측정되었습니다 ({base_machine.get('node')}, "
+                  f"Python {base_machine.get('python')}).")
+    comparison = compare(results, baseline, args.tolerance, args.min_delta_ms)
+    _print_results(results, comparison)
+
+    meta = {'created': datetime.datetime.now().isoformat(timespec='seconds'), 'machine_info': _machine_info(),
+            'sizes': {name: SIZES[name] for name in args.sizes}, 'repeat': args.repeat, 'seed': args.seed}
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'meta': meta, 'results': results, 'baseline': args.baseline if baseline else None,
+                       'comparison': comparison}, f, ensure_ascii=False, indent=2)
+    if args.update_baseline:
+        merged = dict(baseline.get('results', {})) if baseline else {}
+        merged.update(results)
+        os.makedirs(os.path.dirname(os.path.abspath(args.baseline)), exist_ok=True)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump({'meta': meta, 'results': merged}, f, ensure_ascii=False, indent=2)
+        print(f"\n기준값 저장: {args.baseline}")
+        return 0
+
+    regressions = [row['key'] for row in comparison if row['regressed']]
+    if baseline is None:
+        print(f"\n기준값 파일이 없습니다: {args.baseline} (--update-baseline 으로 생성)")
+    elif regressions:
+        print(f"\n성능 회귀 {len(regressions)}건 (중앙값 +{args.tolerance:.0%} 초과): {', '.join(regressions)}")
+        return 1
+    else:
+        print("\n기준값 대비 회귀 없음")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,196 @@
+"""라벨 렌더링 벤치마크 및 골든 이미지 검증 스크립트
+
+사용법 (저장소 루트에서):
+    python benchmarks/label_benchmark.py                  # 측정 + 골든 이미지 비교
+    python benchmarks/label_benchmark.py --update-golden  # 골든 이미지 갱신
+    python benchmarks/label_benchmark.py --json result.json
+
+기본 폰트는 저장소에 포함된 나눔고딕(assets/fonts/NanumGothic.ttf)이라 Windows 폰트가 없는 Linux에서도
+같은 결과를 얻고, 한글 제목/항목명/말줄임 처리까지 골든 이미지로 검증됩니다. 실제 운영 폰트로 측정하려면
+--font 에 TTF 경로를 지정하세요. 골든 이미지는 기본 폰트 기준이며, Pillow 버전이 바뀌면 --update-golden 으로 다시 생성합니다.
+"""
+
+import argparse
+import io
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import PIL  # noqa: E402
+import qrcode  # noqa: E402
+from PIL import Image, ImageChops  # noqa: E402
+
+from core.label_renderer import BUNDLED_FONT, LABEL_TEMPLATES, LabelRenderer, build_qr_payload, render_qr_mask  # noqa: E402
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+GOLDEN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'golden', 'labels')
+GOLDEN_FONT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), BUNDLED_FONT)
+
+QUANTITIES = (1, 48, 9999)
+ITEM_NAMES = {
+    'short': "브라켓 A",
+    'long': "하우징 어셈블리 프론트 좌측 브라켓 보강형 (수출용 특수사양) " * 2,
+}
+SCALES = (1.0, 1.5, 2.0)
+
+# 골든 이미지로 고정할 대표 케이스 (템플릿별)
+GOLDEN_CASES = (('short', 1, 1.0), ('long', 9999, 1.0), ('short', 48, 2.0))
+
+FIXED_FIELDS = {
+    'item_code': "AB12345678901",
+    'item_spec': "120x45x3.2t SUS304",
+    'worker_name': "홍길동",
+    'creation_date': "2025-01-02 03:04:05",
+}
+
+
+def _fields(template_name, name_key, quantity):
+    prefix = 'DEFECT' if template_name == 'defective' else 'SPARE'
+    return dict(FIXED_FIELDS, label_id=f"{prefix}-20250102-030405000000", item_name=ITEM_NAMES[name_key], quantity=quantity)
+
+
+def _percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def _timed(fn, iterations):
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return {'mean_ms': statistics.fmean(samples), 'min_ms': min(samples), 'p95_ms': _percentile(samples, 95)}
+
+
+def _png_bytes(img):
+    buf = io.BytesIO()
+    img.save(buf, format='PNG')
+    return buf.getvalue()
+
+
+def _legacy_qr(payload, template):
+    """변경 전 방식(box_size=10 이미지 생성 후 축소)의 QR 생성 (비교용)"""
+    qr = qrcode.QRCode(version=1, error_correction=template.qr_error_correction, box_size=10, border=template.qr_border)
+    qr.add_data(payload)
+    qr.make(fit=True)
+    return qr.make_image(fill_color=template.text_color, back_color=template.bg_color).resize((template.qr_size, template.qr_size))
+
+
+def benchmark_case(renderer, template_name, name_key, quantity, scale, iterations):
+    fields = _fields(template_name, name_key, quantity)
+    render = lambda: renderer.render(template_name, scale=scale, **fields)
+    render()  # 폰트/정적 배경 캐시 준비
+
+    tracemalloc.start()
+    img = render()
+    _, py_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    result = {
+        'template': template_name, 'item_name': name_key, 'quantity': quantity, 'scale': scale,
+        'render': _timed(render, iterations),
+        'png_encode': _timed(lambda: _png_bytes(img), max(1, iterations // 4)),
+        'png_bytes': len(_png_bytes(img)),
+        'image_bytes': img.width * img.height * len(img.getbands()),
+        'py_peak_kb': round(py_peak / 1024, 1),
+    }
+    return result, img
+
+
+def benchmark_qr(iterations):
+    results = {}
+    for template_name, template in LABEL_TEMPLATES.items():
+        payload = build_qr_payload("DEFECT-20250102-030405000000", FIXED_FIELDS['item_code'], 9999)
+        results[template_name] = {
+            'direct': _timed(lambda: render_qr_mask(payload, template.qr_size, template.qr_error_correction, template.qr_border), iterations),
+            'legacy': _timed(lambda: _legacy_qr(payload, template), iterations),
+        }
+    return results
+
+
+def _golden_path(template_name, name_key, quantity, scale):
+    return os.path.join(GOLDEN_DIR, f"{template_name}_{name_key}_q{quantity}_x{scale:g}.png")
+
+
+def check_golden(template_name, name_key, quantity, scale, img, update, max_diff_ratio):
+    """골든 이미지와 픽셀 단위로 비교합니다. (다른 픽셀 비율, 통과 여부)를 반환합니다."""
+    path = _golden_path(template_name, name_key, quantity, scale)
+    if update:
+        os.makedirs(GOLDEN_DIR, exist_ok=True)
+        img.save(path, format='PNG')
+        return 0.0, True
+    if not os.path.exists(path):
+        return None, False
+    with Image.open(path) as golden:
+        golden = golden.convert(img.mode)
+        if golden.size != img.size:
+            return 1.0, False
+        diff = ImageChops.difference(golden, img).convert('L').point(lambda v: 255 if v else 0)
+    changed = diff.histogram()[255]
+    ratio = changed / (img.width * img.height)
+    return ratio, ratio <= max_diff_ratio
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="라벨 렌더링 벤치마크 및 골든 이미지 검증")
+    parser.add_argument('--iterations', type=int, default=20)
+    parser.add_argument('--font', default=GOLDEN_FONT, help="라벨 폰트 (기본: 저장소의 나눔고딕)")
+    parser.add_argument('--update-golden', action='store_true', help="골든 이미지를 현재 결과로 갱신")
+    parser.add_argument('--max-diff-ratio', type=float, default=0.001, help="허용하는 다른 픽셀 비율 (기본 0.1%%)")
+    parser.add_argument('--json', dest='json_path', help="결과를 JSON 파일로 저장")
+    args = parser.parse_args(argv)
+
+    renderer = LabelRenderer(font_override=args.font)
+    golden_keys = {(t, n, q, s) for t in LABEL_TEMPLATES for (n, q, s) in GOLDEN_CASES}
+    check_golden_images = args.font == GOLDEN_FONT
+
+    cases, failures = [], []
+    print(f"{'template':<10} {'name':<6} {'qty':>5} {'scale':>5} {'mean':>8} {'p95':>8} {'png_kb':>7} {'py_kb':>7}  golden")
+    for template_name in LABEL_TEMPLATES:
+        for name_key in ITEM_NAMES:
+            for quantity in QUANTITIES:
+                for scale in SCALES:
+                    result, img = benchmark_case(renderer, template_name, name_key, quantity, scale, args.iterations)
+                    golden = ''
+                    if check_golden_images and (template_name, name_key, quantity, scale) in golden_keys:
+                        ratio, ok = check_golden(template_name, name_key, quantity, scale, img, args.update_golden, args.max_diff_ratio)
+                        result['golden_diff_ratio'] = ratio
+                        golden = 'updated' if args.update_golden else ('missing' if ratio is None else f"{'ok' if ok else 'FAIL'} ({ratio:.4%})")
+                        if not ok:
+                            failures.append(result)
+                    cases.append(result)
+                    print(f"{template_name:<10} {name_key:<6} {quantity:>5} {scale:>5g} {result['render']['mean_ms']:>7.2f}ms "
+                          f"{result['render']['p95_ms']:>6.2f}ms {result['png_bytes'] / 1024:>7.1f} {result['py_peak_kb']:>7.1f}  {golden}")
+
+    qr = benchmark_qr(args.iterations)
+    for template_name, r in qr.items():
+        print(f"QR {template_name:<10} direct {r['direct']['mean_ms']:.2f}ms / legacy {r['legacy']['mean_ms']:.2f}ms")
+
+    report = {
+        'pillow': PIL.__version__, 'python': sys.version.split()[0], 'platform': sys.platform, 'font': args.font,
+        'iterations': args.iterations, 'cases': cases, 'qr': qr,
+        'rss_peak_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource else None,
+    }
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    if failures:
+        print(f"골든 이미지 불일치 {len(failures)}건")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
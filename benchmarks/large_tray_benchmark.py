@@ -0,0 +1,141 @@
+"""대형 트레이 스캔당 처리 시간 벤치마크
+
+사용법 (저장소 루트에서):
+    python benchmarks/large_tray_benchmark.py                 # 60 / 1,000 / 10,000개 트레이 측정
+    python benchmarks/large_tray_benchmark.py --sizes 60 20000
+    python benchmarks/large_tray_benchmark.py --json result.json
+
+스캔 1건마다 앱이 하는 작업(중복 확인, 세션 반영, 작업 상태 저장)을 Tk 없이 재현합니다.
+'legacy' 는 이전 방식(리스트 검색 + 상태 파일 전체 JSON 저장), 'large' 는 대형 트레이 모드
+(집합 색인 + 저널 추가 기록)입니다. 스캔당 시간이 트레이 앞부분(첫 10%)과 뒷부분(마지막 10%)에서
+비슷하면 트레이 크기와 관계없이 일정한 것입니다. 트레이 완료 시 TRAY_COMPLETE 행 기록/읽기 시간도 함께 잽니다.
+"""
+
+import argparse
+import csv
+import datetime
+import io
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core import log_shards  # noqa: E402,F401  (csv 필드 한도 설정)
+from core.models import InspectionSession, ScanRecord, SCAN_GOOD  # noqa: E402
+from core.replication import WriteAheadReplicator  # noqa: E402
+from core.session_journal import ScanJournal, load_session  # noqa: E402
+
+DEFAULT_SIZES = (60, 1000, 10000)
+LEGACY_MAX = 2000  # 이전 방식은 O(n²)이라 이 크기까지만 측정합니다.
+
+
+def _barcodes(n):
+    return [f"AB12345678901{i:08d}" for i in range(n)]
+
+
+def _tail_ratio(timings):
+    k = max(1, len(timings) // 10)
+    head, tail = statistics.mean(timings[:k]), statistics.mean(timings[-k:])
+    return head, tail
+
+
+def bench_legacy(n, folder):
+    """리스트 검색 + 스캔마다 상태 파일 전체 저장"""
+    state_path = os.path.join(folder, 'legacy_state.json')
+    session = InspectionSession(master_label_code='M', quantity=n)
+    items, scanned = [], []
+    timings = []
+    for barcode in _barcodes(n):
+        t0 = time.perf_counter()
+        if barcode in scanned:
+            raise AssertionError(barcode)
+        items.append({'barcode': barcode, 'timestamp': datetime.datetime.now().isoformat(), 'status': 'Good'})
+        scanned.append(barcode)
+        state = dict(session.__dict__, good_items=items, scanned_barcodes=scanned, start_time=None)
+        state.pop('_scanned', None)
+        with open(state_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, indent=4)
+        timings.append(time.perf_counter() - t0)
+    return timings
+
+
+def bench_large(n, folder):
+    """집합 색인 + 저널 추가 기록 (복제 스레드는 띄우지 않고 outbox 기록까지만 측정)"""
+    replicator = WriteAheadReplicator(os.path.join(folder, 'outbox'), os.path.join(folder, 'sync'))
+    state_path = os.path.join(folder, 'sync', 'state.json')
+    journal = ScanJournal(replicator, state_path)
+    session = InspectionSession(master_label_code='M', quantity=n)
+    journal.write_snapshot(session.to_state(), journal=True)
+    timings = []
+    for barcode in _barcodes(n):
+        t0 = time.perf_counter()
+        if session.has_scanned(barcode):
+            raise AssertionError(barcode)
+        record = ScanRecord(barcode, SCAN_GOOD)
+        session.add_scan(record)
+        journal.append_scan(record)
+        timings.append(time.perf_counter() - t0)
+
+    t0 = time.perf_counter()
+    with open(replicator.local_path(state_path), 'r', encoding='utf-8') as f:
+        restored = load_session(json.load(f), state_path, replicator.local_path)
+    restore_ms = (time.perf_counter() - t0) * 1000
+    assert restored.scan_count == n
+    return timings, restore_ms, session
+
+
+def bench_completion(session):
+    """TRAY_COMPLETE 행 기록 및 csv 로 다시 읽기"""
+    detail = {'master_label_code': session.master_label_code,
+              'scanned_product_barcodes': [item.barcode for item in session.good_items],
+              'defective_product_barcodes': [item.barcode for item in session.defective_items]}
+    t0 = time.perf_counter()
+    buf = io.StringIO()
+    writer = csv.DictWriter(buf, fieldnames=log_shards.LOG_HEADERS)
+    writer.writerow({'timestamp': datetime.datetime.now().isoformat(), 'worker': 'bench',
+                     'event': 'TRAY_COMPLETE', 'details': json.dumps(detail, ensure_ascii=False)})
+    write_ms = (time.perf_counter() - t0) * 1000
+    t0 = time.perf_counter()
+    row = next(csv.DictReader(io.StringIO(buf.getvalue()), fieldnames=log_shards.LOG_HEADERS))
+    assert len(json.loads(row['details'])['scanned_product_barcodes']) == len(session.good_items)
+    read_ms = (time.perf_counter() - t0) * 1000
+    return write_ms, read_ms, len(buf.getvalue())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES))
+    parser.add_argument('--json', help="결과를 JSON 파일로 저장")
+    args = parser.parse_args()
+
+    results = []
+    print(f"{'size':>7} {'mode':>7} {'first10% us':>12} {'last10% us':>11} {'total s':>8}  extra")
+    for n in args.sizes:
+        with tempfile.TemporaryDirectory() as folder:
+            timings, restore_ms, session = bench_large(n, folder)
+            head, tail = _tail_ratio(timings)
+            write_ms, read_ms, row_bytes = bench_completion(session)
+            results.append({'size': n, 'mode': 'large', 'first_us': head * 1e6, 'last_us': tail * 1e6,
+                            'total_s': sum(timings), 'restore_ms': restore_ms,
+                            'complete_write_ms': write_ms, 'complete_read_ms': read_ms, 'complete_row_bytes': row_bytes})
+            print(f"{n:>7} {'large':>7} {head * 1e6:>12.1f} {tail * 1e6:>11.1f} {sum(timings):>8.3f}  "
+                  f"restore {restore_ms:.1f}ms, TRAY_COMPLETE {row_bytes / 1024:.0f}KB "
+                  f"write {write_ms:.1f}ms / read {read_ms:.1f}ms")
+            if n <= LEGACY_MAX:
+                timings = bench_legacy(n, folder)
+                head, tail = _tail_ratio(timings)
+                results.append({'size': n, 'mode': 'legacy', 'first_us': head * 1e6, 'last_us': tail * 1e6,
+                                'total_s': sum(timings)})
+                print(f"{n:>7} {'legacy':>7} {head * 1e6:>12.1f} {tail * 1e6:>11.1f} {sum(timings):>8.3f}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'python': sys.version.split()[0], 'results': results}, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,314 @@
+"""이벤트 로그 컬럼형 내보내기 모듈 (명령줄 도구)
+
+작업자/일자별 CSV 로그의 이벤트와 details(JSON)를 평탄화하여 날짜 파티션별 컬럼형 파일로
+저장합니다. 바코드 목록은 바코드 하나당 한 행으로 펼치며, 문자열 컬럼은 사전 인코딩합니다.
+pyarrow 가 있으면 Parquet, 없으면 NumPy .npz 로 저장합니다.
+
+사용법 (저장소 루트에서):
+    python -m core.columnar_export --log-dir C:\\Sync --out export
+    python -m core.columnar_export --format npz --since 2025-01-01
+
+원본 로그가 바뀌지 않은 날짜는 건너뛰므로 매일 실행하면 새로 추가/변경된 날짜만 변환합니다.
+"""
+
+import argparse
+import csv
+import datetime
+import json
+import os
+import shutil
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from core.log_shards import LOG_KINDS, LOG_PATTERN
+from utils.file_handler import resolve_save_folder
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+EXPORT_VERSION = 1
+MANIFEST_NAME = '_manifest.json'
+
+# details 에서 한 행에 여러 바코드를 담는 목록 키 -> barcode_role 값
+BARCODE_LIST_KEYS = {
+    'scanned_product_barcodes': 'good',
+    'defective_product_barcodes': 'defective',
+    'barcodes': 'barcodes',
+    'remnant_barcodes': 'remnant',
+}
+
+STRING_COLUMNS = ['log_kind', 'worker', 'event', 'item_code', 'item_name', 'item_spec', 'master_label_code',
+                  'barcode', 'barcode_role', 'status', 'extra']
+INT_COLUMNS = ['event_index', 'scan_count', 'tray_capacity', 'quantity', 'error_count']
+FLOAT_COLUMNS = ['work_time_sec', 'total_idle_seconds', 'duration_sec']
+BOOL_COLUMNS = ['is_partial_submission', 'has_error_or_reset', 'is_restored_session', 'is_remnant_session']
+# timestamp 는 로컬 시각 기준 epoch 마이크로초(int64)로 저장합니다.
+COLUMNS = ['timestamp'] + STRING_COLUMNS + INT_COLUMNS + FLOAT_COLUMNS + BOOL_COLUMNS
+
+_DETAIL_COLUMNS = set(STRING_COLUMNS + INT_COLUMNS + FLOAT_COLUMNS + BOOL_COLUMNS) - {'log_kind', 'worker', 'event', 'barcode_role', 'extra', 'event_index'}
+_EPOCH = datetime.datetime(1970, 1, 1)
+
+# 정수/불리언 결측값 (npz 는 null 을 표현할 수 없으므로 사용)
+NPZ_INT_MISSING = -1
+
+
+def available_formats() -> List[str]:
+    return [name for name, module in (('parquet', pq), ('npz', np)) if module is not None]
+
+
+def _timestamp_us(value: str) -> Optional[int]:
+    try:
+        delta = datetime.datetime.fromisoformat(value) - _EPOCH
+    except ValueError:
+        return None
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def _scalar(column: str, value: Any) -> Any:
+    if value is None or value == '':
+        return None
+    try:
+        if column in INT_COLUMNS:
+            return int(value)
+        if column in FLOAT_COLUMNS:
+            return float(value)
+        if column in BOOL_COLUMNS:
+            return bool(value)
+    except (TypeError, ValueError):
+        return None
+    return value if isinstance(value, str) else json.dumps(value, ensure_ascii=False)
+
+
+class _ColumnBuffer:
+    """평탄화한 행을 컬럼별 리스트로 모읍니다."""
+
+    def __init__(self):
+        self.columns: Dict[str, List[Any]] = {name: [] for name in COLUMNS}
+        self.rows = 0
+
+    def append(self, values: Dict[str, Any]):
+        for name, column in self.columns.items():
+            column.append(values.get(name))
+        self.rows += 1
+
+
+def flatten_log(path: str, kind: str, buffer: _ColumnBuffer, event_index: int) -> int:
+    """로그 파일 하나를 평탄화하여 buffer 에 추가하고 다음 event_index 를 반환합니다."""
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        reader = csv.reader(f)
+        if next(reader, None) != ['timestamp', 'worker', 'event', 'details']:
+            return event_index
+        for row in reader:
+            if len(row) != 4:
+                continue
+            timestamp, worker, event, raw_details = row
+            try:
+                details = json.loads(raw_details) if raw_details else {}
+            except json.JSONDecodeError:
+                details = {'raw': raw_details}
+            if not isinstance(details, dict):
+                details = {'value': details}
+
+            base = {'timestamp': _timestamp_us(timestamp), 'log_kind': kind, 'worker': worker, 'event': event,
+                    'event_index': event_index}
+            barcode_lists, extra = [], {}
+            for key, value in details.items():
+                if key in BARCODE_LIST_KEYS and isinstance(value, list):
+                    barcode_lists.append((BARCODE_LIST_KEYS[key], value))
+                elif key in _DETAIL_COLUMNS:
+                    base[key] = _scalar(key, value)
+                else:
+                    extra[key] = value
+            if extra:
+                base['extra'] = json.dumps(extra, ensure_ascii=False)
+
+            exploded = False
+            for role, barcodes in barcode_lists:
+                for barcode in barcodes:
+                    buffer.append(dict(base, barcode=str(barcode), barcode_role=role))
+                    exploded = True
+            if not exploded:
+                buffer.append(base)
+            event_index += 1
+    return event_index
+
+
+def _write_parquet(buffer: _ColumnBuffer, path: str):
+    types = {'timestamp': pa.int64()}
+    types.update({name: pa.int64() for name in INT_COLUMNS})
+    types.update({name: pa.float64() for name in FLOAT_COLUMNS})
+    types.update({name: pa.bool_() for name in BOOL_COLUMNS})
+    arrays = []
+    for name in COLUMNS:
+        if name in STRING_COLUMNS:
+            arrays.append(pa.array(buffer.columns[name], type=pa.string()).dictionary_encode())
+        else:
+            arrays.append(pa.array(buffer.columns[name], type=types[name]))
+    table = pa.Table.from_arrays(arrays, names=COLUMNS)
+    pq.write_table(table, path, compression='zstd', use_dictionary=True)
+
+
+def _write_npz(buffer: _ColumnBuffer, path: str):
+    """문자열 컬럼은 <이름>__codes(int32, 결측 -1) 와 <이름>__dict 로 나누어 저장합니다."""
+    arrays = {}
+    for name in COLUMNS:
+        values = buffer.columns[name]
+        if name in STRING_COLUMNS:
+            dictionary: Dict[str, int] = {}
+            codes = np.fromiter((-1 if v is None else dictionary.setdefault(v, len(dictionary)) for v in values),
+                                dtype=np.int32, count=len(values))
+            arrays[f"{name}__codes"] = codes
+            arrays[f"{name}__dict"] = np.array(list(dictionary), dtype=str)
+        elif name in FLOAT_COLUMNS:
+            arrays[name] = np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+        elif name in BOOL_COLUMNS:
+            arrays[name] = np.array([NPZ_INT_MISSING if v is None else int(v) for v in values], dtype=np.int8)
+        else:
+            arrays[name] = np.array([NPZ_INT_MISSING if v is None else v for v in values], dtype=np.int64)
+    with open(path, 'wb') as f:
+        np.savez_compressed(f, **arrays)
+
+
+WRITERS = {'parquet': ('events.parquet', _write_parquet), 'npz': ('events.npz', _write_npz)}
+
+
+class ColumnarExporter:
+    """날짜(로그 파일명 기준) 파티션별로 내보내며, 원본이 바뀐 파티션만 다시 변환합니다."""
+
+    def __init__(self, log_dir: str, out_dir: str, fmt: str):
+        if fmt not in WRITERS:
+            raise ValueError(f"지원하지 않는 형식입니다: {fmt}")
+        if fmt not in available_formats():
+            raise ImportError(f"'{fmt}' 형식에 필요한 라이브러리({'pyarrow' if fmt == 'parquet' else 'numpy'})가 설치되어 있지 않습니다.")
+        self.log_dir = log_dir
+        self.out_dir = out_dir
+        self.fmt = fmt
+        self.manifest_path = os.path.join(out_dir, MANIFEST_NAME)
+        self.manifest = self._load_manifest()
+
+    def _load_manifest(self) -> Dict[str, Any]:
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {'version': EXPORT_VERSION, 'partitions': {}}
+        if manifest.get('version') != EXPORT_VERSION:
+            return {'version': EXPORT_VERSION, 'partitions': {}}
+        return manifest
+
+    def _save_manifest(self):
+        tmp_path = f"{self.manifest_path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.manifest, f, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, self.manifest_path)
+
+    def discover(self, since: Optional[datetime.date] = None, until: Optional[datetime.date] = None) -> Dict[str, List[Tuple[str, str]]]:
+        """{파티션 날짜(YYYY-MM-DD): [(종류, 경로)]}"""
+        partitions: Dict[str, List[Tuple[str, str]]] = {}
+        for dirpath, _, filenames in os.walk(self.log_dir):
+            for name in filenames:
+                match = LOG_PATTERN.match(name)
+                if not match:
+                    continue
+                raw = match.group(3)
+                day = f"{raw[:4]}-{raw[4:6]}-{raw[6:]}"
+                if (since and day < since.isoformat()) or (until and day > until.isoformat()):
+                    continue
+                partitions.setdefault(day, []).append((LOG_KINDS[match.group(1)], os.path.join(dirpath, name)))
+        return partitions
+
+    def _fingerprint(self, sources: List[Tuple[str, str]]) -> List[List[Any]]:
+        result = []
+        for _, path in sorted(sources, key=lambda s: s[1]):
+            st = os.stat(path)
+            result.append([os.path.relpath(path, self.log_dir), st.st_size, st.st_mtime_ns])
+        return result
+
+    def partition_path(self, day: str) -> str:
+        return os.path.join(self.out_dir, f"date={day}", WRITERS[self.fmt][0])
+
+    def export(self, since: Optional[datetime.date] = None, until: Optional[datetime.date] = None,
+               force: bool = False) -> Dict[str, Dict[str, Any]]:
+        """변경된 파티션을 내보내고 {날짜: {'rows', 'events', 'skipped'}}를 반환합니다."""
+        os.makedirs(self.out_dir, exist_ok=True)
+        results = {}
+        for day, sources in sorted(self.discover(since, until).items()):
+            fingerprint = self._fingerprint(sources)
+            previous = self.manifest['partitions'].get(day)
+            out_path = self.partition_path(day)
+            if (not force and previous and previous['format'] == self.fmt and previous['sources'] == fingerprint
+                    and os.path.exists(out_path)):
+                results[day] = {'rows': previous['rows'], 'events': previous['events'], 'skipped': True}
+                continue
+
+            buffer, events = _ColumnBuffer(), 0
+            for kind, path in sorted(sources, key=lambda s: s[1]):
+                events = flatten_log(path, kind, buffer, events)
+
+            partition_dir = os.path.dirname(out_path)
+            if os.path.isdir(partition_dir):
+                shutil.rmtree(partition_dir)  # 다른 형식으로 저장된 이전 결과 제거
+            os.makedirs(partition_dir)
+            tmp_path = f"{out_path}.{threading.get_ident()}.tmp"
+            WRITERS[self.fmt][1](buffer, tmp_path)
+            os.replace(tmp_path, out_path)
+
+            self.manifest['partitions'][day] = {'format': self.fmt, 'sources': fingerprint, 'rows': buffer.rows, 'events': events}
+            self._save_manifest()
+            results[day] = {'rows': buffer.rows, 'events': events, 'skipped': False}
+        return results
+
+
+def _parse_date(value: str) -> datetime.date:
+    try:
+        return datetime.date.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"날짜 형식은 YYYY-MM-DD 입니다: {value}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="이벤트 로그를 날짜별 컬럼형 파일(Parquet/npz)로 내보내기")
+    parser.add_argument('--log-dir', default=resolve_save_folder(),
+                        help="로그 폴더 (하위 폴더 포함, 기본: INSPECTION_SAVE_FOLDER, config.json 의 paths.save_folder, C:\\Sync / ~/Sync 순)")
+    parser.add_argument('--out', default='export', help="내보내기 폴더")
+    parser.add_argument('--format', choices=['auto', 'parquet', 'npz'], default='auto', help="auto: pyarrow 가 있으면 parquet, 없으면 npz")
+    parser.add_argument('--since', type=_parse_date, help="시작일 (YYYY-MM-DD)")
+    parser.add_argument('--until', type=_parse_date, help="종료일 (YYYY-MM-DD)")
+    parser.add_argument('--force', action='store_true', help="변경 여부와 관계없이 모두 다시 변환")
+    args = parser.parse_args(argv)
+
+    formats = available_formats()
+    fmt = args.format if args.format != 'auto' else (formats[0] if formats else None)
+    if fmt is None:
+        print("pyarrow 또는 numpy 가 필요합니다. (pip install pyarrow 또는 pip install numpy)", file=sys.stderr)
+        return 2
+    if not os.path.isdir(args.log_dir):
+        print(f"로그 폴더를 찾을 수 없습니다: {args.log_dir}", file=sys.stderr)
+        return 2
+
+    try:
+        exporter = ColumnarExporter(args.log_dir, args.out, fmt)
+    except ImportError as e:
+        print(e, file=sys.stderr)
+        return 2
+
+    start = time.perf_counter()
+    results = exporter.export(args.since, args.until, args.force)
+    converted = {day: r for day, r in results.items() if not r['skipped']}
+    print(f"{fmt}: {len(converted)}개 날짜 변환, {len(results) - len(converted)}개 변경 없음 "
+          f"({sum(r['rows'] for r in converted.values())}행, {time.perf_counter() - start:.2f}초)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,225 @@
+"""스테이션 공용 완료 현품표 등록부 모듈
+
+현품표의 작업 완료(TRAY_COMPLETE)와 재개(TRAY_RESUMED)를 스테이션별 추가 기록 파일
+(stations/<스테이션 ID>/completed_master_labels.csv)에 남기고, 모든 스테이션의 파일을
+{현품표 코드: (시각, 로그 파일)} 해시 색인으로 메모리에 유지합니다.
+다른 스테이션이나 이전 날짜에 완료된 현품표도 스캔 한 번에 상수 시간으로 확인할 수 있습니다.
+"""
+
+import csv
+import io
+import json
+import os
+import sys
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from core.log_shards import SHARD_ROOT, find_log_files, read_appended, read_events
+
+REGISTRY_FILE = 'completed_master_labels.csv'
+REGISTRY_HEADERS = ['timestamp', 'event', 'master_label_code', 'worker', 'log']
+EVENT_COMPLETE = 'COMPLETE'
+EVENT_RESUME = 'RESUME'
+_LOG_EVENTS = {'TRAY_COMPLETE': EVENT_COMPLETE, 'TRAY_RESUMED': EVENT_RESUME}
+
+
+class CompletedLabelRegistry:
+    """모든 스테이션의 완료 현품표를 메모리 색인으로 유지합니다.
+
+    색인 값은 (마지막 기록 시각, 완료 행이 있는 로그의 save_folder 기준 경로) 이며, 재개된 현품표는
+    로그 경로가 ''입니다. 스테이션마다 파일을 읽는 시점이 다르므로 같은 현품표는 시각이 늦은 기록이 이깁니다.
+    on_append(remote_path, size) 는 로컬 사본에 행을 추가한 뒤 호출되며 복제 예약에 사용합니다.
+    adopt(remote_path) 는 로컬 사본이 없을 때 원격 등록부를 가져오며, 가져왔으면 True 를 반환합니다.
+    처음 읽기(ensure_built)가 끝나기 전의 완료/재개 기록은 색인에만 반영하고 파일 기록은 읽기가 끝난 뒤에 합니다.
+    (기록하는 화면 스레드가 처음 읽기를 기다리지 않도록)
+    """
+
+    def __init__(self, save_folder: str, station: str, overlay: Optional[str] = None,
+                 on_append: Optional[Callable[[str, int], None]] = None,
+                 adopt: Optional[Callable[[str], bool]] = None):
+        self.save_folder = save_folder
+        self.station = station
+        self.overlay = overlay
+        self.on_append = on_append
+        self.adopt = adopt
+        self.own_relpath = os.path.join(SHARD_ROOT, station, REGISTRY_FILE)
+        self._index: Dict[str, Tuple[str, str]] = {}
+        self._offsets: Dict[str, Tuple[int, str]] = {}
+        self._lock = threading.RLock()
+        self._built = False
+        self._pending: List[List[str]] = []   # 처음 읽기가 끝나면 기록할 행
+        self._pending_lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    @property
+    def built(self) -> bool:
+        """처음 읽기가 끝났으면 True. (False 이면 조회가 ensure_built() 를 기다립니다)"""
+        return self._built
+
+    def is_completed(self, master_label_code: str) -> bool:
+        self.ensure_built()
+        entry = self._index.get(master_label_code)
+        return entry is not None and bool(entry[1])
+
+    def completed_log(self, master_label_code: str) -> Optional[str]:
+        """완료 행이 기록된 로그 파일의 save_folder 기준 전체 경로"""
+        self.ensure_built()
+        entry = self._index.get(master_label_code)
+        return os.path.join(self.save_folder, entry[1]) if entry and entry[1] else None
+
+    def __len__(self) -> int:
+        return sum(1 for _, log in self._index.values() if log)
+
+    # ------------------------------------------------------------------
+    # 기록
+    # ------------------------------------------------------------------
+    def record_complete(self, master_label_code: str, timestamp: str, worker: str, log_path: str):
+        self._record([timestamp, EVENT_COMPLETE, master_label_code, worker,
+                      os.path.relpath(log_path, self.save_folder)])
+
+    def record_resume(self, master_label_code: str, timestamp: str, worker: str):
+        self._record([timestamp, EVENT_RESUME, master_label_code, worker, ''])
+
+    def _record(self, row: List[str]):
+        with self._pending_lock:
+            if not self._built:
+                self._apply_row(row)
+                self._pending.append(row)
+                return
+        self._append([row])
+
+    def _append(self, rows: List[List[str]]):
+        remote = os.path.join(self.save_folder, self.own_relpath)
+        local = os.path.join(self.overlay, self.own_relpath) if self.overlay else remote
+        with self._lock:
+            for row in rows:
+                self._apply_row(row)
+            os.makedirs(os.path.dirname(local), exist_ok=True)
+            file_exists = os.path.exists(local) and os.stat(local).st_size > 0
+            if not file_exists and self.adopt and self.overlay:
+                file_exists = self.adopt(remote)
+            with open(local, 'a', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                if not file_exists:
+                    writer.writerow(REGISTRY_HEADERS)
+                writer.writerows(rows)
+                f.flush()
+                size = os.fstat(f.fileno()).st_size
+        if self.on_append and self.overlay:
+            self.on_append(remote, size)
+
+    # ------------------------------------------------------------------
+    # 갱신
+    # ------------------------------------------------------------------
+    def ensure_built(self):
+        """처음 한 번 모든 스테이션의 등록부를 읽습니다. 이 스테이션의 등록부가 없으면 로그에서 만듭니다."""
+        if self._built:
+            return
+        with self._lock:
+            if self._built:
+                return
+            if self.adopt and self.overlay and not os.path.exists(os.path.join(self.overlay, self.own_relpath)):
+                # outbox 가 비었으면 원격 등록부를 여기서 가져옵니다. (기록 시 화면 스레드에서 네트워크 복사하지 않도록)
+                self.adopt(os.path.join(self.save_folder, self.own_relpath))
+            for relpath in self._registry_files():
+                self._refresh(relpath)
+            if not self._exists(self.own_relpath):
+                self._backfill()
+            while True:
+                with self._pending_lock:
+                    pending, self._pending = self._pending, []
+                    if not pending:
+                        self._built = True
+                        break
+                self._append(pending)
+
+    def apply(self, paths: Iterable[str]) -> bool:
+        """폴더 변경 알림 중 등록부 파일을 반영합니다. 색인이 바뀌었으면 True."""
+        changed = False
+        with self._lock:
+            if not self._built:
+                return False
+            for path in paths:
+                if os.path.basename(path) == REGISTRY_FILE:
+                    changed |= self._refresh(self._relpath(path))
+        return changed
+
+    def _exists(self, relpath: str) -> bool:
+        return (bool(self.overlay) and os.path.exists(os.path.join(self.overlay, relpath))) or \
+            os.path.exists(os.path.join(self.save_folder, relpath))
+
+    def _registry_files(self) -> List[str]:
+        relpaths = set()
+        for root in filter(None, (self.save_folder, self.overlay)):
+            try:
+                stations = [entry.name for entry in os.scandir(os.path.join(root, SHARD_ROOT)) if entry.is_dir()]
+            except OSError:
+                continue
+            relpaths.update(os.path.join(SHARD_ROOT, station, REGISTRY_FILE) for station in stations
+                            if os.path.exists(os.path.join(root, SHARD_ROOT, station, REGISTRY_FILE)))
+        return sorted(relpaths)
+
+    def _relpath(self, path: str) -> str:
+        if self.overlay and os.path.abspath(path).startswith(os.path.abspath(self.overlay) + os.sep):
+            return os.path.relpath(path, self.overlay)
+        return os.path.relpath(path, self.save_folder)
+
+    def _source(self, relpath: str) -> str:
+        # 이 스테이션의 등록부는 outbox 사본이 원격보다 같거나 최신입니다.
+        if self.overlay:
+            local = os.path.join(self.overlay, relpath)
+            if os.path.exists(local):
+                return local
+        return os.path.join(self.save_folder, relpath)
+
+    def _refresh(self, relpath: str) -> bool:
+        offset, fingerprint = self._offsets.get(relpath, (0, ''))
+        try:
+            data, offset, fingerprint, _ = read_appended(self._source(relpath), offset, fingerprint)
+        except OSError:
+            return False  # 지워진 등록부의 기록은 그대로 둡니다. (추가 기록 전용)
+        self._offsets[relpath] = (offset, fingerprint)
+        changed = False
+        for row in csv.reader(io.StringIO(data.decode('utf-8', errors='replace'))):
+            changed |= self._apply_row(row)
+        return changed
+
+    def _apply_row(self, row: List[str]) -> bool:
+        if len(row) < 5 or row[1] not in (EVENT_COMPLETE, EVENT_RESUME) or not row[2]:
+            return False
+        timestamp, event, code, _, log = row[:5]
+        current = self._index.get(code)
+        if current is not None and current[0] > timestamp:
+            return False
+        entry = (timestamp, sys.intern(log) if event == EVENT_COMPLETE else '')
+        if entry == current:
+            return False
+        self._index[code] = entry
+        return True
+
+    def _backfill(self):
+        """기존 로그(이 스테이션 로그와 분할 이전의 최상위 로그)의 완료/재개 이력으로 등록부를 만듭니다."""
+        logs = [log for log in find_log_files(self.save_folder, 'inspection', overlay=self.overlay)
+                if log.station in ('', self.station)]
+        rows = []
+        for log in logs:
+            relpath = self._relpath(log.path)
+            for row in read_events([log]):
+                event = _LOG_EVENTS.get(row.get('event'))
+                if not event or '"master_label_code"' not in (row.get('details') or ''):
+                    continue
+                code = _master_label_code(row.get('details'))
+                if code:
+                    rows.append([row.get('timestamp') or '', event, code, row.get('worker') or '',
+                                 relpath if event == EVENT_COMPLETE else ''])
+        rows.sort(key=lambda r: r[0])
+        self._append(rows)
+
+
+def _master_label_code(details: Optional[str]) -> Optional[str]:
+    try:
+        return json.loads(details or '{}').get('master_label_code')
+    except (ValueError, AttributeError):
+        return None
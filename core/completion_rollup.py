@@ -0,0 +1,189 @@
+"""완료 현황 일별 집계(rollup) 모듈
+
+검사 이벤트 로그(작업자/일자별 CSV)마다 (OBD, PHS, 품목코드)별 완료 트레이 수를
+집계 파일로 유지합니다. 집계 파일은 처리한 로그의 바이트 위치를 기억하므로,
+로그에 행이 추가되면 추가된 부분만 읽어 갱신합니다.
+한 번 읽은 집계는 로그의 (크기, 수정 시각)과 함께 메모리에 두어, 바뀌지 않은 로그는
+다음 조회 때 stat 한 번으로 끝납니다. (로그도 집계 파일도 열지 않음)
+overlay(복제 대기 outbox)를 주면 이 스테이션의 로그는 아직 동기화 폴더에 반영되지 않은
+행까지 로컬 사본에서 읽습니다. 집계는 동기화 폴더 기준 상대 경로로 구분합니다.
+"""
+
+import csv
+import datetime
+import hashlib
+import io
+import json
+import os
+import re
+import threading
+from typing import Dict, Optional, Tuple, List
+
+from core.log_shards import LOG_HEADERS, find_log_files
+
+ROLLUP_VERSION = 1
+_FINGERPRINT_BYTES = 256
+
+SummaryKey = Tuple[str, str, str]  # (OBD, PHS, 품목코드)
+
+
+def parse_master_label_qr(qr_data: str) -> Optional[Dict[str, str]]:
+    """현품표 QR(JSON 또는 'KEY=VALUE|...' 형식)을 파싱합니다. 현품표가 아니면 None."""
+    stripped = qr_data.strip()
+    if stripped.startswith('{') and stripped.endswith('}'):
+        try:
+            parsed = json.loads(stripped)
+            return parsed if isinstance(parsed, dict) and 'CLC' in parsed else None
+        except json.JSONDecodeError:
+            pass
+
+    if '=' not in qr_data or '|' not in qr_data:
+        return None
+    try:
+        parsed = dict(pair.split('=', 1) for pair in stripped.split('|'))
+    except ValueError:
+        return None
+    return parsed if 'CLC' in parsed and 'WID' in parsed else None
+
+
+def _count_tray_complete(row: Dict[str, str], counts: Dict[SummaryKey, List]):
+    """TRAY_COMPLETE 행 하나를 집계에 반영합니다. (부분 제출은 제외)"""
+    if row.get('event') != 'TRAY_COMPLETE':
+        return
+    try:
+        details = json.loads(row.get('details') or '{}')
+    except json.JSONDecodeError:
+        return
+    master_code = details.get('master_label_code')
+    item_code = details.get('item_code')
+    if not master_code or not item_code or details.get('is_partial_submission', False):
+        return
+    qr_data = parse_master_label_qr(master_code)
+    if not qr_data:
+        return
+    key = (qr_data.get('OBD', 'N/A'), qr_data.get('PHS', 'N/A'), item_code)
+    entry = counts.setdefault(key, [details.get('item_name', '알 수 없음'), 0])
+    entry[1] += 1
+
+
+def _stamp(path: str, stat: os.stat_result) -> Tuple[str, int, int]:
+    return path, stat.st_size, stat.st_mtime_ns
+
+
+class CompletionRollupStore:
+    """로그 파일별 완료 집계를 캐시 폴더에 유지하고 기간 합계를 제공합니다."""
+
+    def __init__(self, log_folder: str, rollup_dir: str, overlay: Optional[str] = None):
+        self.log_folder = log_folder
+        self.rollup_dir = rollup_dir
+        self.overlay = overlay
+        self._lock = threading.Lock()
+        # 로그 상대 경로 → ((읽은 파일 경로, 크기, mtime), 집계)
+        self._memo: Dict[str, Tuple[Tuple[str, int, int], Dict[SummaryKey, List]]] = {}
+
+    def _relpath(self, log_path: str) -> str:
+        if self.overlay and os.path.abspath(log_path).startswith(os.path.abspath(self.overlay) + os.sep):
+            return os.path.relpath(log_path, self.overlay)
+        return os.path.relpath(log_path, self.log_folder)
+
+    def _rollup_path(self, relpath: str) -> str:
+        # 스테이션 폴더마다 같은 파일 이름이 있을 수 있으므로 상대 경로로 구분합니다.
+        return os.path.join(self.rollup_dir, re.sub(r'[\\/]', '__', os.path.splitext(relpath)[0]) + ".json")
+
+    @staticmethod
+    def _fingerprint(f, offset: int) -> str:
+        start = max(0, offset - _FINGERPRINT_BYTES)
+        f.seek(start)
+        return hashlib.sha1(f.read(offset - start)).hexdigest()
+
+    def _load(self, relpath: str) -> Optional[Dict]:
+        try:
+            with open(self._rollup_path(relpath), 'r', encoding='utf-8') as f:
+                rollup = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        return rollup if rollup.get('version') == ROLLUP_VERSION else None
+
+    def _save(self, relpath: str, offset: int, fingerprint: str, counts: Dict[SummaryKey, List]):
+        os.makedirs(self.rollup_dir, exist_ok=True)
+        path = self._rollup_path(relpath)
+        data = {
+            'version': ROLLUP_VERSION, 'offset': offset, 'fingerprint': fingerprint,
+            'counts': [[obd, phs, code, name, count] for (obd, phs, code), (name, count) in counts.items()],
+        }
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def refresh(self, log_path: str) -> Dict[SummaryKey, List]:
+        """로그 파일의 집계를 최신 상태로 맞추고 {키: [품목명, 수량]}을 반환합니다.
+
+        저장된 위치 이후에 추가된 행만 읽으며, 로그가 줄었거나 다시 쓰여졌으면 처음부터 집계합니다.
+        """
+        relpath = self._relpath(log_path)
+        with self._lock:
+            memo = self._memo.get(relpath)
+            if memo is not None and memo[0] == _stamp(log_path, os.stat(log_path)):
+                return memo[1]
+            rollup = self._load(relpath)
+            with open(log_path, 'rb') as f:
+                stat = os.fstat(f.fileno())
+                size = stat.st_size
+                counts: Dict[SummaryKey, List] = {}
+                offset = 0
+                if rollup and rollup['offset'] <= size and self._fingerprint(f, rollup['offset']) == rollup['fingerprint']:
+                    offset = rollup['offset']
+                    counts = {(obd, phs, code): [name, count] for obd, phs, code, name, count in rollup['counts']}
+                if rollup and offset == size:
+                    self._memo[relpath] = (_stamp(log_path, stat), counts)
+                    return counts
+
+                f.seek(offset)
+                chunk = f.read(size - offset)
+                end = chunk.rfind(b'\n') + 1  # 기록 중인 마지막 행은 다음에 읽습니다.
+                if end == 0 and rollup and offset > 0:
+                    self._memo[relpath] = (_stamp(log_path, stat), counts)
+                    return counts
+                text = chunk[:end].decode('utf-8-sig' if offset == 0 else 'utf-8', errors='replace')
+                reader = csv.DictReader(io.StringIO(text)) if offset == 0 else csv.DictReader(io.StringIO(text), fieldnames=LOG_HEADERS)
+                for row in reader:
+                    _count_tray_complete(row, counts)
+                new_offset = offset + end
+                fingerprint = self._fingerprint(f, new_offset)
+
+            try:
+                self._save(relpath, new_offset, fingerprint, counts)
+            except OSError as e:
+                print(f"완료 집계 저장 실패 ({log_path}): {e}")
+            self._memo[relpath] = (_stamp(log_path, stat), counts)
+            return counts
+
+    def invalidate(self, log_path: str):
+        """로그를 수정(재작성)한 뒤 호출하여 해당 집계를 폐기합니다."""
+        relpath = self._relpath(log_path)
+        with self._lock:
+            self._memo.pop(relpath, None)
+            try:
+                os.remove(self._rollup_path(relpath))
+            except OSError:
+                pass
+
+    def log_files_in_range(self, start_date: datetime.date, end_date: datetime.date) -> List[str]:
+        """기간에 해당하는 검사 이벤트 로그 파일 목록을 반환합니다. (모든 스테이션 포함, outbox 사본 우선)"""
+        return [f.path for f in find_log_files(self.log_folder, 'inspection', since=start_date, until=end_date,
+                                               overlay=self.overlay)]
+
+    def summarize(self, start_date: datetime.date, end_date: datetime.date) -> Dict[SummaryKey, Dict]:
+        """기간 내 모든 작업자 로그의 집계를 합산합니다. {키: {'count', 'item_name'}}"""
+        summary: Dict[SummaryKey, Dict] = {}
+        for log_path in self.log_files_in_range(start_date, end_date):
+            try:
+                counts = self.refresh(log_path)
+            except Exception as e:
+                print(f"'{log_path}' 처리 중 오류: {e}")
+                continue
+            for key, (item_name, count) in counts.items():
+                entry = summary.setdefault(key, {'count': 0, 'item_name': item_name})
+                entry['count'] += count
+        return summary
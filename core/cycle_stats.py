@@ -0,0 +1,214 @@
+"""트레이 작업 시간(사이클 타임) 스트리밍 통계 모듈
+
+값을 모아 두지 않고 O(1)로 평균/최소/최대/EWMA와 근사 백분위수(P² 알고리즘)를 갱신하며,
+작은 JSON 상태로 저장/복원할 수 있습니다.
+"""
+
+import json
+import os
+import threading
+from typing import Dict, Any, Optional, List
+
+
+class P2Quantile:
+    """P² 알고리즘(Jain & Chlamtac)으로 분위수를 근사합니다. 5개 표지값만 유지합니다."""
+
+    __slots__ = ('p', 'count', 'heights', 'positions', 'desired', 'increments')
+
+    def __init__(self, p: float):
+        self.p = p
+        self.count = 0
+        self.heights: List[float] = []
+        self.positions = [0, 1, 2, 3, 4]
+        self.desired = [0.0, 2 * p, 4 * p, 2 + 2 * p, 4.0]
+        self.increments = [0.0, p / 2, p, (1 + p) / 2, 1.0]
+
+    def add(self, x: float):
+        self.count += 1
+        q = self.heights
+        if self.count <= 5:
+            q.append(x)
+            q.sort()
+            return
+
+        if x < q[0]:
+            q[0], k = x, 0
+        elif x >= q[4]:
+            q[4], k = x, 3
+        else:
+            k = next(i for i in range(4) if q[i] <= x < q[i + 1])
+
+        n = self.positions
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self.desired[i] += self.increments[i]
+
+        for i in (1, 2, 3):
+            d = self.desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                s = 1 if d > 0 else -1
+                # 포물선 보간, 단조성이 깨지면 선형 보간
+                qp = q[i] + s / (n[i + 1] - n[i - 1]) * (
+                    (n[i] - n[i - 1] + s) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+                    + (n[i + 1] - n[i] - s) * (q[i] - q[i - 1]) / (n[i] - n[i - 1]))
+                if not q[i - 1] < qp < q[i + 1]:
+                    qp = q[i] + s * (q[i + s] - q[i]) / (n[i + s] - n[i])
+                q[i] = qp
+                n[i] += s
+
+    def value(self) -> Optional[float]:
+        if not self.count:
+            return None
+        if self.count <= 5:
+            return self.heights[min(self.count - 1, int(round(self.p * (self.count - 1))))]
+        return self.heights[2]
+
+    def to_state(self) -> list:
+        return [self.count, self.heights, self.positions, self.desired]
+
+    @classmethod
+    def from_state(cls, p: float, state: list) -> 'P2Quantile':
+        obj = cls(p)
+        obj.count, obj.heights, obj.positions, obj.desired = state[0], list(state[1]), list(state[2]), list(state[3])
+        return obj
+
+
+class StreamingStats:
+    """평균/최소/최대/EWMA/p50/p90을 O(1)로 갱신합니다."""
+
+    __slots__ = ('count', 'mean', 'min', 'max', 'ewma', 'alpha', 'p50', 'p90')
+
+    def __init__(self, alpha: float = 0.2):
+        self.count = 0
+        self.mean = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self.ewma: Optional[float] = None
+        self.alpha = alpha
+        self.p50 = P2Quantile(0.5)
+        self.p90 = P2Quantile(0.9)
+
+    def add(self, x: float):
+        self.count += 1
+        self.mean += (x - self.mean) / self.count
+        self.min = x if self.min is None else min(self.min, x)
+        self.max = x if self.max is None else max(self.max, x)
+        self.ewma = x if self.ewma is None else self.alpha * x + (1 - self.alpha) * self.ewma
+        self.p50.add(x)
+        self.p90.add(x)
+
+    def snapshot(self) -> Dict[str, Optional[float]]:
+        return {
+            'count': self.count, 'mean': self.mean if self.count else None, 'min': self.min, 'max': self.max,
+            'ewma': self.ewma, 'p50': self.p50.value(), 'p90': self.p90.value(),
+        }
+
+    def to_state(self) -> Dict[str, Any]:
+        return {'n': self.count, 'mean': self.mean, 'min': self.min, 'max': self.max, 'ewma': self.ewma,
+                'alpha': self.alpha, 'p50': self.p50.to_state(), 'p90': self.p90.to_state()}
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> 'StreamingStats':
+        obj = cls(state.get('alpha', 0.2))
+        obj.count, obj.mean, obj.min, obj.max, obj.ewma = state['n'], state['mean'], state['min'], state['max'], state['ewma']
+        obj.p50 = P2Quantile.from_state(0.5, state['p50'])
+        obj.p90 = P2Quantile.from_state(0.9, state['p90'])
+        return obj
+
+
+MIN_SEC_PER_PIECE = 2.0  # 개당 작업 시간이 이보다 짧은 트레이는 비정상 기록으로 보고 통계에서 제외합니다.
+
+
+def is_clean_tray(details: Dict[str, Any]) -> bool:
+    """TRAY_COMPLETE 상세가 사이클 타임 통계에 넣을 정상 트레이인지 확인합니다.
+
+    수량을 모두 채웠고, 오류/리셋·부분 제출·복구 세션이 아니며, 개당 작업 시간이 현실적인 트레이만 해당합니다.
+    """
+    capacity = details.get('tray_capacity') or 0
+    if capacity <= 0 or details.get('scan_count') != capacity:
+        return False
+    if details.get('has_error_or_reset') or details.get('is_partial_submission') or details.get('is_restored_session'):
+        return False
+    return float(details.get('work_time_sec') or 0.0) / capacity >= MIN_SEC_PER_PIECE
+
+
+class CycleTimeStats:
+    """한 작업자의 주간 트레이 작업 시간 통계 (전체 및 품목별)"""
+
+    def __init__(self, week_start: str):
+        self.week_start = week_start
+        self.overall = StreamingStats()
+        self.by_item: Dict[str, StreamingStats] = {}
+        self.log_sizes: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def add(self, seconds: float, item_code: Optional[str] = None):
+        with self._lock:
+            self.overall.add(seconds)
+            if item_code:
+                self.by_item.setdefault(item_code, StreamingStats()).add(seconds)
+
+    def add_tray(self, details: Dict[str, Any]) -> bool:
+        """정상 트레이(is_clean_tray)만 작업 시간을 반영합니다. 반영했으면 True."""
+        if not is_clean_tray(details):
+            return False
+        self.add(float(details.get('work_time_sec') or 0.0), details.get('item_code'))
+        return True
+
+    def item(self, item_code: str) -> Optional[StreamingStats]:
+        return self.by_item.get(item_code)
+
+    def to_state(self) -> Dict[str, Any]:
+        with self._lock:
+            return {'week_start': self.week_start, 'log_sizes': dict(self.log_sizes), 'overall': self.overall.to_state(),
+                    'by_item': {code: stats.to_state() for code, stats in self.by_item.items()}}
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> 'CycleTimeStats':
+        obj = cls(state['week_start'])
+        obj.log_sizes = dict(state.get('log_sizes', {}))
+        obj.overall = StreamingStats.from_state(state['overall'])
+        obj.by_item = {code: StreamingStats.from_state(s) for code, s in state.get('by_item', {}).items()}
+        return obj
+
+
+class CycleStatsStore:
+    """작업자별 CycleTimeStats 상태를 하나의 JSON 파일로 저장/복원합니다."""
+
+    VERSION = 2  # 2: 실시간 반영에도 정상 트레이 기준 적용 (이전 상태는 로그로 다시 계산)
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def _read_all(self) -> Dict[str, Any]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+        return data.get('workers', {}) if data.get('version') == self.VERSION else {}
+
+    def load(self, worker: str, week_start: str, log_sizes: Dict[str, int]) -> Optional[CycleTimeStats]:
+        """저장된 상태가 같은 주이고 반영된 로그 크기가 현재와 같으면 복원합니다. 아니면 None."""
+        with self._lock:
+            state = self._read_all().get(worker)
+        if not state or state.get('week_start') != week_start or state.get('log_sizes') != log_sizes:
+            return None
+        try:
+            return CycleTimeStats.from_state(state)
+        except (KeyError, TypeError, IndexError):
+            return None
+
+    def save(self, worker: str, stats: CycleTimeStats):
+        state = stats.to_state()
+        with self._lock:
+            workers = self._read_all()
+            workers = {name: s for name, s in workers.items() if s.get('week_start') == stats.week_start}
+            workers[worker] = state
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            tmp_path = f"{self.path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': self.VERSION, 'workers': workers}, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
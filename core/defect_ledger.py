@@ -0,0 +1,246 @@
+"""불량 원장(ledger) 메모리 색인 모듈
+
+불량 처리 모드를 열 때마다 defects_merged 폴더 전체와 모든 검사/리워크 로그를 다시 읽지 않도록,
+불량표 JSON 레코드(처리된 불량 바코드)와 로그의 INSPECTION_DEFECTIVE / REWORK_SUCCESS 행을
+메모리에 유지합니다. 폴더 변경 감지(core/folder_watch.py)가 알려 준 파일만 다시 읽으며,
+로그는 파일별로 읽은 바이트 위치를 기억해 추가된 부분만 읽습니다.
+"""
+
+import csv
+import json
+import os
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from core.log_shards import LOG_KINDS, LOG_PATTERN, find_log_files, read_appended
+
+_LEDGER_EVENTS = {'INSPECTION_DEFECTIVE': b'INSPECTION_DEFECTIVE', 'REWORK_SUCCESS': b'REWORK_SUCCESS'}
+
+
+class JsonRecordIndex:
+    """root 이하 *.json 레코드를 {경로: 레코드}로 유지합니다.
+
+    resolve(path) 는 읽을 실제 경로를 돌려주는 함수로, 복제 대기 중인 로컬 사본을 읽을 때 사용합니다.
+    on_record(path, record) 는 레코드가 추가/변경되거나(record) 사라질 때(None) 잠금 안에서 호출됩니다.
+    """
+
+    def __init__(self, root: str, recursive: bool = True, resolve: Optional[Callable[[str], str]] = None,
+                 on_record: Optional[Callable[[str, Optional[dict]], None]] = None):
+        self.root = root
+        self.recursive = recursive
+        self.resolve = resolve or (lambda path: path)
+        self.on_record = on_record
+        self._records: Dict[str, dict] = {}
+        self._stamps: Dict[str, Tuple[str, int, int]] = {}
+        self._by_name: Dict[str, str] = {}
+        self._lock = threading.RLock()
+
+    def _owns(self, path: str) -> bool:
+        parent = os.path.dirname(path)
+        if self.recursive:
+            return parent == self.root or parent.startswith(self.root + os.sep)
+        return parent == self.root
+
+    def rescan(self) -> bool:
+        """폴더 전체를 비교해 바뀐 레코드만 다시 읽습니다."""
+        found = set()
+        if self.recursive:
+            for dirpath, _, filenames in os.walk(self.root):
+                found.update(os.path.join(dirpath, name) for name in filenames if name.endswith('.json'))
+        else:
+            try:
+                found.update(os.path.join(self.root, name) for name in os.listdir(self.root) if name.endswith('.json'))
+            except OSError:
+                pass
+        with self._lock:
+            return self._refresh(found | set(self._records))
+
+    def apply(self, paths: Iterable[str]) -> bool:
+        """변경된 경로(파일 또는 폴더)를 반영합니다. 레코드가 바뀌었으면 True."""
+        targets = set()
+        with self._lock:
+            for path in paths:
+                if path.endswith('.json'):
+                    if self._owns(path):
+                        targets.add(path)
+                elif path == self.root or path.startswith(self.root + os.sep):
+                    # 폴더가 생기거나 지워진 경우: 폴더 안 파일과 기존 레코드를 함께 확인합니다.
+                    prefix = path + os.sep
+                    targets.update(p for p in self._records if p.startswith(prefix))
+                    for dirpath, _, filenames in os.walk(path):
+                        targets.update(os.path.join(dirpath, n) for n in filenames if n.endswith('.json'))
+                        if not self.recursive:
+                            break
+            return self._refresh(targets)
+
+    def _refresh(self, paths: Iterable[str]) -> bool:
+        changed = False
+        for path in paths:
+            source = self.resolve(path)
+            try:
+                st = os.stat(source)
+            except OSError:
+                if self._records.pop(path, None) is not None:
+                    self._stamps.pop(path, None)
+                    self._by_name.pop(os.path.basename(path), None)
+                    if self.on_record:
+                        self.on_record(path, None)
+                    changed = True
+                continue
+            stamp = (source, st.st_size, st.st_mtime_ns)
+            if self._stamps.get(path) == stamp:
+                continue
+            try:
+                with open(source, 'r', encoding='utf-8') as f:
+                    record = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"레코드 파일 '{path}' 읽기 오류: {e}")
+                continue  # 기록 중인 파일은 다음 변경 알림 때 다시 읽습니다.
+            if not isinstance(record, dict):
+                continue
+            self._records[path] = record
+            self._stamps[path] = stamp
+            self._by_name[os.path.basename(path)] = path
+            if self.on_record:
+                self.on_record(path, record)
+            changed = True
+        return changed
+
+    def items(self, folder: Optional[str] = None) -> List[Tuple[str, dict]]:
+        """(경로, 레코드 사본) 목록. folder 를 주면 그 폴더 바로 아래 레코드만 반환합니다."""
+        with self._lock:
+            return [(path, dict(record)) for path, record in self._records.items()
+                    if folder is None or os.path.dirname(path) == folder]
+
+    def find(self, filename: str) -> Optional[str]:
+        with self._lock:
+            return self._by_name.get(filename)
+
+
+class _LogState:
+    __slots__ = ('offset', 'fingerprint', 'defects', 'reworked')
+
+    def __init__(self):
+        self.offset = 0
+        self.fingerprint = ''
+        self.defects: Dict[str, str] = {}   # 불량 바코드 → 품목코드
+        self.reworked: Set[str] = set()
+
+
+class DefectLedger:
+    """불량표 레코드와 검사/리워크 로그의 불량 관련 이벤트를 메모리에 유지합니다."""
+
+    def __init__(self, save_folder: str, defects_folder: str, overlay: Optional[str] = None,
+                 resolve: Optional[Callable[[str], str]] = None):
+        self.save_folder = save_folder
+        self.overlay = overlay
+        self.records = JsonRecordIndex(defects_folder, resolve=resolve)
+        self._logs: Dict[str, _LogState] = {}
+        self._lock = threading.RLock()
+        self._built = False
+
+    @property
+    def built(self) -> bool:
+        """처음 읽기가 끝났으면 True"""
+        return self._built
+
+    # ------------------------------------------------------------------
+    # 갱신
+    # ------------------------------------------------------------------
+    def ensure_built(self):
+        """처음 한 번 모든 레코드와 로그를 읽습니다. (다른 스레드가 만드는 중이면 끝날 때까지 기다림)"""
+        with self._lock:
+            if self._built:
+                return
+            self.records.rescan()
+            for kind in ('inspection', 'rework'):
+                for log in find_log_files(self.save_folder, kind, overlay=self.overlay):
+                    self._refresh_log(self._relpath(log.path))
+            self._built = True
+
+    def apply(self, paths: Iterable[str]) -> bool:
+        """폴더 변경 알림을 반영합니다. 불량 현황이 바뀌었으면 True."""
+        paths = list(paths)
+        changed = self.records.apply(paths)
+        with self._lock:
+            if not self._built:
+                return changed
+            for path in paths:
+                match = LOG_PATTERN.match(os.path.basename(path))
+                if match and LOG_KINDS[match.group(1)] in ('inspection', 'rework'):
+                    changed |= self._refresh_log(self._relpath(path))
+        return changed
+
+    def _relpath(self, path: str) -> str:
+        if self.overlay and os.path.abspath(path).startswith(os.path.abspath(self.overlay) + os.sep):
+            return os.path.relpath(path, self.overlay)
+        return os.path.relpath(path, self.save_folder)
+
+    def _source(self, relpath: str) -> str:
+        # 이 스테이션의 로그는 outbox 사본이 원격보다 같거나 최신입니다.
+        if self.overlay:
+            local = os.path.join(self.overlay, relpath)
+            if os.path.exists(local):
+                return local
+        return os.path.join(self.save_folder, relpath)
+
+    def _refresh_log(self, relpath: str) -> bool:
+        state = self._logs.get(relpath) or _LogState()
+        try:
+            data, offset, fingerprint, restarted = read_appended(self._source(relpath), state.offset, state.fingerprint)
+        except FileNotFoundError:
+            return self._logs.pop(relpath, None) is not None
+        except OSError as e:
+            print(f"불량 원장 로그 읽기 오류 ({relpath}): {e}")
+            return False
+        if restarted:
+            state = _LogState()  # 다시 쓰여진 로그는 처음부터 읽습니다.
+        changed = self._scan_rows(data, state) or restarted
+        state.offset, state.fingerprint = offset, fingerprint
+        self._logs[relpath] = state
+        return changed
+
+    @staticmethod
+    def _scan_rows(data: bytes, state: _LogState) -> bool:
+        changed = False
+        for line in data.splitlines():
+            marker = next((event for event, token in _LEDGER_EVENTS.items() if token in line), None)
+            if marker is None:
+                continue
+            try:
+                row = next(csv.reader([line.decode('utf-8', errors='replace')]))
+                if len(row) < 4 or row[2] != marker:
+                    continue
+                details = json.loads(row[3] or '{}')
+            except (StopIteration, csv.Error, ValueError):
+                continue
+            barcode = details.get('barcode')
+            if not barcode:
+                continue
+            if marker == 'REWORK_SUCCESS':
+                state.reworked.add(barcode)
+            elif details.get('item_code'):
+                state.defects[barcode] = details['item_code']
+            changed = True
+        return changed
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def summary(self) -> Dict[str, Dict[str, Set[str]]]:
+        """{품목코드: {'unprocessed_barcodes', 'processed_barcodes'}}. 리워크된 바코드는 제외합니다."""
+        processed: Set[str] = set()
+        for _, record in self.records.items():
+            processed.update(record.get('barcodes', []))
+        with self._lock:
+            reworked = set().union(*(state.reworked for state in self._logs.values()))
+            defects: Dict[str, str] = {}
+            for state in self._logs.values():
+                defects.update(state.defects)
+        result: Dict[str, Dict[str, Set[str]]] = {}
+        for barcode, item_code in defects.items():
+            if barcode in reworked:
+                continue
+            entry = result.setdefault(item_code, {'unprocessed_barcodes': set(), 'processed_barcodes': set()})
+            entry['processed_barcodes' if barcode in processed else 'unprocessed_barcodes'].add(barcode)
+        return result
@@ -0,0 +1,327 @@
+"""동기화 폴더 변경 감지 모듈
+
+다른 스테이션이 만든 불량표/잔량표 JSON 과 이벤트 로그를 화면을 열 때마다 다시 탐색하지 않도록,
+폴더 변경을 감지해 바뀐 경로 묶음을 콜백으로 전달합니다.
+
+- Windows: ReadDirectoryChangesW (하위 폴더 포함, 네트워크 공유 폴더도 지원)
+- Linux: inotify (하위 폴더마다 감시 등록)
+- 그 외/실패 시: 폴링. 수정 시각이 바뀐 폴더와 최근 수정된 파일이 있는 폴더만 다시 나열합니다.
+
+네이티브 감지는 버퍼 초과나 원격 파일 시스템에서 이벤트를 놓칠 수 있으므로, 폴링 스냅샷 비교를
+rescan_interval 마다 전체 폴더에 대해 한 번씩 실행해 누락분을 보충합니다.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import threading
+import time
+from typing import Callable, Dict, Iterable, Optional, Set, Tuple
+
+IGNORED_SUFFIXES = ('.tmp',)
+# 이 시간(초) 안에 수정된 파일이 있는 폴더는 폴더 수정 시각과 관계없이 매번 다시 나열합니다. (추가 기록 중인 로그)
+HOT_FILE_SEC = 3600
+
+_Entry = Tuple[bool, int, int]  # (폴더 여부, 크기, 수정 시각 ns)
+
+
+class DirectorySnapshot:
+    """폴더 트리의 (크기, 수정 시각) 스냅샷을 유지하고 이전 스냅샷과의 차이를 반환합니다."""
+
+    def __init__(self, root: str, ignore_dirs: Iterable[str] = ()):
+        self.root = root
+        self.ignore_dirs = {os.path.join(root, name) for name in ignore_dirs}
+        self._dirs: Dict[str, Tuple[int, Dict[str, _Entry]]] = {}
+
+    def scan(self, full: bool = False) -> Set[str]:
+        """스냅샷을 갱신하고 생성/수정/삭제된 경로를 반환합니다. 첫 호출은 기준만 만들고 빈 집합을 반환합니다."""
+        initial = not self._dirs
+        changed: Set[str] = set()
+        hot_after = time.time_ns() - HOT_FILE_SEC * 1_000_000_000
+        seen = set()
+        stack = [self.root]
+        while stack:
+            path = stack.pop()
+            known = self._dirs.get(path)
+            try:
+                dir_mtime = os.stat(path).st_mtime_ns
+            except OSError:
+                continue
+            seen.add(path)
+            if known is not None and not full and known[0] == dir_mtime and not any(
+                    not is_dir and mtime > hot_after for is_dir, _, mtime in known[1].values()):
+                entries = known[1]
+            else:
+                entries = self._list(path)
+                if not initial:
+                    old = known[1] if known else {}
+                    changed.update(os.path.join(path, name) for name, entry in entries.items() if old.get(name) != entry)
+                    changed.update(os.path.join(path, name) for name in old.keys() - entries.keys())
+                self._dirs[path] = (dir_mtime, entries)
+            stack.extend(os.path.join(path, name) for name, entry in entries.items()
+                         if entry[0] and os.path.join(path, name) not in self.ignore_dirs)
+        # 사라진 폴더는 스냅샷에서 지우고, 그 안의 파일도 삭제로 알립니다.
+        for path in list(self._dirs.keys() - seen):
+            changed.update(os.path.join(path, name) for name in self._dirs.pop(path)[1])
+            changed.add(path)
+        return set() if initial else changed
+
+    @staticmethod
+    def _list(path: str) -> Dict[str, _Entry]:
+        entries = {}
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    if entry.name.endswith(IGNORED_SUFFIXES):
+                        continue
+                    try:
+                        if entry.is_dir():
+                            entries[entry.name] = (True, 0, 0)
+                        else:
+                            st = entry.stat()
+                            entries[entry.name] = (False, st.st_size, st.st_mtime_ns)
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+        return entries
+
+
+class _InotifyBackend:
+    """Linux inotify 감시. 새로 생긴 하위 폴더도 감시에 추가합니다."""
+    IN_MODIFY, IN_CLOSE_WRITE, IN_MOVED_FROM, IN_MOVED_TO = 0x2, 0x8, 0x40, 0x80
+    IN_CREATE, IN_DELETE, IN_DELETE_SELF, IN_Q_OVERFLOW, IN_ISDIR = 0x100, 0x200, 0x400, 0x4000, 0x40000000
+    MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+    _HEADER = struct.Struct('iIII')
+
+    name = 'inotify'
+
+    def __init__(self, root: str, emit: Callable[[Optional[Iterable[str]]], None], ignore_dirs: Set[str]):
+        self.root, self.emit, self.ignore_dirs = root, emit, ignore_dirs
+        self._libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | getattr(os, 'O_CLOEXEC', 0))
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 실패")
+        self._watches: Dict[int, str] = {}
+        self._add_tree(root)
+
+    def _add_tree(self, top: str) -> Set[str]:
+        """top 이하 폴더를 감시에 추가하고, 감시 전에 이미 생긴 파일 경로를 반환합니다."""
+        existing = set()
+        for dirpath, dirnames, filenames in os.walk(top):
+            dirnames[:] = [d for d in dirnames if os.path.join(dirpath, d) not in self.ignore_dirs]
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(dirpath), self.MASK)
+            if wd >= 0:
+                self._watches[wd] = dirpath
+            existing.update(os.path.join(dirpath, name) for name in filenames)
+        return existing
+
+    def run(self, stop: threading.Event):
+        try:
+            while not stop.is_set():
+                ready, _, _ = select.select([self._fd], [], [], 0.5)
+                if not ready:
+                    continue
+                try:
+                    data = os.read(self._fd, 64 * 1024)
+                except BlockingIOError:
+                    continue
+                self._parse(data)
+        finally:
+            os.close(self._fd)
+
+    def _parse(self, data: bytes):
+        paths = set()
+        offset = 0
+        while offset + self._HEADER.size <= len(data):
+            wd, mask, _, length = self._HEADER.unpack_from(data, offset)
+            name = data[offset + self._HEADER.size: offset + self._HEADER.size + length].rstrip(b'\0')
+            offset += self._HEADER.size + length
+            if mask & self.IN_Q_OVERFLOW:
+                self.emit(None)
+                continue
+            parent = self._watches.get(wd)
+            if parent is None:
+                continue
+            path = os.path.join(parent, os.fsdecode(name)) if name else parent
+            if mask & self.IN_DELETE_SELF:
+                self._watches.pop(wd, None)
+            if mask & self.IN_ISDIR and mask & (self.IN_CREATE | self.IN_MOVED_TO) and path not in self.ignore_dirs:
+                paths.update(self._add_tree(path))
+            paths.add(path)
+        if paths:
+            self.emit(paths)
+
+
+class _Win32Backend:
+    """Windows ReadDirectoryChangesW 감시 (하위 폴더 포함)."""
+    FILE_LIST_DIRECTORY = 0x0001
+    FILE_SHARE_ALL = 0x00000007
+    OPEN_EXISTING = 3
+    FILE_FLAG_BACKUP_SEMANTICS = 0x02000000
+    NOTIFY_FILTER = 0x00000001 | 0x00000002 | 0x00000008 | 0x00000010  # FILE_NAME | DIR_NAME | SIZE | LAST_WRITE
+    ERROR_OPERATION_ABORTED = 995
+    # 네트워크 공유 폴더는 64KB 를 넘는 버퍼를 지원하지 않습니다.
+    BUFFER_SIZE = 64 * 1024
+
+    name = 'ReadDirectoryChangesW'
+
+    def __init__(self, root: str, emit: Callable[[Optional[Iterable[str]]], None], ignore_dirs: Set[str]):
+        from ctypes import wintypes
+        self.root, self.emit, self.ignore_dirs = root, emit, ignore_dirs
+        self._kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+        self._kernel32.CreateFileW.restype = wintypes.HANDLE
+        self._kernel32.CreateFileW.argtypes = [wintypes.LPCWSTR, wintypes.DWORD, wintypes.DWORD, ctypes.c_void_p,
+                                               wintypes.DWORD, wintypes.DWORD, wintypes.HANDLE]
+        self._kernel32.ReadDirectoryChangesW.argtypes = [wintypes.HANDLE, ctypes.c_void_p, wintypes.DWORD, wintypes.BOOL,
+                                                         wintypes.DWORD, ctypes.POINTER(wintypes.DWORD), ctypes.c_void_p, ctypes.c_void_p]
+        self._kernel32.CancelIoEx.argtypes = [wintypes.HANDLE, ctypes.c_void_p]
+        self._kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+        self._wintypes = wintypes
+        self._handle = self._kernel32.CreateFileW(root, self.FILE_LIST_DIRECTORY, self.FILE_SHARE_ALL, None,
+                                                  self.OPEN_EXISTING, self.FILE_FLAG_BACKUP_SEMANTICS, None)
+        if self._handle in (None, wintypes.HANDLE(-1).value):
+            raise ctypes.WinError(ctypes.get_last_error())
+
+    def run(self, stop: threading.Event):
+        buffer = ctypes.create_string_buffer(self.BUFFER_SIZE)
+        returned = self._wintypes.DWORD()
+        canceller = threading.Thread(target=self._cancel_on_stop, args=(stop,), daemon=True)
+        canceller.start()
+        try:
+            while not stop.is_set():
+                ok = self._kernel32.ReadDirectoryChangesW(self._handle, buffer, len(buffer), True, self.NOTIFY_FILTER,
+                                                         ctypes.byref(returned), None, None)
+                if stop.is_set():
+                    break
+                if not ok:
+                    if ctypes.get_last_error() == self.ERROR_OPERATION_ABORTED:
+                        break
+                    self.emit(None)
+                    stop.wait(5.0)
+                    continue
+                if returned.value == 0:
+                    self.emit(None)  # 버퍼 초과: 전체 비교로 보충
+                    continue
+                self.emit(self._parse(buffer.raw[:returned.value]))
+        finally:
+            self._kernel32.CloseHandle(self._handle)
+
+    def _cancel_on_stop(self, stop: threading.Event):
+        stop.wait()
+        self._kernel32.CancelIoEx(self._handle, None)
+
+    def _parse(self, data: bytes) -> Set[str]:
+        paths = set()
+        offset = 0
+        while True:
+            next_offset, _, length = struct.unpack_from('III', data, offset)
+            name = data[offset + 12: offset + 12 + length].decode('utf-16-le')
+            paths.add(os.path.join(self.root, name))
+            if not next_offset:
+                return paths
+            offset += next_offset
+
+
+class FolderWatcher:
+    """root 이하의 변경을 감지해 on_changes(바뀐 경로 집합)을 감시 스레드에서 호출합니다.
+
+    backend: 'auto'(OS 기본 → 실패 시 폴링), 'native', 'polling'
+    같은 경로의 연속 변경은 debounce 초 동안 모아 한 번에 전달합니다.
+    """
+
+    def __init__(self, root: str, on_changes: Callable[[Set[str]], None], backend: str = 'auto',
+                 poll_interval: float = 2.0, rescan_interval: float = 300.0, debounce: float = 0.5,
+                 ignore_dirs: Iterable[str] = ()):
+        self.root = root
+        self.on_changes = on_changes
+        self.requested_backend = backend
+        self.poll_interval = poll_interval
+        self.rescan_interval = rescan_interval
+        self.debounce = debounce
+        self.snapshot = DirectorySnapshot(root, ignore_dirs)
+        self._ignore_dirs = self.snapshot.ignore_dirs
+        self._native = None
+        self.backend_name = 'polling'
+        self._lock = threading.Lock()
+        self._pending: Set[str] = set()
+        self._wake = threading.Event()
+        self._rescan = threading.Event()
+        self._stop = threading.Event()
+        self._threads = []
+
+    def start(self):
+        if self.requested_backend != 'polling':
+            try:
+                if os.name == 'nt':
+                    self._native = _Win32Backend(self.root, self._emit, self._ignore_dirs)
+                elif hasattr(select, 'select') and os.uname().sysname == 'Linux':
+                    self._native = _InotifyBackend(self.root, self._emit, self._ignore_dirs)
+                if self._native:
+                    self.backend_name = self._native.name
+            except (OSError, AttributeError) as e:
+                print(f"폴더 변경 감지(네이티브) 사용 불가, 폴링으로 대체합니다: {e}")
+                self._native = None
+        targets = [self._poll_loop, self._dispatch_loop]
+        if self._native:
+            targets.append(lambda: self._native.run(self._stop))
+        for target in targets:
+            thread = threading.Thread(target=target, name='folder-watch', daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: float = 1.0):
+        self._stop.set()
+        self._wake.set()
+        self._rescan.set()
+        for thread in self._threads:
+            thread.join(timeout)
+
+    def _emit(self, paths: Optional[Iterable[str]]):
+        """백엔드에서 호출. None 은 이벤트 누락(버퍼 초과)을 뜻하며 전체 비교를 요청합니다."""
+        if paths is None:
+            self._rescan.set()
+            return
+        paths = {p for p in paths if not p.endswith(IGNORED_SUFFIXES) and not any(
+            p == d or p.startswith(d + os.sep) for d in self._ignore_dirs)}
+        if paths:
+            with self._lock:
+                self._pending.update(paths)
+            self._wake.set()
+
+    def _poll_loop(self):
+        self.snapshot.scan(full=True)  # 기준 스냅샷
+        last_full = time.monotonic()
+        while not self._stop.is_set():
+            interval = self.rescan_interval if self._native else self.poll_interval
+            requested = self._rescan.wait(interval)
+            if self._stop.is_set():
+                return
+            self._rescan.clear()
+            now = time.monotonic()
+            full = requested or now - last_full >= self.rescan_interval
+            if full:
+                last_full = now
+            try:
+                changed = self.snapshot.scan(full=full)
+            except Exception as e:
+                print(f"폴더 스냅샷 비교 오류: {e}")
+                continue
+            self._emit(changed)
+
+    def _dispatch_loop(self):
+        while True:
+            self._wake.wait()
+            if self._stop.is_set():
+                return
+            self._stop.wait(self.debounce)
+            with self._lock:
+                batch, self._pending = self._pending, set()
+                self._wake.clear()
+            if batch:
+                try:
+                    self.on_changes(batch)
+                except Exception as e:
+                    print(f"폴더 변경 처리 오류: {e}")
@@ -0,0 +1,175 @@
+"""품목 마스터(Item.csv) 컴파일 캐시 모듈"""
+
+import csv
+import glob
+import hashlib
+import io
+import marshal
+import os
+import threading
+from typing import List, Dict, Optional, Any
+
+from utils.exceptions import FileHandlingError
+
+
+CACHE_FORMAT_VERSION = 1
+CACHE_PREFIX = "item_master_"
+CACHE_SUFFIX = ".marshal"
+ENCODINGS_TO_TRY = ['utf-8-sig', 'cp949', 'euc-kr', 'utf-8']
+
+
+def compute_csv_hash(csv_bytes: bytes) -> str:
+    """CSV 원본 바이트의 SHA-1 해시를 반환합니다."""
+    return hashlib.sha1(csv_bytes).hexdigest()
+
+
+def cache_path_for(cache_dir: str, csv_hash: str) -> str:
+    """CSV 해시에 대응하는 캐시 파일 경로를 반환합니다."""
+    return os.path.join(cache_dir, f"{CACHE_PREFIX}{csv_hash[:16]}{CACHE_SUFFIX}")
+
+
+def _decode_csv(csv_bytes: bytes) -> tuple:
+    """여러 인코딩을 시도하여 CSV를 디코딩하고 (텍스트, 인코딩)을 반환합니다."""
+    for encoding in ENCODINGS_TO_TRY:
+        try:
+            return csv_bytes.decode(encoding), encoding
+        except UnicodeDecodeError:
+            continue
+    raise FileHandlingError("파일의 인코딩을 알 수 없습니다.")
+
+
+def _normalize_row(row: Dict[Optional[str], Any]) -> Dict[str, str]:
+    """키/값의 앞뒤 공백을 제거하고 잘못된 열(None 키)을 버립니다."""
+    normalized = {}
+    for key, value in row.items():
+        if key is None:
+            continue
+        normalized[key.strip()] = value.strip() if isinstance(value, str) else (value or '')
+    return normalized
+
+
+def compile_item_master(csv_bytes: bytes, csv_hash: str) -> Dict[str, Any]:
+    """CSV 바이트를 정규화된 레코드와 조회 인덱스로 컴파일합니다."""
+    text, encoding = _decode_csv(csv_bytes)
+    records = [_normalize_row(row) for row in csv.DictReader(io.StringIO(text))]
+
+    by_code: Dict[str, int] = {}
+    for idx, record in enumerate(records):
+        code = record.get('Item Code')
+        if code and code not in by_code:
+            by_code[code] = idx
+
+    return {
+        'version': CACHE_FORMAT_VERSION,
+        'csv_hash': csv_hash,
+        'encoding': encoding,
+        'records': records,
+        'by_code': by_code,
+        'code_lengths': sorted({len(code) for code in by_code}),
+    }
+
+
+def _write_cache(cache_dir: str, compiled: Dict[str, Any]):
+    """컴파일 결과를 원자적으로 저장합니다. (다른 해시의 캐시 파일은 prune_stale_caches 로 정리)"""
+    os.makedirs(cache_dir, exist_ok=True)
+    target = cache_path_for(cache_dir, compiled['csv_hash'])
+    tmp_path = f"{target}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        marshal.dump(compiled, f)
+    os.replace(tmp_path, target)
+
+
+def prune_stale_caches(cache_dir: str, keep_hashes: List[str]):
+    """지정된 해시 이외의 캐시 파일을 삭제합니다."""
+    keep = {os.path.normcase(cache_path_for(cache_dir, h)) for h in keep_hashes}
+    for path in glob.glob(os.path.join(cache_dir, f"{CACHE_PREFIX}*{CACHE_SUFFIX}")):
+        if os.path.normcase(path) not in keep:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+def _read_cache(cache_dir: str, csv_hash: str) -> Optional[Dict[str, Any]]:
+    path = cache_path_for(cache_dir, csv_hash)
+    try:
+        with open(path, 'rb') as f:
+            compiled = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if not isinstance(compiled, dict) or compiled.get('version') != CACHE_FORMAT_VERSION or compiled.get('csv_hash') != csv_hash:
+        return None
+    return compiled
+
+
+def precompile_in_background(csv_path: str, cache_dir: str) -> threading.Thread:
+    """새 Item.csv(예: 업데이트 패키지)를 백그라운드 스레드에서 미리 컴파일합니다."""
+    def worker():
+        try:
+            with open(csv_path, 'rb') as f:
+                csv_bytes = f.read()
+            csv_hash = compute_csv_hash(csv_bytes)
+            if _read_cache(cache_dir, csv_hash) is None:
+                _write_cache(cache_dir, compile_item_master(csv_bytes, csv_hash))
+        except Exception as e:
+            print(f"품목 마스터 사전 컴파일 실패: {e}")
+
+    thread = threading.Thread(target=worker, daemon=True)
+    thread.start()
+    return thread
+
+
+class ItemMaster:
+    """컴파일된 품목 마스터와 품목코드 조회 인덱스를 제공합니다."""
+
+    def __init__(self, compiled: Dict[str, Any], source: str):
+        self.records: List[Dict[str, str]] = compiled['records']
+        self.csv_hash: str = compiled['csv_hash']
+        self.encoding: str = compiled['encoding']
+        self.source = source
+        self._by_code: Dict[str, int] = compiled['by_code']
+        self._code_lengths: List[int] = compiled['code_lengths']
+
+    @classmethod
+    def load(cls, csv_path: str, cache_dir: str) -> 'ItemMaster':
+        """캐시가 유효하면 캐시에서, 아니면 CSV를 컴파일하여 품목 마스터를 로드합니다.
+
+        어느 경우든 현재 CSV 이외의 캐시 파일(이전 버전, 업데이트 때 미리 컴파일한 뒤 적용되지 않은 것)은 정리합니다.
+        FileNotFoundError는 그대로 전달되며, 인코딩 감지 실패 시 FileHandlingError가 발생합니다.
+        """
+        with open(csv_path, 'rb') as f:
+            csv_bytes = f.read()
+        csv_hash = compute_csv_hash(csv_bytes)
+
+        compiled = _read_cache(cache_dir, csv_hash)
+        source = 'cache'
+        if compiled is None:
+            compiled = compile_item_master(csv_bytes, csv_hash)
+            source = 'csv'
+            try:
+                _write_cache(cache_dir, compiled)
+            except OSError as e:
+                print(f"품목 마스터 캐시 저장 실패: {e}")
+        prune_stale_caches(cache_dir, [csv_hash])
+        return cls(compiled, source=source)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def get(self, item_code: Optional[str]) -> Optional[Dict[str, str]]:
+        """품목코드와 정확히 일치하는 레코드를 반환합니다."""
+        idx = self._by_code.get(item_code) if item_code else None
+        return self.records[idx] if idx is not None else None
+
+    def __contains__(self, item_code: str) -> bool:
+        return item_code in self._by_code
+
+    def find_code_in_barcode(self, barcode: str) -> Optional[str]:
+        """바코드에 포함된 품목코드를 찾습니다. 여러 개가 포함되면 CSV 순서상 먼저인 코드를 반환합니다."""
+        best_idx = None
+        for length in self._code_lengths:
+            for start in range(len(barcode) - length + 1):
+                idx = self._by_code.get(barcode[start:start + length])
+                if idx is not None and (best_idx is None or idx < best_idx):
+                    best_idx = idx
+        return self.records[best_idx]['Item Code'] if best_idx is not None else None
@@ -0,0 +1,151 @@
+"""라벨 일괄 렌더링(프로세스 풀) 및 다중 페이지 PDF 생성 모듈
+
+spawn 방식 프로세스 풀의 작업 프로세스는 부모 프로세스의 __main__ 스크립트를 다시 import 합니다.
+앱(Inspection_worker.py)에서 바로 풀을 만들면 작업 프로세스마다 tkinter/pygame 등 앱 전체를 읽으므로,
+앱은 render_labels_to_pdf_isolated() 로 이 모듈을 __main__ 으로 하는 별도 프로세스에서 풀을 만듭니다.
+
+    python -m core.label_batch <작업 명세 JSON>
+"""
+
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from PIL import Image
+
+from core.label_renderer import LabelRenderer
+from core.label_worker import init_worker, render_in_worker
+
+
+# 이 수량 이하는 프로세스 생성 비용이 더 크므로 현재 프로세스에서 렌더링합니다.
+INLINE_THRESHOLD = 4
+# 라벨 레이아웃 1px = 203dpi 프린터 1dot 기준으로 PDF 페이지 크기를 정합니다.
+PDF_RESOLUTION = 203.0
+# 별도 프로세스의 진행 상황 행 머리말. 작업 프로세스나 라이브러리가 출력하는 다른 행은 무시합니다.
+PROGRESS_TAG = 'LABEL_BATCH_PROGRESS'
+
+LabelJobSpec = Tuple[str, Dict[str, Any]]  # (템플릿 이름, LabelRenderer.render() 인자)
+ProgressCallback = Callable[[int, int], None]
+
+_PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def render_batch(jobs: List[LabelJobSpec], max_workers: Optional[int] = None,
+                 progress: Optional[ProgressCallback] = None,
+                 renderer: Optional[LabelRenderer] = None) -> List[Image.Image]:
+    """라벨 여러 장을 CPU 코어 수만큼의 프로세스로 나누어 렌더링하고 입력 순서대로 반환합니다.
+
+    progress(완료 수, 전체 수)는 호출한 스레드에서 호출됩니다.
+    """
+    total = len(jobs)
+    results: List[Optional[Image.Image]] = [None] * total
+    workers = min(max_workers or os.cpu_count() or 1, total)
+    renderer = renderer or LabelRenderer()
+
+    if total <= INLINE_THRESHOLD or workers <= 1:
+        for i, (template_name, fields) in enumerate(jobs):
+            results[i] = renderer.render(template_name, **fields)
+            if progress:
+                progress(i + 1, total)
+        return results
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(renderer.font_fallbacks, renderer.font_override)) as executor:
+        futures = [executor.submit(render_in_worker, i, template_name, fields) for i, (template_name, fields) in enumerate(jobs)]
+        for done, future in enumerate(as_completed(futures), 1):
+            index, mode, size, data = future.result()
+            results[index] = Image.frombytes(mode, size, data)
+            if progress:
+                progress(done, total)
+    return results
+
+
+def save_pdf(images: List[Image.Image], output_path: str) -> str:
+    """이미지들을 한 장씩 페이지로 하는 PDF 파일을 저장합니다."""
+    if not images:
+        raise ValueError("PDF로 저장할 라벨이 없습니다.")
+    os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+    pages = [img if img.mode == 'RGB' else img.convert('RGB') for img in images]
+    tmp_path = f"{output_path}.{threading.get_ident()}.tmp"
+    pages[0].save(tmp_path, format='PDF', save_all=True, append_images=pages[1:], resolution=PDF_RESOLUTION)
+    os.replace(tmp_path, output_path)
+    return output_path
+
+
+def render_labels_to_pdf(jobs: List[LabelJobSpec], output_path: str, max_workers: Optional[int] = None,
+                         progress: Optional[ProgressCallback] = None,
+                         renderer: Optional[LabelRenderer] = None) -> str:
+    """라벨들을 병렬 렌더링하여 다중 페이지 PDF 하나로 저장하고 경로를 반환합니다."""
+    return save_pdf(render_batch(jobs, max_workers, progress, renderer), output_path)
+
+
+def render_labels_to_pdf_isolated(jobs: List[LabelJobSpec], output_path: str, max_workers: Optional[int] = None,
+                                  progress: Optional[ProgressCallback] = None,
+                                  font_fallbacks: Tuple[str, ...] = ()) -> str:
+    """render_labels_to_pdf() 를 'python -m core.label_batch' 프로세스에서 실행합니다.
+
+    PyInstaller 실행 파일은 -m 으로 모듈을 실행할 수 없으므로 현재 프로세스에서 풀을 만듭니다.
+    """
+    if getattr(sys, 'frozen', False):
+        return render_labels_to_pdf(jobs, output_path, max_workers, progress, LabelRenderer(font_fallbacks))
+
+    spec_path = f"{output_path}.jobs.json"
+    os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+    with open(spec_path, 'w', encoding='utf-8') as f:
+        json.dump({'jobs': jobs, 'output_path': output_path, 'max_workers': max_workers,
+                   'font_fallbacks': list(font_fallbacks)}, f, ensure_ascii=False)
+    try:
+        env = dict(os.environ, PYTHONIOENCODING='utf-8')
+        with subprocess.Popen([sys.executable, '-m', 'core.label_batch', spec_path], cwd=_PACKAGE_ROOT, env=env,
+                              stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, encoding='utf-8') as proc:
+            for line in proc.stdout:
+                parts = line.split()
+                if len(parts) == 3 and parts[0] == PROGRESS_TAG and progress:
+                    progress(int(parts[1]), int(parts[2]))
+            error = proc.stderr.read()
+        if proc.returncode != 0:
+            raise RuntimeError(error.strip().splitlines()[-1] if error.strip() else f"종료 코드 {proc.returncode}")
+    finally:
+        try:
+            os.remove(spec_path)
+        except OSError:
+            pass
+    return output_path
+
+
+def prune_batches(batch_dir: str, keep_days: float, keep_count: int):
+    """일괄 재발행 PDF 중 keep_days 보다 오래되었거나 최신 keep_count 개 밖인 파일을 삭제합니다."""
+    try:
+        entries = [entry for entry in os.scandir(batch_dir) if entry.is_file()]
+    except OSError:
+        return
+    entries.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+    cutoff = time.time() - keep_days * 86400
+    for i, entry in enumerate(entries):
+        if i >= keep_count or entry.stat().st_mtime < cutoff:
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = sys.argv[1:] if argv is None else argv
+    if len(args) != 1:
+        print("사용법: python -m core.label_batch <작업 명세 JSON>", file=sys.stderr)
+        return 2
+    with open(args[0], 'r', encoding='utf-8') as f:
+        spec = json.load(f)
+    jobs = [(template_name, fields) for template_name, fields in spec['jobs']]
+    render_labels_to_pdf(jobs, spec['output_path'], spec.get('max_workers'),
+                         progress=lambda done, total: print(PROGRESS_TAG, done, total, flush=True),
+                         renderer=LabelRenderer(tuple(spec.get('font_fallbacks') or ())))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,122 @@
+"""라벨 이미지 온디맨드 생성 및 용량 제한 디스크 캐시 모듈
+
+불량표/잔량표의 원본 데이터는 JSON 레코드이며, 이미지는 출력하거나 열어볼 때만
+렌더링되어 로컬 캐시에 저장됩니다. 캐시는 최근 사용 순(LRU)으로 용량을 유지합니다.
+"""
+
+import datetime
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Any
+
+from core.label_renderer import LabelRenderer
+
+
+def _format_creation_date(value: str) -> str:
+    """ISO 형식 생성일시를 라벨 표기(YYYY-MM-DD HH:MM:SS)로 변환합니다."""
+    if not value:
+        return ''
+    try:
+        return datetime.datetime.fromisoformat(value.replace('Z', '+00:00')).strftime('%Y-%m-%d %H:%M:%S')
+    except ValueError:
+        return value
+
+
+def label_fields_from_record(template_name: str, record: Dict[str, Any]) -> Dict[str, Any]:
+    """불량표/잔량표 JSON 레코드를 LabelRenderer.render()의 인자로 변환합니다."""
+    if template_name == 'defective':
+        label_id = record.get('defect_box_id', '')
+        quantity = record.get('quantity', len(record.get('barcodes', [])))
+    else:
+        label_id = record.get('remnant_id', '')
+        quantity = len(record.get('remnant_barcodes', []))
+    return {
+        'label_id': label_id,
+        'item_code': record.get('item_code', ''),
+        'item_name': record.get('item_name', ''),
+        'item_spec': record.get('item_spec', ''),
+        'quantity': quantity,
+        'worker_name': record.get('worker', ''),
+        'creation_date': _format_creation_date(record.get('creation_date', '')),
+    }
+
+
+class LabelImageCache:
+    """라벨 이미지를 필요할 때 렌더링하고, 최대 용량을 넘으면 오래 사용하지 않은 파일부터 삭제합니다."""
+
+    def __init__(self, cache_dir: str, renderer: LabelRenderer, max_bytes: int = 200 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.renderer = renderer
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._total_bytes = 0
+        self._scan_existing()
+
+    def _scan_existing(self):
+        """캐시 폴더의 기존 파일을 수정 시각 순으로 인덱싱합니다."""
+        found = []
+        for dirpath, _, filenames in os.walk(self.cache_dir):
+            for filename in filenames:
+                if not filename.endswith('.png'):
+                    continue
+                path = os.path.join(dirpath, filename)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                found.append((st.st_mtime, path, st.st_size))
+        for _, path, size in sorted(found):
+            self._entries[path] = size
+            self._total_bytes += size
+
+    def path_for(self, template_name: str, fields: Dict[str, Any]) -> str:
+        """라벨 값에 대응하는 캐시 파일 경로를 반환합니다. 값이 바뀌면 경로도 바뀝니다."""
+        digest = hashlib.sha1(json.dumps(fields, sort_keys=True, ensure_ascii=False).encode('utf-8')).hexdigest()[:10]
+        return os.path.join(self.cache_dir, template_name, f"{fields['label_id']}_{digest}.png")
+
+    def materialize(self, template_name: str, fields: Dict[str, Any]) -> str:
+        """캐시에 이미지가 있으면 경로를, 없으면 렌더링 후 저장한 경로를 반환합니다."""
+        path = self.path_for(template_name, fields)
+        with self._lock:
+            if path in self._entries and os.path.exists(path):
+                self._entries.move_to_end(path)
+                try:
+                    os.utime(path)
+                except OSError:
+                    pass
+                return path
+
+        img = self.renderer.render(template_name, **fields)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        img.save(tmp_path, format='PNG')
+        os.replace(tmp_path, path)
+        size = os.path.getsize(path)
+
+        with self._lock:
+            self._total_bytes -= self._entries.pop(path, 0)
+            self._entries[path] = size
+            self._total_bytes += size
+            self._evict(keep=path)
+        return path
+
+    def _evict(self, keep: str):
+        while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+            path, size = next(iter(self._entries.items()))
+            if path == keep:
+                break
+            self._entries.popitem(last=False)
+            self._total_bytes -= size
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    @property
+    def total_bytes(self) -> int:
+        with self._lock:
+            return self._total_bytes
@@ -0,0 +1,162 @@
+"""라벨 프린터 네이티브 출력(ZPL) 모듈
+
+PNG 렌더러와 같은 LabelTemplate 레이아웃을 사용하여 텍스트/선/QR 코드를
+프린터 명령으로 변환합니다. 레이아웃 1px = 프린터 1dot(203dpi 기준 800x400 ≈ 100x50mm)입니다.
+"""
+
+import os
+import socket
+import threading
+from typing import Optional
+
+import qrcode
+
+from core.label_renderer import LABEL_TEMPLATES, LabelTemplate, build_qr_payload, qr_matrix
+from utils.exceptions import ConfigurationError, FileHandlingError, NetworkError
+
+
+_QR_LEVELS = {
+    qrcode.constants.ERROR_CORRECT_L: 'L',
+    qrcode.constants.ERROR_CORRECT_M: 'M',
+    qrcode.constants.ERROR_CORRECT_Q: 'Q',
+    qrcode.constants.ERROR_CORRECT_H: 'H',
+}
+
+
+def _zpl_text(text: str) -> str:
+    """^FH 16진 이스케이프로 ZPL 제어 문자(^, ~, \\)를 안전하게 변환합니다."""
+    return str(text).replace('\\', '\\5C').replace('^', '\\5E').replace('~', '\\7E')
+
+
+class ZplLabelEncoder:
+    """LabelTemplate과 라벨 값으로 ZPL II 명령을 생성합니다.
+
+    한글 출력에는 프린터에 저장된 유니코드 TTF가 필요하므로 printer_font에
+    프린터 내 경로(예: 'E:MALGUN.TTF')를 지정합니다. 비어 있으면 내장 폰트 0을 사용합니다.
+    """
+
+    FONT_ALIAS = 'J'
+
+    def __init__(self, printer_font: str = ''):
+        self.printer_font = printer_font
+
+    def _font(self, size: int) -> str:
+        alias = self.FONT_ALIAS if self.printer_font else '0'
+        return f"^A{alias}N,{size},{size}"
+
+    def _text(self, x: int, y: int, size: int, text: str) -> str:
+        return f"^FO{int(x)},{int(y)}{self._font(size)}^FH\\^FD{_zpl_text(text)}^FS"
+
+    def encode(self, template_name: str, label_id: str, item_code: str, item_name: str, item_spec: str,
+               quantity: int, worker_name: str, creation_date: str, qr_payload: Optional[str] = None) -> bytes:
+        """라벨 한 장의 ZPL 명령(UTF-8)을 반환합니다."""
+        template: LabelTemplate = LABEL_TEMPLATES[template_name]
+        lay, sizes = template.layout, template.font_sizes
+        W, H = template.size
+
+        cmds = ["^XA", "^CI28", f"^PW{W}", f"^LL{H}", "^LH0,0"]
+        if self.printer_font:
+            cmds.append(f"^CW{self.FONT_ALIAS},{self.printer_font}")
+
+        # 제목 (프린터 폰트의 글자 높이는 지정 크기와 같다고 보고 구분선 위치를 계산합니다)
+        title_y = lay['title_top_margin']
+        cmds.append(f"^FO0,{title_y}{self._font(sizes['title'])}^FB{W},1,0,C^FH\\^FD{_zpl_text(template.title)}^FS")
+        line_y = title_y + sizes['title'] + lay['header_line_margin']
+        cmds.append(f"^FO30,{line_y}^GB{W - 60},3,3^FS")
+
+        y_pos = line_y + lay['content_top_margin']
+        for label, value in zip(template.row_labels, (item_name, item_code, item_spec)):
+            cmds.append(self._text(lay['table_header_x'], y_pos, sizes['header'], label))
+            cmds.append(self._text(lay['table_value_x'], y_pos, sizes['body'], f": {value}"))
+            y_pos += lay['table_line_height']
+
+        qty_text = f": {quantity}"
+        cmds.append(self._text(lay['table_header_x'], y_pos, sizes['header'], template.quantity_label))
+        cmds.append(self._text(lay['table_value_x'], y_pos - 10, sizes['quantity'], qty_text))
+        unit_x = lay['table_value_x'] + int(len(qty_text) * sizes['quantity'] * 0.6) + 5
+        cmds.append(self._text(unit_x, y_pos, sizes['unit'], "EA"))
+
+        footer_y = H - lay['footer_bottom_margin']
+        cmds.append(f"^FO30,{footer_y - lay['footer_line_margin']}^GB{W - 60},1,1^FS")
+        footer_text = template.footer_format.format(label_id=label_id, creation_date=creation_date, worker_name=worker_name)
+        cmds.append(self._text(template.padding, footer_y, sizes['footer'], footer_text))
+
+        # QR: PNG와 같은 모듈 행렬 크기로 배율을 정해 같은 영역(qr_size)에 맞춥니다.
+        payload = qr_payload if qr_payload is not None else build_qr_payload(label_id, item_code, quantity)
+        modules = len(qr_matrix(payload, template.qr_error_correction, template.qr_border))
+        magnification = max(1, min(10, template.qr_size // modules))
+        level = _QR_LEVELS.get(template.qr_error_correction, 'M')
+        qr_x = W - template.qr_size - template.padding
+        qr_y = line_y + lay['content_top_margin']
+        cmds.append(f"^FO{qr_x},{qr_y}^BQN,2,{magnification}^FH\\^FD{level}A,{_zpl_text(payload)}^FS")
+
+        cmds.append("^XZ")
+        return ("\n".join(cmds) + "\n").encode('utf-8')
+
+
+class SpoolFileSink:
+    """ZPL 작업을 스풀 폴더에 파일로 기록합니다. (프린터 공유/드라이버가 폴더를 감시하는 구성)"""
+
+    def __init__(self, spool_dir: str, extension: str = ".zpl"):
+        self.spool_dir = spool_dir
+        self.extension = extension
+
+    def send(self, job_name: str, data: bytes) -> str:
+        try:
+            os.makedirs(self.spool_dir, exist_ok=True)
+            path = os.path.join(self.spool_dir, f"{job_name}{self.extension}")
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+            return path
+        except OSError as e:
+            raise FileHandlingError(f"스풀 파일 기록 실패: {e}") from e
+
+
+class RawTcpSink:
+    """ZPL 작업을 프린터의 RAW 포트(기본 9100)로 직접 전송합니다."""
+
+    def __init__(self, host: str, port: int = 9100, timeout: float = 5.0):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+
+    def send(self, job_name: str, data: bytes) -> str:
+        try:
+            with socket.create_connection((self.host, self.port), timeout=self.timeout) as sock:
+                sock.sendall(data)
+            return f"{self.host}:{self.port}"
+        except OSError as e:
+            raise NetworkError(f"프린터({self.host}:{self.port}) 전송 실패: {e}") from e
+
+
+class LabelPrinter:
+    """라벨 값을 프린터 명령으로 변환하여 출력 대상(sink)으로 보냅니다."""
+
+    def __init__(self, encoder: ZplLabelEncoder, sink):
+        self.encoder = encoder
+        self.sink = sink
+
+    def print_label(self, template_name: str, **fields) -> str:
+        """라벨 한 장을 출력하고 출력 대상(파일 경로 또는 host:port)을 반환합니다."""
+        data = self.encoder.encode(template_name, **fields)
+        return self.sink.send(fields['label_id'], data)
+
+
+def create_label_printer(backend: str, spool_dir: str = '', host: str = '', port: int = 9100,
+                         printer_font: str = '', timeout: float = 5.0) -> Optional[LabelPrinter]:
+    """설정값으로 LabelPrinter를 만듭니다. backend가 'none'이거나 비어 있으면 None을 반환합니다."""
+    backend = (backend or 'none').lower()
+    if backend == 'none':
+        return None
+    encoder = ZplLabelEncoder(printer_font)
+    if backend == 'spool':
+        if not spool_dir:
+            raise ConfigurationError("label.printer.spool_dir 설정이 필요합니다.")
+        return LabelPrinter(encoder, SpoolFileSink(spool_dir))
+    if backend == 'tcp':
+        if not host:
+            raise ConfigurationError("label.printer.host 설정이 필요합니다.")
+        return LabelPrinter(encoder, RawTcpSink(host, int(port), timeout))
+    raise ConfigurationError(f"지원하지 않는 라벨 프린터 방식입니다: {backend}")
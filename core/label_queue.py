@@ -0,0 +1,110 @@
+"""라벨 이미지 비동기 렌더링 큐 모듈"""
+
+import queue
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, Any, Optional
+
+from core.label_cache import LabelImageCache
+
+
+@dataclass
+class LabelJob:
+    """렌더링 대기 중인 라벨 한 장입니다."""
+    template_name: str
+    fields: Dict[str, Any]
+    on_done: Optional[Callable[['LabelJob'], None]] = None
+    on_error: Optional[Callable[[Exception], None]] = None
+    print_label: bool = False
+    output_path: Optional[str] = None
+    printed_to: Optional[str] = None
+    print_error: Optional[Exception] = None
+
+
+class LabelRenderQueue:
+    """라벨 출력과 이미지 생성을 백그라운드 스레드에서 순서대로 처리합니다.
+
+    print_label 작업은 printer가 있으면 프린터 명령만 전송하고, 프린터가 없거나
+    출력에 실패한 경우에만 이미지 캐시에 PNG를 생성합니다(수동 출력용).
+    결과는 완료 콜백에 전달되는 LabelJob의 output_path/printed_to/print_error에 기록됩니다.
+    완료/실패 콜백은 dispatch(콜백)로 전달되며, UI에서는 Tk 메인 스레드가 꺼내 실행하는 큐에
+    넣는 함수를 지정합니다. (작업 스레드에서 Tk 를 직접 부르면 종료 대기 중에 멈춥니다)
+    """
+
+    def __init__(self, image_cache: LabelImageCache, dispatch: Callable[[Callable[[], None]], None], printer=None):
+        self.image_cache = image_cache
+        self.printer = printer
+        self._dispatch = dispatch
+        self._jobs: "queue.Queue[Optional[LabelJob]]" = queue.Queue()
+        self._pending = 0
+        self._pending_lock = threading.Lock()
+        self._idle = threading.Event()
+        self._idle.set()
+        self._thread = threading.Thread(target=self._worker, daemon=True)
+        self._thread.start()
+
+    @property
+    def pending(self) -> int:
+        """아직 완료되지 않은 작업 수를 반환합니다."""
+        with self._pending_lock:
+            return self._pending
+
+    def submit(self, template_name: str, fields: Dict[str, Any],
+               on_done: Optional[Callable[[LabelJob], None]] = None,
+               on_error: Optional[Callable[[Exception], None]] = None,
+               print_label: bool = False) -> LabelJob:
+        """라벨 작업을 큐에 추가합니다. fields는 LabelRenderer.render()의 키워드 인자입니다."""
+        job = LabelJob(template_name, fields, on_done, on_error, print_label)
+        with self._pending_lock:
+            self._pending += 1
+            self._idle.clear()
+        self._jobs.put(job)
+        return job
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """대기 중인 작업이 모두 끝날 때까지 기다립니다."""
+        return self._idle.wait(timeout)
+
+    def stop(self, timeout: Optional[float] = None):
+        """남은 작업을 처리한 뒤 작업 스레드를 종료합니다."""
+        self._jobs.put(None)
+        if self._thread.is_alive():
+            self._thread.join(timeout)
+
+    def _worker(self):
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                break
+            try:
+                if job.print_label:
+                    self._print(job)
+                if not job.printed_to:
+                    job.output_path = self.image_cache.materialize(job.template_name, job.fields)
+                self._notify(job.on_done, job)
+            except Exception as e:
+                print(f"라벨 이미지 생성 실패 ({job.fields.get('label_id')}): {e}")
+                self._notify(job.on_error, e)
+            finally:
+                with self._pending_lock:
+                    self._pending -= 1
+                    if self._pending == 0:
+                        self._idle.set()
+
+    def _print(self, job: LabelJob):
+        printer = self.printer
+        if printer is None:
+            return
+        try:
+            job.printed_to = printer.print_label(job.template_name, **job.fields)
+        except Exception as e:
+            print(f"라벨 프린터 출력 실패 ({job.fields.get('label_id')}): {e}")
+            job.print_error = e
+
+    def _notify(self, callback: Optional[Callable], arg: Any):
+        if callback is None:
+            return
+        try:
+            self._dispatch(lambda: callback(arg))
+        except Exception as e:
+            print(f"라벨 완료 콜백 전달 실패: {e}")
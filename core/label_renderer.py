@@ -0,0 +1,226 @@
+"""템플릿 기반 라벨(불량표/잔량표) 렌더러 모듈"""
+
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, Tuple, Any, Optional
+
+from PIL import Image, ImageDraw, ImageFont
+import qrcode
+
+
+@dataclass(frozen=True)
+class LabelTemplate:
+    """라벨 한 종류의 레이아웃 정의입니다. 좌표와 크기는 배율 1.0 기준(px)입니다."""
+    name: str
+    title: str
+    bg_color: str
+    text_color: str
+    font_path: str
+    footer_format: str
+    row_labels: Tuple[str, str, str] = ("품 목 명", "품목코드", "규    격")
+    quantity_label: str = "수    량"
+    stroke_colon: bool = False
+    qr_error_correction: int = qrcode.constants.ERROR_CORRECT_M
+    size: Tuple[int, int] = (800, 400)
+    padding: int = 30
+    font_sizes: Dict[str, int] = field(default_factory=lambda: {'title': 60, 'header': 32, 'body': 34, 'quantity': 70, 'unit': 32, 'footer': 16})
+    qr_size: int = 220
+    qr_border: int = 4
+    layout: Dict[str, int] = field(default_factory=lambda: {
+        'title_top_margin': 25, 'header_line_margin': 15, 'content_top_margin': 30,
+        'table_line_height': 48, 'table_header_x': 50, 'table_value_x': 180,
+        'footer_bottom_margin': 40, 'footer_line_margin': 15,
+    })
+
+
+LABEL_TEMPLATES: Dict[str, LabelTemplate] = {}
+
+# 저장소에 포함된 한글 폰트(나눔고딕, SIL OFL 1.1). 운영 폰트(맑은 고딕)가 없는 PC 의 대체 폰트이자
+# 골든 이미지 기준 폰트입니다. 저장소(또는 실행 파일) 루트 기준 상대 경로입니다.
+BUNDLED_FONT = os.path.join('assets', 'fonts', 'NanumGothic.ttf')
+
+
+def register_template(template: LabelTemplate):
+    """새 라벨 템플릿을 등록합니다. 같은 이름이 있으면 교체됩니다."""
+    LABEL_TEMPLATES[template.name] = template
+
+
+register_template(LabelTemplate(
+    name='defective', title="불 량 표", bg_color="#FADBD8", text_color="#C0392B",
+    font_path="C:/Windows/Fonts/malgunbd.ttf",
+    footer_format="ID: {label_id} | 생성일: {creation_date} | 작업자: {worker_name}",
+    stroke_colon=True,
+))
+register_template(LabelTemplate(
+    name='remnant', title="잔 량 표", bg_color="white", text_color="black",
+    font_path="C:/Windows/Fonts/malgun.ttf",
+    footer_format="잔량 ID: {label_id}   |   생성일: {creation_date}   |   작업자: {worker_name}",
+    row_labels=("품 목 명", "품목코드", "규      격"), quantity_label="수      량",
+    qr_error_correction=qrcode.constants.ERROR_CORRECT_L,
+    font_sizes={'title': 48, 'header': 32, 'body': 34, 'quantity': 70, 'unit': 32, 'footer': 16},
+))
+
+
+def build_qr_payload(label_id: str, item_code: str, quantity: int) -> str:
+    """라벨 QR 코드에 담기는 JSON 문자열을 생성합니다."""
+    return json.dumps({'id': label_id, 'code': item_code, 'qty': quantity})
+
+
+def qr_matrix(data: str, error_correction: int, border: int):
+    """QR 모듈 행렬(여백 포함, True=어두운 모듈)을 반환합니다."""
+    qr = qrcode.QRCode(version=1, error_correction=error_correction, box_size=1, border=border)
+    qr.add_data(data)
+    qr.make(fit=True)
+    return qr.get_matrix()
+
+
+def render_qr_mask(data: str, size: int, error_correction: int, border: int) -> Image.Image:
+    """QR 모듈을 목표 크기의 1비트 마스크로 직접 렌더링합니다. (확대 후 축소 과정 없음)"""
+    matrix = qr_matrix(data, error_correction, border)
+    n = len(matrix)
+    modules = Image.frombytes('L', (n, n), bytes(255 if cell else 0 for row in matrix for cell in row))
+    return modules.resize((size, size), Image.Resampling.NEAREST).convert('1')
+
+
+def _fit_text(draw: ImageDraw.ImageDraw, text: str, font, max_width: float) -> str:
+    """텍스트가 max_width를 넘으면 뒤를 잘라 '…'을 붙입니다."""
+    if draw.textlength(text, font=font) <= max_width:
+        return text
+    lo, hi = 0, len(text)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if draw.textlength(text[:mid] + "…", font=font) <= max_width:
+            lo = mid
+        else:
+            hi = mid - 1
+    return text[:lo] + "…"
+
+
+@dataclass
+class _StaticLayer:
+    image: Image.Image
+    line_y: int
+
+
+class LabelRenderer:
+    """폰트, 템플릿별 정적 배경을 캐시하여 라벨을 빠르게 렌더링합니다.
+
+    font_override를 지정하면 템플릿 폰트 대신 모든 라벨에 해당 폰트를 사용합니다.
+    BUILTIN_FONT는 Pillow 내장 폰트로 한글 글리프가 없으므로, 시스템 폰트와 무관한 결과가 필요하면
+    BUNDLED_FONT 를 지정합니다.
+    """
+
+    BUILTIN_FONT = 'builtin'
+
+    def __init__(self, font_fallbacks: Tuple[str, ...] = (), font_override: Optional[str] = None):
+        self.font_fallbacks = font_fallbacks
+        self.font_override = font_override
+        self._lock = threading.Lock()
+        self._fonts: Dict[Tuple[str, int], Any] = {}
+        self._backgrounds: Dict[Tuple[str, float], _StaticLayer] = {}
+        self.used_fallback_font = False
+
+    def _font(self, font_path: str, size: int):
+        font_path = self.font_override or font_path
+        key = (font_path, size)
+        font = self._fonts.get(key)
+        if font is None and font_path == self.BUILTIN_FONT:
+            font = self._fonts[key] = ImageFont.load_default(size)
+        if font is None:
+            for path in (font_path,) + tuple(self.font_fallbacks):
+                try:
+                    font = ImageFont.truetype(path, size)
+                    break
+                except (IOError, OSError):
+                    continue
+            if font is None:
+                self.used_fallback_font = True
+                font = ImageFont.load_default()
+            elif path != font_path:
+                self.used_fallback_font = True
+            self._fonts[key] = font
+        return font
+
+    def _fonts_for(self, template: LabelTemplate, scale: float) -> Dict[str, Any]:
+        return {name: self._font(template.font_path, max(1, int(size * scale))) for name, size in template.font_sizes.items()}
+
+    def _static_layer(self, template: LabelTemplate, scale: float) -> _StaticLayer:
+        key = (template.name, scale)
+        layer = self._backgrounds.get(key)
+        if layer is not None:
+            return layer
+
+        with self._lock:
+            layer = self._backgrounds.get(key)
+            if layer is not None:
+                return layer
+
+            s = lambda v: int(round(v * scale))
+            fonts = self._fonts_for(template, scale)
+            lay = template.layout
+            W, H = s(template.size[0]), s(template.size[1])
+            img = Image.new('RGB', (W, H), template.bg_color)
+            draw = ImageDraw.Draw(img)
+            color = template.text_color
+
+            title_bbox = draw.textbbox((0, 0), template.title, font=fonts['title'])
+            title_w, title_h = title_bbox[2] - title_bbox[0], title_bbox[3] - title_bbox[1]
+            draw.text(((W - title_w) / 2, s(lay['title_top_margin'])), template.title, font=fonts['title'], fill=color)
+            line_y = s(lay['title_top_margin']) + title_h + s(lay['header_line_margin'])
+            draw.line([(s(30), line_y), (W - s(30), line_y)], fill=color, width=max(1, s(3)))
+
+            y_pos = line_y + s(lay['content_top_margin'])
+            for label in template.row_labels + (template.quantity_label,):
+                draw.text((s(lay['table_header_x']), y_pos), label, font=fonts['header'], fill=color)
+                y_pos += s(lay['table_line_height'])
+
+            footer_line_y = H - s(lay['footer_bottom_margin']) - s(lay['footer_line_margin'])
+            draw.line([(s(30), footer_line_y), (W - s(30), footer_line_y)], fill=color, width=max(1, s(1)))
+
+            layer = _StaticLayer(image=img, line_y=line_y)
+            self._backgrounds[key] = layer
+            return layer
+
+    def render(self, template_name: str, label_id: str, item_code: str, item_name: str, item_spec: str,
+               quantity: int, worker_name: str, creation_date: str, scale: float = 1.0,
+               qr_payload: Optional[str] = None) -> Image.Image:
+        """템플릿에 값을 채워 라벨 이미지를 생성합니다."""
+        template = LABEL_TEMPLATES[template_name]
+        layer = self._static_layer(template, scale)
+        s = lambda v: int(round(v * scale))
+        fonts = self._fonts_for(template, scale)
+        lay = template.layout
+        color = template.text_color
+
+        img = layer.image.copy()
+        W, H = img.size
+        draw = ImageDraw.Draw(img)
+
+        qr_size = s(template.qr_size)
+        qr_box = (W - qr_size - s(template.padding), layer.line_y + s(lay['content_top_margin']))
+
+        # 긴 품목명/규격이 QR 코드 영역을 침범하지 않도록 자릅니다.
+        x_value = s(lay['table_value_x'])
+        max_value_w = qr_box[0] - s(10) - x_value
+        y_pos = layer.line_y + s(lay['content_top_margin'])
+        for value in (item_name, item_code, item_spec):
+            draw.text((x_value, y_pos), _fit_text(draw, f": {value}", fonts['body'], max_value_w), font=fonts['body'], fill=color)
+            y_pos += s(lay['table_line_height'])
+
+        qty_y = y_pos - s(10)
+        colon_w = draw.textlength(": ", font=fonts['quantity'])
+        qty_text = str(quantity)
+        qty_w = draw.textlength(qty_text, font=fonts['quantity'])
+        draw.text((x_value, qty_y), ": ", font=fonts['quantity'], fill=color, stroke_width=1 if template.stroke_colon else 0)
+        draw.text((x_value + colon_w, qty_y), qty_text, font=fonts['quantity'], fill=color, stroke_width=1)
+        draw.text((x_value + colon_w + qty_w + s(5), y_pos), "EA", font=fonts['unit'], fill=color)
+
+        footer_text = template.footer_format.format(label_id=label_id, creation_date=creation_date, worker_name=worker_name)
+        draw.text((s(template.padding), H - s(lay['footer_bottom_margin'])), footer_text, font=fonts['footer'], fill=color)
+
+        payload = qr_payload if qr_payload is not None else build_qr_payload(label_id, item_code, quantity)
+        qr_mask = render_qr_mask(payload, qr_size, template.qr_error_correction, template.qr_border)
+        img.paste(color, qr_box + (qr_box[0] + qr_size, qr_box[1] + qr_size), qr_mask)
+        return img
@@ -0,0 +1,21 @@
+"""라벨 일괄 렌더링 프로세스 풀의 작업 함수 모듈
+
+spawn 방식 작업 프로세스가 import 하는 모듈이므로 core.label_renderer 외에는 import 하지 않습니다.
+"""
+
+from typing import Any, Dict, Optional, Tuple
+
+from core.label_renderer import LabelRenderer
+
+_worker_renderer: Optional[LabelRenderer] = None
+
+
+def init_worker(font_fallbacks: Tuple[str, ...], font_override: Optional[str]):
+    global _worker_renderer
+    _worker_renderer = LabelRenderer(font_fallbacks, font_override)
+
+
+def render_in_worker(index: int, template_name: str, fields: Dict[str, Any]):
+    """작업 프로세스에서 라벨을 렌더링하여 (순번, 모드, 크기, 원시 픽셀)로 반환합니다."""
+    img = _worker_renderer.render(template_name, **fields)
+    return index, img.mode, img.size, img.tobytes()
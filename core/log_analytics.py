@@ -0,0 +1,359 @@
+"""Sync 로그 오프라인 분석 모듈 (명령줄 도구)
+
+검사/리워크/불량처리 이벤트 로그를 찾아 파일 단위로 프로세스 풀에서 집계하고,
+병합 가능한 부분 집계를 합쳐 CSV/JSON 보고서를 만듭니다.
+
+사용법 (저장소 루트에서):
+    python -m core.log_analytics --log-dir C:\\Sync --out reports
+    python -m core.log_analytics --since 2025-01-01 --until 2025-12-31 --worker 홍길동
+"""
+
+import argparse
+import csv
+import datetime
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from core.log_shards import LOG_KINDS, LOG_PATTERN
+from utils.file_handler import resolve_save_folder
+
+
+# 작업 시간 분포는 고정 폭 히스토그램으로 집계해 프로세스 간 병합과 백분위수 계산에 사용합니다.
+CYCLE_BIN_SEC = 10
+CYCLE_MAX_SEC = 4 * 3600
+# 주간 통계와 같은 기준으로, 개당 2초 미만인 트레이는 작업 시간 분포에서 제외합니다.
+MINIMUM_REALISTIC_TIME_PER_PC = 2.0
+# 이 수 이하의 파일은 프로세스 생성 비용이 더 크므로 현재 프로세스에서 처리합니다.
+INLINE_THRESHOLD = 8
+
+THROUGHPUT_FIELDS = ['trays', 'partial_trays', 'good', 'defective', 'work_time_sec', 'idle_sec', 'scan_errors']
+REPORT_FIELDS = {
+    'throughput': ['date', 'worker', 'item_code', 'item_name', *THROUGHPUT_FIELDS, 'trays_per_hour', 'defect_rate'],
+    'defect_pareto': ['item_code', 'item_name', 'defective', 'inspected', 'defect_rate', 'share', 'cumulative_share',
+                      'defect_boxes', 'defect_box_quantity'],
+    'cycle_times': ['item_code', 'item_name', 'trays', 'mean_sec', 'p10_sec', 'p50_sec', 'p90_sec'],
+    'idle': ['date', 'worker', 'hour', 'episodes', 'idle_sec'],
+    'rework': ['date', 'worker', 'reworked'],
+}
+
+
+def discover_logs(log_dir: str, since: Optional[datetime.date] = None, until: Optional[datetime.date] = None,
+                  worker: Optional[str] = None) -> List[Tuple[str, str]]:
+    """log_dir 이하의 이벤트 로그를 찾아 [(종류, 경로)]로 반환합니다.
+
+    로그 파일은 작업 시작일 기준으로 이름이 붙어 자정을 넘긴 행을 포함할 수 있으므로
+    since 하루 전 파일까지 포함합니다. (행 단위 날짜 필터는 집계 시 적용)
+    """
+    file_worker = re.sub(r'[\\/*?:"<>|]', "", worker) if worker else None
+    first = (since - datetime.timedelta(days=1)).strftime('%Y%m%d') if since else None
+    last = until.strftime('%Y%m%d') if until else None
+    found = []
+    for dirpath, _, filenames in os.walk(log_dir):
+        for name in filenames:
+            match = LOG_PATTERN.match(name)
+            if not match:
+                continue
+            file_date = match.group(3)
+            if (first and file_date < first) or (last and file_date > last) or (file_worker and match.group(2) != file_worker):
+                continue
+            found.append((LOG_KINDS[match.group(1)], os.path.join(dirpath, name)))
+    # 큰 파일부터 분배해야 마지막에 한 프로세스만 남아 기다리는 시간이 줄어듭니다.
+    found.sort(key=lambda entry: _file_size(entry[1]), reverse=True)
+    return found
+
+
+def _file_size(path: str) -> int:
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+def _new_partial() -> Dict[str, Any]:
+    return {
+        'rows': 0, 'bad_rows': 0,
+        'throughput': {},    # "날짜|작업자|품목" -> [THROUGHPUT_FIELDS 순서의 값]
+        'item_names': {},    # 품목코드 -> 품목명
+        'cycle_hist': {},    # 품목코드 -> {구간 시작(초): 트레이 수}
+        'idle': {},          # "날짜|작업자|시" -> [횟수, 초]
+        'rework': {},        # "날짜|작업자" -> 건수
+        'defect_merge': {},  # 품목코드 -> [불량표 수, 수량]
+        'events': {},        # 이벤트 -> 건수
+    }
+
+
+def _details(raw: str) -> Dict[str, Any]:
+    if not raw:
+        return {}
+    try:
+        value = json.loads(raw)
+    except json.JSONDecodeError:
+        return {}
+    return value if isinstance(value, dict) else {}
+
+
+def _add_tray(partial: Dict[str, Any], day: str, worker: str, d: Dict[str, Any]):
+    """TRAY_COMPLETE 상세 정보를 처리량/작업 시간 분포에 반영합니다."""
+    item_code = d.get('item_code') or 'UNKNOWN'
+    if d.get('item_name'):
+        partial['item_names'][item_code] = d['item_name']
+    work_time = float(d.get('work_time_sec') or 0.0)
+    capacity = d.get('tray_capacity') or 0
+    values = [0] * len(THROUGHPUT_FIELDS)
+    values[1 if d.get('is_partial_submission') else 0] = 1
+    values[2] = len(d.get('scanned_product_barcodes') or ())
+    values[3] = len(d.get('defective_product_barcodes') or ())
+    values[4] = work_time
+    values[5] = float(d.get('total_idle_seconds') or 0.0)
+    values[6] = int(d.get('error_count') or 0)
+    entry = partial['throughput'].setdefault(f"{day}|{worker}|{item_code}", [0] * len(THROUGHPUT_FIELDS))
+    for i, value in enumerate(values):
+        entry[i] += value
+
+    if (capacity and d.get('scan_count') == capacity and not d.get('has_error_or_reset')
+            and not d.get('is_partial_submission') and not d.get('is_restored_session')
+            and work_time / capacity >= MINIMUM_REALISTIC_TIME_PER_PC):
+        hist = partial['cycle_hist'].setdefault(item_code, {})
+        bin_start = int(min(work_time, CYCLE_MAX_SEC) // CYCLE_BIN_SEC * CYCLE_BIN_SEC)
+        hist[bin_start] = hist.get(bin_start, 0) + 1
+
+
+def analyze_file(path: str, since: Optional[str] = None, until: Optional[str] = None,
+                 worker: Optional[str] = None) -> Dict[str, Any]:
+    """로그 파일 하나를 집계합니다. since/until 은 'YYYY-MM-DD' 문자열입니다."""
+    partial = _new_partial()
+    events = partial['events']
+    try:
+        f = open(path, 'r', encoding='utf-8-sig', newline='')
+    except OSError as e:
+        print(f"로그 파일을 열 수 없습니다 ({path}): {e}", file=sys.stderr)
+        return partial
+
+    with f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header != ['timestamp', 'worker', 'event', 'details']:
+            partial['bad_rows'] += 1
+            return partial
+        for row in reader:
+            if len(row) != 4:
+                partial['bad_rows'] += 1
+                continue
+            timestamp, row_worker, event, raw_details = row
+            day = timestamp[:10]
+            if (since and day < since) or (until and day > until) or (worker and row_worker != worker):
+                continue
+            partial['rows'] += 1
+            events[event] = events.get(event, 0) + 1
+
+            # details 는 필요한 이벤트만 파싱합니다. (대부분의 행은 스캔 이벤트라 건너뜁니다)
+            if event == 'TRAY_COMPLETE':
+                try:
+                    _add_tray(partial, day, row_worker, _details(raw_details))
+                except (TypeError, ValueError):
+                    partial['bad_rows'] += 1
+            elif event == 'IDLE_END':
+                try:
+                    duration = float(_details(raw_details).get('duration_sec') or 0.0)
+                except (TypeError, ValueError):
+                    continue
+                entry = partial['idle'].setdefault(f"{day}|{row_worker}|{timestamp[11:13]}", [0, 0.0])
+                entry[0] += 1
+                entry[1] += duration
+            elif event == 'REWORK_SUCCESS':
+                key = f"{day}|{row_worker}"
+                partial['rework'][key] = partial['rework'].get(key, 0) + 1
+            elif event == 'DEFECT_MERGE_COMPLETE':
+                d = _details(raw_details)
+                item_code = d.get('item_code') or 'UNKNOWN'
+                if d.get('item_name'):
+                    partial['item_names'].setdefault(item_code, d['item_name'])
+                entry = partial['defect_merge'].setdefault(item_code, [0, 0])
+                entry[0] += 1
+                entry[1] += int(d.get('quantity') or len(d.get('barcodes') or ()))
+    return partial
+
+
+def _analyze_job(args: Tuple) -> Dict[str, Any]:
+    return analyze_file(*args)
+
+
+def merge_partials(partials: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """파일별 부분 집계를 하나로 합칩니다."""
+    total = _new_partial()
+    for p in partials:
+        total['rows'] += p['rows']
+        total['bad_rows'] += p['bad_rows']
+        total['item_names'].update(p['item_names'])
+        for section in ('throughput', 'idle', 'defect_merge'):
+            target = total[section]
+            for key, values in p[section].items():
+                if key in target:
+                    target[key] = [a + b for a, b in zip(target[key], values)]
+                else:
+                    target[key] = list(values)
+        for section in ('rework', 'events'):
+            target = total[section]
+            for key, count in p[section].items():
+                target[key] = target.get(key, 0) + count
+        for item_code, hist in p['cycle_hist'].items():
+            target = total['cycle_hist'].setdefault(item_code, {})
+            for bin_start, count in hist.items():
+                target[bin_start] = target.get(bin_start, 0) + count
+    return total
+
+
+def run_analysis(log_dir: str, since: Optional[datetime.date] = None, until: Optional[datetime.date] = None,
+                 worker: Optional[str] = None, max_workers: Optional[int] = None) -> Dict[str, Any]:
+    """로그를 찾아 병렬로 집계한 병합 결과를 반환합니다."""
+    logs = discover_logs(log_dir, since, until, worker)
+    since_str, until_str = (since.isoformat() if since else None), (until.isoformat() if until else None)
+    jobs = [(path, since_str, until_str, worker) for _, path in logs]
+    workers = min(max_workers or os.cpu_count() or 1, len(jobs))
+
+    if len(jobs) <= INLINE_THRESHOLD or workers <= 1:
+        total = merge_partials(_analyze_job(job) for job in jobs)
+    else:
+        # 작업 단위를 묶어 보내 프로세스 간 통신 횟수를 줄입니다.
+        chunksize = max(1, len(jobs) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            total = merge_partials(executor.map(_analyze_job, jobs, chunksize=chunksize))
+    total['files'] = len(logs)
+    total['files_by_kind'] = {kind: sum(1 for k, _ in logs if k == kind) for kind in LOG_KINDS.values()}
+    return total
+
+
+def _hist_percentile(hist: Dict[int, int], count: int, pct: float) -> float:
+    """히스토그램 구간 안에서 선형 보간한 백분위수"""
+    target = pct * count
+    seen = 0
+    for bin_start in sorted(hist):
+        n = hist[bin_start]
+        if seen + n >= target:
+            return bin_start + CYCLE_BIN_SEC * (target - seen) / n
+        seen += n
+    return float(max(hist) + CYCLE_BIN_SEC)
+
+
+def build_reports(total: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+    """병합된 집계를 보고서 행 목록으로 변환합니다."""
+    names = total['item_names']
+
+    throughput = []
+    for key, values in sorted(total['throughput'].items()):
+        day, worker, item_code = key.split('|', 2)
+        row = dict(zip(THROUGHPUT_FIELDS, values), date=day, worker=worker, item_code=item_code, item_name=names.get(item_code, ''))
+        pieces = row['good'] + row['defective']
+        hours = row['work_time_sec'] / 3600
+        row['trays_per_hour'] = round(row['trays'] / hours, 2) if hours else None
+        row['defect_rate'] = round(row['defective'] / pieces, 4) if pieces else None
+        row['work_time_sec'], row['idle_sec'] = round(row['work_time_sec'], 1), round(row['idle_sec'], 1)
+        throughput.append(row)
+
+    defects_by_item: Dict[str, List[int]] = {}
+    for key, values in total['throughput'].items():
+        item_code = key.rsplit('|', 1)[1]
+        entry = defects_by_item.setdefault(item_code, [0, 0])
+        entry[0] += values[3]
+        entry[1] += values[2] + values[3]
+    pareto, cumulative = [], 0
+    total_defects = sum(d for d, _ in defects_by_item.values())
+    for item_code, (defective, pieces) in sorted(defects_by_item.items(), key=lambda kv: -kv[1][0]):
+        if not defective:
+            continue
+        cumulative += defective
+        merged = total['defect_merge'].get(item_code, [0, 0])
+        pareto.append({
+            'item_code': item_code, 'item_name': names.get(item_code, ''), 'defective': defective,
+            'inspected': pieces, 'defect_rate': round(defective / pieces, 4) if pieces else None,
+            'share': round(defective / total_defects, 4), 'cumulative_share': round(cumulative / total_defects, 4),
+            'defect_boxes': merged[0], 'defect_box_quantity': merged[1],
+        })
+
+    cycle_times = []
+    for item_code, hist in sorted(total['cycle_hist'].items()):
+        count = sum(hist.values())
+        mean = sum((b + CYCLE_BIN_SEC / 2) * n for b, n in hist.items()) / count
+        cycle_times.append({
+            'item_code': item_code, 'item_name': names.get(item_code, ''), 'trays': count, 'mean_sec': round(mean, 1),
+            **{f"p{int(p * 100)}_sec": round(_hist_percentile(hist, count, p), 1) for p in (0.1, 0.5, 0.9)},
+            'histogram': {str(b): hist[b] for b in sorted(hist)},
+        })
+
+    idle = []
+    for key, (episodes, seconds) in sorted(total['idle'].items()):
+        day, worker, hour = key.split('|', 2)
+        idle.append({'date': day, 'worker': worker, 'hour': int(hour) if hour.isdigit() else hour,
+                     'episodes': episodes, 'idle_sec': round(seconds, 1)})
+
+    rework = [{'date': key.split('|', 1)[0], 'worker': key.split('|', 1)[1], 'reworked': count}
+              for key, count in sorted(total['rework'].items())]
+
+    return {'throughput': throughput, 'defect_pareto': pareto, 'cycle_times': cycle_times, 'idle': idle, 'rework': rework}
+
+
+def write_reports(reports: Dict[str, List[Dict[str, Any]]], total: Dict[str, Any], out_dir: str, elapsed: float) -> List[str]:
+    """보고서별 CSV와 전체 결과 summary.json 을 저장하고 경로 목록을 반환합니다."""
+    os.makedirs(out_dir, exist_ok=True)
+    written = []
+    for name, rows in reports.items():
+        path = os.path.join(out_dir, f"{name}.csv")
+        with open(path, 'w', newline='', encoding='utf-8-sig') as f:
+            writer = csv.DictWriter(f, fieldnames=REPORT_FIELDS[name], extrasaction='ignore')
+            writer.writeheader()
+            writer.writerows(rows)
+        written.append(path)
+
+    summary_path = os.path.join(out_dir, 'summary.json')
+    summary = {
+        'generated_at': datetime.datetime.now().isoformat(timespec='seconds'), 'elapsed_sec': round(elapsed, 3),
+        'files': total['files'], 'files_by_kind': total['files_by_kind'], 'rows': total['rows'], 'bad_rows': total['bad_rows'], 'events': total['events'],
+        **reports,
+    }
+    with open(summary_path, 'w', encoding='utf-8') as f:
+        json.dump(summary, f, ensure_ascii=False, indent=2)
+    written.append(summary_path)
+    return written
+
+
+def _parse_date(value: str) -> datetime.date:
+    try:
+        return datetime.date.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"날짜 형식은 YYYY-MM-DD 입니다: {value}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Inspection Worker 이벤트 로그 오프라인 분석")
+    parser.add_argument('--log-dir', default=resolve_save_folder(),
+                        help="로그 폴더 (하위 폴더 포함, 기본: INSPECTION_SAVE_FOLDER, config.json 의 paths.save_folder, C:\\Sync / ~/Sync 순)")
+    parser.add_argument('--out', default='analysis_output', help="보고서 저장 폴더")
+    parser.add_argument('--since', type=_parse_date, help="시작일 (YYYY-MM-DD)")
+    parser.add_argument('--until', type=_parse_date, help="종료일 (YYYY-MM-DD)")
+    parser.add_argument('--worker', help="특정 작업자만 집계")
+    parser.add_argument('--jobs', type=int, default=None, help="작업 프로세스 수 (기본: CPU 코어 수)")
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.log_dir):
+        print(f"로그 폴더를 찾을 수 없습니다: {args.log_dir}", file=sys.stderr)
+        return 2
+
+    start = time.perf_counter()
+    total = run_analysis(args.log_dir, args.since, args.until, args.worker, args.jobs)
+    reports = build_reports(total)
+    elapsed = time.perf_counter() - start
+    written = write_reports(reports, total, args.out, elapsed)
+
+    print(f"로그 {total['files']}개, {total['rows']}행 분석 ({elapsed:.2f}초)")
+    for path in written:
+        print(f"  - {path}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
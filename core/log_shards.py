@@ -0,0 +1,168 @@
+"""스테이션별 이벤트 로그 분할 저장 및 통합 조회 모듈
+
+공유 동기화 폴더(C:\\Sync)에 여러 스테이션이 같은 파일에 추가 기록하면 동기화 충돌이나
+행이 섞이는 문제가 생기므로, 각 스테이션은 자기 폴더(stations/<스테이션 ID>/)에만 기록합니다.
+파일 이름 형식은 기존과 같으며, 조회 시에는 기존 최상위 로그와 모든 스테이션 로그를
+하나의 목록(또는 시간순 스트림)으로 봅니다.
+"""
+
+import csv
+import datetime
+import hashlib
+import heapq
+import os
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+LOG_PATTERN = re.compile(r"^(검사작업이벤트로그|리워크작업이벤트로그|불량처리로그)_(.*)_(\d{8})\.csv$")
+LOG_KINDS = {'검사작업이벤트로그': 'inspection', '리워크작업이벤트로그': 'rework', '불량처리로그': 'defect_merge'}
+LOG_PREFIXES = {kind: prefix for prefix, kind in LOG_KINDS.items()}
+LOG_HEADERS = ['timestamp', 'worker', 'event', 'details']
+SHARD_ROOT = 'stations'
+_FINGERPRINT_BYTES = 256
+
+# 대형 트레이의 TRAY_COMPLETE 행은 바코드 목록 때문에 csv 기본 필드 한도(128KB)를 넘을 수 있습니다.
+# 모든 로그 읽기 모듈이 이 모듈을 거치므로 여기서 한 번 늘려 둡니다.
+csv.field_size_limit(max(csv.field_size_limit(), 64 * 1024 * 1024))
+
+
+@dataclass(frozen=True)
+class LogFile:
+    kind: str      # 'inspection' | 'rework' | 'defect_merge'
+    worker: str    # 파일 이름의 작업자명 (특수문자 제거됨)
+    date: str      # YYYYMMDD
+    path: str
+    station: str   # 기존 최상위 로그는 ''
+
+
+def sanitize_worker_name(name: str) -> str:
+    return re.sub(r'[\\/*?:"<>|]', "", name)
+
+
+def station_id(computer_id: str) -> str:
+    """computer_id(hex(uuid.getnode()) 또는 호스트명)를 폴더 이름으로 쓸 수 있게 정리합니다."""
+    value = computer_id[2:] if computer_id.lower().startswith('0x') else computer_id
+    return re.sub(r'[^0-9A-Za-z_.-]', '', value) or 'unknown'
+
+
+def _scan_dir(folder: str, station: str, found: List[LogFile], kind, worker, first, last):
+    try:
+        names = os.listdir(folder)
+    except OSError:
+        return
+    for name in names:
+        match = LOG_PATTERN.match(name)
+        if not match:
+            continue
+        file_kind, file_worker, file_date = LOG_KINDS[match.group(1)], match.group(2), match.group(3)
+        if (kind and file_kind != kind) or (worker is not None and file_worker != worker):
+            continue
+        if (first and file_date < first) or (last and file_date > last):
+            continue
+        found.append(LogFile(file_kind, file_worker, file_date, os.path.join(folder, name), station))
+
+
+def _scan_root(root: str, found: List[LogFile], kind, worker, first, last):
+    _scan_dir(root, '', found, kind, worker, first, last)
+    shard_root = os.path.join(root, SHARD_ROOT)
+    try:
+        stations = sorted(entry.name for entry in os.scandir(shard_root) if entry.is_dir())
+    except OSError:
+        stations = []
+    for station in stations:
+        _scan_dir(os.path.join(shard_root, station), station, found, kind, worker, first, last)
+
+
+def find_log_files(save_folder: str, kind: Optional[str] = None, worker: Optional[str] = None,
+                   since: Optional[datetime.date] = None, until: Optional[datetime.date] = None,
+                   overlay: Optional[str] = None) -> List[LogFile]:
+    """기존 최상위 로그와 모든 스테이션 로그 중 조건에 맞는 파일을 (날짜, 경로) 순으로 반환합니다.
+
+    worker 는 파일 이름 기준(sanitize_worker_name 적용 후)이며, since/until 은 파일 날짜 기준입니다.
+    overlay 는 save_folder 와 같은 구조의 로컬 폴더(복제 대기 outbox)로, 같은 상대 경로의 파일은
+    overlay 쪽 경로로 대체되고 아직 복제되지 않은 파일도 포함됩니다.
+    """
+    first = since.strftime('%Y%m%d') if since else None
+    last = until.strftime('%Y%m%d') if until else None
+    found: List[LogFile] = []
+    _scan_root(save_folder, found, kind, worker, first, last)
+    if overlay:
+        local: List[LogFile] = []
+        _scan_root(overlay, local, kind, worker, first, last)
+        by_relpath = {os.path.relpath(f.path, save_folder): f for f in found}
+        by_relpath.update((os.path.relpath(f.path, overlay), f) for f in local)
+        found = list(by_relpath.values())
+    found.sort(key=lambda f: (f.date, f.station, f.path))
+    return found
+
+
+def _read_rows(path: str) -> Iterator[Dict[str, str]]:
+    try:
+        with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+            for row in csv.DictReader(f):
+                yield row
+    except OSError as e:
+        print(f"로그 파일을 읽을 수 없습니다 ({path}): {e}")
+
+
+def read_events(files: Iterable[LogFile]) -> Iterator[Dict[str, str]]:
+    """여러 로그 파일의 행을 timestamp 순으로 합친 하나의 스트림으로 반환합니다.
+
+    각 파일은 시간순으로 기록되므로 파일별 스트림을 병합하며, 모든 행을 메모리에 올리지 않습니다.
+    """
+    return heapq.merge(*(_read_rows(f.path) for f in files), key=lambda row: row.get('timestamp') or '')
+
+
+def _fingerprint(f, offset: int) -> str:
+    start = max(0, offset - _FINGERPRINT_BYTES)
+    f.seek(start)
+    return hashlib.sha1(f.read(offset - start)).hexdigest()
+
+
+def read_appended(path: str, offset: int = 0, fingerprint: str = '') -> Tuple[bytes, int, str, bool]:
+    """추가 기록만 되는 파일에서 offset 이후의 완결된 행들을 읽습니다.
+
+    (읽은 바이트, 새 offset, 새 fingerprint, 처음부터 다시 읽었는지) 를 반환합니다.
+    fingerprint 는 offset 직전 바이트의 해시로, 파일이 줄거나 다시 쓰였으면 처음부터 읽습니다.
+    기록 중인 마지막 행(줄바꿈 전)은 다음 호출에서 읽습니다. 파일이 없으면 OSError 가 그대로 전달됩니다.
+    """
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        restarted = offset > 0 and (offset > size or _fingerprint(f, offset) != fingerprint)
+        if restarted:
+            offset = 0
+        if offset == size:
+            return b'', offset, fingerprint, restarted
+        f.seek(offset)
+        chunk = f.read(size - offset)
+        end = chunk.rfind(b'\n') + 1
+        offset += end
+        return chunk[:end], offset, _fingerprint(f, offset), restarted
+
+
+class ShardedEventLog:
+    """현재 스테이션의 로그 파일 경로를 정하고, 전체 스테이션 로그를 조회합니다."""
+
+    def __init__(self, save_folder: str, computer_id: str, overlay: Optional[str] = None):
+        self.save_folder = save_folder
+        self.overlay = overlay
+        self.station = station_id(computer_id)
+        self.shard_dir = os.path.join(save_folder, SHARD_ROOT, self.station)
+
+    def path_for(self, kind: str, worker_name: str, day: datetime.date) -> str:
+        """이 스테이션이 기록할 로그 파일의 save_folder 기준 경로 (overlay 를 쓰지 않으면 폴더도 생성)"""
+        if not self.overlay:
+            os.makedirs(self.shard_dir, exist_ok=True)
+        return os.path.join(self.shard_dir, f"{LOG_PREFIXES[kind]}_{sanitize_worker_name(worker_name)}_{day.strftime('%Y%m%d')}.csv")
+
+    def log_files(self, kind: Optional[str] = None, worker_name: Optional[str] = None,
+                  since: Optional[datetime.date] = None, until: Optional[datetime.date] = None) -> List[LogFile]:
+        worker = sanitize_worker_name(worker_name) if worker_name is not None else None
+        return find_log_files(self.save_folder, kind, worker, since, until, self.overlay)
+
+    def relative_name(self, path: str) -> str:
+        """로그 파일을 구분하는 키 (save_folder 또는 overlay 기준 상대 경로)"""
+        if self.overlay and os.path.abspath(path).startswith(os.path.abspath(self.overlay) + os.sep):
+            return os.path.relpath(path, self.overlay)
+        return os.path.relpath(path, self.save_folder)
@@ -1,8 +1,44 @@
 """데이터 모델 정의 모듈"""
 
-from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Any
+from dataclasses import dataclass, field, fields
+from typing import List, Dict, Optional, Any, Set
 import datetime
+import heapq
+import sys
+import time
+
+SCAN_GOOD = 'Good'
+SCAN_DEFECTIVE = 'Defective'
+
+
+class ScanRecord:
+    """검사 스캔 1건. 바코드는 intern 하고 시각은 epoch 초(float)로 보관합니다.
+
+    대형 트레이에서 스캔마다 dict 와 ISO 문자열을 만들지 않도록 하며,
+    저장 시에는 기존 JSON 형식({'barcode', 'timestamp', 'status'})으로 변환합니다.
+    """
+    __slots__ = ('barcode', 'timestamp', 'status')
+
+    def __init__(self, barcode: str, status: str = SCAN_GOOD, timestamp: Optional[float] = None):
+        self.barcode = sys.intern(barcode)
+        self.status = SCAN_DEFECTIVE if status == SCAN_DEFECTIVE else SCAN_GOOD
+        self.timestamp = time.time() if timestamp is None else timestamp
+
+    def __repr__(self) -> str:
+        return f"ScanRecord({self.barcode!r}, {self.status!r}, {self.timestamp!r})"
+
+    def to_dict(self) -> Dict[str, str]:
+        return {'barcode': self.barcode,
+                'timestamp': datetime.datetime.fromtimestamp(self.timestamp).isoformat(),
+                'status': self.status}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], default_status: str = SCAN_GOOD) -> 'ScanRecord':
+        try:
+            timestamp = datetime.datetime.fromisoformat(data['timestamp']).timestamp()
+        except (KeyError, TypeError, ValueError):
+            timestamp = None
+        return cls(data['barcode'], data.get('status') or default_status, timestamp)
 
 
 @dataclass
@@ -19,9 +55,8 @@ class InspectionSession:
     outbound_date: str = ""
     item_group: str = ""
     quantity: int = 60
-    good_items: List[Dict[str, Any]] = field(default_factory=list)
-    defective_items: List[Dict[str, Any]] = field(default_factory=list)
-    scanned_barcodes: List[str] = field(default_factory=list)
+    good_items: List[ScanRecord] = field(default_factory=list)
+    defective_items: List[ScanRecord] = field(default_factory=list)
     mismatch_error_count: int = 0
     total_idle_seconds: float = 0.0
     stopwatch_seconds: float = 0.0
@@ -32,6 +67,65 @@ class InspectionSession:
     is_remnant_session: bool = False
     consumed_remnant_ids: List[str] = field(default_factory=list)
 
+    def __post_init__(self):
+        # 중복 스캔 확인용 색인 (대형 트레이에서 리스트 검색을 피함). 스캔 기록은 양품/불량 목록에만 둡니다.
+        self._scanned: Set[str] = {item.barcode for item in self.good_items + self.defective_items}
+
+    @property
+    def scanned_barcodes(self) -> List[str]:
+        """스캔 순서대로의 바코드 목록. 양품/불량 목록에서 매번 만드는 읽기 전용 사본입니다."""
+        merged = heapq.merge(self.good_items, self.defective_items, key=lambda item: item.timestamp)
+        return [item.barcode for item in merged]
+
+    @property
+    def scan_count(self) -> int:
+        return len(self.good_items) + len(self.defective_items)
+
+    def has_scanned(self, barcode: str) -> bool:
+        return barcode in self._scanned
+
+    def last_scan(self) -> Optional[ScanRecord]:
+        """마지막 스캔. 양품/불량 목록은 각각 스캔 순서이므로 두 목록의 끝만 비교합니다."""
+        good = self.good_items[-1] if self.good_items else None
+        defective = self.defective_items[-1] if self.defective_items else None
+        if good is None or defective is None:
+            return good or defective
+        return defective if defective.timestamp >= good.timestamp else good
+
+    def add_scan(self, record: ScanRecord):
+        (self.defective_items if record.status == SCAN_DEFECTIVE else self.good_items).append(record)
+        self._scanned.add(record.barcode)
+
+    def pop_last_scan(self) -> Optional[ScanRecord]:
+        """마지막 스캔을 취소합니다."""
+        record = self.last_scan()
+        if record is None:
+            return None
+        items = self.defective_items if self.defective_items and self.defective_items[-1] is record else self.good_items
+        items.pop()
+        self._scanned.discard(record.barcode)
+        return record
+
+    def to_state(self) -> Dict[str, Any]:
+        """작업 상태 파일(JSON)로 저장할 dict. 스캔 기록은 기존 dict 형식으로 변환합니다."""
+        state = self.__dict__.copy()
+        state.pop('_scanned', None)
+        state['scanned_barcodes'] = self.scanned_barcodes  # 이전 버전 호환용 (복원 시에는 사용하지 않음)
+        state['good_items'] = [item.to_dict() for item in self.good_items]
+        state['defective_items'] = [item.to_dict() for item in self.defective_items]
+        state['start_time'] = self.start_time.isoformat() if self.start_time else None
+        return state
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> 'InspectionSession':
+        """to_state 결과(또는 이전 버전 상태 파일)로 세션을 복원합니다. 알 수 없는 키는 무시합니다."""
+        known = {f.name for f in fields(cls)}
+        values = {key: value for key, value in state.items() if key in known}
+        values['good_items'] = [ScanRecord.from_dict(item, SCAN_GOOD) for item in state.get('good_items', [])]
+        values['defective_items'] = [ScanRecord.from_dict(item, SCAN_DEFECTIVE) for item in state.get('defective_items', [])]
+        values['start_time'] = datetime.datetime.fromisoformat(state['start_time']) if state.get('start_time') else None
+        return cls(**values)
+
 
 @dataclass
 class RemnantCreationSession:
@@ -0,0 +1,99 @@
+"""잔량(SPARE) 재고 색인 모듈
+
+remnants_folder 의 SPARE-*.json 레코드를 품목코드별 잔량 목록으로 메모리에 유지합니다.
+잔량 생성/분할/소진 시 바뀐 파일만 반영하고, 다른 스테이션의 변경은 폴더 변경 감지로 반영하므로
+트레이를 시작할 때 폴더를 다시 읽지 않고 오래된 잔량부터 안내할 수 있습니다.
+"""
+
+import datetime
+import os
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional
+
+from core.defect_ledger import JsonRecordIndex
+
+
+@dataclass(frozen=True)
+class RemnantSummary:
+    remnant_id: str
+    item_code: str
+    quantity: int
+    worker: str
+    creation_date: Optional[datetime.datetime]
+
+    def age(self, now: Optional[datetime.datetime] = None) -> Optional[datetime.timedelta]:
+        if self.creation_date is None:
+            return None
+        return (now or datetime.datetime.now()) - self.creation_date
+
+
+def _remnant_id(path: str) -> str:
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def _summarize(path: str, record: dict) -> Optional[RemnantSummary]:
+    item_code = record.get('item_code')
+    if not item_code:
+        return None
+    try:
+        created = datetime.datetime.fromisoformat(record.get('creation_date') or '')
+    except (TypeError, ValueError):
+        created = None
+    return RemnantSummary(_remnant_id(path), item_code, len(record.get('remnant_barcodes') or []),
+                          record.get('worker', ''), created)
+
+
+class RemnantInventory:
+    """{품목코드: {잔량 ID: RemnantSummary}} 색인"""
+
+    def __init__(self, remnants_folder: str, resolve: Optional[Callable[[str], str]] = None):
+        self._by_item: Dict[str, Dict[str, RemnantSummary]] = {}
+        self._item_of: Dict[str, str] = {}   # 레코드 경로 → 품목코드
+        self._lock = threading.RLock()
+        self._built = False
+        self.records = JsonRecordIndex(remnants_folder, recursive=False, resolve=resolve, on_record=self._on_record)
+
+    def _on_record(self, path: str, record: Optional[dict]):
+        with self._lock:
+            old_item = self._item_of.pop(path, None)
+            if old_item is not None:
+                entries = self._by_item.get(old_item, {})
+                entries.pop(_remnant_id(path), None)
+                if not entries:
+                    self._by_item.pop(old_item, None)
+            summary = _summarize(path, record) if record is not None else None
+            if summary is not None:
+                self._by_item.setdefault(summary.item_code, {})[summary.remnant_id] = summary
+                self._item_of[path] = summary.item_code
+
+    @property
+    def built(self) -> bool:
+        """처음 읽기가 끝났으면 True. (False 이면 for_item() 이 ensure_built() 를 기다립니다)"""
+        return self._built
+
+    def ensure_built(self):
+        """처음 한 번 잔량 폴더를 읽습니다."""
+        if self._built:
+            return
+        with self._lock:
+            if not self._built:
+                self.records.rescan()
+                self._built = True
+
+    def apply(self, paths: Iterable[str]) -> bool:
+        """생성/삭제된 잔량 파일(또는 폴더 변경 알림)을 반영합니다. 재고가 바뀌었으면 True."""
+        with self._lock:
+            if not self._built:
+                return False
+            return self.records.apply(paths)
+
+    def for_item(self, item_code: str, exclude: Iterable[str] = (), limit: Optional[int] = None) -> List[RemnantSummary]:
+        """품목의 잔량을 오래된 순(FIFO)으로 반환합니다. exclude 는 이미 사용 중인 잔량 ID 입니다."""
+        self.ensure_built()
+        excluded = set(exclude)
+        with self._lock:
+            entries = [s for s in self._by_item.get(item_code, {}).values() if s.remnant_id not in excluded]
+        entries.sort(key=lambda s: (s.creation_date is None, s.creation_date or datetime.datetime.min, s.remnant_id))
+        return entries[:limit] if limit is not None else entries
+
@@ -0,0 +1,406 @@
+"""로컬 선기록(write-ahead) 후 동기화 폴더로 비동기 복제하는 모듈
+
+이벤트 로그 추가 기록과 JSON 레코드 저장은 먼저 로컬 디스크의 outbox 폴더(동기화 폴더와 같은
+상대 경로 구조)에 기록하고, 백그라운드 스레드 하나가 작업 순서대로 동기화 폴더에 반영합니다.
+네트워크 드라이브가 느리거나 잠시 끊겨도 스캔 처리는 로컬 기록만 기다립니다.
+
+- 같은 파일에 대한 작업은 기록한 순서대로 반영되며, 실패하면 그 작업에서 멈추고 재시도합니다.
+- 대기 중인 작업 목록과 파일별 반영 위치는 outbox 의 _journal.json 에 저장되어 재시작 후 이어서 복제합니다.
+- 이벤트 로그는 반영된 바이트 위치 이후의 추가분만 복사합니다. 원격 파일 크기가 예상과 다르면 원격이 로컬의
+  앞부분일 때만 그 뒤부터 이어 쓰고, 다르면 원격 내용을 충돌 사본(*.conflict-시각)으로 남긴 뒤 로컬 파일로 씁니다.
+- outbox 가 지워진 뒤 같은 파일에 다시 기록할 때는 adopt_remote() 로 원격 파일을 먼저 가져와 이어 씁니다.
+"""
+
+import collections
+import datetime
+import json
+import os
+import shutil
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+JOURNAL_FILE = '_journal.json'
+_COPY_CHUNK = 1024 * 1024
+
+
+class WriteAheadReplicator:
+    """outbox 에 기록된 변경을 동기화 폴더로 순서대로 복제합니다.
+
+    on_change(pending, error) 는 대기 작업 수나 오류 상태가 바뀔 때 복제 스레드에서 호출됩니다.
+    """
+
+    def __init__(self, local_root: str, remote_root: str, max_retry_sec: float = 60.0,
+                 on_change: Optional[Callable[[int, Optional[str]], None]] = None):
+        self.local_root = local_root
+        self.remote_root = remote_root
+        self.max_retry_sec = max_retry_sec
+        self.on_change = on_change
+        self._cond = threading.Condition()
+        self._ops = collections.deque()        # [종류('append'|'put'|'delete'), 상대 경로]
+        self._offsets: Dict[str, int] = {}     # 추가 기록 파일별 원격에 반영된 바이트 수
+        self._committed: Dict[str, int] = {}   # 추가 기록 파일별 완결된 행까지의 로컬 크기
+        self.last_error: Optional[str] = None
+        self._busy = False                     # 맨 앞 작업을 복제 스레드가 처리 중인지 여부
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+        os.makedirs(local_root, exist_ok=True)
+        self._load_journal()
+
+    # ------------------------------------------------------------------
+    # 경로 변환
+    # ------------------------------------------------------------------
+    def relpath(self, path: str) -> str:
+        base = self.local_root if self.is_local(path) else self.remote_root
+        return os.path.relpath(path, base)
+
+    def is_local(self, path: str) -> bool:
+        return os.path.abspath(path).startswith(os.path.abspath(self.local_root) + os.sep)
+
+    def local_path(self, remote_path: str) -> str:
+        return os.path.join(self.local_root, os.path.relpath(remote_path, self.remote_root))
+
+    def remote_path(self, path: str) -> str:
+        return os.path.join(self.remote_root, self.relpath(path)) if self.is_local(path) else path
+
+    def resolve(self, remote_path: str) -> str:
+        """읽기용 경로: 아직 반영되지 않은 변경이 있거나 이 스테이션이 기록 중인 로그면 로컬 경로를 반환합니다.
+
+        삭제가 대기 중이면 존재하지 않는 로컬 경로가 반환되므로 호출 측의 exists 검사가 그대로 동작합니다.
+        """
+        rel = os.path.relpath(remote_path, self.remote_root)
+        local = os.path.join(self.local_root, rel)
+        with self._cond:
+            if any(op_rel == rel and kind != 'append' for kind, op_rel in self._ops):
+                return local
+            if rel in self._offsets and os.path.exists(local):
+                return local
+        return remote_path
+
+    def list_dir(self, remote_dir: str) -> Dict[str, str]:
+        """원격 폴더의 {파일 이름: 읽기 경로}. 복제 대기 중인 레코드는 로컬 사본으로, 삭제 대기 중인 파일은 제외합니다."""
+        try:
+            entries = {name: os.path.join(remote_dir, name) for name in os.listdir(remote_dir)}
+        except OSError:
+            entries = {}
+        rel_dir = os.path.relpath(remote_dir, self.remote_root)
+        with self._cond:
+            for kind, rel in self._ops:
+                if kind == 'append' or os.path.dirname(rel) != rel_dir:
+                    continue
+                name = os.path.basename(rel)
+                if kind == 'put':
+                    entries[name] = os.path.join(self.local_root, rel)
+                else:
+                    entries.pop(name, None)
+        return entries
+
+    # ------------------------------------------------------------------
+    # 기록 (호출 측 스레드, 로컬 디스크만 사용)
+    # ------------------------------------------------------------------
+    def append_done(self, remote_path: str, committed_size: int):
+        """로컬 로그 파일에 행을 추가한 뒤 호출합니다. committed_size 는 flush 직후 파일 크기입니다."""
+        rel = os.path.relpath(remote_path, self.remote_root)
+        with self._cond:
+            self._committed[rel] = committed_size
+            self._offsets.setdefault(rel, 0)
+            changed = self._enqueue('append', rel)
+        if changed:
+            self._notify_change()
+
+    def adopt_remote(self, remote_path: str) -> bool:
+        """로컬 사본이 없는 추가 기록 파일에 처음 쓰기 전에 호출합니다.
+
+        원격 파일이 있으면 로컬로 가져오고 반영 위치를 원격 크기로 맞춰, 이후 추가분만 원격에 이어 쓰게 합니다.
+        가져왔으면 True, 원격 파일이 없거나 비어 있거나 읽을 수 없으면 False 를 반환합니다.
+        """
+        rel = os.path.relpath(remote_path, self.remote_root)
+        local = os.path.join(self.local_root, rel)
+        try:
+            if os.path.getsize(remote_path) == 0:
+                return False
+            os.makedirs(os.path.dirname(local), exist_ok=True)
+            size = self._copy_file(remote_path, local)
+        except OSError:
+            return False
+        with self._cond:
+            self._offsets[rel] = size
+            self._committed[rel] = size
+            self._save_journal()
+        return True
+
+    def write_json(self, remote_path: str, data, **json_kwargs):
+        """JSON 레코드를 로컬에 원자적으로 저장하고 원격 반영을 예약합니다."""
+        rel = os.path.relpath(remote_path, self.remote_root)
+        local = os.path.join(self.local_root, rel)
+        # 반영을 마친 복제 스레드가 로컬 사본을 지우는 것과 겹치지 않도록 잠금 안에서 기록합니다.
+        with self._cond:
+            os.makedirs(os.path.dirname(local), exist_ok=True)
+            tmp_path = f"{local}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, **json_kwargs)
+            os.replace(tmp_path, local)
+            changed = self._enqueue('put', rel)
+        if changed:
+            self._notify_change()
+
+    def replace(self, remote_path: str):
+        """로컬 로그 파일을 통째로 다시 쓴 뒤 호출합니다. (대기 중인 추가분 복사는 전체 복사로 대체됩니다)"""
+        rel = os.path.relpath(remote_path, self.remote_root)
+        with self._cond:
+            head = [self._ops[0]] if self._ops and self._busy else []
+            self._ops = collections.deque(head + [op for op in list(self._ops)[len(head):] if op != ['append', rel]])
+            self._committed.pop(rel, None)
+            self._enqueue('put', rel)
+        self._notify_change()
+
+    def delete(self, remote_path: str):
+        """로컬 사본을 지우고 원격 파일 삭제를 예약합니다."""
+        rel = os.path.relpath(remote_path, self.remote_root)
+        with self._cond:
+            try:
+                os.remove(os.path.join(self.local_root, rel))
+            except FileNotFoundError:
+                pass
+            changed = self._enqueue('delete', rel)
+        if changed:
+            self._notify_change()
+
+    def _enqueue(self, kind: str, rel: str) -> bool:
+        """작업을 예약합니다. (잠금 안에서 호출) 같은 파일의 마지막 대기 작업과 같으면 생략하고 False 를 반환합니다.
+
+        생략된 작업은 앞선 작업이 복제 시점의 최신 로컬 내용을 반영하므로 잃지 않습니다.
+        복제 스레드가 이미 처리 중인 맨 앞 작업은 비교 대상에서 제외합니다.
+        """
+        start = 1 if self._busy else 0
+        last = next((op for op in reversed(list(self._ops)[start:]) if op[1] == rel), None)
+        if last is not None and last[0] == kind:
+            return False
+        self._ops.append([kind, rel])
+        self._save_journal()
+        self._cond.notify_all()
+        return True
+
+    # ------------------------------------------------------------------
+    # 상태
+    # ------------------------------------------------------------------
+    def pending(self) -> int:
+        with self._cond:
+            return len(self._ops)
+
+    def _notify_change(self):
+        # UI 콜백이 다른 잠금을 기다릴 수 있으므로 반드시 잠금 밖에서 호출합니다.
+        # on_change 는 Tk 를 직접 부르지 말고 UI 스레드로 넘기기만 해야 합니다. (종료 중 기록/복제 스레드가 멈춤)
+        if self.on_change:
+            try:
+                self.on_change(len(self._ops), self.last_error)
+            except Exception as e:
+                print(f"동기화 상태 알림 오류: {e}")
+
+    def _load_journal(self):
+        try:
+            with open(os.path.join(self.local_root, JOURNAL_FILE), 'r', encoding='utf-8') as f:
+                journal = json.load(f)
+            self._ops = collections.deque([kind, rel] for kind, rel in journal.get('ops', []))
+            self._offsets = {rel: int(offset) for rel, offset in journal.get('offsets', {}).items()}
+        except (OSError, ValueError, TypeError):
+            pass
+        # 저널 저장 전에 종료된 경우에 대비해, 반영 위치보다 큰 로컬 로그는 다시 예약합니다.
+        queued = {rel for kind, rel in self._ops if kind == 'append'}
+        for rel, offset in self._offsets.items():
+            try:
+                size = os.path.getsize(os.path.join(self.local_root, rel))
+            except OSError:
+                continue
+            if size > offset and rel not in queued:
+                self._ops.append(['append', rel])
+
+    def _save_journal(self):
+        path = os.path.join(self.local_root, JOURNAL_FILE)
+        tmp_path = f"{path}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'ops': list(self._ops), 'offsets': self._offsets}, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"동기화 저널 저장 실패: {e}")
+
+    def prune(self, retention_days: float):
+        """원격에 모두 반영되었고 retention_days 동안 수정되지 않은 로컬 로그 사본을 정리합니다."""
+        cutoff = time.time() - retention_days * 86400
+        with self._cond:
+            queued = {rel for _, rel in self._ops}
+            for rel, offset in list(self._offsets.items()):
+                local = os.path.join(self.local_root, rel)
+                try:
+                    stat = os.stat(local)
+                except FileNotFoundError:
+                    if rel not in queued:
+                        del self._offsets[rel]
+                    continue
+                if rel not in queued and stat.st_size == offset and stat.st_mtime < cutoff:
+                    try:
+                        os.remove(local)
+                        del self._offsets[rel]
+                    except OSError:
+                        pass
+            self._save_journal()
+
+    # ------------------------------------------------------------------
+    # 복제 스레드
+    # ------------------------------------------------------------------
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name='sync-replicator', daemon=True)
+        self._thread.start()
+
+    def flush(self, timeout: float) -> bool:
+        """대기 작업이 모두 반영될 때까지 최대 timeout 초 기다립니다. 모두 반영되면 True."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while self._ops:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def stop(self, timeout: float = 2.0):
+        """복제 스레드를 멈춥니다. 남은 작업은 저널에 남아 다음 실행 때 반영됩니다."""
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        if self._thread:
+            self._thread.join(timeout)
+
+    def _run(self):
+        delay = 1.0
+        while True:
+            with self._cond:
+                while not self._ops and not self._stopping:
+                    self._cond.wait()
+                if self._stopping:
+                    return
+                kind, rel = self._ops[0]
+                committed = self._committed.get(rel)
+                offset = self._offsets.get(rel, 0)
+                self._busy = True
+            try:
+                new_offset = self._apply(kind, rel, committed, offset)
+            except OSError as e:
+                with self._cond:
+                    self._busy = False
+                    self.last_error = str(e)
+                self._notify_change()
+                # 순서를 지키기 위해 실패한 작업을 건너뛰지 않고 간격을 늘려 재시도합니다.
+                deadline = time.monotonic() + delay
+                with self._cond:
+                    while not self._stopping and time.monotonic() < deadline:
+                        self._cond.wait(deadline - time.monotonic())
+                delay = min(delay * 2, self.max_retry_sec)
+                continue
+
+            delay = 1.0
+            with self._cond:
+                self._busy = False
+                if self._ops and self._ops[0] == [kind, rel]:
+                    self._ops.popleft()
+                if new_offset is not None:
+                    self._offsets[rel] = new_offset
+                    # 복사하는 동안 행이 더 추가되었으면 다시 예약합니다.
+                    if self._committed.get(rel, new_offset) > new_offset and ['append', rel] not in self._ops:
+                        self._ops.append(['append', rel])
+                elif kind == 'put' and rel not in self._offsets and [kind, rel] not in self._ops:
+                    # 반영된 레코드의 로컬 사본은 지웁니다. (읽기는 다시 원격 파일로)
+                    try:
+                        os.remove(os.path.join(self.local_root, rel))
+                    except OSError:
+                        pass
+                self.last_error = None
+                self._save_journal()
+                self._cond.notify_all()
+            self._notify_change()
+
+    def _apply(self, kind: str, rel: str, committed: Optional[int], offset: int) -> Optional[int]:
+        """작업 하나를 원격에 반영합니다. 추가 기록/전체 복사한 로그는 새 반영 위치를 반환합니다."""
+        local = os.path.join(self.local_root, rel)
+        remote = os.path.join(self.remote_root, rel)
+        if kind == 'delete':
+            try:
+                os.remove(remote)
+            except FileNotFoundError:
+                pass
+            return None
+        if not os.path.exists(local):
+            return None  # 이후 작업에서 삭제된 파일
+
+        os.makedirs(os.path.dirname(remote), exist_ok=True)
+        if kind == 'put':
+            size = self._copy_file(local, remote)
+            return size if rel in self._offsets else None
+
+        with open(local, 'rb') as src:
+            end = committed if committed is not None else os.fstat(src.fileno()).st_size
+            if end <= offset:
+                return offset
+            try:
+                remote_size = os.path.getsize(remote)
+            except FileNotFoundError:
+                remote_size = 0
+            if remote_size != offset:
+                # 반영 위치를 모르는 원격 내용은 덮어쓰지 않습니다.
+                if remote_size <= end and self._is_prefix(src, remote, remote_size):
+                    offset = remote_size
+                else:
+                    self._keep_conflict_copy(remote)
+                    return self._copy_file(local, remote, end)
+            src.seek(offset)
+            with open(remote, 'ab') as dst:
+                remaining = end - offset
+                while remaining > 0:
+                    chunk = src.read(min(_COPY_CHUNK, remaining))
+                    if not chunk:
+                        break
+                    dst.write(chunk)
+                    remaining -= len(chunk)
+            return end - remaining
+
+    @staticmethod
+    def _is_prefix(src, remote: str, length: int) -> bool:
+        """원격 파일 내용이 로컬 파일(src)의 앞부분 length 바이트와 같은지 비교합니다."""
+        if length == 0:
+            return True
+        src.seek(0)
+        with open(remote, 'rb') as dst:
+            remaining = length
+            while remaining > 0:
+                chunk = dst.read(min(_COPY_CHUNK, remaining))
+                if not chunk or src.read(len(chunk)) != chunk:
+                    return False
+                remaining -= len(chunk)
+        return True
+
+    @staticmethod
+    def _keep_conflict_copy(remote: str):
+        """원격 파일을 로그 목록에 잡히지 않는 이름으로 옮겨 둡니다."""
+        conflict = f"{remote}.conflict-{datetime.datetime.now().strftime('%Y%m%d%H%M%S')}"
+        os.replace(remote, conflict)
+        print(f"동기화 충돌: 원격 파일이 로컬 기록과 달라 사본을 남겼습니다 ({conflict})")
+
+    @staticmethod
+    def _copy_file(local: str, remote: str, length: Optional[int] = None) -> int:
+        """로컬 파일(또는 앞부분 length 바이트)을 원격 임시 파일에 쓴 뒤 교체합니다."""
+        tmp_path = f"{remote}.{os.getpid()}.tmp"
+        with open(local, 'rb') as src, open(tmp_path, 'wb') as dst:
+            if length is None:
+                shutil.copyfileobj(src, dst, _COPY_CHUNK)
+            else:
+                remaining = length
+                while remaining > 0:
+                    chunk = src.read(min(_COPY_CHUNK, remaining))
+                    if not chunk:
+                        break
+                    dst.write(chunk)
+                    remaining -= len(chunk)
+            size = dst.tell()
+        os.replace(tmp_path, remote)
+        return size
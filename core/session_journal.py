@@ -0,0 +1,117 @@
+"""대형 트레이 작업 상태 저널 모듈
+
+작업 상태 파일(JSON)을 스캔마다 통째로 다시 쓰면 트레이 크기에 비례해 느려지므로,
+대형 트레이는 작업 시작/복구 때만 상태 스냅샷을 쓰고 이후 스캔과 판정 취소는
+저널 파일(JSON Lines)에 한 줄씩 추가합니다. 복구할 때는 스냅샷에 저널을 이어서 적용합니다.
+각 행에는 그 시점의 작업 시간/휴식 시간/오류 수/오류 여부(COUNTER_KEYS)도 함께 기록하며,
+스캔 없이 오류나 휴식만 생긴 경우에는 이 값들만 담은 행을 추가합니다.
+"""
+
+import json
+import os
+import uuid
+from typing import Any, Callable, Dict, Optional
+
+from core.models import InspectionSession, ScanRecord, SCAN_DEFECTIVE, SCAN_GOOD
+
+JOURNAL_KEY = 'scan_journal'
+# 저널 행의 세션 누적값: 키 -> (InspectionSession 속성, 형 변환)
+COUNTER_KEYS = {'w': ('stopwatch_seconds', float), 'i': ('total_idle_seconds', float),
+                'e': ('mismatch_error_count', int), 'r': ('has_error_or_reset', bool)}
+
+
+def session_counters(session: InspectionSession) -> Dict[str, Any]:
+    """저널 행에 함께 기록할 세션 누적값"""
+    counters = {}
+    for key, (attr, cast) in COUNTER_KEYS.items():
+        value = getattr(session, attr)
+        counters[key] = round(value, 1) if cast is float else int(value)
+    return counters
+
+
+class ScanJournal:
+    """상태 파일(state_path) 하나에 딸린 스캔 저널. 기록은 replicator 의 로컬 outbox 를 거칩니다."""
+
+    def __init__(self, replicator, state_path: str):
+        self.replicator = replicator
+        self.state_path = state_path
+        self.path: Optional[str] = None
+        self._attached = False  # 이전 실행의 저널을 이어 쓰는 중 (로컬 사본이 없으면 원격에서 가져옴)
+
+    @property
+    def active(self) -> bool:
+        return self.path is not None
+
+    def attach(self, name: Optional[str]):
+        """저장된 상태 파일이 가리키는 기존 저널을 이어서 사용합니다."""
+        self.path = os.path.join(os.path.dirname(self.state_path), name) if name else None
+        self._attached = bool(name)
+
+    def write_snapshot(self, state: Dict[str, Any], journal: bool):
+        """상태 스냅샷을 씁니다. journal 이면 새 저널을 시작하고, 이전 저널은 삭제합니다."""
+        old_path = self.path
+        self.path = None
+        self._attached = False
+        if journal:
+            base = os.path.splitext(os.path.basename(self.state_path))[0]
+            name = f"{base}_{uuid.uuid4().hex[:12]}.scans.jsonl"
+            self.path = os.path.join(os.path.dirname(self.state_path), name)
+            state[JOURNAL_KEY] = name
+        self.replicator.write_json(self.state_path, state, indent=4)
+        if old_path:
+            self.replicator.delete(old_path)
+
+    def append_scan(self, record: ScanRecord, counters: Optional[Dict[str, Any]] = None):
+        self._append({'b': record.barcode, 's': 'D' if record.status == SCAN_DEFECTIVE else 'G',
+                      't': round(record.timestamp, 3), **(counters or {})})
+
+    def append_undo(self, barcode: str, counters: Optional[Dict[str, Any]] = None):
+        self._append({'u': barcode, **(counters or {})})
+
+    def append_counters(self, counters: Dict[str, Any]):
+        """스캔 없이 바뀐 세션 누적값(오류, 휴식 등)만 기록합니다."""
+        self._append(dict(counters))
+
+    def _append(self, entry: Dict[str, Any]):
+        local_path = self.replicator.local_path(self.path)
+        if not os.path.exists(local_path):
+            os.makedirs(os.path.dirname(local_path), exist_ok=True)
+            if self._attached:
+                self.replicator.adopt_remote(self.path)
+        with open(local_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            f.flush()
+            size = os.fstat(f.fileno()).st_size
+        self.replicator.append_done(self.path, size)
+
+    def delete(self):
+        if self.path:
+            self.replicator.delete(self.path)
+            self.path = None
+
+
+def load_session(state: Dict[str, Any], state_path: str,
+                 resolve: Callable[[str], str] = lambda path: path) -> InspectionSession:
+    """상태 파일 내용으로 세션을 만들고, 저널이 있으면 스냅샷 이후의 스캔/취소를 적용합니다."""
+    session = InspectionSession.from_state(state)
+    name = state.get(JOURNAL_KEY)
+    if not name:
+        return session
+    try:
+        with open(resolve(os.path.join(os.path.dirname(state_path), name)), 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # 기록 도중 종료된 마지막 행
+                if 'u' in entry:
+                    session.pop_last_scan()
+                elif entry.get('b'):
+                    status = SCAN_DEFECTIVE if entry.get('s') == 'D' else SCAN_GOOD
+                    session.add_scan(ScanRecord(entry['b'], status, entry.get('t')))
+                for key, (attr, cast) in COUNTER_KEYS.items():
+                    if key in entry:
+                        setattr(session, attr, cast(entry[key]))
+    except FileNotFoundError:
+        pass
+    return session
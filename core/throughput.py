@@ -0,0 +1,117 @@
+"""최근 작업 처리량(롤링 윈도우) 집계 모듈
+
+이벤트가 기록될 때마다 1분 단위 버킷에 누적하며, 버킷은 가장 긴 윈도우 길이만큼의
+고정 크기 링 버퍼이므로 교대 근무 내내 메모리 사용량이 일정합니다.
+"""
+
+import threading
+import time
+from typing import Dict, Optional, Sequence
+
+DEFAULT_WINDOWS_MIN = (15, 60, 480)
+
+# 버킷별 카운터 인덱스
+_GOOD, _DEFECT, _TRAYS, _IDLE = range(4)
+
+
+class ThroughputTracker:
+    """시간당 트레이 수, 분당 처리 수량, 불량률, 대기 비율을 윈도우별로 제공합니다."""
+
+    def __init__(self, windows_min: Sequence[int] = DEFAULT_WINDOWS_MIN, bucket_seconds: int = 60, clock=time.monotonic):
+        self.windows_min = tuple(sorted(windows_min))
+        self.bucket_seconds = bucket_seconds
+        self._clock = clock
+        self._size = max(1, self.windows_min[-1] * 60 // bucket_seconds)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """작업자 변경 등으로 집계를 처음부터 다시 시작합니다."""
+        with self._lock:
+            self._stamps = [-1] * self._size  # 버킷에 담긴 절대 버킷 번호
+            self._counts = [[0, 0, 0, 0.0] for _ in range(self._size)]
+            self._started_at = self._clock()
+            self._idle_since: Optional[float] = None
+            self.version = 0
+
+    def _bucket(self, index: int) -> list:
+        slot = index % self._size
+        if self._stamps[slot] != index:
+            self._stamps[slot] = index
+            self._counts[slot] = [0, 0, 0, 0.0]
+        return self._counts[slot]
+
+    def _add_idle(self, start: float, end: float):
+        """[start, end) 구간의 대기 시간을 걸치는 버킷들에 나누어 더합니다."""
+        start = max(start, end - self._size * self.bucket_seconds, self._started_at)
+        while start < end:
+            index = int(start // self.bucket_seconds)
+            boundary = min(end, (index + 1) * self.bucket_seconds)
+            self._bucket(index)[_IDLE] += boundary - start
+            start = boundary
+
+    def record(self, event_type: str, detail: Optional[Dict] = None):
+        """_log_event 로 기록되는 이벤트를 반영합니다. 관련 없는 이벤트는 무시합니다."""
+        now = self._clock()
+        with self._lock:
+            bucket = self._bucket(int(now // self.bucket_seconds))
+            if event_type == 'INSPECTION_GOOD':
+                bucket[_GOOD] += 1
+            elif event_type == 'INSPECTION_DEFECTIVE':
+                bucket[_DEFECT] += 1
+            elif event_type == 'INSPECTION_UNDO':
+                bucket[_DEFECT if (detail or {}).get('status') == 'Defective' else _GOOD] -= 1
+            elif event_type == 'TRAY_COMPLETE':
+                if not (detail or {}).get('is_partial_submission'):
+                    bucket[_TRAYS] += 1
+            elif event_type == 'IDLE_START':
+                self._idle_since = now
+            elif event_type == 'IDLE_END':
+                try:
+                    duration = float((detail or {}).get('duration_sec', 0))
+                except (TypeError, ValueError):
+                    duration = 0.0
+                # 대기 시간은 마지막 작업 시점부터 계산되므로 IDLE_START 이전 구간도 포함됩니다.
+                self._add_idle(now - duration if duration > 0 else (self._idle_since or now), now)
+                self._idle_since = None
+            else:
+                return
+            self.version += 1
+
+    def snapshot(self) -> Dict[int, Dict[str, Optional[float]]]:
+        """윈도우(분)별 {'pieces_per_min', 'trays_per_hour', 'defect_rate', 'idle_share'}를 반환합니다.
+
+        윈도우가 작업 시작 이후 경과 시간보다 길면 경과 시간 기준으로 나눕니다.
+        """
+        now = self._clock()
+        current = int(now // self.bucket_seconds)
+        with self._lock:
+            totals = [0, 0, 0, 0.0]
+            bounds = iter(self.windows_min)
+            next_window = next(bounds)
+            result = {}
+            for age in range(self._size):
+                slot = (current - age) % self._size
+                if self._stamps[slot] == current - age:
+                    for i, value in enumerate(self._counts[slot]):
+                        totals[i] += value
+                if (age + 1) * self.bucket_seconds == next_window * 60:
+                    result[next_window] = self._rates(totals, next_window * 60, now)
+                    next_window = next(bounds, None)
+                    if next_window is None:
+                        break
+        return result
+
+    def _rates(self, totals: list, window_sec: float, now: float) -> Dict[str, Optional[float]]:
+        # 현재 버킷은 부분 구간이므로 경과 시간은 현재 시각 기준으로 계산합니다.
+        elapsed = max(1.0, min(window_sec - self.bucket_seconds + now % self.bucket_seconds, now - self._started_at))
+        good, defect, trays, idle = max(0, totals[_GOOD]), max(0, totals[_DEFECT]), totals[_TRAYS], totals[_IDLE]
+        if self._idle_since is not None:
+            idle += now - max(self._idle_since, now - elapsed)
+        pieces = good + defect
+        return {
+            'pieces_per_min': pieces * 60 / elapsed,
+            'trays_per_hour': trays * 3600 / elapsed,
+            'defect_rate': defect / pieces if pieces else None,
+            'idle_share': min(1.0, idle / elapsed),
+        }
@@ -0,0 +1,275 @@
+"""바코드 추적(역색인) 모듈
+
+검사/리워크/불량처리 이벤트 로그에서 바코드(및 불량표/잔량표 ID)별 이벤트 참조를
+SQLite 역색인으로 유지합니다. 로그마다 처리한 바이트 위치를 기억하므로
+추가된 행만 읽어 색인을 갱신합니다.
+"""
+
+import csv
+import hashlib
+import io
+import json
+import os
+import sqlite3
+import threading
+from contextlib import closing
+from typing import Any, Dict, Iterator, List, Tuple
+
+from core.log_shards import LOG_PATTERN
+
+INDEX_VERSION = 1
+LOG_HEADERS = ['timestamp', 'worker', 'event', 'details']
+_FINGERPRINT_BYTES = 256
+
+# 단계 표시 이름 (UI)
+STAGE_NAMES = {
+    'tray': "트레이 완료",
+    'rework': "리워크",
+    'defect_box': "불량표 통합",
+    'exchange': "제품 교환",
+    'remnant': "잔량 등록",
+    'remnant_consumed': "잔량 사용",
+    'defect_box_scanned': "불량표 재스캔",
+}
+
+Ref = Tuple[str, str, str, str]  # (키, 단계, 역할, 상대 참조)
+
+# 바코드 참조를 담는 이벤트 (개별 판정 이벤트는 TRAY_COMPLETE 에 모두 포함되므로 제외)
+INDEXED_EVENTS = frozenset([
+    'TRAY_COMPLETE', 'REWORK_SUCCESS', 'DEFECT_MERGE_COMPLETE', 'DEFECT_CREATED_FROM_OVERFLOW', 'DEFECT_LABEL_SCANNED',
+    'PRODUCT_EXCHANGE_COMPLETED', 'REMNANT_CREATED', 'REMNANT_CREATED_FROM_OVERFLOW', 'REMNANT_CONSUMED',
+])
+
+
+def event_container(event: str, details: Dict[str, Any]) -> str:
+    """이벤트가 가리키는 현품표/불량표/잔량표 ID"""
+    if event == 'TRAY_COMPLETE':
+        return details.get('master_label_code') or ''
+    if event in ('DEFECT_MERGE_COMPLETE', 'DEFECT_CREATED_FROM_OVERFLOW', 'DEFECT_LABEL_SCANNED'):
+        return details.get('defect_box_id') or ''
+    if event in ('REMNANT_CREATED', 'REMNANT_CREATED_FROM_OVERFLOW', 'REMNANT_CONSUMED'):
+        return details.get('remnant_id') or ''
+    return ''
+
+
+def extract_refs(event: str, details: Dict[str, Any]) -> Iterator[Ref]:
+    """이벤트 하나에서 (키, 단계, 역할, 상대 참조)를 추출합니다. 키는 바코드 또는 라벨 ID입니다."""
+    if event == 'TRAY_COMPLETE':
+        role_suffix = '_partial' if details.get('is_partial_submission') else ''
+        for barcode in details.get('scanned_product_barcodes') or ():
+            yield barcode, 'tray', 'good' + role_suffix, ''
+        for barcode in details.get('defective_product_barcodes') or ():
+            yield barcode, 'tray', 'defective' + role_suffix, ''
+    elif event == 'REWORK_SUCCESS':
+        if details.get('barcode'):
+            yield details['barcode'], 'rework', 'reworked', ''
+    elif event in ('DEFECT_MERGE_COMPLETE', 'DEFECT_CREATED_FROM_OVERFLOW'):
+        for barcode in details.get('barcodes') or ():
+            yield barcode, 'defect_box', 'merged', ''
+    elif event == 'DEFECT_LABEL_SCANNED':
+        if details.get('defect_box_id'):
+            yield details['defect_box_id'], 'defect_box_scanned', 'scanned', ''
+    elif event == 'PRODUCT_EXCHANGE_COMPLETED':
+        for pair in details.get('exchange_pairs') or ():
+            if isinstance(pair, dict) and pair.get('defective') and pair.get('good'):
+                yield pair['defective'], 'exchange', 'replaced', pair['good']
+                yield pair['good'], 'exchange', 'replacement', pair['defective']
+    elif event in ('REMNANT_CREATED', 'REMNANT_CREATED_FROM_OVERFLOW'):
+        for barcode in details.get('remnant_barcodes') or ():
+            yield barcode, 'remnant', 'stored', ''
+    elif event == 'REMNANT_CONSUMED':
+        if details.get('remnant_id'):
+            yield details['remnant_id'], 'remnant_consumed', 'consumed', ''
+
+
+class BarcodeTraceIndex:
+    """로그 폴더의 이벤트 로그를 증분 색인하고 바코드 이력을 조회합니다."""
+
+    def __init__(self, log_folder: str, db_path: str):
+        self.log_folder = log_folder
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+        with self._lock, closing(self._connect()) as conn:
+            self._init_schema(conn)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    @staticmethod
+    def _init_schema(conn: sqlite3.Connection):
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != INDEX_VERSION:
+            conn.executescript("""
+                DROP TABLE IF EXISTS refs;
+                DROP TABLE IF EXISTS events;
+                DROP TABLE IF EXISTS sources;
+            """)
+        # 바코드별 참조는 키 순서로 저장(WITHOUT ROWID)하여 조회 시 한 구간만 읽습니다.
+        conn.executescript(f"""
+            CREATE TABLE IF NOT EXISTS sources (
+                id INTEGER PRIMARY KEY, name TEXT UNIQUE NOT NULL, "offset" INTEGER NOT NULL, fingerprint TEXT NOT NULL);
+            CREATE TABLE IF NOT EXISTS events (
+                id INTEGER PRIMARY KEY, source_id INTEGER NOT NULL, ts TEXT NOT NULL, worker TEXT, event TEXT NOT NULL,
+                item_code TEXT, container TEXT);
+            CREATE INDEX IF NOT EXISTS events_source ON events (source_id);
+            CREATE TABLE IF NOT EXISTS refs (
+                key TEXT NOT NULL, event_id INTEGER NOT NULL, stage TEXT NOT NULL, role TEXT NOT NULL, other TEXT NOT NULL,
+                PRIMARY KEY (key, event_id, role, other)) WITHOUT ROWID;
+            PRAGMA user_version = {INDEX_VERSION};
+        """)
+        conn.commit()
+
+    @staticmethod
+    def _fingerprint(f, offset: int) -> str:
+        start = max(0, offset - _FINGERPRINT_BYTES)
+        f.seek(start)
+        return hashlib.sha1(f.read(offset - start)).hexdigest()
+
+    @staticmethod
+    def _delete_source_rows(conn: sqlite3.Connection, source_id: int):
+        conn.execute("DELETE FROM refs WHERE event_id IN (SELECT id FROM events WHERE source_id = ?)", (source_id,))
+        conn.execute("DELETE FROM events WHERE source_id = ?", (source_id,))
+
+    def log_files(self) -> List[str]:
+        paths = []
+        for dirpath, _, filenames in os.walk(self.log_folder):
+            paths.extend(os.path.join(dirpath, name) for name in filenames if LOG_PATTERN.match(name))
+        return sorted(paths)
+
+    def refresh(self, log_path: str) -> int:
+        """로그 파일 하나의 색인을 최신 상태로 맞추고 새로 추가한 참조 수를 반환합니다.
+
+        로그가 줄었거나 다시 쓰여졌으면 해당 로그의 참조를 지우고 처음부터 색인합니다.
+        """
+        with self._lock, closing(self._connect()) as conn:
+            return self._refresh(conn, log_path)
+
+    def _refresh(self, conn: sqlite3.Connection, log_path: str) -> int:
+        name = os.path.relpath(log_path, self.log_folder)
+        row = conn.execute('SELECT id, "offset", fingerprint FROM sources WHERE name = ?', (name,)).fetchone()
+        with open(log_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if row and row[1] == size and size > 0:
+                return 0
+            source_id, offset = (row[0], row[1]) if row else (None, 0)
+            if row and (row[1] > size or self._fingerprint(f, row[1]) != row[2]):
+                self._delete_source_rows(conn, source_id)
+                offset = 0
+
+            f.seek(offset)
+            chunk = f.read(size - offset)
+            end = chunk.rfind(b'\n') + 1  # 기록 중인 마지막 행은 다음에 읽습니다.
+            text = chunk[:end].decode('utf-8-sig' if offset == 0 else 'utf-8', errors='replace')
+            new_offset = offset + end
+            fingerprint = self._fingerprint(f, new_offset)
+
+        if source_id is None:
+            source_id = conn.execute('INSERT INTO sources (name, "offset", fingerprint) VALUES (?, 0, \'\')', (name,)).lastrowid
+
+        reader = csv.reader(io.StringIO(text))
+        if offset == 0:
+            next(reader, None)  # 헤더
+        added = 0
+        for log_row in reader:
+            if len(log_row) != 4 or log_row[2] not in INDEXED_EVENTS or not log_row[3]:
+                continue
+            timestamp, worker, event, raw = log_row
+            try:
+                details = json.loads(raw)
+            except json.JSONDecodeError:
+                continue
+            if not isinstance(details, dict):
+                continue
+            refs = {(str(key), stage, role, str(other)) for key, stage, role, other in extract_refs(event, details)}
+            if not refs:
+                continue
+            event_id = conn.execute(
+                "INSERT INTO events (source_id, ts, worker, event, item_code, container) VALUES (?, ?, ?, ?, ?, ?)",
+                (source_id, timestamp, worker, event, details.get('item_code') or '', event_container(event, details))).lastrowid
+            conn.executemany("INSERT OR IGNORE INTO refs (key, event_id, stage, role, other) VALUES (?, ?, ?, ?, ?)",
+                             [(key, event_id, stage, role, other) for key, stage, role, other in refs])
+            added += len(refs)
+
+        conn.execute('UPDATE sources SET "offset" = ?, fingerprint = ? WHERE id = ?', (new_offset, fingerprint, source_id))
+        conn.commit()
+        return added
+
+    def refresh_all(self) -> int:
+        """모든 로그의 색인을 갱신합니다. 크기가 색인된 위치와 같은 로그는 열지 않고 건너뜁니다."""
+        added = 0
+        with closing(self._connect()) as conn:
+            with self._lock:
+                offsets = dict(conn.execute('SELECT name, "offset" FROM sources'))
+            for path in self.log_files():
+                try:
+                    if offsets.get(os.path.relpath(path, self.log_folder)) == os.path.getsize(path):
+                        continue
+                    # 파일 단위로 잠가 색인 중에도 조회가 오래 기다리지 않게 합니다.
+                    with self._lock:
+                        added += self._refresh(conn, path)
+                except OSError as e:
+                    print(f"바코드 색인 갱신 실패 ({path}): {e}")
+        return added
+
+    def invalidate(self, log_path: str):
+        """로그를 수정(재작성)한 뒤 호출하여 해당 로그의 색인을 폐기합니다."""
+        name = os.path.relpath(log_path, self.log_folder)
+        with self._lock, closing(self._connect()) as conn:
+            row = conn.execute("SELECT id FROM sources WHERE name = ?", (name,)).fetchone()
+            if row:
+                self._delete_source_rows(conn, row[0])
+                conn.execute("DELETE FROM sources WHERE id = ?", (row[0],))
+            conn.commit()
+
+    def _refs(self, conn: sqlite3.Connection, key: str) -> List[Dict[str, Any]]:
+        cursor = conn.execute(
+            "SELECT e.ts, e.worker, e.event, r.stage, r.role, CASE WHEN r.other != '' THEN r.other ELSE e.container END, "
+            "e.item_code, s.name FROM refs r JOIN events e ON e.id = r.event_id JOIN sources s ON s.id = e.source_id "
+            "WHERE r.key = ? ORDER BY e.ts", (key,))
+        names = ('timestamp', 'worker', 'event', 'stage', 'role', 'ref', 'item_code', 'source')
+        return [dict(zip(names, row)) for row in cursor]
+
+    def lookup(self, barcode: str, refresh: bool = True) -> List[Dict[str, Any]]:
+        """바코드의 전체 이력을 시간순으로 반환합니다.
+
+        잔량표/불량표에 담긴 경우 해당 라벨의 후속 이벤트(잔량 사용, 불량표 재스캔)도 함께 반환합니다.
+        """
+        if refresh:
+            self.refresh_all()
+        barcode = barcode.strip()
+        with self._lock, closing(self._connect()) as conn:
+            events = self._refs(conn, barcode)
+            containers = {e['ref'] for e in events if e['stage'] in ('remnant', 'defect_box') and e['ref']}
+            for container_id in containers:
+                for e in self._refs(conn, container_id):
+                    e['ref'] = container_id
+                    events.append(e)
+        events.sort(key=lambda e: e['timestamp'])
+        return events
+
+    @staticmethod
+    def summarize(events: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """이력을 단계별 요약으로 정리합니다."""
+        summary: Dict[str, Any] = {'master_labels': [], 'inspection': None, 'reworked': False, 'defect_boxes': [],
+                                   'exchanged_with': [], 'remnants': [], 'remnants_consumed': []}
+        for e in events:
+            stage, ref = e['stage'], e['ref']
+            if stage == 'tray':
+                summary['inspection'] = e['role'].split('_')[0]
+                if ref and ref not in summary['master_labels']:
+                    summary['master_labels'].append(ref)
+            elif stage == 'rework':
+                summary['reworked'] = True
+            elif stage == 'defect_box' and ref not in summary['defect_boxes']:
+                summary['defect_boxes'].append(ref)
+            elif stage == 'exchange':
+                summary['exchanged_with'].append(ref)
+            elif stage == 'remnant' and ref not in summary['remnants']:
+                summary['remnants'].append(ref)
+            elif stage == 'remnant_consumed' and ref not in summary['remnants_consumed']:
+                summary['remnants_consumed'].append(ref)
+        return summary
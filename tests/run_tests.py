@@ -0,0 +1,27 @@
+"""테스트 실행 스크립트
+
+    python tests/run_tests.py              # 모든 테스트
+    python tests/run_tests.py replication  # tests/test_replication.py 만
+"""
+
+import os
+import sys
+import unittest
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(TESTS_DIR))
+
+
+def main(argv=None) -> int:
+    names = sys.argv[1:] if argv is None else argv
+    loader = unittest.TestLoader()
+    if names:
+        suite = unittest.TestSuite(loader.loadTestsFromName(f"tests.test_{name}") for name in names)
+    else:
+        suite = loader.discover(TESTS_DIR, top_level_dir=os.path.dirname(TESTS_DIR))
+    result = unittest.TextTestRunner(verbosity=2).run(suite)
+    return 0 if result.wasSuccessful() else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,103 @@
+"""라벨 프린터 ZPL 출력(core.label_printer) 테스트"""
+
+import socket
+import threading
+import unittest
+
+from core.label_printer import create_label_printer
+from core.label_renderer import build_qr_payload
+from utils.exceptions import ConfigurationError, NetworkError
+
+TIMEOUT_SEC = 5.0
+
+
+class _RawPrinterServer:
+    """localhost 에서 RAW 포트(9100) 프린터 대신 접속 하나를 받아 수신 바이트를 모읍니다."""
+
+    def __init__(self):
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.sock.bind(('127.0.0.1', 0))
+        self.sock.listen()
+        self.sock.settimeout(TIMEOUT_SEC)
+        self.port = self.sock.getsockname()[1]
+        self.received: bytes = b''
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def _serve(self):
+        try:
+            conn, _ = self.sock.accept()
+        except OSError:
+            return
+        with conn:
+            chunks = []
+            while True:
+                chunk = conn.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+        self.received = b''.join(chunks)
+
+    def wait(self) -> bytes:
+        self._thread.join(TIMEOUT_SEC)
+        return self.received
+
+    def close(self):
+        self.sock.close()
+
+
+class TestTcpLabelPrinter(unittest.TestCase):
+    def _fields(self, label_id: str) -> dict:
+        return {'label_id': label_id, 'item_code': 'CODE-1', 'item_name': '품목^A~B\\C',
+                'item_spec': '규격 10x20', 'quantity': 12, 'worker_name': '작업자',
+                'creation_date': '2025-01-01 09:30'}
+
+    def _print(self, template_name: str, label_id: str) -> str:
+        """create_label_printer('tcp') 로 라벨 한 장을 출력하고 프린터가 받은 ZPL 을 반환합니다."""
+        server = _RawPrinterServer()
+        self.addCleanup(server.close)
+        printer = create_label_printer('tcp', host='127.0.0.1', port=server.port, timeout=TIMEOUT_SEC)
+        target = printer.print_label(template_name, **self._fields(label_id))
+        self.assertEqual(target, f"127.0.0.1:{server.port}")
+        return server.wait().decode('utf-8')
+
+    def _assert_label(self, zpl: str, label_id: str):
+        self.assertTrue(zpl.startswith('^XA\n'))
+        self.assertTrue(zpl.endswith('^XZ\n'))
+        self.assertEqual(zpl.count('^XA'), 1)
+        self.assertIn('^CI28', zpl)
+        # 필드 값의 ZPL 제어 문자는 ^FH 16진 이스케이프로 전송됩니다.
+        self.assertIn('^FH\\^FD: 품목\\5EA\\7EB\\5CC^FS', zpl)
+        self.assertIn('^FH\\^FD: CODE-1^FS', zpl)
+        self.assertIn('^FH\\^FD: 12^FS', zpl)
+        self.assertIn(label_id, zpl)
+        payload = build_qr_payload(label_id, 'CODE-1', 12)
+        self.assertIn('^BQN,2,', zpl)
+        self.assertIn(f'A,{payload}^FS', zpl)
+
+    def test_defective_label(self):
+        zpl = self._print('defective', 'DF-20250101-0001')
+        self._assert_label(zpl, 'DF-20250101-0001')
+        self.assertIn('^FD불 량 표^FS', zpl)
+
+    def test_remnant_label(self):
+        zpl = self._print('remnant', 'RM-20250101-0001')
+        self._assert_label(zpl, 'RM-20250101-0001')
+        self.assertIn('^FD잔 량 표^FS', zpl)
+
+    def test_connection_failure_raises_network_error(self):
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as unused:
+            unused.bind(('127.0.0.1', 0))
+            port = unused.getsockname()[1]
+        printer = create_label_printer('tcp', host='127.0.0.1', port=port, timeout=TIMEOUT_SEC)
+        with self.assertRaises(NetworkError):
+            printer.print_label('defective', **self._fields('DF-20250101-0002'))
+
+    def test_tcp_requires_host(self):
+        with self.assertRaises(ConfigurationError):
+            create_label_printer('tcp', host='')
+        self.assertIsNone(create_label_printer('none'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+"""데이터 모델(core.models) 테스트"""
+
+import datetime
+import json
+import unittest
+
+from core.models import InspectionSession, ScanRecord, SCAN_DEFECTIVE, SCAN_GOOD
+
+
+def _records(items):
+    return [(item.barcode, item.status, round(item.timestamp, 3)) for item in items]
+
+
+class TestInspectionSessionState(unittest.TestCase):
+    def _session(self) -> InspectionSession:
+        session = InspectionSession(master_label_code='WID=W1|CLC=C1', item_code='C1', item_name='품목',
+                                    quantity=4, start_time=datetime.datetime(2025, 1, 1, 9, 30),
+                                    mismatch_error_count=2, total_idle_seconds=12.5, stopwatch_seconds=300.2,
+                                    has_error_or_reset=True, consumed_remnant_ids=['R1'])
+        session.add_scan(ScanRecord('B1', SCAN_GOOD, 1735691400.125))
+        session.add_scan(ScanRecord('B2', SCAN_DEFECTIVE, 1735691401.5))
+        session.add_scan(ScanRecord('B3', SCAN_GOOD, 1735691402.75))
+        return session
+
+    def test_state_roundtrip(self):
+        """from_state(to_state()) 는 JSON 저장을 거쳐도 같은 세션을 만듭니다."""
+        session = self._session()
+        state = json.loads(json.dumps(session.to_state()))
+        restored = InspectionSession.from_state(state)
+
+        self.assertEqual(restored.to_state(), session.to_state())
+        self.assertEqual(_records(restored.good_items), _records(session.good_items))
+        self.assertEqual(_records(restored.defective_items), _records(session.defective_items))
+        self.assertEqual(restored.scanned_barcodes, ['B1', 'B2', 'B3'])
+        self.assertEqual(restored.start_time, session.start_time)
+        self.assertTrue(restored.has_scanned('B2'))
+        self.assertFalse(restored.has_scanned('B4'))
+
+    def test_from_state_ignores_unknown_keys(self):
+        """이전/이후 버전 상태 파일의 알 수 없는 키는 무시합니다."""
+        state = self._session().to_state()
+        state['unknown_key'] = 1
+        restored = InspectionSession.from_state(state)
+        self.assertEqual(restored.item_code, 'C1')
+
+    def test_pop_last_scan(self):
+        """판정 취소는 마지막 스캔을 양품/불량 목록과 중복 확인 색인에서 함께 뺍니다."""
+        session = self._session()
+        self.assertEqual(session.pop_last_scan().barcode, 'B3')
+        self.assertEqual(session.pop_last_scan().barcode, 'B2')
+        self.assertEqual(_records(session.good_items), [('B1', SCAN_GOOD, 1735691400.125)])
+        self.assertEqual(session.defective_items, [])
+        self.assertFalse(session.has_scanned('B2'))
+        self.assertTrue(session.has_scanned('B1'))
+
+    def test_scanned_barcodes_is_derived_view(self):
+        """스캔 순서 목록은 양품/불량 목록에서 만들며 직접 바꿀 수 없습니다."""
+        session = self._session()
+        self.assertEqual(session.scanned_barcodes, ['B1', 'B2', 'B3'])
+        self.assertEqual(session.scan_count, 3)
+        self.assertEqual(session.last_scan().barcode, 'B3')
+        with self.assertRaises(AttributeError):
+            session.scanned_barcodes = []
+        session.scanned_barcodes.append('B4')
+        self.assertFalse(session.has_scanned('B4'))
+        self.assertEqual(session.scan_count, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
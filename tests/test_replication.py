@@ -0,0 +1,196 @@
+"""동기화 폴더 복제(core.replication.WriteAheadReplicator) 테스트"""
+
+import glob
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+from core.replication import WriteAheadReplicator
+
+FLUSH_SEC = 5.0
+
+
+class _GatedReplicator(WriteAheadReplicator):
+    """첫 작업을 반영하기 직전에 gate 가 열릴 때까지 멈추는 복제기 (처리 중인 작업 재현용)"""
+
+    def __init__(self, *args, **kwargs):
+        self.entered = threading.Event()
+        self.gate = threading.Event()
+        super().__init__(*args, **kwargs)
+
+    def _apply(self, *args):
+        self.entered.set()
+        self.gate.wait(FLUSH_SEC)
+        return super()._apply(*args)
+
+
+class TestWriteAheadReplicator(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.outbox = os.path.join(self.root, 'outbox')
+        self.sync = os.path.join(self.root, 'sync')
+        self.remote = os.path.join(self.sync, 'stations', 'a', '검사작업이벤트로그_작업자_20250101.csv')
+        self.replicators = []
+
+    def tearDown(self):
+        for replicator in self.replicators:
+            replicator.stop()
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def _replicator(self, cls=WriteAheadReplicator, start=True) -> WriteAheadReplicator:
+        replicator = cls(self.outbox, self.sync, max_retry_sec=0.1)
+        self.replicators.append(replicator)
+        if start:
+            replicator.start()
+        return replicator
+
+    def _write(self, replicator: WriteAheadReplicator, line: str, notify: bool = True):
+        """앱의 로그 기록 스레드와 같은 순서로 outbox 에 한 행을 추가합니다."""
+        local = replicator.local_path(self.remote)
+        if not os.path.exists(local):
+            os.makedirs(os.path.dirname(local), exist_ok=True)
+            if not replicator.adopt_remote(self.remote):
+                with open(local, 'w', encoding='utf-8') as f:
+                    f.write('timestamp,worker,event,details\n')
+        with open(local, 'a', encoding='utf-8') as f:
+            f.write(line + '\n')
+            f.flush()
+            size = os.fstat(f.fileno()).st_size
+        if notify:
+            replicator.append_done(self.remote, size)
+
+    def _read(self, path: str) -> str:
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+
+    def _stop(self, replicator: WriteAheadReplicator):
+        replicator.stop()
+        self.replicators.remove(replicator)
+
+    def test_append_resumes_after_restart(self):
+        """종료 시 남은 추가분은 저널로 다음 실행에서 이어서 반영됩니다."""
+        first = self._replicator(start=False)
+        self._write(first, 'row1')
+        self._write(first, 'row2')
+        self.assertEqual(first.pending(), 1)
+        self._stop(first)
+
+        second = self._replicator()
+        self.assertTrue(second.flush(FLUSH_SEC))
+        self.assertEqual(self._read(self.remote), self._read(second.local_path(self.remote)))
+        self.assertTrue(self._read(self.remote).endswith('row1\nrow2\n'))
+
+    def test_unjournaled_append_is_requeued(self):
+        """저널 저장 전에 종료되어 예약되지 않은 추가분도 로컬 크기를 보고 다시 예약합니다."""
+        first = self._replicator()
+        self._write(first, 'row1')
+        self.assertTrue(first.flush(FLUSH_SEC))
+        self._stop(first)
+        self._write(first, 'row2', notify=False)
+
+        second = self._replicator(start=False)
+        self.assertEqual(second.pending(), 1)
+        second.start()
+        self.assertTrue(second.flush(FLUSH_SEC))
+        self.assertTrue(self._read(self.remote).endswith('row1\nrow2\n'))
+
+    def test_remote_prefix_is_continued(self):
+        """원격이 로컬의 앞부분이면 충돌 사본 없이 그 뒤부터 이어 씁니다."""
+        replicator = self._replicator()
+        self._write(replicator, 'row1')
+        self._write(replicator, 'row2')
+        self.assertTrue(replicator.flush(FLUSH_SEC))
+        with open(self.remote, 'w', encoding='utf-8') as f:
+            f.write('timestamp,worker,event,details\nrow1\n')
+
+        self._write(replicator, 'row3')
+        self.assertTrue(replicator.flush(FLUSH_SEC))
+        self.assertEqual(self._read(self.remote), self._read(replicator.local_path(self.remote)))
+        self.assertEqual(glob.glob(self.remote + '.conflict-*'), [])
+
+    def test_diverged_remote_is_kept_as_conflict_copy(self):
+        """로컬의 앞부분이 아닌 원격 내용은 충돌 사본으로 남기고 로컬 기록으로 씁니다."""
+        replicator = self._replicator()
+        self._write(replicator, 'row1')
+        self.assertTrue(replicator.flush(FLUSH_SEC))
+        foreign = 'timestamp,worker,event,details\nROW1\nforeign\n'
+        with open(self.remote, 'w', encoding='utf-8') as f:
+            f.write(foreign)
+
+        self._write(replicator, 'row2')
+        self.assertTrue(replicator.flush(FLUSH_SEC))
+        self.assertEqual(self._read(self.remote), self._read(replicator.local_path(self.remote)))
+        conflicts = glob.glob(self.remote + '.conflict-*')
+        self.assertEqual(len(conflicts), 1)
+        self.assertEqual(self._read(conflicts[0]), foreign)
+
+    def test_adopt_remote_after_outbox_loss(self):
+        """outbox 가 지워진 뒤에는 원격 파일을 가져와 이어 쓰므로 원격 기록을 잃지 않습니다."""
+        first = self._replicator()
+        self._write(first, 'row1')
+        self.assertTrue(first.flush(FLUSH_SEC))
+        self._stop(first)
+        shutil.rmtree(self.outbox)
+
+        second = self._replicator()
+        self._write(second, 'row2')
+        self.assertTrue(second.flush(FLUSH_SEC))
+        self.assertTrue(self._read(self.remote).endswith('row1\nrow2\n'))
+        self.assertEqual(glob.glob(self.remote + '.conflict-*'), [])
+
+    def test_replace_while_append_in_flight(self):
+        """처리 중인 추가 기록 뒤에 전체 복사가 예약되고, 최종 원격 내용은 다시 쓴 로컬 파일과 같습니다."""
+        replicator = self._replicator(cls=_GatedReplicator)
+        self._write(replicator, 'row1')
+        self._write(replicator, 'row2')
+        self.assertTrue(replicator.entered.wait(FLUSH_SEC))
+
+        local = replicator.local_path(self.remote)
+        rewritten = self._read(local).replace('row1', 'ROW1-replaced')
+        with open(local, 'w', encoding='utf-8') as f:
+            f.write(rewritten)
+        replicator.replace(self.remote)
+        with replicator._cond:
+            rel = replicator.relpath(self.remote)
+            self.assertEqual(list(replicator._ops), [['append', rel], ['put', rel]])
+
+        replicator.gate.set()
+        self.assertTrue(replicator.flush(FLUSH_SEC))
+        self.assertEqual(self._read(self.remote), rewritten)
+
+        self._write(replicator, 'row3')
+        self.assertTrue(replicator.flush(FLUSH_SEC))
+        self.assertEqual(self._read(self.remote), rewritten + 'row3\n')
+
+    def test_prune_keeps_recent_and_pending_copies(self):
+        """반영이 끝나고 오래된 로컬 사본만 정리합니다."""
+        replicator = self._replicator()
+        self._write(replicator, 'row1')
+        self.assertTrue(replicator.flush(FLUSH_SEC))
+        self._stop(replicator)
+
+        local = replicator.local_path(self.remote)
+        old = time.time() - 10 * 86400
+        os.utime(local, (old, old))
+        pending_remote = self.remote.replace('20250101', '20250102')
+        replicator = self._replicator(start=False)
+        pending_local = replicator.local_path(pending_remote)
+        with open(pending_local, 'w', encoding='utf-8') as f:
+            f.write('header\n')
+        replicator.append_done(pending_remote, os.path.getsize(pending_local))
+        os.utime(pending_local, (old, old))
+
+        replicator.prune(retention_days=30)
+        self.assertTrue(os.path.exists(local))
+        replicator.prune(retention_days=7)
+        self.assertFalse(os.path.exists(local))
+        self.assertNotIn(replicator.relpath(self.remote), replicator._offsets)
+        self.assertTrue(os.path.exists(pending_local))
+        self.assertTrue(os.path.exists(self.remote))
+
+
+if __name__ == '__main__':
+    unittest.main()
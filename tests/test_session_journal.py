@@ -0,0 +1,128 @@
+"""대형 트레이 작업 상태 저널(core.session_journal) 복구 테스트"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from core.models import InspectionSession, ScanRecord, SCAN_DEFECTIVE, SCAN_GOOD
+from core.replication import WriteAheadReplicator
+from core.session_journal import JOURNAL_KEY, ScanJournal, load_session, session_counters
+
+
+class TestScanJournal(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        # 복제 스레드는 시작하지 않으므로 모든 기록은 로컬 outbox 에만 남습니다 (원격 반영 전 종료 상황)
+        self.replicator = WriteAheadReplicator(os.path.join(self.root, 'outbox'), os.path.join(self.root, 'sync'))
+        self.state_path = os.path.join(self.root, 'sync', 'states', '_current_inspection_state_작업자.json')
+        self.journal = ScanJournal(self.replicator, self.state_path)
+        self.session = InspectionSession(master_label_code='WID=W1|CLC=C1', item_code='C1', quantity=1000)
+        self.session.add_scan(ScanRecord('S1', SCAN_GOOD, 1000.0))
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def _scan(self, barcode: str, status: str = SCAN_GOOD, timestamp: float = 2000.0):
+        record = ScanRecord(barcode, status, timestamp)
+        self.session.add_scan(record)
+        self.journal.append_scan(record, session_counters(self.session))
+
+    def _undo(self):
+        undone = self.session.pop_last_scan()
+        self.journal.append_undo(undone.barcode, session_counters(self.session))
+
+    def _recover(self) -> InspectionSession:
+        """앱의 복구 순서와 같이 상태 파일을 읽고 저널을 이어서 적용합니다."""
+        with open(self.replicator.resolve(self.state_path), 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        return load_session(state, self.state_path, self.replicator.resolve)
+
+    def _journal_local_path(self) -> str:
+        return self.replicator.local_path(self.journal.path)
+
+    def test_snapshot_and_journal_replay(self):
+        """스냅샷 이후의 스캔과 누적값은 저널로 복구됩니다."""
+        self.journal.write_snapshot(self.session.to_state(), journal=True)
+        self._scan('S2', timestamp=2000.25)
+        self.session.stopwatch_seconds = 42.04
+        self.session.mismatch_error_count = 1
+        self._scan('S3', SCAN_DEFECTIVE, timestamp=2001.5)
+
+        restored = self._recover()
+        self.assertEqual(restored.scanned_barcodes, ['S1', 'S2', 'S3'])
+        self.assertEqual([(r.barcode, r.timestamp) for r in restored.good_items], [('S1', 1000.0), ('S2', 2000.25)])
+        self.assertEqual([(r.barcode, r.status) for r in restored.defective_items], [('S3', SCAN_DEFECTIVE)])
+        self.assertEqual(restored.stopwatch_seconds, 42.0)
+        self.assertEqual(restored.mismatch_error_count, 1)
+        self.assertTrue(restored.has_scanned('S3'))
+
+    def test_counter_only_entry(self):
+        """스캔 없이 바뀐 오류/휴식 누적값도 복구됩니다."""
+        self.journal.write_snapshot(self.session.to_state(), journal=True)
+        self.session.total_idle_seconds = 30.0
+        self.session.has_error_or_reset = True
+        self.journal.append_counters(session_counters(self.session))
+
+        restored = self._recover()
+        self.assertEqual(restored.total_idle_seconds, 30.0)
+        self.assertIs(restored.has_error_or_reset, True)
+        self.assertEqual(restored.scanned_barcodes, ['S1'])
+
+    def test_torn_last_line_is_ignored(self):
+        """기록 도중 종료되어 잘린 마지막 행은 건너뛰고 앞의 행까지 복구합니다."""
+        self.journal.write_snapshot(self.session.to_state(), journal=True)
+        self._scan('S2')
+        with open(self._journal_local_path(), 'a', encoding='utf-8') as f:
+            f.write('{"b": "S3", "s": "G", "t": 20')
+
+        restored = self._recover()
+        self.assertEqual(restored.scanned_barcodes, ['S1', 'S2'])
+        self.assertFalse(restored.has_scanned('S3'))
+
+    def test_undo_entries(self):
+        """판정 취소 행은 스냅샷에 있던 스캔도 포함해 마지막 스캔부터 취소합니다."""
+        self.journal.write_snapshot(self.session.to_state(), journal=True)
+        self._scan('S2', SCAN_DEFECTIVE)
+        self._undo()
+        self._undo()
+        self._scan('S4')
+
+        restored = self._recover()
+        self.assertEqual(restored.scanned_barcodes, ['S4'])
+        self.assertEqual(restored.defective_items, [])
+        self.assertFalse(restored.has_scanned('S1'))
+        self.assertFalse(restored.has_scanned('S2'))
+
+    def test_new_snapshot_starts_new_journal(self):
+        """새 스냅샷은 새 저널을 가리키고 이전 저널 행은 다시 적용하지 않습니다."""
+        self.journal.write_snapshot(self.session.to_state(), journal=True)
+        first = self.journal.path
+        self._scan('S2')
+        self.journal.write_snapshot(self.session.to_state(), journal=True)
+        self._scan('S3')
+
+        self.assertNotEqual(self.journal.path, first)
+        self.assertFalse(os.path.exists(self.replicator.local_path(first)))
+        restored = self._recover()
+        self.assertEqual(restored.scanned_barcodes, ['S1', 'S2', 'S3'])
+
+    def test_attach_continues_previous_journal(self):
+        """재시작 후 attach 한 저널에 이어 쓴 행도 복구됩니다."""
+        self.journal.write_snapshot(self.session.to_state(), journal=True)
+        self._scan('S2')
+        with open(self.replicator.resolve(self.state_path), 'r', encoding='utf-8') as f:
+            state = json.load(f)
+
+        self.journal = ScanJournal(self.replicator, self.state_path)
+        self.journal.attach(state.get(JOURNAL_KEY))
+        self.session = load_session(state, self.state_path, self.replicator.resolve)
+        self._scan('S3')
+
+        restored = self._recover()
+        self.assertEqual(restored.scanned_barcodes, ['S1', 'S2', 'S3'])
+
+
+if __name__ == '__main__':
+    unittest.main()
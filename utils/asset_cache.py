@@ -0,0 +1,89 @@
+"""이미지 에셋 캐시 모듈"""
+
+import threading
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from PIL import Image, ImageTk
+
+from utils.file_handler import resource_path
+
+
+class ImageAssetCache:
+    """이미지 에셋을 한 번만 디코딩하고 (에셋, 배율)별 PhotoImage를 메모이즈합니다.
+
+    디코딩과 리사이즈는 백그라운드 스레드에서도 안전하게 수행할 수 있으며,
+    PhotoImage 생성은 Tk 메인 스레드에서 get_photo() 호출 시에만 이루어집니다.
+    """
+
+    def __init__(self, resolver: Callable[[str], str] = resource_path):
+        self._resolver = resolver
+        self._lock = threading.Lock()
+        self._originals: Dict[str, Image.Image] = {}
+        self._scaled: Dict[Tuple[str, int], Image.Image] = {}
+        self._photos: Dict[Tuple[str, int], ImageTk.PhotoImage] = {}
+        self._failed: set = set()
+
+    @staticmethod
+    def target_width(base_width: int, scale_factor: float) -> int:
+        """기준 너비와 배율로 실제 표시 너비를 계산합니다."""
+        return max(1, int(base_width * round(scale_factor, 2)))
+
+    def _load_original(self, asset: str) -> Optional[Image.Image]:
+        with self._lock:
+            if asset in self._originals:
+                return self._originals[asset]
+            if asset in self._failed:
+                return None
+        try:
+            with Image.open(self._resolver(asset)) as img:
+                img.load()
+                decoded = img.copy()
+        except (OSError, ValueError) as e:
+            print(f"이미지 로드 실패 ({asset}): {e}")
+            with self._lock:
+                self._failed.add(asset)
+            return None
+        with self._lock:
+            return self._originals.setdefault(asset, decoded)
+
+    def get_scaled_image(self, asset: str, width: int) -> Optional[Image.Image]:
+        """지정 너비로 리사이즈된 PIL 이미지를 반환합니다. (스레드 안전)"""
+        key = (asset, width)
+        with self._lock:
+            cached = self._scaled.get(key)
+        if cached is not None:
+            return cached
+
+        original = self._load_original(asset)
+        if original is None:
+            return None
+        height = max(1, int(width * (original.height / original.width)))
+        resized = original.resize((width, height), Image.Resampling.LANCZOS)
+        with self._lock:
+            return self._scaled.setdefault(key, resized)
+
+    def get_photo(self, asset: str, base_width: int, scale_factor: float) -> Optional[ImageTk.PhotoImage]:
+        """(에셋, 배율)에 해당하는 PhotoImage를 반환합니다. Tk 메인 스레드에서만 호출하세요."""
+        key = (asset, self.target_width(base_width, scale_factor))
+        photo = self._photos.get(key)
+        if photo is not None:
+            return photo
+        scaled = self.get_scaled_image(*key)
+        if scaled is None:
+            return None
+        photo = ImageTk.PhotoImage(scaled)
+        self._photos[key] = photo
+        return photo
+
+    def prefetch(self, assets: Iterable[str], base_width: int, scale_factors: Iterable[float]) -> threading.Thread:
+        """에셋들을 백그라운드에서 디코딩하고 주어진 배율들로 미리 리사이즈합니다."""
+        assets, widths = list(dict.fromkeys(assets)), [self.target_width(base_width, s) for s in scale_factors]
+
+        def worker():
+            for asset in assets:
+                for width in widths:
+                    self.get_scaled_image(asset, width)
+
+        thread = threading.Thread(target=worker, daemon=True)
+        thread.start()
+        return thread
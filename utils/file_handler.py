@@ -1,9 +1,37 @@
 """파일 처리 유틸리티 모듈"""
 
+import json
 import os
 import sys
 from typing import Optional
 
+SAVE_FOLDER_ENV = 'INSPECTION_SAVE_FOLDER'
+
+
+def resolve_save_folder(configured: Optional[str] = None) -> str:
+    """동기화(Sync) 폴더 경로를 정합니다.
+
+    우선순위는 환경 변수 INSPECTION_SAVE_FOLDER > 설정값(paths.save_folder) > OS 기본값
+    (Windows: C:\\Sync, 그 외: ~/Sync) 입니다.
+    configured 를 주지 않으면 앱 설정 파일(config.json)에서 읽습니다. (분석 CLI 등 앱 밖에서 호출할 때)
+    """
+    if configured is None:
+        configured = _configured_save_folder()
+    value = os.environ.get(SAVE_FOLDER_ENV) or configured
+    if value:
+        return os.path.abspath(os.path.expanduser(value))
+    if os.name == 'nt':
+        return "C:\\Sync"
+    return os.path.join(os.path.expanduser('~'), 'Sync')
+
+
+def _configured_save_folder() -> str:
+    try:
+        with open(resource_path('config.json'), 'r', encoding='utf-8') as f:
+            return json.load(f).get('paths', {}).get('save_folder') or ''
+    except (OSError, ValueError, AttributeError):
+        return ''
+
 
 def resource_path(relative_path: str) -> str:
     """ PyInstaller로 패키징했을 때의 리소스 경로를 가져옵니다. """